@@ -0,0 +1,27 @@
+-- Add the secondary indexes to a RAMSTK Program database created before
+-- they were part of sqlite_program_db.sql.  Safe to run more than once.
+BEGIN TRANSACTION;
+CREATE INDEX IF NOT EXISTS idx_action_cause ON ramstk_action (fld_cause_id);
+CREATE INDEX IF NOT EXISTS idx_allocation_revision ON ramstk_allocation (fld_revision_id, fld_hardware_id);
+CREATE INDEX IF NOT EXISTS idx_cause_mechanism ON ramstk_cause (fld_mechanism_id);
+CREATE INDEX IF NOT EXISTS idx_cause_mode ON ramstk_cause (fld_mode_id);
+CREATE INDEX IF NOT EXISTS idx_control_cause ON ramstk_control (fld_cause_id);
+CREATE INDEX IF NOT EXISTS idx_environment_phase ON ramstk_environment (fld_phase_id);
+CREATE INDEX IF NOT EXISTS idx_failure_definition_revision ON ramstk_failure_definition (fld_revision_id, fld_definition_id);
+CREATE INDEX IF NOT EXISTS idx_function_revision ON ramstk_function (fld_revision_id, fld_function_id);
+CREATE INDEX IF NOT EXISTS idx_hardware_revision ON ramstk_hardware (fld_revision_id, fld_hardware_id);
+CREATE INDEX IF NOT EXISTS idx_hazard_analysis_function ON ramstk_hazard_analysis (fld_function_id);
+CREATE INDEX IF NOT EXISTS idx_hazard_analysis_revision ON ramstk_hazard_analysis (fld_revision_id, fld_hazard_id);
+CREATE INDEX IF NOT EXISTS idx_mechanism_mode ON ramstk_mechanism (fld_mode_id);
+CREATE INDEX IF NOT EXISTS idx_mission_phase_mission ON ramstk_mission_phase (fld_mission_id);
+CREATE INDEX IF NOT EXISTS idx_mission_revision ON ramstk_mission (fld_revision_id, fld_mission_id);
+CREATE INDEX IF NOT EXISTS idx_mode_hardware ON ramstk_mode (fld_hardware_id);
+CREATE INDEX IF NOT EXISTS idx_op_load_mechanism ON ramstk_op_load (fld_mechanism_id);
+CREATE INDEX IF NOT EXISTS idx_op_stress_load ON ramstk_op_stress (fld_load_id);
+CREATE INDEX IF NOT EXISTS idx_program_status_revision ON ramstk_program_status (fld_revision_id, fld_status_id);
+CREATE INDEX IF NOT EXISTS idx_requirement_revision ON ramstk_requirement (fld_revision_id, fld_requirement_id);
+CREATE INDEX IF NOT EXISTS idx_similar_item_revision ON ramstk_similar_item (fld_revision_id, fld_hardware_id);
+CREATE INDEX IF NOT EXISTS idx_stakeholder_revision ON ramstk_stakeholder (fld_revision_id, fld_stakeholder_id);
+CREATE INDEX IF NOT EXISTS idx_test_method_load ON ramstk_test_method (fld_load_id);
+CREATE INDEX IF NOT EXISTS idx_validation_revision ON ramstk_validation (fld_revision_id, fld_validation_id);
+COMMIT;
@@ -18,81 +18,16 @@ from typing import Tuple
 from pubsub import pub
 
 # RAMSTK Package Imports
+from ramstk.application import do_connect_to_site_db, do_initialize_databases
 from ramstk.configuration import RAMSTKSiteConfiguration, RAMSTKUserConfiguration
 from ramstk.db import BaseDatabase
 from ramstk.db.common import do_load_variables
-from ramstk.exim import Export, Import
 from ramstk.logger import RAMSTKLogManager
-from ramstk.models import (
-    RAMSTKActionTable,
-    RAMSTKAllocationTable,
-    RAMSTKCauseTable,
-    RAMSTKControlTable,
-    RAMSTKDesignElectricTable,
-    RAMSTKDesignMechanicTable,
-    RAMSTKEnvironmentTable,
-    RAMSTKFailureDefinitionTable,
-    RAMSTKFMEAView,
-    RAMSTKFunctionTable,
-    RAMSTKHardwareBoMView,
-    RAMSTKHardwareTable,
-    RAMSTKHazardTable,
-    RAMSTKMechanismTable,
-    RAMSTKMILHDBK217FTable,
-    RAMSTKMissionPhaseTable,
-    RAMSTKMissionTable,
-    RAMSTKModeTable,
-    RAMSTKNSWCTable,
-    RAMSTKOpLoadTable,
-    RAMSTKOpStressTable,
-    RAMSTKPoFView,
-    RAMSTKProgramDB,
-    RAMSTKProgramInfoTable,
-    RAMSTKProgramStatusTable,
-    RAMSTKReliabilityTable,
-    RAMSTKRequirementTable,
-    RAMSTKRevisionTable,
-    RAMSTKSimilarItemTable,
-    RAMSTKSiteInfoTable,
-    RAMSTKStakeholderTable,
-    RAMSTKTestMethodTable,
-    RAMSTKUsageProfileView,
-    RAMSTKValidationTable,
-)
 from ramstk.utilities import file_exists
-from ramstk.views.gtk3 import Gtk, RAMSTKDesktop, _
+from ramstk.views.gtk3 import GLib, Gtk, RAMSTKDesktop, _
 from ramstk.views.gtk3.widgets import RAMSTKDatabaseSelect
 
 
-def do_connect_to_site_db(conn_info) -> BaseDatabase:
-    """Connect to the site (common) database.
-
-    :param conn_info: the site database connection information.
-    :return: _site_db
-    :rtype: BaseDatabase
-    """
-    pub.sendMessage(
-        "do_log_info_msg",
-        logger_name="INFO",
-        message="Connecting to the RAMSTK common database {0} on {1} "
-        "using port {2}.".format(
-            conn_info["database"], conn_info["host"], conn_info["port"]
-        ),
-    )
-
-    _site_db = BaseDatabase()
-    _site_db.do_connect(conn_info)
-    pub.sendMessage(
-        "do_log_info_msg",
-        logger_name="INFO",
-        message="Connected to the RAMSTK common database {0:s}.".format(
-            conn_info["database"]
-        ),
-    )
-
-    return _site_db
-
-
 def do_first_run(configuration: RAMSTKSiteConfiguration) -> None:
     """Raise dialog to setup site database.
 
@@ -128,64 +63,6 @@ def do_first_run(configuration: RAMSTKSiteConfiguration) -> None:
     _dialog.do_destroy()
 
 
-def do_initialize_databases(
-    configuration: RAMSTKUserConfiguration, site_db: BaseDatabase
-) -> RAMSTKProgramDB:
-    """Initialize the databases for the current instance of RAMSTK.
-
-    :param configuration: the instance of the user configuration object to associate
-        with this database model.
-    :param site_db: the instance of the site data access object to associate with
-        this database model.
-    :return: _program_db
-    :rtype: RAMSTKProgramDB
-    """
-    _program_db = RAMSTKProgramDB()
-    _program_db.dic_tables["action"] = RAMSTKActionTable()
-    _program_db.dic_tables["allocation"] = RAMSTKAllocationTable()
-    _program_db.dic_tables["cause"] = RAMSTKCauseTable()
-    _program_db.dic_tables["control"] = RAMSTKControlTable()
-    _program_db.dic_tables["design_electric"] = RAMSTKDesignElectricTable()
-    _program_db.dic_tables["design_mechanic"] = RAMSTKDesignMechanicTable()
-    _program_db.dic_tables["environment"] = RAMSTKEnvironmentTable()
-    _program_db.dic_tables["failure_definition"] = RAMSTKFailureDefinitionTable()
-    _program_db.dic_tables["function"] = RAMSTKFunctionTable()
-    _program_db.dic_tables["hardware"] = RAMSTKHardwareTable()
-    _program_db.dic_tables["hazards"] = RAMSTKHazardTable()
-    _program_db.dic_tables["mechanism"] = RAMSTKMechanismTable()
-    _program_db.dic_tables["milhdbk217f"] = RAMSTKMILHDBK217FTable()
-    _program_db.dic_tables["mission"] = RAMSTKMissionTable()
-    _program_db.dic_tables["mission_phase"] = RAMSTKMissionPhaseTable()
-    _program_db.dic_tables["mode"] = RAMSTKModeTable()
-    _program_db.dic_tables["nswc"] = RAMSTKNSWCTable()
-    _program_db.dic_tables["opload"] = RAMSTKOpLoadTable()
-    _program_db.dic_tables["opstress"] = RAMSTKOpStressTable()
-    _program_db.dic_tables["program_info"] = RAMSTKProgramInfoTable()
-    _program_db.dic_tables["program_status"] = RAMSTKProgramStatusTable()
-    _program_db.dic_tables["reliability"] = RAMSTKReliabilityTable()
-    _program_db.dic_tables["requirement"] = RAMSTKRequirementTable()
-    _program_db.dic_tables["revision"] = RAMSTKRevisionTable()
-    _program_db.dic_tables["similar_item"] = RAMSTKSimilarItemTable()
-    _program_db.dic_tables["stakeholder"] = RAMSTKStakeholderTable()
-    _program_db.dic_tables["test_method"] = RAMSTKTestMethodTable()
-    _program_db.dic_tables["validation"] = RAMSTKValidationTable()
-    _program_db.dic_tables["export"] = Export()
-    _program_db.dic_tables["import"] = Import()
-    _program_db.user_configuration = configuration
-
-    # noinspection PyTypeChecker
-    _program_db.dic_tables["options"] = RAMSTKSiteInfoTable()
-    _program_db.dic_tables["options"].dao = site_db
-    _program_db.dic_tables["options"].do_select_all({"site_id": 1})
-
-    _program_db.dic_views["fmea"] = RAMSTKFMEAView()
-    _program_db.dic_views["hardwarebom"] = RAMSTKHardwareBoMView()
-    _program_db.dic_views["pof"] = RAMSTKPoFView()
-    _program_db.dic_views["usage_profile"] = RAMSTKUsageProfileView()
-
-    return _program_db
-
-
 def do_initialize_loggers(log_file: str, log_level: str) -> RAMSTKLogManager:
     """Initialize the loggers for the current instance of RAMSTK.
 
@@ -340,9 +217,10 @@ def the_one_ring() -> None:
         message="Initializing the RAMSTK application.",
     )
 
-    _program_db = do_initialize_databases(  # pylint: disable=unused-variable
-        user_configuration, site_db
-    )
+    _program_db = do_initialize_databases(user_configuration, site_db)
+
+    # Run the background task callbacks on the GTK main loop.
+    _program_db.tasks.dispatch = GLib.idle_add
 
     pub.sendMessage(
         "do_log_info_msg",
@@ -7,6 +7,7 @@ from . import (
     criticality,
     derating,
     dormancy,
+    equation,
     fha,
     improvementfactor,
     similaritem,
@@ -6,6 +6,19 @@
 # Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Component Derating Calculations Module."""
 
+# Third Party Imports
+import numpy as np
+
+# The electrical stresses and environments in the order they're stored in the
+# RAMSTK_STRESS_LIMITS for each category; [harsh current, mild current, harsh
+# power, mild power, harsh voltage, mild voltage].
+STRESS_TYPES = ("current", "power", "voltage")
+ENVIRONMENTS = ("harsh", "mild")
+
+# The category IDs each electrical stress ratio applies to in STRESS_TYPES
+# order.
+STRESS_CATEGORIES = ((1, 2, 5, 6, 7, 8), (3,), (4, 5, 8))
+
 
 def check_overstress(op_stress, limits):
     """Check if an operating condition results in an overstressed condition.
@@ -71,3 +84,175 @@ def check_overstress(op_stress, limits):
             _overstress[key][1] = True
 
     return _overstress
+
+
+def get_stress_limits(stress_limits):
+    """Lay out the stress limits of each category as a dense array.
+
+    >>> get_stress_limits({1: [0.8, 0.9, 1.0, 1.0, 0.7, 0.9]})[1]
+    array([[[0. , 0.8],
+            [0. , 0.9]],
+    <BLANKLINE>
+           [[0. , 1. ],
+            [0. , 1. ]],
+    <BLANKLINE>
+           [[0. , 0.7],
+            [0. , 0.9]]])
+
+    :param stress_limits: the RAMSTK_STRESS_LIMITS dict; the key is the
+        category ID and the value is the list of upper stress limits.
+    :return: _limits; the array of [lower limit, upper limit] indexed by
+        [category ID, stress type, environment].  Categories without stress
+        limits are nan.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _limits = np.full(
+        (max(stress_limits, default=0) + 1, len(STRESS_TYPES), len(ENVIRONMENTS), 2),
+        np.nan,
+    )
+    for _category_id, _upper in stress_limits.items():
+        _limits[_category_id, :, :, 0] = 0.0
+        _limits[_category_id, :, :, 1] = np.reshape(
+            _upper[: len(STRESS_TYPES) * len(ENVIRONMENTS)],
+            (len(STRESS_TYPES), len(ENVIRONMENTS)),
+        )
+
+    return _limits
+
+
+def do_screen_overstress(category_id, ratios, limits):
+    """Check many components for overstressed conditions at once.
+
+    This is the batch form of check_overstress() for the electrical stresses.
+    Components in a category without stress limits are never overstressed.
+
+    >>> _limits = get_stress_limits({3: [0.8, 0.9, 0.6, 0.7, 0.7, 0.9]})
+    >>> do_screen_overstress([3], [[0.85, 0.5, -0.1]], _limits)[0, :, :, 1]
+    array([[ True, False],
+           [False, False],
+           [False, False]])
+
+    :param category_id: the category ID of each component.
+    :param ratios: the (current, power, voltage) stress ratios of each
+        component.
+    :param limits: the stress limits array from get_stress_limits().
+    :return: _overstress; the array of booleans indexed by [component, stress
+        type, environment, limit] where limit 0 is below the lower limit and
+        limit 1 is above the upper limit.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _category_id = np.asarray(category_id, dtype=int)
+    _valid = (_category_id >= 0) & (_category_id < limits.shape[0])
+    _limits = np.where(
+        _valid[:, None, None, None],
+        limits[np.where(_valid, _category_id, 0)],
+        np.nan,
+    )
+    _ratios = np.asarray(ratios, dtype=float)[:, :, None]
+
+    with np.errstate(invalid="ignore"):
+        return np.stack([_ratios < _limits[..., 0], _ratios > _limits[..., 1]], axis=-1)
+
+
+def do_calculate_stress_ratios(category_id, operating, rated, ratios):
+    """Calculate the electrical stress ratios of many components at once.
+
+    Each ratio is only calculated for components in the categories it applies
+    to (see STRESS_CATEGORIES) with a non-zero rated value; the passed ratio
+    is kept for all other components.
+
+    >>> do_calculate_stress_ratios(
+    ...     [3, 4], [[0.1, 0.5, 5.0], [0.1, 0.5, 5.0]],
+    ...     [[0.2, 1.0, 10.0], [0.2, 1.0, 0.0]], [[0.0, 0.0, 0.0]] * 2
+    ... )
+    array([[0. , 0.5, 0. ],
+           [0. , 0. , 0. ]])
+
+    :param category_id: the category ID of each component.
+    :param operating: the operating (current, power, voltage) of each
+        component.
+    :param rated: the rated (current, power, voltage) of each component.
+    :param ratios: the current (current, power, voltage) stress ratios of each
+        component.
+    :return: _ratios; the (current, power, voltage) stress ratios of each
+        component.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _category_id = np.asarray(category_id, dtype=int)
+    _rated = np.asarray(rated, dtype=float)
+    _ratios = np.array(ratios, dtype=float)
+
+    np.divide(
+        np.asarray(operating, dtype=float),
+        _rated,
+        out=_ratios,
+        where=np.column_stack(
+            [np.isin(_category_id, _categories) for _categories in STRESS_CATEGORIES]
+        )
+        & (_rated != 0.0),
+    )
+
+    return _ratios
+
+
+def get_overstress_reasons(overstress):
+    """Describe the overstressed conditions of many components.
+
+    >>> _overstress = np.zeros((2, 3, 2, 2), dtype=bool)
+    >>> _overstress[1, 0, 1, 1] = True
+    >>> get_overstress_reasons(_overstress)
+    ['', 'Operating current is greater than limit in a mild environment.\\n']
+
+    :param overstress: the array of overstress conditions from
+        do_screen_overstress().
+    :return: _reasons; the description of every overstress condition of each
+        component.  Components that aren't overstressed have an empty reason.
+    :rtype: list
+    """
+    _messages = np.array(
+        [
+            [
+                [
+                    "Operating {0} is less than limit in a {1} "
+                    "environment.\n".format(_stress, _environment),
+                    "Operating {0} is greater than limit in a {1} "
+                    "environment.\n".format(_stress, _environment),
+                ]
+                for _environment in ENVIRONMENTS
+            ]
+            for _stress in STRESS_TYPES
+        ]
+    )
+
+    return ["".join(_messages[_overstress]) for _overstress in overstress]
+
+
+def get_overstress_violations(component_id, ratios, overstress):
+    """List every overstressed condition of many components.
+
+    >>> _overstress = np.zeros((2, 3, 2, 2), dtype=bool)
+    >>> _overstress[1, 0, 1, 1] = True
+    >>> _violations = get_overstress_violations(
+    ...     [10, 11], [[0.1] * 3, [0.95] * 3], _overstress
+    ... )
+    >>> _violations["component_id"], _violations["stress"], _violations["limit"]
+    (array([11]), array(['current'], dtype='<U7'), array(['upper'], dtype='<U5'))
+
+    :param component_id: the ID of each component.
+    :param ratios: the (current, power, voltage) stress ratios of each
+        component.
+    :param overstress: the array of overstress conditions from
+        do_screen_overstress().
+    :return: the arrays of the ID, stress type, environment, limit (lower or
+        upper), and stress ratio of each overstressed condition keyed by name.
+    :rtype: dict
+    """
+    _component, _stress, _environment, _limit = np.nonzero(overstress)
+
+    return {
+        "component_id": np.asarray(component_id, dtype=int)[_component],
+        "stress": np.array(STRESS_TYPES)[_stress],
+        "environment": np.array(ENVIRONMENTS)[_environment],
+        "limit": np.array(["lower", "upper"])[_limit],
+        "ratio": np.asarray(ratios, dtype=float)[_component, _stress],
+    }
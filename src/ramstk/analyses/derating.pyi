@@ -1,4 +1,22 @@
 # Standard Library Imports
-from typing import Any
+from typing import Any, Dict, List, Tuple
+
+# Third Party Imports
+import numpy as np
+
+STRESS_TYPES: Tuple[str, ...]
+ENVIRONMENTS: Tuple[str, ...]
+STRESS_CATEGORIES: Tuple[Tuple[int, ...], ...]
 
 def check_overstress(op_stress: Any, limits: Any): ...
+def get_stress_limits(stress_limits: Dict[int, List[float]]) -> np.ndarray: ...
+def do_screen_overstress(
+    category_id: Any, ratios: Any, limits: np.ndarray
+) -> np.ndarray: ...
+def do_calculate_stress_ratios(
+    category_id: Any, operating: Any, rated: Any, ratios: Any
+) -> np.ndarray: ...
+def get_overstress_reasons(overstress: np.ndarray) -> List[str]: ...
+def get_overstress_violations(
+    component_id: Any, ratios: Any, overstress: np.ndarray
+) -> Dict[str, np.ndarray]: ...
@@ -8,119 +8,135 @@
 """Dormancy Calculations Module."""
 
 # Standard Library Imports
-from typing import List, Union
+from typing import Any, List, Union
 
 # Third Party Imports
 import numpy as np
 
+# The dormant hazard rate multipliers for each category, active environment, and
+# dormant environment.  The semiconductor multipliers are [diodes, transistors].
+_DORMANT_HR_MULT = [
+    [
+        [0.0, 0.08, 0.0, 0.0],
+        [0.0, 0.08, 0.0, 0.0],
+        [0.0, 0.08, 0.0, 0.0],
+        [0.0, 0.05, 0.06, 0.0],
+        [0.0, 0.05, 0.06, 0.0],
+        [0.06, 0.04, 0.0, 0.0],
+        [0.06, 0.04, 0.0, 0.0],
+        [0.06, 0.04, 0.0, 0.0],
+        [0.06, 0.04, 0.0, 0.0],
+        [0.06, 0.04, 0.0, 0.0],
+        [0.0, 0.3, 0.0, 0.1],
+    ],
+    [
+        [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
+        [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
+        [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
+        [[0.0, 0.0], [0.03, 0.03], [0.04, 0.05], [0.0, 0.0]],
+        [[0.0, 0.0], [0.03, 0.03], [0.04, 0.05], [0.0, 0.0]],
+        [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
+        [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
+        [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
+        [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
+        [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
+        [[0.0, 0.0], [0.8, 1.0], [0.0, 0.0], [0.2, 0.2]],
+    ],
+    [
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.06, 0.1, 0.0],
+        [0.0, 0.06, 0.1, 0.0],
+        [0.06, 0.2, 0.0, 0.0],
+        [0.06, 0.2, 0.0, 0.0],
+        [0.06, 0.2, 0.0, 0.0],
+        [0.06, 0.2, 0.0, 0.0],
+        [0.06, 0.2, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.5],
+    ],
+    [
+        [0.0, 0.1, 0.0, 0.0],
+        [0.0, 0.1, 0.0, 0.0],
+        [0.0, 0.1, 0.0, 0.0],
+        [0.0, 0.04, 0.1, 0.0],
+        [0.0, 0.04, 0.1, 0.0],
+        [0.1, 0.03, 0.0, 0.0],
+        [0.1, 0.03, 0.0, 0.0],
+        [0.1, 0.03, 0.0, 0.0],
+        [0.1, 0.03, 0.0, 0.0],
+        [0.1, 0.03, 0.0, 0.0],
+        [0.0, 0.4, 0.0, 0.2],
+    ],
+    [
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.3, 0.3, 0.0],
+        [0.0, 0.3, 0.3, 0.0],
+        [0.2, 0.2, 0.0, 0.0],
+        [0.2, 0.2, 0.0, 0.0],
+        [0.2, 0.2, 0.0, 0.0],
+        [0.2, 0.2, 0.0, 0.0],
+        [0.2, 0.2, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.5],
+    ],
+    [
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.2, 0.0, 0.0],
+        [0.0, 0.08, 0.3, 0.0],
+        [0.0, 0.08, 0.3, 0.0],
+        [0.2, 0.04, 0.0, 0.0],
+        [0.2, 0.04, 0.0, 0.0],
+        [0.2, 0.04, 0.0, 0.0],
+        [0.2, 0.04, 0.0, 0.0],
+        [0.2, 0.04, 0.0, 0.0],
+        [0.0, 0.9, 0.0, 0.4],
+    ],
+    [
+        [0.0, 0.4, 0.0, 0.0],
+        [0.0, 0.4, 0.0, 0.0],
+        [0.0, 0.4, 0.0, 0.0],
+        [0.0, 0.2, 0.4, 0.0],
+        [0.0, 0.2, 0.4, 0.0],
+        [0.2, 0.1, 0.0, 0.0],
+        [0.2, 0.1, 0.0, 0.0],
+        [0.2, 0.1, 0.0, 0.0],
+        [0.2, 0.1, 0.0, 0.0],
+        [0.2, 0.1, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.8],
+    ],
+    [
+        [0.0, 0.005, 0.0, 0.0],
+        [0.0, 0.005, 0.0, 0.0],
+        [0.0, 0.005, 0.0, 0.0],
+        [0.0, 0.003, 0.008, 0.0],
+        [0.0, 0.003, 0.008, 0.0],
+        [0.0005, 0.003, 0.0, 0.0],
+        [0.0005, 0.003, 0.0, 0.0],
+        [0.0005, 0.003, 0.0, 0.0],
+        [0.0005, 0.003, 0.0, 0.0],
+        [0.0005, 0.003, 0.0, 0.0],
+        [0.0, 0.03, 0.0, 0.02],
+    ],
+]
+
+# The dense lookup cube of dormant hazard rate multipliers indexed by
+# [category, transistor, active environment, dormant environment].  Index 1 on
+# the transistor axis is only different from index 0 for semiconductors.
 DORMANT_HR_MULT = np.array(
     [
         [
-            [0.0, 0.08, 0.0, 0.0],
-            [0.0, 0.08, 0.0, 0.0],
-            [0.0, 0.08, 0.0, 0.0],
-            [0.0, 0.05, 0.06, 0.0],
-            [0.0, 0.05, 0.06, 0.0],
-            [0.06, 0.04, 0.0, 0.0],
-            [0.06, 0.04, 0.0, 0.0],
-            [0.06, 0.04, 0.0, 0.0],
-            [0.06, 0.04, 0.0, 0.0],
-            [0.06, 0.04, 0.0, 0.0],
-            [0.0, 0.3, 0.0, 0.1],
-        ],
-        [
-            [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
-            [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
-            [[0.0, 0.0], [0.04, 0.05], [0.0, 0.0], [0.0, 0.0]],
-            [[0.0, 0.0], [0.03, 0.03], [0.04, 0.05], [0.0, 0.0]],
-            [[0.0, 0.0], [0.03, 0.03], [0.04, 0.05], [0.0, 0.0]],
-            [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
-            [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
-            [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
-            [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
-            [[0.05, 0.06], [0.01, 0.02], [0.0, 0.0], [0.0, 0.0]],
-            [[0.0, 0.0], [0.8, 1.0], [0.0, 0.0], [0.2, 0.2]],
-        ],
-        [
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.06, 0.1, 0.0],
-            [0.0, 0.06, 0.1, 0.0],
-            [0.06, 0.2, 0.0, 0.0],
-            [0.06, 0.2, 0.0, 0.0],
-            [0.06, 0.2, 0.0, 0.0],
-            [0.06, 0.2, 0.0, 0.0],
-            [0.06, 0.2, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.5],
-        ],
-        [
-            [0.0, 0.1, 0.0, 0.0],
-            [0.0, 0.1, 0.0, 0.0],
-            [0.0, 0.1, 0.0, 0.0],
-            [0.0, 0.04, 0.1, 0.0],
-            [0.0, 0.04, 0.1, 0.0],
-            [0.1, 0.03, 0.0, 0.0],
-            [0.1, 0.03, 0.0, 0.0],
-            [0.1, 0.03, 0.0, 0.0],
-            [0.1, 0.03, 0.0, 0.0],
-            [0.1, 0.03, 0.0, 0.0],
-            [0.0, 0.4, 0.0, 0.2],
-        ],
-        [
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.3, 0.3, 0.0],
-            [0.0, 0.3, 0.3, 0.0],
-            [0.2, 0.2, 0.0, 0.0],
-            [0.2, 0.2, 0.0, 0.0],
-            [0.2, 0.2, 0.0, 0.0],
-            [0.2, 0.2, 0.0, 0.0],
-            [0.2, 0.2, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.5],
-        ],
-        [
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.2, 0.0, 0.0],
-            [0.0, 0.08, 0.3, 0.0],
-            [0.0, 0.08, 0.3, 0.0],
-            [0.2, 0.04, 0.0, 0.0],
-            [0.2, 0.04, 0.0, 0.0],
-            [0.2, 0.04, 0.0, 0.0],
-            [0.2, 0.04, 0.0, 0.0],
-            [0.2, 0.04, 0.0, 0.0],
-            [0.0, 0.9, 0.0, 0.4],
-        ],
-        [
-            [0.0, 0.4, 0.0, 0.0],
-            [0.0, 0.4, 0.0, 0.0],
-            [0.0, 0.4, 0.0, 0.0],
-            [0.0, 0.2, 0.4, 0.0],
-            [0.0, 0.2, 0.4, 0.0],
-            [0.2, 0.1, 0.0, 0.0],
-            [0.2, 0.1, 0.0, 0.0],
-            [0.2, 0.1, 0.0, 0.0],
-            [0.2, 0.1, 0.0, 0.0],
-            [0.2, 0.1, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.8],
-        ],
-        [
-            [0.0, 0.005, 0.0, 0.0],
-            [0.0, 0.005, 0.0, 0.0],
-            [0.0, 0.005, 0.0, 0.0],
-            [0.0, 0.003, 0.008, 0.0],
-            [0.0, 0.003, 0.008, 0.0],
-            [0.0005, 0.003, 0.0, 0.0],
-            [0.0005, 0.003, 0.0, 0.0],
-            [0.0005, 0.003, 0.0, 0.0],
-            [0.0005, 0.003, 0.0, 0.0],
-            [0.0005, 0.003, 0.0, 0.0],
-            [0.0, 0.03, 0.0, 0.02],
-        ],
+            [
+                _multiplier if isinstance(_multiplier, list) else [_multiplier] * 2
+                for _multiplier in _environment
+            ]
+            for _environment in _category
+        ]
+        for _category in _DORMANT_HR_MULT
     ]
-)
+).transpose(0, 3, 1, 2)
 
 
 def do_calculate_dormant_hazard_rate(
@@ -179,18 +195,59 @@ def do_calculate_dormant_hazard_rate(
     :rtype: float
     :raise: IndexError if an indexing argument asks for a non-existent index.
     """
-    if hw_info[0] == 2:
-        if hw_info[1] in [1, 2]:
-            _dormant_hr_mult = DORMANT_HR_MULT[hw_info[0] - 1][env_info[0] - 1][
-                env_info[1] - 1
-            ][0]
-        else:
-            _dormant_hr_mult = DORMANT_HR_MULT[hw_info[0] - 1][env_info[0] - 1][
-                env_info[1] - 1
-            ][1]
-    else:
-        _dormant_hr_mult = DORMANT_HR_MULT[hw_info[0] - 1][env_info[0] - 1][
-            env_info[1] - 1
-        ]
+    _transistor = int(hw_info[0] == 2 and hw_info[1] not in [1, 2])
+    _dormant_hr_mult = DORMANT_HR_MULT[hw_info[0] - 1][_transistor][env_info[0] - 1][
+        env_info[1] - 1
+    ]
+
+    return float(_dormant_hr_mult * hw_info[2])
+
+
+def do_calculate_dormant_hazard_rates(
+    category_id: Any,
+    subcategory_id: Any,
+    env_active: Any,
+    env_dormant: Any,
+    hazard_rate_active: Any,
+) -> np.ndarray:
+    """Calculate the dormant hazard rate for many hardware items at once.
+
+    This is the batch form of do_calculate_dormant_hazard_rate().  The
+    multipliers for all the hardware items are looked up from DORMANT_HR_MULT in
+    a single indexing operation.  Items with a category or environment that has
+    no dormancy multiplier (e.g., a missile active environment) have a dormant
+    hazard rate of 0.0 rather than raising an IndexError.
+
+    :param category_id: the category ID of each hardware item.
+    :param subcategory_id: the subcategory ID of each hardware item.
+    :param env_active: the active environment ID of each hardware item.
+    :param env_dormant: the dormant environment ID of each hardware item.
+    :param hazard_rate_active: the active hazard rate of each hardware item.
+    :return: the dormant hazard rate of each hardware item.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _category = np.asarray(category_id, dtype=int) - 1
+    _active = np.asarray(env_active, dtype=int) - 1
+    _dormant = np.asarray(env_dormant, dtype=int) - 1
+    _transistor = (_category == 1) & ~np.isin(subcategory_id, [1, 2])
+
+    _valid = (
+        (_category >= 0)
+        & (_category < DORMANT_HR_MULT.shape[0])
+        & (_active >= 0)
+        & (_active < DORMANT_HR_MULT.shape[2])
+        & (_dormant >= 0)
+        & (_dormant < DORMANT_HR_MULT.shape[3])
+    )
+    _dormant_hr_mult = np.where(
+        _valid,
+        DORMANT_HR_MULT[
+            np.where(_valid, _category, 0),
+            _transistor.astype(int),
+            np.where(_valid, _active, 0),
+            np.where(_valid, _dormant, 0),
+        ],
+        0.0,
+    )
 
-    return _dormant_hr_mult * hw_info[2]
+    return _dormant_hr_mult * np.asarray(hazard_rate_active, dtype=float)
@@ -1,8 +1,19 @@
 # Standard Library Imports
 from typing import Any, List, Union
 
-DORMANT_HR_MULT: Any
+# Third Party Imports
+import numpy as np
+
+_DORMANT_HR_MULT: List[Any]
+DORMANT_HR_MULT: np.ndarray
 
 def do_calculate_dormant_hazard_rate(
     hw_info: List[Union[int, float]], env_info: List[int]
 ) -> float: ...
+def do_calculate_dormant_hazard_rates(
+    category_id: Any,
+    subcategory_id: Any,
+    env_active: Any,
+    env_dormant: Any,
+    hazard_rate_active: Any,
+) -> np.ndarray: ...
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.equation.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""User-Defined Equation Module."""
+
+# Standard Library Imports
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+# noinspection PyPackageRequirements
+from sympy import S, lambdify, symbols, sympify  # type: ignore
+
+EQUATION_CACHE_SIZE: int = 256
+
+
+@lru_cache(maxsize=EQUATION_CACHE_SIZE)
+def get_compiled_equation(
+    equation: str, variables: Tuple[str, ...]
+) -> Callable[..., Any]:
+    """Compile a user-defined equation to a NumPy function.
+
+    The equation is parsed by SymPy once and the compiled function is kept in a
+    least recently used cache keyed by the equation text and variable names.
+    The least recently used equation is evicted when the cache is full.
+
+        >>> _function = get_compiled_equation("uf1*uf2", ("uf1", "uf2"))
+        >>> _function(1.5, 2.0)
+        3.0
+
+    :param equation: the user-defined equation to compile.
+    :param variables: the names of the variables the equation may use, in the
+        order the compiled function expects them.
+    :return: the compiled function of the variables.
+    :rtype: callable
+    :raise: sympy.SympifyError if the equation can't be parsed.
+    :raise: ZeroDivisionError if the equation divides a constant by zero.
+    """
+    _expression = sympify(equation)
+    if _expression.has(S.ComplexInfinity, S.NaN):
+        raise ZeroDivisionError(
+            "User-defined equation {0} divides by zero.".format(equation)
+        )
+
+    return lambdify(symbols(variables), _expression, modules="numpy")
+
+
+def _get_equation_result(
+    equation: str, variables: Tuple[str, ...], arguments: List[Any]
+) -> Any:
+    """Calculate a user-defined equation with NumPy floating point errors raised.
+
+    Division by zero raises a ZeroDivisionError whether the arguments are
+    floats or arrays so a single record and a batch of records fail the same
+    way.
+
+    :param equation: the user-defined equation to calculate.
+    :param variables: the names of the variables the equation may use.
+    :param arguments: the value or array of values of each variable.
+    :return: the result of the equation.
+    :rtype: float or :class:`numpy.ndarray`
+    :raise: ZeroDivisionError if the equation divides by zero.
+    """
+    try:
+        with np.errstate(divide="raise", invalid="raise"):
+            return get_compiled_equation(equation, variables)(*arguments)
+    except (FloatingPointError, ZeroDivisionError) as _error:
+        raise ZeroDivisionError(
+            "User-defined equation {0} divides by zero.".format(equation)
+        ) from _error
+
+
+def do_calculate_equations(
+    values: Dict[str, Any],
+    variables: Tuple[str, ...],
+    equations: Sequence[str],
+    results: Sequence[str],
+) -> Dict[str, Any]:
+    """Calculate a set of user-defined equations in order.
+
+    The result of each equation is assigned to the matching results key before
+    the next equation is calculated so later equations can use the results of
+    earlier ones.
+
+    :param values: the dict of variable values keyed by variable name.
+    :param variables: the names of the variables the equations may use.
+    :param equations: the keys in values holding each equation.
+    :param results: the keys in values to assign each equation's result to.
+    :return: values; the dict of variable values with updated results.
+    :rtype: dict
+    :raise: ZeroDivisionError if an equation divides by zero.
+    """
+    for _equation, _result in zip(equations, results):
+        values[_result] = float(
+            _get_equation_result(
+                values[_equation],
+                variables,
+                [values[_variable] for _variable in variables],
+            )
+        )
+
+    return values
+
+
+def do_calculate_all_equations(
+    values: Dict[str, Any],
+    variables: Tuple[str, ...],
+    equations: Sequence[str],
+    results: Sequence[str],
+) -> Dict[str, Any]:
+    """Calculate a set of user-defined equations for many records at once.
+
+    This is the batch form of do_calculate_equations().  Each variable in values
+    is an array with one element per record and each equation is a list with
+    one equation per record.  Records sharing the same equation are calculated
+    together with a single call to the compiled equation.
+
+    :param values: the dict of variable arrays keyed by variable name.
+    :param variables: the names of the variables the equations may use.
+    :param equations: the keys in values holding each equation list.
+    :param results: the keys in values to assign each equation's results to.
+    :return: values; the dict of variable arrays with updated results.
+    :rtype: dict
+    :raise: ZeroDivisionError if an equation divides by zero for any record.
+    """
+    for _equation, _result in zip(equations, results):
+        _groups: Dict[str, List[int]] = {}
+        for _row, _text in enumerate(values[_equation]):
+            _groups.setdefault(_text, []).append(_row)
+
+        _values = np.array(values[_result], dtype=float)
+        for _text, _rows in _groups.items():
+            _values[_rows] = _get_equation_result(
+                _text,
+                variables,
+                [np.asarray(values[_variable])[_rows] for _variable in variables],
+            )
+        values[_result] = _values
+
+    return values
@@ -7,15 +7,28 @@
 """Functional Hazards Analysis (FHA) Module."""
 
 # Standard Library Imports
-from typing import Any, Dict, List
-
-# Third Party Imports
-# noinspection PyPackageRequirements
-from sympy import symbols, sympify  # type: ignore
+from typing import Any, Dict, List, Tuple
 
 # RAMSTK Package Imports
+from ramstk.analyses import equation
 from ramstk.exceptions import OutOfRangeError
 
+FHA_EQUATIONS: Tuple[str, ...] = (
+    "equation1",
+    "equation2",
+    "equation3",
+    "equation4",
+    "equation5",
+)
+FHA_RESULTS: Tuple[str, ...] = ("res1", "res2", "res3", "res4", "res5")
+FHA_VARIABLES: Tuple[str, ...] = (
+    "uf1",
+    "uf2",
+    "uf3",
+    "ui1",
+    "ui2",
+    "ui3",
+) + FHA_RESULTS
 PROBABILITY = {
     "Level E - Extremely Unlikely": 1,
     "Level D - Remote": 2,
@@ -75,88 +88,24 @@ def calculate_user_defined(fha: Dict[str, Any]) -> Dict[str, Any]:
     :return: fha; the functional hazards assessment dict with updated results.
     :rtype: dict
     """
-    (uf1, uf2, uf3, ui1, ui2, ui3, res1, res2, res3, res4, res5) = symbols(
-        "uf1 uf2 uf3 ui1 ui2 ui3 res1 res2 res3 res4 res5"
+    return equation.do_calculate_equations(
+        fha, FHA_VARIABLES, FHA_EQUATIONS, FHA_RESULTS
     )
 
-    # pylint: disable=eval-used
-    fha["res1"] = sympify(fha["equation1"]).evalf(
-        subs={
-            uf1: fha["uf1"],
-            uf2: fha["uf2"],
-            uf3: fha["uf3"],
-            ui1: fha["ui1"],
-            ui2: fha["ui2"],
-            ui3: fha["ui3"],
-            res1: fha["res1"],
-            res2: fha["res2"],
-            res3: fha["res3"],
-            res4: fha["res4"],
-            res5: fha["res5"],
-        }
-    )
-    fha["res2"] = sympify(fha["equation2"]).evalf(
-        subs={
-            uf1: fha["uf1"],
-            uf2: fha["uf2"],
-            uf3: fha["uf3"],
-            ui1: fha["ui1"],
-            ui2: fha["ui2"],
-            ui3: fha["ui3"],
-            res1: fha["res1"],
-            res2: fha["res2"],
-            res3: fha["res3"],
-            res4: fha["res4"],
-            res5: fha["res5"],
-        }
-    )
-    fha["res3"] = sympify(fha["equation3"]).evalf(
-        subs={
-            uf1: fha["uf1"],
-            uf2: fha["uf2"],
-            uf3: fha["uf3"],
-            ui1: fha["ui1"],
-            ui2: fha["ui2"],
-            ui3: fha["ui3"],
-            res1: fha["res1"],
-            res2: fha["res2"],
-            res3: fha["res3"],
-            res4: fha["res4"],
-            res5: fha["res5"],
-        }
-    )
-    fha["res4"] = sympify(fha["equation4"]).evalf(
-        subs={
-            uf1: fha["uf1"],
-            uf2: fha["uf2"],
-            uf3: fha["uf3"],
-            ui1: fha["ui1"],
-            ui2: fha["ui2"],
-            ui3: fha["ui3"],
-            res1: fha["res1"],
-            res2: fha["res2"],
-            res3: fha["res3"],
-            res4: fha["res4"],
-            res5: fha["res5"],
-        }
-    )
-    fha["res5"] = sympify(fha["equation5"]).evalf(
-        subs={
-            uf1: fha["uf1"],
-            uf2: fha["uf2"],
-            uf3: fha["uf3"],
-            ui1: fha["ui1"],
-            ui2: fha["ui2"],
-            ui3: fha["ui3"],
-            res1: fha["res1"],
-            res2: fha["res2"],
-            res3: fha["res3"],
-            res4: fha["res4"],
-            res5: fha["res5"],
-        }
-    )
 
-    return fha
+def calculate_all_user_defined(fha: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate the user-defined hazards analysis for many hazards at once.
+
+    :param fha: the user-defined functional hazards assessment dict.  This is
+        the same dict passed to calculate_user_defined() except each value is a
+        list or array with one element per hazard.
+    :return: fha; the functional hazards assessment dict with updated result
+        arrays.
+    :rtype: dict
+    """
+    return equation.do_calculate_all_equations(
+        fha, FHA_VARIABLES, FHA_EQUATIONS, FHA_RESULTS
+    )
 
 
 def set_user_defined_floats(fha: Dict[str, Any], floats: List[float]) -> Dict[str, Any]:
@@ -2,7 +2,7 @@
 """The MIL-HDBK-217F Analyses Package."""
 
 # RAMSTK Local Imports
-from . import milhdbk217f
+from . import batch, milhdbk217f, montecarlo, tables
 from .models import (
     capacitor,
     connection,
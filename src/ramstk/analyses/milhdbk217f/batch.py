@@ -0,0 +1,592 @@
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.batch.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Batch (Whole Bill of Materials) Calculations Module."""
+
+# Standard Library Imports
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import milhdbk217f, tables
+from .models import capacitor, resistor
+
+# These are the attributes the MIL-HDBK-217F models read.  Each part in a batch
+# is one row in a structured array with this dtype.
+PART_DTYPE = np.dtype(
+    [
+        ("hardware_id", "i8"),
+        ("category_id", "i8"),
+        ("subcategory_id", "i8"),
+        ("hazard_rate_method_id", "i8"),
+        ("hazard_rate_active", "f8"),
+        ("application_id", "i8"),
+        ("area", "f8"),
+        ("capacitance", "f8"),
+        ("configuration_id", "i8"),
+        ("construction_id", "i8"),
+        ("contact_form_id", "i8"),
+        ("contact_gauge", "i8"),
+        ("contact_rating_id", "i8"),
+        ("current_operating", "f8"),
+        ("current_rated", "f8"),
+        ("current_ratio", "f8"),
+        ("duty_cycle", "f8"),
+        ("environment_active_id", "i8"),
+        ("family_id", "i8"),
+        ("feature_size", "f8"),
+        ("frequency_operating", "f8"),
+        ("insert_id", "i8"),
+        ("insulation_id", "i8"),
+        ("lambda_b", "f8"),
+        ("manufacturing_id", "i8"),
+        ("matching_id", "i8"),
+        ("n_active_pins", "i8"),
+        ("n_circuit_planes", "i8"),
+        ("n_cycles", "i8"),
+        ("n_elements", "i8"),
+        ("n_hand_soldered", "i8"),
+        ("n_wave_soldered", "i8"),
+        ("package_id", "i8"),
+        ("page_number", "O"),
+        ("power_operating", "f8"),
+        ("power_rated", "f8"),
+        ("power_ratio", "f8"),
+        ("quality_id", "i8"),
+        ("resistance", "f8"),
+        ("specification_id", "i8"),
+        ("technology_id", "i8"),
+        ("temperature_active", "f8"),
+        ("temperature_case", "f8"),
+        ("temperature_hot_spot", "f8"),
+        ("temperature_junction", "f8"),
+        ("temperature_rated_max", "f8"),
+        ("temperature_rise", "f8"),
+        ("theta_jc", "f8"),
+        ("type_id", "i8"),
+        ("voltage_ac_operating", "f8"),
+        ("voltage_dc_operating", "f8"),
+        ("voltage_esd", "f8"),
+        ("voltage_rated", "f8"),
+        ("voltage_ratio", "f8"),
+        ("weight", "f8"),
+        ("years_in_production", "i8"),
+        ("lambdaBD", "f8"),
+        ("lambdaBP", "f8"),
+        ("lambdaEOS", "f8"),
+        ("C1", "f8"),
+        ("C2", "f8"),
+        ("piA", "f8"),
+        ("piC", "f8"),
+        ("piCD", "f8"),
+        ("piCF", "f8"),
+        ("piCV", "f8"),
+        ("piCYC", "f8"),
+        ("piE", "f8"),
+        ("piF", "f8"),
+        ("piI", "f8"),
+        ("piK", "f8"),
+        ("piL", "f8"),
+        ("piM", "f8"),
+        ("piMFG", "f8"),
+        ("piP", "f8"),
+        ("piPT", "f8"),
+        ("piQ", "f8"),
+        ("piR", "f8"),
+        ("piS", "f8"),
+        ("piT", "f8"),
+        ("piTAPS", "f8"),
+        ("piU", "f8"),
+        ("piV", "f8"),
+    ]
+)
+
+# The parts count hazard rate is a function of these attributes only, so it is
+# calculated once for each unique combination of them.
+PART_COUNT_KEYS = [
+    "category_id",
+    "subcategory_id",
+    "environment_active_id",
+    "quality_id",
+    "specification_id",
+    "type_id",
+    "family_id",
+    "technology_id",
+    "n_elements",
+    "application_id",
+    "construction_id",
+]
+
+_ERRORS = (
+    ArithmeticError,
+    IndexError,
+    KeyError,
+    TypeError,
+    UnboundLocalError,
+    ValueError,
+)
+
+
+def do_make_parts_array(columns: Dict[str, Sequence[Any]], n_parts: int) -> np.ndarray:
+    """Build the structured array of parts used by the batch calculations.
+
+    :param columns: the dict of attribute values for the parts; the key is the
+        attribute name and the value is the sequence of values for each part.
+        Keys that are not part of PART_DTYPE are ignored.
+    :param n_parts: the number of parts (rows) in the array.
+    :return: _parts; the structured array of parts.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _parts = np.zeros(n_parts, dtype=PART_DTYPE)
+    _parts["page_number"] = ""
+
+    for _field, _values in columns.items():
+        if _field in PART_DTYPE.names:
+            _parts[_field] = _values
+
+    return _parts
+
+
+def do_predict_active_hazard_rate(parts: np.ndarray) -> np.ndarray:
+    """Calculate the active hazard rate for every part in a batch.
+
+    Parts are grouped by category and subcategory and each group is calculated
+    with array operations.  Categories without an array implementation of the
+    part stress model are calculated one part at a time with the same model
+    functions used by milhdbk217f.do_predict_active_hazard_rate().
+
+    .. important:: unlike the single part calculation, this function does not
+        raise or broadcast errors.  The hazard rate for any part that can't be
+        calculated is returned as numpy.nan and the caller is responsible for
+        handling these parts.
+
+    :param parts: the structured array (PART_DTYPE) of parts to calculate.
+    :return: _hazard_rate; the active hazard rate for each part.  Parts with a
+        hazard rate method other than parts count or parts stress are returned
+        with their current active hazard rate.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _hazard_rate = np.array(parts["hazard_rate_active"], dtype=float)
+    _part_count = np.flatnonzero(parts["hazard_rate_method_id"] == 1)
+    _part_stress = np.flatnonzero(parts["hazard_rate_method_id"] == 2)
+
+    with np.errstate(all="ignore"):
+        _hazard_rate[_part_count] = _do_calculate_part_count(parts[_part_count])
+        _hazard_rate[_part_stress] = _do_calculate_part_stress(parts[_part_stress])
+
+    _hazard_rate[~np.isfinite(_hazard_rate)] = np.nan
+
+    return _hazard_rate
+
+
+def _do_calculate_part_count(parts: np.ndarray) -> np.ndarray:
+    """Calculate the MIL-HDBK-217F parts count active hazard rates.
+
+    The base hazard rate and quality factor of categories with compiled
+    parts count tables are looked up for all the parts at once.  The other
+    categories are calculated once for each unique combination of
+    PART_COUNT_KEYS.
+
+    :param parts: the structured array of parts to calculate.
+    :return: the parts count active hazard rate for each part.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _hazard_rate = np.full(parts.size, np.nan)
+    _compiled = np.isin(parts["category_id"], list(tables.PART_COUNT_TYPE_KEYS))
+
+    _hazard_rate[_compiled] = tables.PART_COUNT_LAMBDA_B.lookup(
+        parts["category_id"][_compiled],
+        parts["subcategory_id"][_compiled],
+        _do_get_part_count_type_id(parts[_compiled]),
+        parts["environment_active_id"][_compiled],
+    ) * tables.PART_COUNT_PI_Q.lookup(
+        parts["category_id"][_compiled],
+        parts["subcategory_id"][_compiled],
+        parts["quality_id"][_compiled],
+    )
+
+    _others = parts[~_compiled]
+    if _others.size > 0:
+        _first, _inverse = _do_group(*[_others[_key] for _key in PART_COUNT_KEYS])
+
+        _values = np.empty(_first.size)
+        for _idx, _row in enumerate(_first):
+            try:
+                _values[_idx] = milhdbk217f.do_calculate_part_count(
+                    **_do_make_attributes(_others[_row])
+                )["hazard_rate_active"]
+            except _ERRORS:
+                _values[_idx] = np.nan
+        _hazard_rate[~_compiled] = _values[_inverse]
+
+    return _hazard_rate
+
+
+def _do_calculate_part_stress(parts: np.ndarray) -> np.ndarray:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rates.
+
+    :param parts: the structured array of parts to calculate.
+    :return: the parts stress active hazard rate for each part.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _kernels: Dict[int, Callable[[int, np.ndarray], np.ndarray]] = {
+        3: _do_calculate_resistor_part_stress,
+        4: _do_calculate_capacitor_part_stress,
+    }
+
+    _hazard_rate = np.full(parts.size, np.nan)
+    for _category_id in np.unique(parts["category_id"]):
+        _in_category = parts["category_id"] == _category_id
+        if _category_id not in _kernels:
+            _hazard_rate[_in_category] = [
+                _do_calculate_part_stress_scalar(_part) for _part in parts[_in_category]
+            ]
+            continue
+
+        for _subcategory_id in np.unique(parts["subcategory_id"][_in_category]):
+            _idx = np.flatnonzero(
+                _in_category & (parts["subcategory_id"] == _subcategory_id)
+            )
+            try:
+                _hazard_rate[_idx] = _kernels[_category_id](
+                    int(_subcategory_id), parts[_idx]
+                )
+            except _ERRORS:
+                _hazard_rate[_idx] = np.nan
+
+    return _hazard_rate
+
+
+def _do_calculate_part_stress_scalar(part: np.void) -> float:
+    """Calculate the parts stress active hazard rate for a single part.
+
+    :param part: the row of the parts structured array to calculate.
+    :return: the parts stress active hazard rate or numpy.nan on failure.
+    :rtype: float
+    """
+    try:
+        return milhdbk217f.do_calculate_part_stress(**_do_make_attributes(part))[
+            "hazard_rate_active"
+        ]
+    except _ERRORS:
+        return np.nan
+
+
+def _do_calculate_capacitor_part_stress(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray:
+    """Calculate the parts stress active hazard rate for capacitors.
+
+    :param subcategory_id: the capacitor subcategory ID of all the parts.
+    :param parts: the structured array of capacitors to calculate.
+    :return: _hazard_rate; the active hazard rate for each capacitor.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _pi_e, _pi_q = _do_get_stress_factors(parts)
+
+    _f0, _f1 = capacitor.PI_CV_FACTORS[subcategory_id]
+    _pi_cv = _f0 * parts["capacitance"] ** _f1
+
+    _hazard_rate = (
+        _do_calculate_capacitor_lambda_b(subcategory_id, parts) * _pi_q * _pi_e * _pi_cv
+    )
+    if subcategory_id == 12:
+        _hazard_rate = _hazard_rate * _do_calculate_series_resistance_factor(parts)
+    elif subcategory_id == 13:
+        _hazard_rate = _hazard_rate * _do_lookup(
+            capacitor.get_construction_factor, parts["construction_id"]
+        )
+    elif subcategory_id == 19:
+        _hazard_rate = (
+            _hazard_rate
+            * _do_lookup(capacitor.get_configuration_factor, parts["configuration_id"])
+            / _pi_cv
+        )
+
+    return _hazard_rate
+
+
+def _do_calculate_capacitor_lambda_b(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray:
+    """Calculate the parts stress base hazard rate (lambdaB) for capacitors.
+
+    :param subcategory_id: the capacitor subcategory ID of all the parts.
+    :param parts: the structured array of capacitors to calculate.
+    :return: the base hazard rate for each capacitor.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _temperatures = np.array(list(capacitor.REF_TEMPS.keys()))
+    _ref_temps = np.array(list(capacitor.REF_TEMPS.values()))
+    _ref_temp = _ref_temps[
+        np.argmin(
+            np.abs(_temperatures[None, :] - parts["temperature_rated_max"][:, None]),
+            axis=1,
+        )
+    ]
+    _f0, _f1, _f2, _f3, _f4 = capacitor.LAMBDA_B_FACTORS[subcategory_id]
+
+    return (
+        _f0
+        * ((parts["voltage_ratio"] / _f1) ** _f2 + 1.0)
+        * np.exp(_f3 * ((parts["temperature_active"] + 273.0) / _ref_temp) ** _f4)
+    )
+
+
+def _do_calculate_series_resistance_factor(parts: np.ndarray) -> np.ndarray:
+    """Calculate the series resistance factor (piSR) for tantalum capacitors.
+
+    :param parts: the structured array of capacitors to calculate.
+    :return: _pi_sr; the series resistance factor for each capacitor or
+        numpy.nan for capacitors without an operating voltage.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _voltage = parts["voltage_dc_operating"] + parts["voltage_ac_operating"]
+    _ckt_resistance = parts["resistance"] / _voltage
+    _pi_sr = np.select(
+        [
+            (_ckt_resistance > 0.0) & (_ckt_resistance <= 0.1),
+            (_ckt_resistance > 0.1) & (_ckt_resistance <= 0.2),
+            (_ckt_resistance > 0.2) & (_ckt_resistance <= 0.4),
+            (_ckt_resistance > 0.4) & (_ckt_resistance <= 0.6),
+            (_ckt_resistance > 0.6) & (_ckt_resistance <= 0.8),
+        ],
+        [0.33, 0.27, 0.2, 0.13, 0.1],
+        default=0.066,
+    )
+    _pi_sr[_voltage == 0.0] = np.nan
+
+    return _pi_sr
+
+
+def _do_calculate_resistor_part_stress(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray:
+    """Calculate the parts stress active hazard rate for resistors.
+
+    :param subcategory_id: the resistor subcategory ID of all the parts.
+    :param parts: the structured array of resistors to calculate.
+    :return: _hazard_rate; the active hazard rate for each resistor.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _pi_e, _pi_q = _do_get_stress_factors(parts)
+
+    _hazard_rate = (
+        _do_calculate_resistor_lambda_b(subcategory_id, parts) * _pi_q * _pi_e
+    )
+    if subcategory_id == 4:
+        _temperature_case = parts["temperature_active"] + 55.0 * parts["power_ratio"]
+        _pi_t = np.exp(-4056.0 * ((1.0 / (_temperature_case + 273.0)) - 1.0 / 298.0))
+        return _hazard_rate * _pi_t * parts["n_elements"]
+    if subcategory_id == 8:
+        return _hazard_rate
+
+    _pi_r = _do_get_resistance_factor(subcategory_id, parts)
+    if subcategory_id not in resistor.PI_V_BREAKPOINTS:
+        return _hazard_rate * _pi_r
+
+    _index = _do_get_breakpoint_index(
+        parts["voltage_ratio"], resistor.PI_V_BREAKPOINTS[subcategory_id]
+    )
+    _pi_v = tables.PI_V.lookup(3, subcategory_id, _index)
+    _pi_taps = (parts["n_elements"] ** 1.5 / 25.0) + 0.792
+
+    if subcategory_id in [10, 12]:
+        _pi_c = _do_lookup(
+            lambda construction_id: resistor.PI_C[subcategory_id][construction_id - 1],
+            parts["construction_id"],
+        )
+        return _hazard_rate * _pi_taps * _pi_c * _pi_r * _pi_v
+
+    return _hazard_rate * _pi_taps * _pi_r * _pi_v
+
+
+def _do_calculate_resistor_lambda_b(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray:
+    """Calculate the parts stress base hazard rate (lambdaB) for resistors.
+
+    :param subcategory_id: the resistor subcategory ID of all the parts.
+    :param parts: the structured array of resistors to calculate.
+    :return: the base hazard rate for each resistor.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    if subcategory_id == 4:
+        return np.full(parts.size, 0.00006)
+    if subcategory_id == 8:
+        return _do_lookup(
+            lambda type_id: resistor.LAMBDA_B_FACTORS[8][type_id - 1],
+            parts["type_id"],
+        )
+
+    if subcategory_id == 2:
+        _ref_temp = _do_lookup(
+            lambda spec_id: resistor.REF_TEMPS_FILM[spec_id],
+            parts["specification_id"],
+        )
+        _f0, _f1, _f2, _f3, _f4, _f5 = [
+            _do_lookup(
+                lambda spec_id, i=_i: resistor.LAMBDA_B_FACTORS_FILM[spec_id][i],
+                parts["specification_id"],
+            )
+            for _i in range(6)
+        ]
+    else:
+        _ref_temp = resistor.REF_TEMPS[subcategory_id]
+        _f0, _f1, _f2, _f3, _f4, _f5 = resistor.LAMBDA_B_FACTORS[subcategory_id]
+    _temperature = parts["temperature_active"] + 273.0
+
+    return (
+        _f0
+        * np.exp(_f1 * (_temperature / _ref_temp)) ** _f2
+        * np.exp(((parts["power_ratio"] / _f3) * (_temperature / 273.0) ** _f4) ** _f5)
+    )
+
+
+def _do_get_breakpoint_index(values: np.ndarray, breaks: Sequence[float]) -> np.ndarray:
+    """Find the index of the first breakpoint greater than or equal to value.
+
+    Values greater than the last breakpoint are assigned the index of the last
+    breakpoint.  This is the same search the scalar models use.
+
+    :param values: the array of values to locate.
+    :param breaks: the ascending list of breakpoints.
+    :return: the breakpoint index for each value.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.minimum(np.searchsorted(breaks, values, side="left"), len(breaks) - 1)
+
+
+def _do_get_part_count_type_id(parts: np.ndarray) -> np.ndarray:
+    """Select the attribute that keys each part's parts count base hazard rate.
+
+    :param parts: the structured array of parts.
+    :return: _type_id; the value of each part's PART_COUNT_TYPE_KEYS
+        attribute or zero for parts without one.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _type_id = np.zeros(parts.size, dtype=int)
+    for _category_id, _keys in tables.PART_COUNT_TYPE_KEYS.items():
+        _in_category = parts["category_id"] == _category_id
+        if isinstance(_keys, str):
+            _type_id[_in_category] = parts[_keys][_in_category]
+            continue
+
+        for _subcategory_id, _key in _keys.items():
+            _idx = _in_category & (parts["subcategory_id"] == _subcategory_id)
+            _type_id[_idx] = parts[_key][_idx]
+
+    return _type_id
+
+
+def _do_get_resistance_factor(subcategory_id: int, parts: np.ndarray) -> np.ndarray:
+    """Retrieve the resistance factor (piR) for resistors.
+
+    :param subcategory_id: the resistor subcategory ID of all the parts.
+    :param parts: the structured array of resistors.
+    :return: _pi_r; the resistance factor for each resistor.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _unknown = np.zeros(parts.size, dtype=bool)
+    if subcategory_id == 6:
+        _index = np.zeros(parts.size, dtype=int)
+        for _spec_id in np.unique(parts["specification_id"]):
+            _in_spec = parts["specification_id"] == _spec_id
+            try:
+                _index[_in_spec] = _do_get_breakpoint_index(
+                    parts["resistance"][_in_spec],
+                    resistor.PI_R_BREAKPOINTS[6][_spec_id - 1],
+                )
+            except IndexError:
+                _unknown[_in_spec] = True
+    else:
+        _index = _do_get_breakpoint_index(
+            parts["resistance"], resistor.PI_R_BREAKPOINTS[subcategory_id]
+        )
+
+    _pi_r = tables.PI_R.lookup(
+        3, subcategory_id, parts["specification_id"], parts["family_id"], _index
+    )
+    _pi_r[_unknown] = np.nan
+
+    return _pi_r
+
+
+def _do_get_stress_factors(parts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Retrieve the part stress environment (piE) and quality (piQ) factors.
+
+    :param parts: the structured array of parts, all in the same category.
+    :return: (_pi_e, _pi_q); the environment and quality factor for each part.
+    :rtype: tuple
+    """
+    _pi_e = tables.PI_E.lookup(
+        parts["category_id"],
+        parts["subcategory_id"],
+        parts["quality_id"],
+        parts["environment_active_id"],
+    )
+    _pi_q = tables.PART_STRESS_PI_Q.lookup(
+        parts["category_id"], parts["subcategory_id"], parts["quality_id"]
+    )
+
+    return _pi_e, _pi_q
+
+
+def _do_group(*keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the unique combinations of one or more key arrays.
+
+    :param keys: the arrays of keys; all the same length.
+    :return: (_first, _inverse); the index of the first occurrence of each
+        unique combination and the index of each row's combination.
+    :rtype: tuple
+    """
+    _, _first, _inverse = np.unique(
+        np.column_stack(keys), axis=0, return_index=True, return_inverse=True
+    )
+
+    return _first, _inverse.ravel()
+
+
+def _do_lookup(func: Callable[..., float], *keys: np.ndarray) -> np.ndarray:
+    """Evaluate a scalar lookup once for each unique combination of keys.
+
+    :param func: the scalar function to evaluate; it is passed one positional
+        argument for each key array.
+    :param keys: the arrays of keys; all the same length.
+    :return: _values; the result of func for each row or numpy.nan if func
+        raised an error for that row's keys.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if keys[0].size == 0:
+        return np.empty(0)
+
+    _first, _inverse = _do_group(*keys)
+
+    _values = np.empty(_first.size)
+    for _idx, _row in enumerate(_first):
+        try:
+            _values[_idx] = func(*[_key[_row].item() for _key in keys])
+        except _ERRORS:
+            _values[_idx] = np.nan
+
+    return _values[_inverse]
+
+
+def _do_make_attributes(part: np.void) -> Dict[str, Any]:
+    """Convert a row of the parts structured array to an attributes dict.
+
+    :param part: the row of the parts structured array.
+    :return: the attributes dict for the part with Python scalar values.
+    :rtype: dict
+    """
+    return dict(zip(PART_DTYPE.names, part.tolist()))
@@ -0,0 +1,44 @@
+# Standard Library Imports
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import milhdbk217f as milhdbk217f
+from . import tables as tables
+from .models import capacitor as capacitor
+from .models import resistor as resistor
+
+PART_DTYPE: np.dtype
+PART_COUNT_KEYS: List[str]
+
+def do_make_parts_array(
+    columns: Dict[str, Sequence[Any]], n_parts: int
+) -> np.ndarray: ...
+def do_predict_active_hazard_rate(parts: np.ndarray) -> np.ndarray: ...
+def _do_calculate_part_count(parts: np.ndarray) -> np.ndarray: ...
+def _do_calculate_part_stress(parts: np.ndarray) -> np.ndarray: ...
+def _do_calculate_part_stress_scalar(part: np.void) -> float: ...
+def _do_calculate_capacitor_part_stress(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray: ...
+def _do_calculate_capacitor_lambda_b(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray: ...
+def _do_calculate_series_resistance_factor(parts: np.ndarray) -> np.ndarray: ...
+def _do_calculate_resistor_part_stress(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray: ...
+def _do_calculate_resistor_lambda_b(
+    subcategory_id: int, parts: np.ndarray
+) -> np.ndarray: ...
+def _do_get_breakpoint_index(
+    values: np.ndarray, breaks: Sequence[float]
+) -> np.ndarray: ...
+def _do_get_part_count_type_id(parts: np.ndarray) -> np.ndarray: ...
+def _do_get_resistance_factor(subcategory_id: int, parts: np.ndarray) -> np.ndarray: ...
+def _do_get_stress_factors(parts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: ...
+def _do_group(*keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: ...
+def _do_lookup(func: Callable[..., float], *keys: np.ndarray) -> np.ndarray: ...
+def _do_make_attributes(part: np.void) -> Dict[str, Any]: ...
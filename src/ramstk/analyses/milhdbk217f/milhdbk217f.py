@@ -29,6 +29,42 @@ from .models import (
     semiconductor,
     switch,
 )
+from .tables import PART_COUNT_PI_Q, PART_STRESS_PI_Q, PI_E
+
+_PART_COUNT_FUNCTIONS: Dict[int, Any] = {
+    1: integratedcircuit.calculate_part_count,
+    2: semiconductor.calculate_part_count,
+    3: resistor.calculate_part_count,
+    4: capacitor.calculate_part_count,
+    5: inductor.calculate_part_count,
+    6: relay.calculate_part_count,
+    7: switch.calculate_part_count,
+    8: connection.calculate_part_count,
+    9: meter.calculate_part_count,
+    10: {
+        1: crystal.calculate_part_count,
+        2: efilter.calculate_part_count,
+        3: fuse.calculate_part_count,
+        4: lamp.calculate_part_count,
+    },
+}
+_PART_STRESS_FUNCTIONS: Dict[int, Any] = {
+    1: integratedcircuit.calculate_part_stress,
+    2: semiconductor.calculate_part_stress,
+    3: resistor.calculate_part_stress,
+    4: capacitor.calculate_part_stress,
+    5: inductor.calculate_part_stress,
+    6: relay.calculate_part_stress,
+    7: switch.calculate_part_stress,
+    8: connection.calculate_part_stress,
+    9: meter.calculate_part_stress,
+    10: {
+        1: crystal.calculate_part_stress,
+        2: efilter.calculate_part_stress,
+        3: fuse.calculate_part_stress,
+        4: lamp.calculate_part_stress,
+    },
+}
 
 
 # noinspection PyTypeChecker
@@ -107,6 +143,40 @@ def do_predict_active_hazard_rate(**attributes: Dict[str, Any]) -> float:
     return attributes["hazard_rate_active"]
 
 
+def do_calculate_part_count(**attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate the MIL-HDBK-217F parts count active hazard rate.
+
+    Unlike do_predict_active_hazard_rate(), this doesn't broadcast the result
+    or handle any exceptions.  It is used by the batch calculations for the
+    parts they don't calculate with array operations.
+
+    :param attributes: the attributes dict for the component being
+        calculated.
+    :return: attributes; the attributes dict with updated values.
+    :rtype: dict
+    :raise: IndexError if there is no entry for the active environment ID.
+    :raise: KeyError if there is no entry for category ID or subcategory ID.
+    """
+    return _do_calculate_part_count(**attributes)
+
+
+def do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rate.
+
+    Unlike do_predict_active_hazard_rate(), this doesn't broadcast the result
+    or handle any exceptions.  It is used by the batch calculations for the
+    parts they don't calculate with array operations.
+
+    :param attributes: the attributes dict for the component being
+        calculated.
+    :return: attributes; the attributes dict with updated values.
+    :rtype: dict
+    :raise: IndexError if there is no entry for the active environment ID.
+    :raise: KeyError if there is no entry for category ID or subcategory ID.
+    """
+    return _do_calculate_part_stress(**attributes)
+
+
 # noinspection PyTypeChecker
 def _do_calculate_part_count(**attributes: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate the MIL-HDBK-217F parts count active hazard rate.
@@ -118,32 +188,16 @@ def _do_calculate_part_count(**attributes: Dict[str, Any]) -> Dict[str, Any]:
     :raise: IndexError if there is no entry for the active environment ID.
     :raise: KeyError if there is no entry for category ID or subcategory ID.
     """
-    _part_count = {
-        1: integratedcircuit.calculate_part_count,
-        2: semiconductor.calculate_part_count,
-        3: resistor.calculate_part_count,
-        4: capacitor.calculate_part_count,
-        5: inductor.calculate_part_count,
-        6: relay.calculate_part_count,
-        7: switch.calculate_part_count,
-        8: connection.calculate_part_count,
-        9: meter.calculate_part_count,
-        10: {
-            1: crystal.calculate_part_count,
-            2: efilter.calculate_part_count,
-            3: fuse.calculate_part_count,
-            4: lamp.calculate_part_count,
-        },
-    }
-
     if attributes["category_id"] == 2:
-        attributes = _part_count[attributes["category_id"]](**attributes)
+        attributes = _PART_COUNT_FUNCTIONS[attributes["category_id"]](**attributes)
     elif attributes["category_id"] == 10:
-        attributes["lambda_b"] = _part_count[attributes["category_id"]][
+        attributes["lambda_b"] = _PART_COUNT_FUNCTIONS[attributes["category_id"]][
             attributes["subcategory_id"]
         ](**attributes)
     else:
-        attributes["lambda_b"] = _part_count[attributes["category_id"]](**attributes)
+        attributes["lambda_b"] = _PART_COUNT_FUNCTIONS[attributes["category_id"]](
+            **attributes
+        )
 
     if attributes["category_id"] != 2:
         attributes["piQ"] = _get_part_count_quality_factor(
@@ -170,24 +224,6 @@ def _do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]:
     :raise: IndexError if there is no entry for the active environment ID.
     :raise: KeyError if there is no entry for category ID or subcategory ID.
     """
-    _functions = {
-        1: integratedcircuit.calculate_part_stress,
-        2: semiconductor.calculate_part_stress,
-        3: resistor.calculate_part_stress,
-        4: capacitor.calculate_part_stress,
-        5: inductor.calculate_part_stress,
-        6: relay.calculate_part_stress,
-        7: switch.calculate_part_stress,
-        8: connection.calculate_part_stress,
-        9: meter.calculate_part_stress,
-        10: {
-            1: crystal.calculate_part_stress,
-            2: efilter.calculate_part_stress,
-            3: fuse.calculate_part_stress,
-            4: lamp.calculate_part_stress,
-        },
-    }
-
     if attributes["category_id"] != 6:
         attributes["piE"] = _get_environment_factor(
             attributes["category_id"],
@@ -204,11 +240,11 @@ def _do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]:
         )
 
     if attributes["category_id"] == 10:
-        _part_stress = _functions[attributes["category_id"]][
+        _part_stress = _PART_STRESS_FUNCTIONS[attributes["category_id"]][
             attributes["subcategory_id"]
         ]
     else:
-        _part_stress = _functions[attributes["category_id"]]
+        _part_stress = _PART_STRESS_FUNCTIONS[attributes["category_id"]]
 
     return _part_stress(**attributes)
 
@@ -222,44 +258,22 @@ def _get_environment_factor(
     """Retrieve the MIL-HDBK-217F environment factor (piE) for the component.
 
     Most component types have a single list of piE factors, but some require
-    additional indices to select the correct list of factors.
+    additional indices to select the correct list of factors.  The factor is
+    looked up in the compiled tables.PI_E table.
 
     :param category_id: the category ID of the component.
     :param environment_active_id: the active environment ID for the
         component.
     :keyword int subcategory_id: the subcategory ID of the component.
     :keyword int quality_id: the quality level ID of the component.
-    :return: _pi_e; the selected piE value.
+    :return: the selected piE value.
     :rtype: float
     :raise: IndexError if there is no list entry for the passed active
         environment ID.
     :raise: KeyError if there is no piE list for the passed category ID (or
         subcategory ID, quality ID when appllicable).
     """
-    _pi_e_lists = {
-        1: integratedcircuit.PI_E,
-        2: semiconductor.PI_E,
-        3: resistor.PI_E,
-        4: capacitor.PI_E,
-        5: inductor.PI_E,
-        7: switch.PI_E,
-        8: connection.PI_E,
-        9: meter.PI_E,
-        10: {1: crystal.PI_E, 2: efilter.PI_E, 3: fuse.PI_E, 4: lamp.PI_E},
-    }
-
-    if category_id == 8 and subcategory_id in [1, 2]:
-        _pi_e = _pi_e_lists[category_id][subcategory_id][quality_id][
-            environment_active_id - 1
-        ]
-    elif category_id in [2, 3, 5, 7, 9, 10] or (
-        category_id == 8 and subcategory_id not in [1, 2]
-    ):
-        _pi_e = _pi_e_lists[category_id][subcategory_id][environment_active_id - 1]
-    else:
-        _pi_e = _pi_e_lists[category_id][environment_active_id - 1]
-
-    return _pi_e
+    return PI_E.get(category_id, subcategory_id, quality_id, environment_active_id)
 
 
 def _get_part_count_quality_factor(
@@ -276,34 +290,13 @@ def _get_part_count_quality_factor(
     :param category_id: the category ID of the component.
     :param subcategory_id: the subcategory ID of the component.
     :param quality_id: the quality level ID for the component.
-    :return: _pi_q; the selected piQ value.
+    :return: the selected piQ value.
     :rtype: float
     :raise: IndexError if there is no list entry for the passed active
         environment ID.
     :raise: KeyError if there is no piQ list for the passed category ID.
     """
-    _pi_q_lists = {
-        1: integratedcircuit.PI_Q,
-        3: resistor.PART_COUNT_PI_Q,
-        4: capacitor.PART_COUNT_PI_Q,
-        5: inductor.PART_COUNT_PI_Q,
-        6: relay.PART_COUNT_PI_Q,
-        7: switch.PART_COUNT_PI_Q,
-        8: connection.PART_COUNT_PI_Q,
-        9: meter.PART_COUNT_PI_Q,
-        10: {1: crystal.PART_COUNT_PI_Q, 2: efilter.PI_Q},
-    }
-
-    if category_id in [6, 7, 9]:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 10 and subcategory_id in [1, 2]:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 10 and subcategory_id in [3, 4]:
-        _pi_q = 1.0
-    else:
-        _pi_q = _pi_q_lists[category_id][quality_id - 1]
-
-    return _pi_q
+    return PART_COUNT_PI_Q.get(category_id, subcategory_id, quality_id)
 
 
 def _get_part_stress_quality_factor(
@@ -316,37 +309,9 @@ def _get_part_stress_quality_factor(
     :param category_id: the category ID of the component.
     :param subcategory_id: the subcategory ID of the component.
     :param quality_id: the quality level ID for the component.
-    :return: _pi_q; the selected piQ value.
+    :return: the selected piQ value.
     :rtype: float
     :raise: IndexError if there is no list entry for the passed quality ID.
     :raise: KeyError if there is no piQ list for the passed category ID.
     """
-    _pi_q_lists = {
-        1: integratedcircuit.PI_Q,
-        3: resistor.PART_STRESS_PI_Q,
-        4: capacitor.PART_STRESS_PI_Q,
-        6: relay.PART_STRESS_PI_Q,
-        7: switch.PART_STRESS_PI_Q,
-        8: connection.PART_STRESS_PI_Q,
-        9: meter.PART_STRESS_PI_Q,
-        10: {1: crystal.PART_STRESS_PI_Q, 2: efilter.PI_Q},
-    }
-
-    if category_id == 1:
-        _pi_q = _pi_q_lists[category_id][quality_id - 1]
-    elif (category_id == 8 and subcategory_id in [4, 5]) or (
-        category_id == 7 and subcategory_id == 5
-    ):
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 7 and subcategory_id != 5:
-        _pi_q = 0.0
-    elif category_id == 8 and subcategory_id not in [4, 5]:
-        _pi_q = 0.0
-    elif category_id == 9 and subcategory_id == 1:
-        _pi_q = 0.0
-    elif category_id == 10 and subcategory_id in [3, 4]:
-        _pi_q = 0.0
-    else:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-
-    return _pi_q
+    return PART_STRESS_PI_Q.get(category_id, subcategory_id, quality_id)
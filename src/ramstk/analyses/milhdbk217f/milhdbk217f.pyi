@@ -15,8 +15,16 @@ from .models import relay as relay
 from .models import resistor as resistor
 from .models import semiconductor as semiconductor
 from .models import switch as switch
+from .tables import PART_COUNT_PI_Q as PART_COUNT_PI_Q
+from .tables import PART_STRESS_PI_Q as PART_STRESS_PI_Q
+from .tables import PI_E as PI_E
+
+_PART_COUNT_FUNCTIONS: Dict[int, Any]
+_PART_STRESS_FUNCTIONS: Dict[int, Any]
 
 def do_predict_active_hazard_rate(**attributes: Dict[str, Any]) -> float: ...
+def do_calculate_part_count(**attributes: Dict[str, Any]) -> Dict[str, Any]: ...
+def do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]: ...
 def _do_calculate_part_count(**attributes: Dict[str, Any]) -> Dict[str, Any]: ...
 def _do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]: ...
 def _get_environment_factor(
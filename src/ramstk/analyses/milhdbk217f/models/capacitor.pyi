@@ -1,11 +1,13 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+LAMBDA_B_FACTORS: Dict[int, List[float]]
 PART_COUNT_LAMBDA_B: Any
 PART_COUNT_PI_Q: Any
 PART_STRESS_PI_Q: Any
 PI_C: Any
 PI_CF: Any
+PI_CV_FACTORS: Dict[int, List[float]]
 PI_E: Any
 REF_TEMPS: Any
 
@@ -11,6 +11,27 @@
 from math import exp
 from typing import Any, Dict, List
 
+LAMBDA_B_FACTORS: Dict[int, List[float]] = {
+    1: [4.5e-9, 12.0, 1.0, 0.6, 1.0, 1.0],
+    3: [7.33e-3, 0.202, 2.6, 1.45, 0.89, 1.3],
+    5: [0.0031, 1.0, 10.0, 1.0, 1.0, 1.5],
+    6: [0.00148, 1.0, 2.0, 0.5, 1.0, 1.0],
+    7: [0.00015, 2.64, 1.0, 0.466, 1.0, 1.0],
+    8: [0.021, 0.065, 0.105, 0.0, 0.0, 0.0],
+    9: [0.0062, 1.0, 5.0, 1.0, 1.0, 1.0],
+    10: [0.0735, 1.03, 4.45, 2.74, 3.51, 1.0],
+    11: [0.0398, 0.514, 5.28, 1.44, 4.46, 1.0],
+    12: [0.0481, 0.334, 4.66, 1.47, 2.83, 1.0],
+    13: [0.019, 0.445, 7.3, 2.69, 2.46, 1.0],
+    14: [0.0246, 0.459, 9.3, 2.32, 5.3, 1.0],
+    15: [0.018, 1.0, 7.4, 2.55, 3.6, 1.0],
+}
+LAMBDA_B_FACTORS_FILM: Dict[int, List[float]] = {
+    1: [3.25e-4, 1.0, 3.0, 1.0, 1.0, 1.0],
+    2: [3.25e-4, 1.0, 3.0, 1.0, 1.0, 1.0],
+    3: [5.0e-5, 3.5, 1.0, 1.0, 1.0, 1.0],
+    4: [5.0e-5, 3.5, 1.0, 1.0, 1.0, 1.0],
+}
 PART_COUNT_LAMBDA_B = {
     1: [
         0.0005,
@@ -437,6 +458,24 @@ PI_R = {
     14: [1.0, 1.1, 1.2, 1.4, 1.8],
     15: [1.0, 1.1, 1.2, 1.4, 1.8],
 }
+PI_R_BREAKPOINTS: Dict[int, Any] = {
+    1: [1.0e5, 1.0e6, 1.0e7],
+    2: [1.0e5, 1.0e6, 1.0e7],
+    3: [100.0, 1.0e5, 1.0e6],
+    5: [1.0e4, 1.0e5, 1.0e6],
+    6: [
+        [500.0, 1.0e3, 5.0e3, 7.5e3, 1.0e4, 1.5e4, 2.0e4],
+        [100.0, 1.0e3, 1.0e4, 1.0e5, 1.5e5, 2.0e5],
+    ],
+    7: [500.0, 1.0e3, 5.0e3, 1.0e4, 2.0e4],
+    9: [2.0e3, 5.0e3],
+    10: [1.0e4, 2.0e4, 5.0e4, 1.0e5, 2.0e5],
+    11: [2.0e3, 5.0e3],
+    12: [2.0e3, 5.0e3],
+    13: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
+    14: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
+    15: [1.0e4, 5.0e4, 2.0e5, 1.0e6],
+}
 PI_V = {
     9: [1.1, 1.05, 1.0, 1.1, 1.22, 1.4, 2.0],
     10: [1.1, 1.05, 1.0, 1.1, 1.22, 1.4, 2.0],
@@ -446,6 +485,15 @@ PI_V = {
     14: [1.0, 1.05, 1.2],
     15: [1.0, 1.05, 1.2],
 }
+PI_V_BREAKPOINTS: Dict[int, List[float]] = {
+    9: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    10: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    11: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    12: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    13: [0.8, 0.9],
+    14: [0.8, 0.9],
+    15: [0.8, 0.9],
+}
 REF_TEMPS: Dict[int, float] = {
     1: 343.0,
     3: 298.0,
@@ -545,49 +593,27 @@ def calculate_part_stress_lambda_b(attributes: Dict[str, Any]) -> Dict[str, Any]
     _temperature_active: Any = attributes["temperature_active"]
     _power_ratio: Any = attributes["power_ratio"]
 
-    _dic_factors: Dict[int, List[float]] = {
-        1: [4.5e-9, 12.0, 1.0, 0.6, 1.0, 1.0],
-        3: [7.33e-3, 0.202, 2.6, 1.45, 0.89, 1.3],
-        5: [0.0031, 1.0, 10.0, 1.0, 1.0, 1.5],
-        6: [0.00148, 1.0, 2.0, 0.5, 1.0, 1.0],
-        7: [0.00015, 2.64, 1.0, 0.466, 1.0, 1.0],
-        8: [0.021, 0.065, 0.105, 0.0, 0.0, 0.0],
-        9: [0.0062, 1.0, 5.0, 1.0, 1.0, 1.0],
-        10: [0.0735, 1.03, 4.45, 2.74, 3.51, 1.0],
-        11: [0.0398, 0.514, 5.28, 1.44, 4.46, 1.0],
-        12: [0.0481, 0.334, 4.66, 1.47, 2.83, 1.0],
-        13: [0.019, 0.445, 7.3, 2.69, 2.46, 1.0],
-        14: [0.0246, 0.459, 9.3, 2.32, 5.3, 1.0],
-        15: [0.018, 1.0, 7.4, 2.55, 3.6, 1.0],
-    }
-    _dic_factors_film: Dict[int, List[float]] = {
-        1: [3.25e-4, 1.0, 3.0, 1.0, 1.0, 1.0],
-        2: [3.25e-4, 1.0, 3.0, 1.0, 1.0, 1.0],
-        3: [5.0e-5, 3.5, 1.0, 1.0, 1.0, 1.0],
-        4: [5.0e-5, 3.5, 1.0, 1.0, 1.0, 1.0],
-    }
-
     if _subcategory_id == 2:
         _ref_temp = REF_TEMPS_FILM[_specification_id]
-        _f0 = _dic_factors_film[_specification_id][0]
-        _f1 = _dic_factors_film[_specification_id][1]
-        _f2 = _dic_factors_film[_specification_id][2]
-        _f3 = _dic_factors_film[_specification_id][3]
-        _f4 = _dic_factors_film[_specification_id][4]
-        _f5 = _dic_factors_film[_specification_id][5]
+        _f0 = LAMBDA_B_FACTORS_FILM[_specification_id][0]
+        _f1 = LAMBDA_B_FACTORS_FILM[_specification_id][1]
+        _f2 = LAMBDA_B_FACTORS_FILM[_specification_id][2]
+        _f3 = LAMBDA_B_FACTORS_FILM[_specification_id][3]
+        _f4 = LAMBDA_B_FACTORS_FILM[_specification_id][4]
+        _f5 = LAMBDA_B_FACTORS_FILM[_specification_id][5]
     elif _subcategory_id not in [4, 8]:
         _ref_temp = REF_TEMPS[_subcategory_id]
-        _f0 = _dic_factors[_subcategory_id][0]
-        _f1 = _dic_factors[_subcategory_id][1]
-        _f2 = _dic_factors[_subcategory_id][2]
-        _f3 = _dic_factors[_subcategory_id][3]
-        _f4 = _dic_factors[_subcategory_id][4]
-        _f5 = _dic_factors[_subcategory_id][5]
+        _f0 = LAMBDA_B_FACTORS[_subcategory_id][0]
+        _f1 = LAMBDA_B_FACTORS[_subcategory_id][1]
+        _f2 = LAMBDA_B_FACTORS[_subcategory_id][2]
+        _f3 = LAMBDA_B_FACTORS[_subcategory_id][3]
+        _f4 = LAMBDA_B_FACTORS[_subcategory_id][4]
+        _f5 = LAMBDA_B_FACTORS[_subcategory_id][5]
 
     if _subcategory_id == 4:
         _lambda_b = 0.00006
     elif _subcategory_id == 8:
-        _lambda_b = _dic_factors[_subcategory_id][_type_id - 1]
+        _lambda_b = LAMBDA_B_FACTORS[_subcategory_id][_type_id - 1]
     else:
         _lambda_b = (
             _f0
@@ -732,32 +758,14 @@ def get_resistance_factor(attributes: Dict[str, Any]) -> Dict[str, Any]:
     _family_id: Any = attributes["family_id"]
     _resistance: Any = attributes["resistance"]
 
-    _dic_breakpoints = {
-        1: [1.0e5, 1.0e6, 1.0e7],
-        2: [1.0e5, 1.0e6, 1.0e7],
-        3: [100.0, 1.0e5, 1.0e6],
-        5: [1.0e4, 1.0e5, 1.0e6],
-        6: [
-            [500.0, 1.0e3, 5.0e3, 7.5e3, 1.0e4, 1.5e4, 2.0e4],
-            [100.0, 1.0e3, 1.0e4, 1.0e5, 1.5e5, 2.0e5],
-        ],
-        7: [500.0, 1.0e3, 5.0e3, 1.0e4, 2.0e4],
-        9: [2.0e3, 5.0e3],
-        10: [1.0e4, 2.0e4, 5.0e4, 1.0e5, 2.0e5],
-        11: [2.0e3, 5.0e3],
-        12: [2.0e3, 5.0e3],
-        13: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
-        14: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
-        15: [1.0e4, 5.0e4, 2.0e5, 1.0e6],
-    }
     _pi_r = 0.0
 
     if _subcategory_id not in [4, 8]:
         _index = -1
         if _subcategory_id == 6:
-            _breaks = _dic_breakpoints[_subcategory_id][_specification_id - 1]
+            _breaks = PI_R_BREAKPOINTS[_subcategory_id][_specification_id - 1]
         else:
-            _breaks = _dic_breakpoints[_subcategory_id]
+            _breaks = PI_R_BREAKPOINTS[_subcategory_id]
 
         for _index, _value in enumerate(_breaks):
             _diff = _value - _resistance
@@ -796,11 +804,7 @@ def get_voltage_factor(attributes: Dict[str, Any]) -> Dict[str, Any]:
     _voltage_ratio: float = float(attributes["voltage_ratio"])
 
     _index = -1
-    _breaks = [0.0]
-    if _subcategory_id in [9, 10, 11, 12]:
-        _breaks = [0.1, 0.2, 0.6, 0.7, 0.8, 0.9]
-    elif _subcategory_id in [13, 14, 15]:
-        _breaks = [0.8, 0.9]
+    _breaks = PI_V_BREAKPOINTS.get(_subcategory_id, [0.0])
 
     for _index, _value in enumerate(_breaks):
         _diff = _value - _voltage_ratio
@@ -0,0 +1,362 @@
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.montecarlo.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Monte Carlo Uncertainty Propagation Module.
+
+The inputs to a hazard rate prediction are rarely known exactly.  The
+functions in this module sample the uncertain attributes of every part, predict
+the hazard rate of each sample with the batch calculations, and roll the
+samples up the hardware tree to estimate the distribution of each hardware
+item's hazard rate and mission reliability.
+"""
+
+# Standard Library Imports
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import batch
+
+# The samplers for each distribution.  Each is passed the random generator, the
+# nominal values of an attribute (samples x parts), and the distribution
+# parameters.  The normal, uniform, and triangular distributions are added to
+# the nominal value; the lognormal distribution multiplies it so the nominal
+# value is the median.
+SAMPLERS: Dict[str, Callable[..., np.ndarray]] = {
+    "lognormal": lambda rng, nominal, sigma: (
+        nominal * rng.lognormal(0.0, sigma, nominal.shape)
+    ),
+    "normal": lambda rng, nominal, sigma: (
+        nominal + rng.normal(0.0, sigma, nominal.shape)
+    ),
+    "triangular": lambda rng, nominal, left, mode, right: (
+        nominal + rng.triangular(left, mode, right, nominal.shape)
+    ),
+    "uniform": lambda rng, nominal, low, high: (
+        nominal + rng.uniform(low, high, nominal.shape)
+    ),
+}
+
+
+class SimulationBlock(NamedTuple):
+    """The inputs to simulate one block of samples.
+
+    parts is the structured array (PART_DTYPE) of hardware items, parents the
+    row index of each item's parent, quantity the quantity of each item, and
+    report the row indices of the items to return the samples of.
+    distributions is the distribution of each uncertain attribute, n_samples
+    the number of samples in the block, and seed the seed sequence for the
+    block's random generator.
+    """
+
+    parts: np.ndarray
+    parents: np.ndarray
+    quantity: np.ndarray
+    report: np.ndarray
+    distributions: Dict[str, Tuple[Any, ...]]
+    n_samples: int
+    seed: Any
+
+
+def do_sample_parts(
+    parts: np.ndarray,
+    distributions: Dict[str, Tuple[Any, ...]],
+    n_samples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Draw samples of the uncertain attributes of every part.
+
+    :param parts: the structured array (PART_DTYPE) of nominal parts.
+    :param distributions: the distribution of each uncertain attribute keyed
+        by attribute name.  The value is a tuple of the SAMPLERS name followed
+        by its parameters, for example ("normal", 5.0).  Parameters may be
+        scalars or arrays with one value per part.
+    :param n_samples: the number of samples to draw for each part.
+    :param rng: the random generator to draw the samples from.
+    :return: _samples; the structured array of sampled parts with one row per
+        sample and one column per part.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown distribution or an attribute that
+        isn't a real-valued PART_DTYPE field.
+    """
+    _samples = np.repeat(parts[np.newaxis, :], n_samples, axis=0)
+
+    for _field, (_name, *_parameters) in distributions.items():
+        if _field not in batch.PART_DTYPE.names or parts.dtype[_field].kind != "f":
+            raise KeyError(_field)
+
+        _samples[_field] = SAMPLERS[_name](rng, _samples[_field], *_parameters)
+
+    return _samples
+
+
+def do_propagate_uncertainty(
+    parts: np.ndarray,
+    parents: Sequence[int],
+    distributions: Dict[str, Tuple[Any, ...]],
+    n_samples: int,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Propagate the uncertainty in part attributes to every hardware item.
+
+    The samples are drawn and calculated in blocks of block_size.  Each block
+    is predicted with batch.do_predict_active_hazard_rate() and rolled up the
+    hardware tree one level at a time.  Only the running sums of every item
+    and the samples of the reported items are kept between blocks, so memory
+    is bounded by block_size times the number of items plus n_samples times
+    the number of reported items.
+
+    Each block draws from its own child of a SeedSequence created from seed,
+    so the results depend only on seed and block_size and not on the number
+    of worker processes.
+
+    The hazard rate of an item without children is its predicted hazard rate.
+    The hazard rate of an item with children is the sum of its children's
+    hazard rates.  Both are multiplied by the item's quantity.  Samples that
+    can't be calculated are numpy.nan and are left out of the statistics.
+
+    :param parts: the structured array (PART_DTYPE) with one row for each
+        hardware item in the tree.
+    :param parents: the row index of each item's parent; -1 for top-level
+        items.
+    :param distributions: the distribution of each uncertain attribute.  See
+        do_sample_parts().
+    :param n_samples: the total number of samples to draw.
+    :keyword block_size: the number of samples calculated at once.  Defaults
+        to 1000.
+    :keyword max_workers: the maximum number of worker processes.  Set to 1 to
+        calculate in the calling process.  Defaults to 1.
+    :keyword mission_time: the mission time of each item; a scalar or one
+        value per item.  Defaults to 1.0.
+    :keyword percentiles: the percentiles to report.  Defaults to 5, 50, and
+        95.
+    :keyword quantity: the quantity of each item.  Defaults to one.
+    :keyword report: the row indices of the items to report percentiles for.
+        Defaults to the top-level items.
+    :keyword seed: the seed for the random generators.  Defaults to 0.
+    :return: the statistics of the samples.  The mean and std keys hold the
+        mean and standard deviation of every item's hazard rate.  The
+        hazard_rate and reliability keys hold the percentiles (report x
+        percentiles) of the reported items.
+    :rtype: dict
+    :raise: KeyError if passed an unknown distribution or attribute.
+    """
+    _parents = np.asarray(parents, dtype=int)
+    _report = np.asarray(kwargs.get("report", np.flatnonzero(_parents < 0)), dtype=int)
+    _percentiles = list(kwargs.get("percentiles", [5.0, 50.0, 95.0]))
+    _mission_time = np.broadcast_to(
+        np.asarray(kwargs.get("mission_time", 1.0), dtype=float), _parents.shape
+    )
+
+    _count, _mean, _m2, _hazard_rates = _do_simulate_blocks(
+        SimulationBlock(
+            parts=parts,
+            parents=_parents,
+            quantity=np.broadcast_to(
+                np.asarray(kwargs.get("quantity", 1.0), dtype=float), _parents.shape
+            ),
+            report=_report,
+            distributions=distributions,
+            n_samples=n_samples,
+            seed=kwargs.get("seed", 0),
+        ),
+        kwargs.get("block_size", 1000),
+        kwargs.get("max_workers", 1),
+    )
+
+    _mean[_count == 0] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _std = np.sqrt(_m2 / _count)
+
+    return {
+        "n_samples": n_samples,
+        "n_invalid": int(np.isnan(_hazard_rates).any(axis=1).sum()),
+        "mean": _mean,
+        "std": _std,
+        "percentiles": _percentiles,
+        "report": _report,
+        "hazard_rate": _get_percentiles(_hazard_rates, _percentiles),
+        "reliability": _get_percentiles(
+            np.exp(-1.0 * _hazard_rates * _mission_time[_report]), _percentiles
+        ),
+    }
+
+
+def _do_merge_moments(
+    first: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    second: Tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge the running moments of two sets of samples.
+
+    :param first: the count, mean, and sum of squared deviations from the
+        mean of the first set of samples.
+    :param second: the count, mean, and sum of squared deviations from the
+        mean of the second set of samples.
+    :return: the count, mean, and sum of squared deviations from the mean of
+        the combined samples.
+    :rtype: tuple
+    """
+    _count = first[0] + second[0]
+    _weight = np.divide(second[0], _count, out=np.zeros(_count.size), where=_count > 0)
+    _delta = second[1] - first[1]
+
+    return (
+        _count,
+        first[1] + _delta * _weight,
+        first[2] + second[2] + _delta ** 2 * first[0] * _weight,
+    )
+
+
+def _do_roll_up(
+    hazard_rates: np.ndarray, parents: np.ndarray, quantity: np.ndarray
+) -> np.ndarray:
+    """Roll sampled hazard rates up the hardware tree.
+
+    :param hazard_rates: the sampled hazard rate of each item (samples x
+        items).  The values of items with children are ignored.
+    :param parents: the row index of each item's parent; -1 for top-level
+        items.
+    :param quantity: the quantity of each item.
+    :return: _totals; the rolled up hazard rate of each item.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _totals = np.where(np.isin(np.arange(parents.size), parents), 0.0, hazard_rates)
+
+    _depth = _get_depths(parents)
+    for _level in range(_depth.max(initial=0), -1, -1):
+        _rows = np.flatnonzero(_depth == _level)
+        _totals[:, _rows] *= quantity[_rows]
+        _children = _rows[parents[_rows] >= 0]
+        np.add.at(_totals, (slice(None), parents[_children]), _totals[:, _children])
+
+    return _totals
+
+
+def _do_simulate_block(
+    block: SimulationBlock,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sample, predict, and roll up one block of samples.
+
+    :param block: the inputs for the block.
+    :return: (_count, _mean, _m2, _samples); the number of valid samples, the
+        mean, and the sum of squared deviations from the mean of each item's
+        hazard rate and the samples of the reported items.
+    :rtype: tuple
+    """
+    _samples = do_sample_parts(
+        block.parts,
+        block.distributions,
+        block.n_samples,
+        np.random.default_rng(block.seed),
+    )
+    _hazard_rates = batch.do_predict_active_hazard_rate(_samples.ravel()).reshape(
+        _samples.shape
+    )
+    _totals = _do_roll_up(_hazard_rates, block.parents, block.quantity)
+
+    _valid = ~np.isnan(_totals)
+    _count = _valid.sum(axis=0)
+    _mean = np.divide(
+        np.where(_valid, _totals, 0.0).sum(axis=0),
+        _count,
+        out=np.zeros(_count.size),
+        where=_count > 0,
+    )
+
+    return (
+        _count,
+        _mean,
+        (np.where(_valid, _totals - _mean, 0.0) ** 2).sum(axis=0),
+        _totals[:, block.report],
+    )
+
+
+def _do_simulate_blocks(
+    simulation: SimulationBlock, block_size: int, max_workers: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split a simulation into blocks, simulate each, and merge the results.
+
+    Each block draws from its own child of a SeedSequence created from the
+    simulation's seed.
+
+    :param simulation: the inputs for the whole simulation.
+    :param block_size: the number of samples calculated at once.
+    :param max_workers: the maximum number of worker processes.  Set to 1 to
+        simulate in the calling process.
+    :return: (_count, _mean, _m2, _samples); the number of valid samples, the
+        mean, and the sum of squared deviations from the mean of each item's
+        hazard rate over all the blocks and the samples of the reported items.
+    :rtype: tuple
+    """
+    _sizes = [block_size] * (simulation.n_samples // block_size)
+    if simulation.n_samples % block_size:
+        _sizes.append(simulation.n_samples % block_size)
+    _blocks = [
+        simulation._replace(n_samples=_size, seed=_seed)
+        for _size, _seed in zip(
+            _sizes, np.random.SeedSequence(simulation.seed).spawn(len(_sizes))
+        )
+    ]
+
+    _executor = (
+        None if max_workers == 1 else ProcessPoolExecutor(max_workers=max_workers)
+    )
+    _moments = tuple(np.zeros(simulation.parents.size) for _ in range(3))
+    _samples: List[np.ndarray] = [np.empty((0, simulation.report.size))]
+    try:
+        _results: Iterator[Tuple[np.ndarray, ...]] = (
+            map(_do_simulate_block, _blocks)
+            if _executor is None
+            else _executor.map(_do_simulate_block, _blocks)
+        )
+        for _result in _results:
+            _moments = _do_merge_moments(_moments, _result[:3])
+            _samples.append(_result[3])
+    finally:
+        if _executor is not None:
+            _executor.shutdown()
+
+    return (*_moments, np.concatenate(_samples))
+
+
+def _get_depths(parents: np.ndarray) -> np.ndarray:
+    """Calculate the depth of each item in the hardware tree.
+
+    :param parents: the row index of each item's parent; -1 for top-level
+        items.
+    :return: _depth; the number of ancestors of each item.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _depth = np.zeros(parents.size, dtype=int)
+    _ancestor = parents.copy()
+    while (_ancestor >= 0).any():
+        _has_ancestor = _ancestor >= 0
+        _depth[_has_ancestor] += 1
+        _ancestor[_has_ancestor] = parents[_ancestor[_has_ancestor]]
+
+    return _depth
+
+
+def _get_percentiles(samples: np.ndarray, percentiles: Sequence[float]) -> np.ndarray:
+    """Calculate the percentiles of each column of samples.
+
+    :param samples: the samples (samples x items).
+    :param percentiles: the percentiles to calculate.
+    :return: the percentiles of each item (items x percentiles); numpy.nan
+        for items without any valid samples.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if samples.shape[0] == 0 or samples.shape[1] == 0:
+        return np.full((samples.shape[1], len(percentiles)), np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanpercentile(samples, percentiles, axis=0).T
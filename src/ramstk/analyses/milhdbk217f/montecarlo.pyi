@@ -0,0 +1,50 @@
+# Standard Library Imports
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import batch as batch
+
+SAMPLERS: Dict[str, Callable[..., np.ndarray]]
+
+class SimulationBlock(NamedTuple):
+    parts: np.ndarray
+    parents: np.ndarray
+    quantity: np.ndarray
+    report: np.ndarray
+    distributions: Dict[str, Tuple[Any, ...]]
+    n_samples: int
+    seed: Any
+
+def do_sample_parts(
+    parts: np.ndarray,
+    distributions: Dict[str, Tuple[Any, ...]],
+    n_samples: int,
+    rng: np.random.Generator,
+) -> np.ndarray: ...
+def do_propagate_uncertainty(
+    parts: np.ndarray,
+    parents: Sequence[int],
+    distributions: Dict[str, Tuple[Any, ...]],
+    n_samples: int,
+    **kwargs: Any,
+) -> Dict[str, Any]: ...
+def _do_merge_moments(
+    first: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    second: Tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+def _do_roll_up(
+    hazard_rates: np.ndarray, parents: np.ndarray, quantity: np.ndarray
+) -> np.ndarray: ...
+def _do_simulate_block(
+    block: SimulationBlock,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: ...
+def _do_simulate_blocks(
+    simulation: SimulationBlock, block_size: int, max_workers: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: ...
+def _get_depths(parents: np.ndarray) -> np.ndarray: ...
+def _get_percentiles(
+    samples: np.ndarray, percentiles: Sequence[float]
+) -> np.ndarray: ...
@@ -0,0 +1,558 @@
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.tables.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Compiled Factor Tables Module.
+
+The MIL-HDBK-217F models keep their factors in nested dicts and lists whose
+shape depends on the category and subcategory of the part.  The tables in
+this module compile those factors into dense arrays indexed by category ID,
+subcategory ID, and one or more keys so a factor can be looked up for a
+single part or a whole bill of materials with a single indexing operation.
+"""
+
+# Standard Library Imports
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from .models import (
+    capacitor,
+    connection,
+    crystal,
+    efilter,
+    fuse,
+    inductor,
+    integratedcircuit,
+    lamp,
+    meter,
+    relay,
+    resistor,
+    semiconductor,
+    switch,
+)
+
+# These are the errors the model functions raise when there is no factor for
+# the passed IDs.  Those entries are left out of the compiled tables.
+_ERRORS = (
+    ArithmeticError,
+    IndexError,
+    KeyError,
+    TypeError,
+    UnboundLocalError,
+    ValueError,
+)
+
+_PI_E_LISTS: Dict[int, Any] = {
+    1: integratedcircuit.PI_E,
+    2: semiconductor.PI_E,
+    3: resistor.PI_E,
+    4: capacitor.PI_E,
+    5: inductor.PI_E,
+    7: switch.PI_E,
+    8: connection.PI_E,
+    9: meter.PI_E,
+    10: {1: crystal.PI_E, 2: efilter.PI_E, 3: fuse.PI_E, 4: lamp.PI_E},
+}
+_PART_COUNT_PI_Q_LISTS: Dict[int, Any] = {
+    1: integratedcircuit.PI_Q,
+    3: resistor.PART_COUNT_PI_Q,
+    4: capacitor.PART_COUNT_PI_Q,
+    5: inductor.PART_COUNT_PI_Q,
+    6: relay.PART_COUNT_PI_Q,
+    7: switch.PART_COUNT_PI_Q,
+    8: connection.PART_COUNT_PI_Q,
+    9: meter.PART_COUNT_PI_Q,
+    10: {1: crystal.PART_COUNT_PI_Q, 2: efilter.PI_Q},
+}
+_PART_STRESS_PI_Q_LISTS: Dict[int, Any] = {
+    1: integratedcircuit.PI_Q,
+    3: resistor.PART_STRESS_PI_Q,
+    4: capacitor.PART_STRESS_PI_Q,
+    6: relay.PART_STRESS_PI_Q,
+    7: switch.PART_STRESS_PI_Q,
+    8: connection.PART_STRESS_PI_Q,
+    9: meter.PART_STRESS_PI_Q,
+    10: {1: crystal.PART_STRESS_PI_Q, 2: efilter.PI_Q},
+}
+_PART_COUNT_FUNCTIONS: Dict[int, Any] = {
+    3: resistor.calculate_part_count,
+    4: capacitor.calculate_part_count,
+    5: inductor.calculate_part_count,
+    6: relay.calculate_part_count,
+    7: switch.calculate_part_count,
+    8: connection.calculate_part_count,
+    9: meter.calculate_part_count,
+    10: {
+        1: crystal.calculate_part_count,
+        2: efilter.calculate_part_count,
+        3: fuse.calculate_part_count,
+        4: lamp.calculate_part_count,
+    },
+}
+
+# The attribute that selects the list of parts count base hazard rates within
+# a subcategory.  Subcategories not listed have a single list of base hazard
+# rates.
+PART_COUNT_TYPE_KEYS: Dict[int, Union[str, Dict[int, str]]] = {
+    3: "specification_id",
+    4: "specification_id",
+    5: "family_id",
+    6: "type_id",
+    7: "construction_id",
+    8: "type_id",
+    9: "type_id",
+    10: {2: "type_id", 4: "application_id"},
+}
+
+
+def _get_size(*factors: Any, depth: int = 0) -> int:
+    """Return the size of an axis large enough to index nested factors.
+
+    Lists are indexed by ID - 1 and dicts by ID, so the axis has one more
+    entry than the largest list length or dict key.
+
+    :param factors: the nested dicts and lists of factors.
+    :keyword depth: the nesting level of the dicts and lists the axis
+        indexes; zero for the factors themselves.
+    :return: the axis size.
+    :rtype: int
+    """
+    _size = 1
+    for _factor in factors:
+        if isinstance(_factor, dict):
+            _children = list(_factor.values())
+            _keys = list(_factor)
+        elif isinstance(_factor, list):
+            _children = _factor
+            _keys = [len(_factor)]
+        else:
+            continue
+
+        if depth > 0:
+            _size = max(_size, _get_size(*_children, depth=depth - 1))
+        else:
+            _size = max(_size, max(_keys) + 1)
+
+    return _size
+
+
+N_CATEGORIES: int = 11
+N_ENVIRONMENTS: int = _get_size(integratedcircuit.PI_E)
+N_SUBCATEGORIES: int = _get_size(
+    *_PI_E_LISTS.values(),
+    integratedcircuit.PART_COUNT_LAMBDA_B,
+    semiconductor.PART_COUNT_LAMBDA_B_DICT,
+    semiconductor.PART_COUNT_LAMBDA_B_LIST,
+    resistor.PART_COUNT_LAMBDA_B,
+    capacitor.PART_COUNT_LAMBDA_B,
+    inductor.PART_COUNT_LAMBDA_B,
+    relay.PART_COUNT_LAMBDA_B,
+    switch.PART_COUNT_LAMBDA_B,
+    connection.PART_COUNT_LAMBDA_B,
+    meter.PART_COUNT_LAMBDA_B,
+)
+N_QUALITIES: int = max(
+    _get_size(*_PART_COUNT_PI_Q_LISTS.values(), *_PART_STRESS_PI_Q_LISTS.values()),
+    _get_size(
+        *_PART_COUNT_PI_Q_LISTS.values(), *_PART_STRESS_PI_Q_LISTS.values(), depth=1
+    ),
+)
+
+
+class FactorTable:
+    """A MIL-HDBK-217F factor table compiled into a dense array.
+
+    The table is compiled the first time it is used by evaluating the
+    resolver for every combination of IDs in the table's shape.  The resolver
+    is the scalar function that walks the model's nested dicts and lists.
+    Combinations the resolver has no factor for are stored as numpy.nan and
+    flagged as invalid in the mask.
+
+    The first two axes of every table are the category ID and subcategory ID.
+    Factors that don't depend on one of the keys are repeated along that
+    axis.
+    """
+
+    def __init__(
+        self,
+        resolver: Callable[..., float],
+        shape: Tuple[int, ...],
+        categories: Sequence[int],
+    ) -> None:
+        """Initialize a factor table.
+
+        :param resolver: the scalar function that returns the factor for one
+            combination of category ID, subcategory ID, and keys or raises
+            one of the model errors if there is no such factor.
+        :param shape: the size of each axis of the table.
+        :param categories: the category IDs the resolver has factors for.
+        """
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+        self._categories: Sequence[int] = categories
+        self._resolver: Callable[..., float] = resolver
+        self._shape: Tuple[int, ...] = shape
+        self._valid: Optional[np.ndarray] = None
+        self._values: Optional[np.ndarray] = None
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Return the validity mask of the table, compiling it if needed.
+
+        :return: True for each entry that holds a factor.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._valid is None:
+            self.do_compile()
+
+        return self._valid
+
+    @property
+    def values(self) -> np.ndarray:
+        """Return the factors of the table, compiling it if needed.
+
+        :return: the dense array of factors; invalid entries are numpy.nan.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._values is None:
+            self.do_compile()
+
+        return self._values
+
+    def do_compile(self) -> None:
+        """Compile the factors into the dense array and validity mask.
+
+        :return: None
+        :rtype: None
+        """
+        _values = np.full(self._shape, np.nan)
+        _valid = np.zeros(self._shape, dtype=bool)
+
+        for _category_id in self._categories:
+            for _index in np.ndindex(*self._shape[1:]):
+                try:
+                    _values[(_category_id, *_index)] = float(
+                        self._resolver(_category_id, *_index)
+                    )
+                    _valid[(_category_id, *_index)] = True
+                except _ERRORS:
+                    pass
+
+        self._values = _values
+        self._valid = _valid
+
+    def get(self, category_id: int, subcategory_id: int, *keys: int) -> float:
+        """Look up the factor for a single part.
+
+        IDs outside the table or without a factor are passed to the resolver
+        so the caller sees the same result, or error, as the nested lookup.
+
+        :param category_id: the category ID of the part.
+        :param subcategory_id: the subcategory ID of the part.
+        :param keys: the remaining IDs of the part in axis order.
+        :return: the factor.
+        :rtype: float
+        :raise: IndexError or KeyError if there is no factor for the IDs.
+        """
+        _index = (category_id, subcategory_id, *keys)
+        if all(0 <= _id < _size for _id, _size in zip(_index, self._shape)) and bool(
+            self.valid[_index]
+        ):
+            return float(self._values[_index])
+
+        return self._resolver(*_index)
+
+    def lookup(self, category_id: Any, subcategory_id: Any, *keys: Any) -> np.ndarray:
+        """Look up the factor for each of an array of parts.
+
+        The IDs are broadcast against each other so scalars may be mixed with
+        arrays.  IDs outside the table are passed to the resolver once for
+        each unique combination so the result matches get() for every part.
+
+        :param category_id: the category ID of each part.
+        :param subcategory_id: the subcategory ID of each part.
+        :param keys: the remaining IDs of each part in axis order.
+        :return: _factors; the factor for each part or numpy.nan where there
+            is no factor for the part's IDs.
+        :rtype: :class:`numpy.ndarray`
+        """
+        _ids = np.broadcast_arrays(
+            *[
+                np.asarray(_id, dtype=int)
+                for _id in (category_id, subcategory_id, *keys)
+            ]
+        )
+
+        _in_range = np.ones(_ids[0].shape, dtype=bool)
+        for _id, _size in zip(_ids, self._shape):
+            _in_range &= (_id >= 0) & (_id < _size)
+        _index = tuple(np.where(_in_range, _id, 0) for _id in _ids)
+
+        _factors = np.where(
+            _in_range & self.valid[_index], self._values[_index], np.nan
+        )
+
+        if not _in_range.all():
+            _outside, _inverse = np.unique(
+                np.column_stack([_id[~_in_range] for _id in _ids]),
+                axis=0,
+                return_inverse=True,
+            )
+            _values = np.full(len(_outside), np.nan)
+            for _idx, _row in enumerate(_outside.tolist()):
+                try:
+                    _values[_idx] = float(self._resolver(*_row))
+                except _ERRORS:
+                    pass
+            _factors[~_in_range] = _values[_inverse.ravel()]
+
+        return _factors
+
+
+def _get_environment_factor(
+    category_id: int,
+    subcategory_id: int,
+    quality_id: int,
+    environment_active_id: int,
+) -> float:
+    """Retrieve the environment factor (piE) from the model lists.
+
+    :param category_id: the category ID of the component.
+    :param subcategory_id: the subcategory ID of the component.
+    :param quality_id: the quality level ID of the component.
+    :param environment_active_id: the active environment ID of the component.
+    :return: _pi_e; the selected piE value.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed active
+        environment ID.
+    :raise: KeyError if there is no piE list for the passed category ID (or
+        subcategory ID, quality ID when appllicable).
+    """
+    if category_id == 8 and subcategory_id in [1, 2]:
+        _pi_e = _PI_E_LISTS[category_id][subcategory_id][quality_id][
+            environment_active_id - 1
+        ]
+    elif category_id in [2, 3, 5, 7, 9, 10] or (
+        category_id == 8 and subcategory_id not in [1, 2]
+    ):
+        _pi_e = _PI_E_LISTS[category_id][subcategory_id][environment_active_id - 1]
+    else:
+        _pi_e = _PI_E_LISTS[category_id][environment_active_id - 1]
+
+    return _pi_e
+
+
+def _get_part_count_lambda_b(
+    category_id: int,
+    subcategory_id: int,
+    type_id: int,
+    environment_active_id: int,
+) -> float:
+    """Retrieve the parts count base hazard rate from the model functions.
+
+    :param category_id: the category ID of the component.
+    :param subcategory_id: the subcategory ID of the component.
+    :param type_id: the value of the component's PART_COUNT_TYPE_KEYS
+        attribute.
+    :param environment_active_id: the active environment ID of the component.
+    :return: the parts count base hazard rate.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed active
+        environment ID.
+    :raise: KeyError if there is no base hazard rate for the passed category
+        ID, subcategory ID, or type ID.
+    """
+    _attributes = {
+        "subcategory_id": subcategory_id,
+        "environment_active_id": environment_active_id,
+        "application_id": type_id,
+        "construction_id": type_id,
+        "family_id": type_id,
+        "specification_id": type_id,
+        "type_id": type_id,
+    }
+
+    if category_id == 10:
+        return _PART_COUNT_FUNCTIONS[category_id][subcategory_id](**_attributes)
+
+    return _PART_COUNT_FUNCTIONS[category_id](**_attributes)
+
+
+def _get_part_count_quality_factor(
+    category_id: int, subcategory_id: int, quality_id: int
+) -> float:
+    """Retrieve the parts count quality factor (piQ) from the model lists.
+
+    :param category_id: the category ID of the component.
+    :param subcategory_id: the subcategory ID of the component.
+    :param quality_id: the quality level ID for the component.
+    :return: _pi_q; the selected piQ value.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed quality ID.
+    :raise: KeyError if there is no piQ list for the passed category ID.
+    """
+    if category_id in [6, 7, 9]:
+        _pi_q = _PART_COUNT_PI_Q_LISTS[category_id][subcategory_id][quality_id - 1]
+    elif category_id == 10 and subcategory_id in [1, 2]:
+        _pi_q = _PART_COUNT_PI_Q_LISTS[category_id][subcategory_id][quality_id - 1]
+    elif category_id == 10 and subcategory_id in [3, 4]:
+        _pi_q = 1.0
+    else:
+        _pi_q = _PART_COUNT_PI_Q_LISTS[category_id][quality_id - 1]
+
+    return _pi_q
+
+
+def _get_part_stress_quality_factor(
+    category_id: int, subcategory_id: int, quality_id: int
+) -> float:
+    """Retrieve the part stress quality factor (piQ) from the model lists.
+
+    :param category_id: the category ID of the component.
+    :param subcategory_id: the subcategory ID of the component.
+    :param quality_id: the quality level ID for the component.
+    :return: _pi_q; the selected piQ value.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed quality ID.
+    :raise: KeyError if there is no piQ list for the passed category ID.
+    """
+    if category_id == 1:
+        _pi_q = _PART_STRESS_PI_Q_LISTS[category_id][quality_id - 1]
+    elif (category_id == 8 and subcategory_id in [4, 5]) or (
+        category_id == 7 and subcategory_id == 5
+    ):
+        _pi_q = _PART_STRESS_PI_Q_LISTS[category_id][subcategory_id][quality_id - 1]
+    elif category_id == 7 and subcategory_id != 5:
+        _pi_q = 0.0
+    elif category_id == 8 and subcategory_id not in [4, 5]:
+        _pi_q = 0.0
+    elif category_id == 9 and subcategory_id == 1:
+        _pi_q = 0.0
+    elif category_id == 10 and subcategory_id in [3, 4]:
+        _pi_q = 0.0
+    else:
+        _pi_q = _PART_STRESS_PI_Q_LISTS[category_id][subcategory_id][quality_id - 1]
+
+    return _pi_q
+
+
+def _get_resistance_factor(
+    category_id: int,
+    subcategory_id: int,
+    specification_id: int,
+    family_id: int,
+    index: int,
+) -> float:
+    """Retrieve the resistor resistance factor (piR) from the model lists.
+
+    :param category_id: the category ID of the component; always 3.
+    :param subcategory_id: the subcategory ID of the component.
+    :param specification_id: the specification ID of the component.
+    :param family_id: the family ID of the component.
+    :param index: the index of the resistance breakpoint.
+    :return: the selected piR value.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed IDs.
+    :raise: KeyError if there is no piR list for the passed subcategory ID.
+    """
+    if category_id != 3:
+        raise KeyError(category_id)
+
+    if subcategory_id in [6, 7]:
+        return resistor.PI_R[subcategory_id][specification_id - 1][family_id - 1][
+            index + 1
+        ]
+
+    return resistor.PI_R[subcategory_id][index + 1]
+
+
+def _get_voltage_factor(category_id: int, subcategory_id: int, index: int) -> float:
+    """Retrieve the resistor voltage factor (piV) from the model lists.
+
+    :param category_id: the category ID of the component; always 3.
+    :param subcategory_id: the subcategory ID of the component.
+    :param index: the index of the voltage ratio breakpoint.
+    :return: the selected piV value.
+    :rtype: float
+    :raise: IndexError if there is no list entry for the passed index.
+    :raise: KeyError if there is no piV list for the passed subcategory ID.
+    """
+    if category_id != 3:
+        raise KeyError(category_id)
+
+    return resistor.PI_V[subcategory_id][index]
+
+
+PI_E = FactorTable(
+    _get_environment_factor,
+    (
+        N_CATEGORIES,
+        N_SUBCATEGORIES,
+        _get_size(*connection.PI_E.values()),
+        N_ENVIRONMENTS,
+    ),
+    list(_PI_E_LISTS),
+)
+PART_COUNT_LAMBDA_B = FactorTable(
+    _get_part_count_lambda_b,
+    (
+        N_CATEGORIES,
+        N_SUBCATEGORIES,
+        max(
+            _get_size(
+                switch.PART_COUNT_LAMBDA_B_BREAKER,
+                efilter.PART_COUNT_LAMBDA_B,
+                lamp.PART_COUNT_LAMBDA_B,
+            ),
+            _get_size(
+                resistor.PART_COUNT_LAMBDA_B,
+                capacitor.PART_COUNT_LAMBDA_B,
+                inductor.PART_COUNT_LAMBDA_B,
+                relay.PART_COUNT_LAMBDA_B,
+                connection.PART_COUNT_LAMBDA_B,
+                meter.PART_COUNT_LAMBDA_B,
+                depth=1,
+            ),
+        ),
+        N_ENVIRONMENTS,
+    ),
+    list(_PART_COUNT_FUNCTIONS),
+)
+PART_COUNT_PI_Q = FactorTable(
+    _get_part_count_quality_factor,
+    (N_CATEGORIES, N_SUBCATEGORIES, N_QUALITIES),
+    list(_PART_COUNT_PI_Q_LISTS),
+)
+PART_STRESS_PI_Q = FactorTable(
+    _get_part_stress_quality_factor,
+    (N_CATEGORIES, N_SUBCATEGORIES, N_QUALITIES),
+    list(_PART_STRESS_PI_Q_LISTS),
+)
+PI_R = FactorTable(
+    _get_resistance_factor,
+    (
+        N_CATEGORIES,
+        N_SUBCATEGORIES,
+        _get_size(resistor.PI_R[6], resistor.PI_R[7]),
+        _get_size(resistor.PI_R[6], resistor.PI_R[7], depth=1),
+        max(
+            _get_size(*resistor.PI_R.values()),
+            _get_size(resistor.PI_R[6], resistor.PI_R[7], depth=2),
+        ),
+    ),
+    [3],
+)
+PI_V = FactorTable(
+    _get_voltage_factor,
+    (N_CATEGORIES, N_SUBCATEGORIES, _get_size(*resistor.PI_V.values())),
+    [3],
+)
@@ -0,0 +1,84 @@
+# Standard Library Imports
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from .models import capacitor as capacitor
+from .models import connection as connection
+from .models import crystal as crystal
+from .models import efilter as efilter
+from .models import fuse as fuse
+from .models import inductor as inductor
+from .models import integratedcircuit as integratedcircuit
+from .models import lamp as lamp
+from .models import meter as meter
+from .models import relay as relay
+from .models import resistor as resistor
+from .models import semiconductor as semiconductor
+from .models import switch as switch
+
+PART_COUNT_TYPE_KEYS: Dict[int, Union[str, Dict[int, str]]]
+N_CATEGORIES: int
+N_ENVIRONMENTS: int
+N_SUBCATEGORIES: int
+N_QUALITIES: int
+
+def _get_size(*factors: Any, depth: int = ...) -> int: ...
+
+class FactorTable:
+    _categories: Sequence[int]
+    _resolver: Callable[..., float]
+    _shape: Tuple[int, ...]
+    _valid: Optional[np.ndarray]
+    _values: Optional[np.ndarray]
+    def __init__(
+        self,
+        resolver: Callable[..., float],
+        shape: Tuple[int, ...],
+        categories: Sequence[int],
+    ) -> None: ...
+    @property
+    def valid(self) -> np.ndarray: ...
+    @property
+    def values(self) -> np.ndarray: ...
+    def do_compile(self) -> None: ...
+    def get(self, category_id: int, subcategory_id: int, *keys: int) -> float: ...
+    def lookup(
+        self, category_id: Any, subcategory_id: Any, *keys: Any
+    ) -> np.ndarray: ...
+
+def _get_environment_factor(
+    category_id: int,
+    subcategory_id: int,
+    quality_id: int,
+    environment_active_id: int,
+) -> float: ...
+def _get_part_count_lambda_b(
+    category_id: int,
+    subcategory_id: int,
+    type_id: int,
+    environment_active_id: int,
+) -> float: ...
+def _get_part_count_quality_factor(
+    category_id: int, subcategory_id: int, quality_id: int
+) -> float: ...
+def _get_part_stress_quality_factor(
+    category_id: int, subcategory_id: int, quality_id: int
+) -> float: ...
+def _get_resistance_factor(
+    category_id: int,
+    subcategory_id: int,
+    specification_id: int,
+    family_id: int,
+    index: int,
+) -> float: ...
+def _get_voltage_factor(category_id: int, subcategory_id: int, index: int) -> float: ...
+
+PI_E: FactorTable
+PART_COUNT_LAMBDA_B: FactorTable
+PART_COUNT_PI_Q: FactorTable
+PART_STRESS_PI_Q: FactorTable
+PI_R: FactorTable
+PI_V: FactorTable
@@ -7,11 +7,10 @@
 """Reliability Similar Item Assessment Module."""
 
 # Standard Library Imports
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
-# Third Party Imports
-# noinspection PyPackageRequirements
-from sympy import symbols, sympify  # type: ignore
+# RAMSTK Package Imports
+from ramstk.analyses import equation
 
 ENVIRONMENT_FROM_TO: Dict[Tuple[int, int], float] = {
     (0, 0): 1.0,
@@ -123,6 +122,38 @@ TEMPERATURE_FROM_TO: Dict[Tuple[float, float], float] = {
     (70.0, 70.0): 1.0,
 }
 
+SIA_EQUATIONS: Tuple[str, ...] = (
+    "equation1",
+    "equation2",
+    "equation3",
+    "equation4",
+    "equation5",
+)
+SIA_RESULTS: Tuple[str, ...] = ("res1", "res2", "res3", "res4", "res5")
+SIA_VARIABLES: Tuple[str, ...] = (
+    "hr",
+    "pi1",
+    "pi2",
+    "pi3",
+    "pi4",
+    "pi5",
+    "pi6",
+    "pi7",
+    "pi8",
+    "pi9",
+    "pi10",
+    "uf1",
+    "uf2",
+    "uf3",
+    "uf4",
+    "uf5",
+    "ui1",
+    "ui2",
+    "ui3",
+    "ui4",
+    "ui5",
+) + SIA_RESULTS
+
 
 # noinspection PyTypeChecker
 def calculate_topic_633(
@@ -170,8 +201,7 @@ def calculate_topic_633(
     return _change_factor_1, _change_factor_2, _change_factor_3, _result_1
 
 
-# pylint: disable=too-many-locals
-def calculate_user_defined(sia: Dict[str, float]):
+def calculate_user_defined(sia: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate the user-defined similar item analysis.
 
     :param sia: the user-defined similar item assessment dict.  The
@@ -191,195 +221,23 @@ def calculate_user_defined(sia: Dict[str, float]):
     :return: sia; the similar item assessment dict with updated results.
     :rtype: dict
     """
-    (
-        hr,
-        pi1,
-        pi2,
-        pi3,
-        pi4,
-        pi5,
-        pi6,
-        pi7,
-        pi8,
-        pi9,
-        pi10,
-        uf1,
-        uf2,
-        uf3,
-        uf4,
-        uf5,
-        ui1,
-        ui2,
-        ui3,
-        ui4,
-        ui5,
-        res1,
-        res2,
-        res3,
-        res4,
-        res5,
-    ) = symbols(
-        "hr pi1 pi2 pi3 pi4 pi5 pi6 pi7 pi8 pi9 pi10 uf1 uf2 uf3 uf4 uf5 ui1 "
-        "ui2 ui3 ui4 ui5 res1 res2 res3 res4 res5"
+    return equation.do_calculate_equations(
+        sia, SIA_VARIABLES, SIA_EQUATIONS, SIA_RESULTS
     )
 
-    # The subs argument needs to be passed as a dict of sia values just like
-    # it is below.  This will result in duplicate code warnings, but passing
-    # it like this is required to allow the use of the results in subsequent
-    # calculations.
-    # pylint: disable=eval-used
-    sia["res1"] = sympify(sia["equation1"]).evalf(
-        subs={
-            hr: sia["hr"],
-            pi1: sia["pi1"],
-            pi2: sia["pi2"],
-            pi3: sia["pi3"],
-            pi4: sia["pi4"],
-            pi5: sia["pi5"],
-            pi6: sia["pi6"],
-            pi7: sia["pi7"],
-            pi8: sia["pi8"],
-            pi9: sia["pi9"],
-            pi10: sia["pi10"],
-            uf1: sia["uf1"],
-            uf2: sia["uf2"],
-            uf3: sia["uf3"],
-            uf4: sia["uf4"],
-            uf5: sia["uf5"],
-            ui1: sia["ui1"],
-            ui2: sia["ui2"],
-            ui3: sia["ui3"],
-            ui4: sia["ui4"],
-            ui5: sia["ui5"],
-            res1: sia["res1"],
-            res2: sia["res2"],
-            res3: sia["res3"],
-            res4: sia["res4"],
-            res5: sia["res5"],
-        }
-    )
-    sia["res2"] = sympify(sia["equation2"]).evalf(
-        subs={
-            hr: sia["hr"],
-            pi1: sia["pi1"],
-            pi2: sia["pi2"],
-            pi3: sia["pi3"],
-            pi4: sia["pi4"],
-            pi5: sia["pi5"],
-            pi6: sia["pi6"],
-            pi7: sia["pi7"],
-            pi8: sia["pi8"],
-            pi9: sia["pi9"],
-            pi10: sia["pi10"],
-            uf1: sia["uf1"],
-            uf2: sia["uf2"],
-            uf3: sia["uf3"],
-            uf4: sia["uf4"],
-            uf5: sia["uf5"],
-            ui1: sia["ui1"],
-            ui2: sia["ui2"],
-            ui3: sia["ui3"],
-            ui4: sia["ui4"],
-            ui5: sia["ui5"],
-            res1: sia["res1"],
-            res2: sia["res2"],
-            res3: sia["res3"],
-            res4: sia["res4"],
-            res5: sia["res5"],
-        }
-    )
-    sia["res3"] = sympify(sia["equation3"]).evalf(
-        subs={
-            hr: sia["hr"],
-            pi1: sia["pi1"],
-            pi2: sia["pi2"],
-            pi3: sia["pi3"],
-            pi4: sia["pi4"],
-            pi5: sia["pi5"],
-            pi6: sia["pi6"],
-            pi7: sia["pi7"],
-            pi8: sia["pi8"],
-            pi9: sia["pi9"],
-            pi10: sia["pi10"],
-            uf1: sia["uf1"],
-            uf2: sia["uf2"],
-            uf3: sia["uf3"],
-            uf4: sia["uf4"],
-            uf5: sia["uf5"],
-            ui1: sia["ui1"],
-            ui2: sia["ui2"],
-            ui3: sia["ui3"],
-            ui4: sia["ui4"],
-            ui5: sia["ui5"],
-            res1: sia["res1"],
-            res2: sia["res2"],
-            res3: sia["res3"],
-            res4: sia["res4"],
-            res5: sia["res5"],
-        }
-    )
-    sia["res4"] = sympify(sia["equation4"]).evalf(
-        subs={
-            hr: sia["hr"],
-            pi1: sia["pi1"],
-            pi2: sia["pi2"],
-            pi3: sia["pi3"],
-            pi4: sia["pi4"],
-            pi5: sia["pi5"],
-            pi6: sia["pi6"],
-            pi7: sia["pi7"],
-            pi8: sia["pi8"],
-            pi9: sia["pi9"],
-            pi10: sia["pi10"],
-            uf1: sia["uf1"],
-            uf2: sia["uf2"],
-            uf3: sia["uf3"],
-            uf4: sia["uf4"],
-            uf5: sia["uf5"],
-            ui1: sia["ui1"],
-            ui2: sia["ui2"],
-            ui3: sia["ui3"],
-            ui4: sia["ui4"],
-            ui5: sia["ui5"],
-            res1: sia["res1"],
-            res2: sia["res2"],
-            res3: sia["res3"],
-            res4: sia["res4"],
-            res5: sia["res5"],
-        }
-    )
-    sia["res5"] = sympify(sia["equation5"]).evalf(
-        subs={
-            hr: sia["hr"],
-            pi1: sia["pi1"],
-            pi2: sia["pi2"],
-            pi3: sia["pi3"],
-            pi4: sia["pi4"],
-            pi5: sia["pi5"],
-            pi6: sia["pi6"],
-            pi7: sia["pi7"],
-            pi8: sia["pi8"],
-            pi9: sia["pi9"],
-            pi10: sia["pi10"],
-            uf1: sia["uf1"],
-            uf2: sia["uf2"],
-            uf3: sia["uf3"],
-            uf4: sia["uf4"],
-            uf5: sia["uf5"],
-            ui1: sia["ui1"],
-            ui2: sia["ui2"],
-            ui3: sia["ui3"],
-            ui4: sia["ui4"],
-            ui5: sia["ui5"],
-            res1: sia["res1"],
-            res2: sia["res2"],
-            res3: sia["res3"],
-            res4: sia["res4"],
-            res5: sia["res5"],
-        }
-    )
 
-    return sia
+def calculate_all_user_defined(sia: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate the user-defined similar item analysis for many items at once.
+
+    :param sia: the user-defined similar item assessment dict.  This is the
+        same dict passed to calculate_user_defined() except each value is a
+        list or array with one element per similar item.
+    :return: sia; the similar item assessment dict with updated result arrays.
+    :rtype: dict
+    """
+    return equation.do_calculate_all_equations(
+        sia, SIA_VARIABLES, SIA_EQUATIONS, SIA_RESULTS
+    )
 
 
 def set_user_defined_change_factors(
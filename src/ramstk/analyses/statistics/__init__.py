@@ -9,4 +9,18 @@
 
 # RAMSTK Local Imports
 from . import exponential, lognormal, normal, weibull
-from .bounds import do_calculate_beta_bounds, do_calculate_fisher_information
+from .bounds import (
+    do_calculate_beta_bounds,
+    do_calculate_fisher_bounds,
+    do_calculate_fisher_information,
+    do_calculate_fisher_matrix,
+    get_parameter_covariance,
+)
+from .fitting import (
+    clear_fit_cache,
+    do_fit_all,
+    do_fit_censored,
+    get_dataset_hash,
+    get_log_likelihood,
+)
+from .grid import do_calculate_time_grid
@@ -8,12 +8,42 @@
 
 # Standard Library Imports
 import inspect
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Third Party Imports
 import numpy as np
-from scipy import misc
-from scipy.stats import norm
+from scipy.stats import expon, lognorm, norm, weibull_min
+
+# RAMSTK Local Imports
+from . import exponential, lognormal, normal, weibull
+
+# The log-likelihood gradient function and a function returning the frozen
+# scipy distribution for each distribution's estimated parameters.  The
+# parameters are in the same order as the gradient function's arguments.
+DISTRIBUTIONS: Dict[str, Tuple[Callable, Callable]] = {
+    "exponential": (
+        lambda p, t, f, loc: exponential.get_log_likelihood_gradient(
+            p[0], t, f, location=loc
+        ),
+        lambda p, loc: expon(loc=loc, scale=p[0]),
+    ),
+    "lognormal": (
+        lambda p, t, f, loc: lognormal.get_log_likelihood_gradient(
+            p[0], p[1], t, f, location=loc
+        ),
+        lambda p, loc: lognorm(p[0], loc=loc, scale=p[1]),
+    ),
+    "normal": (
+        lambda p, t, f, loc: normal.get_log_likelihood_gradient(p[0], p[1], t, f),
+        lambda p, loc: norm(loc=p[0], scale=p[1]),
+    ),
+    "weibull": (
+        lambda p, t, f, loc: weibull.get_log_likelihood_gradient(
+            p[0], p[1], t, f, location=loc
+        ),
+        lambda p, loc: weibull_min(p[0], loc=loc, scale=p[1]),
+    ),
+}
 
 
 def do_calculate_beta_bounds(
@@ -65,8 +95,9 @@ def do_calculate_fisher_information(
                [9.89376513e+01, 1.12858721e-02]])
 
     :param model: the model function, f(x, ...). This function must take the
-        data set as the first argument.  The remaining arguments of the
-        function should be the scale, shape, and location parameters.
+        data set as the first argument and be able to evaluate the entire data
+        array at once.  The remaining arguments of the function should be the
+        scale, shape, and location parameters.
     :param p0: point in parameter space where Fisher information matrix is
         evaluated.  Passed as a list in the same order as the parameter
         arguments to the model.  See the example above.
@@ -78,19 +109,223 @@ def do_calculate_fisher_information(
     _labels = inspect.getfullargspec(model)[0][1:]
     _p0dict = dict(zip(_labels, p0))
 
+    # Central differences of the model evaluated over the entire data array.
     _D = np.zeros((len(p0), data.size))
-
     for i, argname in enumerate(_labels):
-        # pylint: disable=cell-var-from-loop
-        _D[i, :] = [
-            misc.derivative(
-                lambda p: model(_record, **dict(_p0dict, **{argname: p})),
-                _p0dict[argname],
-                dx=1.0e-6,
-            )
-            for _record in data
-        ]
+        _D[i, :] = (
+            model(data, **dict(_p0dict, **{argname: _p0dict[argname] + 1.0e-6}))
+            - model(data, **dict(_p0dict, **{argname: _p0dict[argname] - 1.0e-6}))
+        ) / 2.0e-6
 
     _fisher = 1.0 / noise ** 2 * np.einsum("mk, nk", _D, _D)
 
     return _fisher
+
+
+def do_calculate_fisher_matrix(
+    distribution: str,
+    parameters: Sequence[float],
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = None,
+    location: float = 0.0,
+) -> np.ndarray:
+    """Calculate the observed Fisher information matrix for a distribution.
+
+    The Fisher information matrix is the negative of the Hessian of the
+    log-likelihood at the parameters.  The log-likelihood gradient of each
+    distribution is calculated in closed form over the entire data array and
+    the Hessian is found by central differences of the summed gradient, so the
+    data is passed through only twice per parameter.
+
+    :param distribution: the name of the distribution; one of exponential,
+        lognormal, normal, or weibull.
+    :param parameters: the estimated parameters in the order the distribution
+        module's get_log_likelihood_gradient() expects them.
+    :param time: the array of failure and suspension times.
+    :param failed: the array indicating whether each record is a failure (True)
+        or a suspension (False).  Defaults to all failures.
+    :param location: the location parameter.  It is not estimated.
+    :return: _fisher; the Fisher information matrix.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _gradient = DISTRIBUTIONS[distribution][0]
+    _parameters = np.asarray(parameters, dtype=float)
+    _time = np.asarray(time, dtype=float)
+
+    _fisher = np.zeros((_parameters.size, _parameters.size))
+    for _idx, _parameter in enumerate(_parameters):
+        _step = 1.0e-6 * max(abs(_parameter), 1.0)
+        _upper = _parameters.copy()
+        _upper[_idx] += _step
+        _lower = _parameters.copy()
+        _lower[_idx] -= _step
+        _fisher[:, _idx] = -(
+            _gradient(_upper, _time, failed, location).sum(axis=1)
+            - _gradient(_lower, _time, failed, location).sum(axis=1)
+        ) / (2.0 * _step)
+
+    return (_fisher + _fisher.T) / 2.0
+
+
+def get_parameter_covariance(fisher: np.ndarray) -> np.ndarray:
+    """Calculate the parameter covariance matrix from the Fisher information.
+
+    :param fisher: the Fisher information matrix.
+    :return: the parameter variance-covariance matrix.
+    :rtype: :class:`numpy.ndarray`
+    :raise: numpy.linalg.LinAlgError if the Fisher matrix is singular.
+    """
+    return np.linalg.inv(fisher)
+
+
+def do_calculate_fisher_bounds(
+    distribution: str,
+    parameters: Sequence[float],
+    time: np.ndarray,
+    time_grid: np.ndarray,
+    **kwargs: Any,
+) -> Dict[str, np.ndarray]:
+    """Calculate the Fisher matrix confidence bounds on the survival and hazard.
+
+    The bounds are calculated over the entire time grid at once using the delta
+    method.  The survival bounds are calculated on log(-log(S(t))) and the
+    hazard bounds on log(h(t)) so the bounds stay within their valid ranges.
+
+    :param distribution: the name of the distribution; one of exponential,
+        lognormal, normal, or weibull.
+    :param parameters: the estimated parameters in the order the distribution
+        module's get_log_likelihood_gradient() expects them.
+    :param time: the array of failure and suspension times used to estimate the
+        parameters.
+    :param time_grid: the array of times to calculate the bounds at.
+    :keyword failed: the array indicating whether each record is a failure
+        (True) or a suspension (False).  Defaults to all failures.
+    :keyword location: the location parameter.  It is not estimated.  Defaults
+        to 0.0.
+    :keyword alpha: the desired confidence level.  Defaults to 0.95.
+    :return: the dict of results.  The covariance key holds the parameter
+        covariance matrix.  The survival and hazard keys each hold an array
+        with the lower bound, point estimate, and upper bound in rows and one
+        column per time in the time grid.
+    :rtype: dict
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _location = kwargs.get("location", 0.0)
+    _alpha = kwargs.get("alpha", 0.95)
+
+    if _alpha > 1.0:
+        _alpha = _alpha / 100.0
+    _z_norm = norm.ppf(1.0 - ((1.0 - _alpha) / 2.0))
+
+    _covariance = get_parameter_covariance(
+        do_calculate_fisher_matrix(
+            distribution,
+            parameters,
+            time,
+            failed=kwargs.get("failed", None),
+            location=_location,
+        )
+    )
+
+    _time_grid = np.asarray(time_grid, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _log_cum_hazard, _log_hazard = _get_log_functions(
+            distribution, parameters, _location, _time_grid
+        )
+        _standard_error = _get_delta_standard_errors(
+            distribution, parameters, _covariance, _location, _time_grid
+        )
+
+        _survival = np.exp(
+            -np.exp(
+                [
+                    _log_cum_hazard + _z_norm * _standard_error[0],
+                    _log_cum_hazard,
+                    _log_cum_hazard - _z_norm * _standard_error[0],
+                ]
+            )
+        )
+        _hazard = np.exp(
+            [
+                _log_hazard - _z_norm * _standard_error[1],
+                _log_hazard,
+                _log_hazard + _z_norm * _standard_error[1],
+            ]
+        )
+
+    # Before the location there are no failures so the survival is one and the
+    # hazard is zero with no uncertainty.
+    _survival = np.where(np.isfinite(_log_cum_hazard), _survival, 1.0)
+    _hazard = np.where(np.isfinite(_log_hazard), _hazard, 0.0)
+
+    return {
+        "covariance": _covariance,
+        "survival": _survival,
+        "hazard": _hazard,
+    }
+
+
+def _get_delta_standard_errors(
+    distribution: str,
+    parameters: Sequence[float],
+    covariance: np.ndarray,
+    location: float,
+    time_grid: np.ndarray,
+) -> np.ndarray:
+    """Calculate the delta method standard errors of the log functions.
+
+    The derivatives of log(-log(S(t))) and log(h(t)) with respect to each
+    parameter are estimated by central differences.
+
+    :param distribution: the name of the distribution.
+    :param parameters: the estimated parameters.
+    :param covariance: the parameter covariance matrix.
+    :param location: the location parameter.
+    :param time_grid: the array of times to calculate the standard errors at.
+    :return: the standard errors of log(-log(S(t))) and log(h(t)) in rows and
+        one column per time in the time grid.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _parameters = np.asarray(parameters, dtype=float)
+
+    _derivatives = np.zeros((2, _parameters.size, time_grid.size))
+    for _idx, _parameter in enumerate(_parameters):
+        _step = 1.0e-6 * max(abs(_parameter), 1.0)
+        _upper = _parameters.copy()
+        _upper[_idx] += _step
+        _lower = _parameters.copy()
+        _lower[_idx] -= _step
+        _derivatives[:, _idx] = (
+            np.asarray(_get_log_functions(distribution, _upper, location, time_grid))
+            - np.asarray(_get_log_functions(distribution, _lower, location, time_grid))
+        ) / (2.0 * _step)
+
+    _variance = np.einsum("kit,ij,kjt->kt", _derivatives, covariance, _derivatives)
+
+    return np.sqrt(_variance)
+
+
+def _get_log_functions(
+    distribution: str,
+    parameters: Sequence[float],
+    location: float,
+    time_grid: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate log(-log(S(t))) and log(h(t)) over the time grid.
+
+    :param distribution: the name of the distribution.
+    :param parameters: the distribution parameters.
+    :param location: the location parameter.
+    :param time_grid: the array of times to calculate the functions at.
+    :return: log(-log(S(t))) and log(h(t)) at each time in the time grid.
+    :rtype: tuple
+    """
+    _distribution = DISTRIBUTIONS[distribution][1](parameters, location)
+    _log_survival = _distribution.logsf(time_grid)
+
+    return (
+        np.log(-_log_survival),
+        _distribution.logpdf(time_grid) - _log_survival,
+    )
@@ -1,12 +1,42 @@
 # Standard Library Imports
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Third Party Imports
 import numpy as np
 
+DISTRIBUTIONS: Dict[str, Tuple[Callable, Callable]]
+
 def do_calculate_beta_bounds(
     minimum: float, likely: float, maximum: float, alpha: float
 ) -> Tuple[float, float, float, float]: ...
 def do_calculate_fisher_information(
     model: Callable, p0: List[float], data: np.ndarray, noise: Any = ...
 ) -> np.ndarray: ...
+def do_calculate_fisher_matrix(
+    distribution: str,
+    parameters: Sequence[float],
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = ...,
+    location: float = ...,
+) -> np.ndarray: ...
+def get_parameter_covariance(fisher: np.ndarray) -> np.ndarray: ...
+def do_calculate_fisher_bounds(
+    distribution: str,
+    parameters: Sequence[float],
+    time: np.ndarray,
+    time_grid: np.ndarray,
+    **kwargs: Any,
+) -> Dict[str, np.ndarray]: ...
+def _get_delta_standard_errors(
+    distribution: str,
+    parameters: Sequence[float],
+    covariance: np.ndarray,
+    location: float,
+    time_grid: np.ndarray,
+) -> np.ndarray: ...
+def _get_log_functions(
+    distribution: str,
+    parameters: Sequence[float],
+    location: float,
+    time_grid: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]: ...
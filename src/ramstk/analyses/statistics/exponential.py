@@ -8,13 +8,39 @@
 """Exponential Module."""
 
 # Standard Library Imports
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
 # Third Party Imports
+import numpy as np
 import scipy
 from scipy.stats import expon
 
 
+def get_cumulative_hazards(scale: Any, time: Any, location: Any = 0.0) -> np.ndarray:
+    """Calculate the cumulative hazard function at each time.
+
+    The parameters and times are broadcast against each other like any other
+    NumPy operation so passing a column of parameters and a row of times
+    returns one row per parameter set and one column per time.  The cumulative
+    hazard is zero up to the location and nan for invalid parameters.
+
+        >>> get_cumulative_hazards(1000.0, [0.0, 100.0])
+        array([0. , 0.1])
+
+    :param scale: the value(s) of the scale (MTBF) parameter.
+    :param time: the time(s) at which to calculate the cumulative hazard.
+    :param location: the value(s) of the location parameter.
+    :return: the cumulative hazard at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _cumulative_hazard = (
+            np.maximum(np.asarray(time, dtype=float) - location, 0.0) / scale
+        )
+
+    return np.where(np.asarray(scale) > 0.0, _cumulative_hazard, np.nan)
+
+
 def get_hazard_rate(scale: float, location: float = 0.0) -> float:
     """Calculates the hazard rate given a scale and location parameter.
 
@@ -40,6 +66,59 @@ def get_hazard_rate(scale: float, location: float = 0.0) -> float:
     return _hazard_rate
 
 
+def get_hazard_rates(scale: Any, time: Any, location: Any = 0.0) -> np.ndarray:
+    """Calculate the hazard rate at each time.
+
+    The exponential hazard rate is constant from the location on.  The hazard
+    rate is zero before the location and nan for invalid parameters.
+
+        >>> get_hazard_rates(1000.0, [0.0, 100.0])
+        array([0.001, 0.001])
+
+    :param scale: the value(s) of the scale (MTBF) parameter.
+    :param time: the time(s) at which to calculate the hazard rate.
+    :param location: the value(s) of the location parameter.
+    :return: the hazard rate at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _hazard_rate = np.where(
+            np.asarray(time, dtype=float) >= location, 1.0 / np.asarray(scale), 0.0
+        )
+
+    return np.where(np.asarray(scale) > 0.0, _hazard_rate, np.nan)
+
+
+def get_log_likelihood_gradient(
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = None,
+    location: float = 0.0,
+) -> np.ndarray:
+    """Calculate the gradient of the log-likelihood of each record.
+
+    Failures contribute the log of the pdf and suspensions (right censored
+    records) contribute the log of the survival function.  The gradient is
+    calculated in closed form over the entire data array at once.
+
+        >>> get_log_likelihood_gradient(10.0, np.array([5.0, 20.0]))
+        array([[-0.05,  0.1 ]])
+
+    :param scale: the scale (MTBF) parameter.
+    :param time: the array of failure and suspension times.
+    :param failed: the array indicating whether each record is a failure (True)
+        or a suspension (False).  Defaults to all failures.
+    :param location: the location parameter.  It is not estimated.
+    :return: the gradient with respect to the scale parameter; one row with one
+        column per record.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z = np.asarray(time, dtype=float) - location
+    _failed = np.ones_like(_z) if failed is None else np.asarray(failed, dtype=float)
+
+    return np.array([_z / scale ** 2 - _failed / scale])
+
+
 def get_mtbf(rate: float, location: float = 0.0) -> float:
     """Calculate the MTBF (scale) given a hazard rate (lambda) and location parameter.
 
@@ -86,6 +165,23 @@ def get_survival(scale: float, time: float, location: float = 0.0) -> float:
     return expon.sf(time, loc=location, scale=scale)
 
 
+def get_survivals(scale: Any, time: Any, location: Any = 0.0) -> np.ndarray:
+    """Calculate the value of the survival function at each time.
+
+    This is the closed-form, broadcasting version of get_survival().
+
+        >>> get_survivals(1000.0, [0.0, 100.0])
+        array([1.        , 0.90483742])
+
+    :param scale: the value(s) of the scale (MTBF) parameter.
+    :param time: the time(s) at which to calculate the survival function.
+    :param location: the value(s) of the location parameter.
+    :return: the value of the survival function at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.exp(-get_cumulative_hazards(scale, time, location=location))
+
+
 def do_fit(data, **kwargs) -> Tuple[float, float]:
     """Fits the provided data to the EXP distribution and estimates scale and location.
 
@@ -1,7 +1,21 @@
 # Standard Library Imports
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
+# Third Party Imports
+import numpy as np
+
+def get_cumulative_hazards(
+    scale: Any, time: Any, location: Any = ...
+) -> np.ndarray: ...
 def get_hazard_rate(scale: float, location: float = ...) -> float: ...
+def get_hazard_rates(scale: Any, time: Any, location: Any = ...) -> np.ndarray: ...
 def get_mtbf(rate: float, location: float = ...) -> float: ...
 def get_survival(scale: float, time: float, location: float = ...) -> float: ...
+def get_survivals(scale: Any, time: Any, location: Any = ...) -> np.ndarray: ...
+def get_log_likelihood_gradient(
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = ...,
+    location: float = ...,
+) -> np.ndarray: ...
 def do_fit(data: Any, **kwargs: Any) -> Tuple[float, float]: ...
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.statistics.fitting.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Functions for fitting distributions to censored and grouped data."""
+
+# Standard Library Imports
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+from scipy.optimize import minimize
+
+# RAMSTK Local Imports
+from .grid import DISTRIBUTIONS
+
+FIT_CACHE_SIZE: int = 64
+
+# Whether each distribution parameter must be positive.  Positive parameters
+# are estimated on the log scale so the optimizer is unconstrained.
+PARAMETERS: Dict[str, Tuple[bool, ...]] = {
+    "exponential": (True,),
+    "lognormal": (True, True),
+    "normal": (False, True),
+    "weibull": (True, True),
+}
+
+_FIT_CACHE: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
+
+def _get_starting_values(
+    distribution: str, time: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Calculate moment estimates of the parameters on the optimizer's scale.
+
+    :param distribution: the name of the distribution.
+    :param time: the representative time of each record.
+    :param weights: the weight (count) of each record.
+    :return: the starting values.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _time = np.maximum(time, np.finfo(float).tiny)
+    _mean = np.average(_time, weights=weights)
+    _std = np.sqrt(np.average((_time - _mean) ** 2, weights=weights))
+    _log_mean = np.average(np.log(_time), weights=weights)
+    _log_std = (
+        np.sqrt(np.average((np.log(_time) - _log_mean) ** 2, weights=weights)) or 1.0
+    )
+
+    _start = {
+        "exponential": [np.log(_mean)],
+        "lognormal": [np.log(_log_std), _log_mean],
+        "normal": [_mean, np.log(_std or _mean or 1.0)],
+        "weibull": [
+            np.log(1.2825 / _log_std),
+            _log_mean + 0.5772 * _log_std / 1.2825,
+        ],
+    }[distribution]
+
+    return np.asarray(_start, dtype=float)
+
+
+def get_log_likelihood(
+    distribution: str,
+    parameters: Sequence[float],
+    left: np.ndarray,
+    right: np.ndarray,
+    **kwargs: Any,
+) -> float:
+    """Calculate the log-likelihood of censored and grouped data.
+
+    Each record is an interval (left, right].  Records with left equal to right
+    are exact failures, records with right equal to inf are right censored, and
+    all other records are interval (or, with left equal to zero, left)
+    censored.
+
+    :param distribution: the name of the distribution.
+    :param parameters: the distribution parameters in the same order as the
+        distribution's get_hazard_rates() function.
+    :param left: the start of each record's interval.
+    :param right: the end of each record's interval.
+    :keyword weights: the weight (count) of each record.  Defaults to one.
+    :keyword location: the value of the location parameter.  It is not
+        estimated.
+    :return: the log-likelihood.
+    :rtype: float
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _weights = kwargs.get("weights", None)
+
+    _log_likelihood = _get_log_likelihood_terms(
+        distribution, parameters, left, right, kwargs.get("location", 0.0)
+    )
+    if _weights is not None:
+        _log_likelihood = _log_likelihood * _weights
+
+    return float(np.sum(_log_likelihood))
+
+
+def do_fit_censored(
+    distribution: str,
+    left: Any,
+    right: Optional[Any] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Fit a distribution to censored and grouped data.
+
+    The maximum likelihood estimates are found with a Nelder-Mead search from
+    several starting points; the best of the searches is returned.  The first
+    starting point is the moment estimate using each interval's midpoint and
+    the others are random perturbations of it.
+
+    :param distribution: the name of the distribution; one of exponential,
+        lognormal, normal, or weibull.
+    :param left: the failure time or start of each record's interval.
+    :param right: the end of each record's interval; equal to left for exact
+        failures and inf for right censored records.  Defaults to all exact
+        failures.
+    :keyword weights: the weight (count) of each record.  Defaults to one.
+    :keyword location: the value of the location parameter.  It is not
+        estimated.
+    :keyword n_starts: the number of starting points to search from.  Defaults
+        to 5.
+    :keyword seed: the seed for the perturbed starting points.  Defaults to 0.
+    :return: the distribution, parameters, log_likelihood, aic, and bic.
+    :rtype: dict
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _location = kwargs.get("location", 0.0)
+
+    _positive = np.asarray(PARAMETERS[distribution])
+    _left = np.asarray(left, dtype=float)
+    _right = _left if right is None else np.asarray(right, dtype=float)
+    _counts = (
+        np.ones_like(_left)
+        if kwargs.get("weights", None) is None
+        else np.asarray(kwargs["weights"], dtype=float)
+    )
+
+    def _do_transform(x: np.ndarray) -> np.ndarray:
+        """Return the distribution parameters for the optimizer's values."""
+        return np.where(_positive, np.exp(x), x)
+
+    def _get_objective(x: np.ndarray) -> float:
+        """Return the negative log-likelihood for the optimizer's values."""
+        _value = -get_log_likelihood(
+            distribution,
+            _do_transform(x),
+            _left,
+            _right,
+            weights=_counts,
+            location=_location,
+        )
+
+        return _value if np.isfinite(_value) else np.inf
+
+    _start = _get_starting_values(
+        distribution,
+        np.where(np.isinf(_right), _left, 0.5 * (_left + _right)) - _location,
+        _counts,
+    )
+    if distribution == "normal":
+        _start[0] += _location
+
+    _best = _do_minimize(
+        _get_objective, _start, kwargs.get("n_starts", 5), kwargs.get("seed", 0)
+    )
+    _n_parameters = _best.x.size
+    _log_likelihood = -float(_best.fun)
+
+    return {
+        "distribution": distribution,
+        "parameters": tuple(float(_p) for _p in _do_transform(_best.x)),
+        "log_likelihood": _log_likelihood,
+        "aic": 2.0 * _n_parameters - 2.0 * _log_likelihood,
+        "bic": _n_parameters * np.log(np.sum(_counts)) - 2.0 * _log_likelihood,
+        "converged": bool(_best.success),
+    }
+
+
+def _do_minimize(
+    objective: Callable[[np.ndarray], float],
+    start: np.ndarray,
+    n_starts: int,
+    seed: int,
+) -> Any:
+    """Minimize the objective with Nelder-Mead searches from several starts.
+
+    The first search starts from start and the others from random
+    perturbations of it.
+
+    :param objective: the function to minimize.
+    :param start: the first starting point.
+    :param n_starts: the number of starting points to search from.
+    :param seed: the seed for the perturbed starting points.
+    :return: _best; the scipy OptimizeResult of the best search.
+    :rtype: :class:`scipy.optimize.OptimizeResult`
+    """
+    _starts = [start] + list(
+        start
+        + np.random.default_rng(seed).normal(
+            0.0, 0.5, (max(n_starts - 1, 0), start.size)
+        )
+    )
+
+    _best = None
+    for _x0 in _starts:
+        _result = minimize(
+            objective,
+            _x0,
+            method="Nelder-Mead",
+            options={"xatol": 1.0e-8, "fatol": 1.0e-10, "maxiter": 2000},
+        )
+        if _best is None or _result.fun < _best.fun:
+            _best = _result
+
+    return _best
+
+
+def _get_log_likelihood_terms(
+    distribution: str,
+    parameters: Sequence[float],
+    left: np.ndarray,
+    right: np.ndarray,
+    location: float,
+) -> np.ndarray:
+    """Calculate each record's contribution to the log-likelihood.
+
+    Exact failures contribute log(h(t)) - H(t), right censored records
+    contribute -H(left), and interval censored records contribute
+    log(S(left) - S(right)).
+
+    :param distribution: the name of the distribution.
+    :param parameters: the distribution parameters.
+    :param left: the start of each record's interval.
+    :param right: the end of each record's interval.
+    :param location: the value of the location parameter.
+    :return: the unweighted log-likelihood of each record.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _hazard_rate, _, _cumulative_hazard, _ = DISTRIBUTIONS[distribution]
+    _parameters = list(parameters)
+    _exact = left == right
+    _censored = np.isinf(right)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        _cumulative_hazard_left = _cumulative_hazard(_parameters, left, location)
+        _cumulative_hazard_right = _cumulative_hazard(
+            _parameters, np.where(_exact | _censored, left, right), location
+        )
+
+        return np.select(
+            [_exact, _censored],
+            [
+                np.log(_hazard_rate(_parameters, left, location))
+                - _cumulative_hazard_left,
+                -_cumulative_hazard_left,
+            ],
+            default=-_cumulative_hazard_left
+            + np.log1p(-np.exp(_cumulative_hazard_left - _cumulative_hazard_right)),
+        )
+
+
+def get_dataset_hash(
+    left: Any, right: Optional[Any] = None, weights: Optional[Any] = None
+) -> str:
+    """Calculate a hash identifying a censored and grouped data set.
+
+    :param left: the failure time or start of each record's interval.
+    :param right: the end of each record's interval.
+    :param weights: the weight (count) of each record.
+    :return: the hex digest of the data set.
+    :rtype: str
+    """
+    _hash = hashlib.sha256()
+    for _array in [left, right, weights]:
+        if _array is None:
+            _hash.update(b"none")
+        else:
+            _hash.update(np.ascontiguousarray(_array, dtype=float).tobytes())
+        _hash.update(b"|")
+
+    return _hash.hexdigest()
+
+
+def do_fit_all(
+    left: Any,
+    right: Optional[Any] = None,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Fit every distribution to censored and grouped data and rank the fits.
+
+    The distributions are fit concurrently in a process pool.  The ranked fits
+    are cached by a hash of the data set and fit options so fitting the same
+    data set again returns the cached results.
+
+    :param left: the failure time or start of each record's interval.
+    :param right: the end of each record's interval; equal to left for exact
+        failures and inf for right censored records.  Defaults to all exact
+        failures.
+    :keyword weights: the weight (count) of each record.  Defaults to one.
+    :keyword location: the value of the location parameter.  It is not
+        estimated.
+    :keyword distributions: the names of the distributions to fit.  Defaults
+        to all distributions.
+    :keyword criterion: the information criterion to rank the fits by; aic or
+        bic.  Defaults to aic.
+    :keyword max_workers: the maximum number of worker processes.  Set to 1 to
+        fit in the calling process.  Defaults to one per distribution.
+    :keyword n_starts: the number of starting points to search from.
+    :keyword seed: the seed for the perturbed starting points.
+    :return: the fits of each distribution, best first.
+    :rtype: list
+    :raise: KeyError if passed an unknown distribution or criterion.
+    """
+    _weights = kwargs.get("weights", None)
+    _distributions = tuple(kwargs.get("distributions", PARAMETERS.keys()))
+    _criterion = kwargs.get("criterion", "aic")
+    _max_workers = kwargs.get("max_workers", len(_distributions))
+    _options = {
+        "weights": _weights,
+        "location": kwargs.get("location", 0.0),
+        "n_starts": kwargs.get("n_starts", 5),
+        "seed": kwargs.get("seed", 0),
+    }
+
+    _key = "{0}:{1}:{2}:{3}:{4}".format(
+        get_dataset_hash(left, right, _weights),
+        ",".join(_distributions),
+        _options["location"],
+        _options["n_starts"],
+        _options["seed"],
+    )
+    try:
+        _fits = _FIT_CACHE[_key]
+        _FIT_CACHE.move_to_end(_key)
+    except KeyError:
+        if _max_workers == 1:
+            _fits = [
+                do_fit_censored(_distribution, left, right, **_options)
+                for _distribution in _distributions
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=_max_workers) as _executor:
+                _futures = [
+                    _executor.submit(
+                        do_fit_censored, _distribution, left, right, **_options
+                    )
+                    for _distribution in _distributions
+                ]
+                _fits = [_future.result() for _future in _futures]
+
+        _FIT_CACHE[_key] = _fits
+        if len(_FIT_CACHE) > FIT_CACHE_SIZE:
+            _FIT_CACHE.popitem(last=False)
+
+    return sorted([dict(_fit) for _fit in _fits], key=lambda _fit: _fit[_criterion])
+
+
+def clear_fit_cache() -> None:
+    """Remove all the cached fits.
+
+    :return: None
+    :rtype: None
+    """
+    _FIT_CACHE.clear()
@@ -0,0 +1,44 @@
+# Standard Library Imports
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+FIT_CACHE_SIZE: int
+PARAMETERS: Dict[str, Tuple[bool, ...]]
+_FIT_CACHE: OrderedDict[str, List[Dict[str, Any]]]
+
+def _get_starting_values(
+    distribution: str, time: np.ndarray, weights: np.ndarray
+) -> np.ndarray: ...
+def get_log_likelihood(
+    distribution: str,
+    parameters: Sequence[float],
+    left: np.ndarray,
+    right: np.ndarray,
+    **kwargs: Any,
+) -> float: ...
+def do_fit_censored(
+    distribution: str, left: Any, right: Optional[Any] = ..., **kwargs: Any
+) -> Dict[str, Any]: ...
+def _do_minimize(
+    objective: Callable[[np.ndarray], float],
+    start: np.ndarray,
+    n_starts: int,
+    seed: int,
+) -> Any: ...
+def _get_log_likelihood_terms(
+    distribution: str,
+    parameters: Sequence[float],
+    left: np.ndarray,
+    right: np.ndarray,
+    location: float,
+) -> np.ndarray: ...
+def get_dataset_hash(
+    left: Any, right: Optional[Any] = ..., weights: Optional[Any] = ...
+) -> str: ...
+def do_fit_all(
+    left: Any, right: Optional[Any] = ..., **kwargs: Any
+) -> List[Dict[str, Any]]: ...
+def clear_fit_cache() -> None: ...
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.statistics.grid.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Functions for calculating reliability functions over a time grid."""
+
+# Standard Library Imports
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+from scipy.special import gamma
+
+# RAMSTK Local Imports
+from . import exponential, lognormal, normal, weibull
+
+# The hazard rate, survival, cumulative hazard, and MTBF function for each
+# distribution.  The parameters are in the same order as the parameters passed
+# to the bounds.DISTRIBUTIONS functions.
+DISTRIBUTIONS: Dict[str, Tuple[Callable, Callable, Callable, Callable]] = {
+    "exponential": (
+        lambda p, t, loc: exponential.get_hazard_rates(p[0], t, location=loc),
+        lambda p, t, loc: exponential.get_survivals(p[0], t, location=loc),
+        lambda p, t, loc: exponential.get_cumulative_hazards(p[0], t, location=loc),
+        lambda p, loc: np.where(p[0] > 0.0, loc + p[0], np.nan),
+    ),
+    "lognormal": (
+        lambda p, t, loc: lognormal.get_hazard_rates(p[0], p[1], t, location=loc),
+        lambda p, t, loc: lognormal.get_survivals(p[0], p[1], t, location=loc),
+        lambda p, t, loc: lognormal.get_cumulative_hazards(p[0], p[1], t, location=loc),
+        lambda p, loc: np.where(
+            (p[0] > 0.0) & (p[1] > 0.0), loc + p[1] * np.exp(0.5 * p[0] ** 2), np.nan
+        ),
+    ),
+    "normal": (
+        lambda p, t, loc: normal.get_hazard_rates(p[0], p[1], t),
+        lambda p, t, loc: normal.get_survivals(p[0], p[1], t),
+        lambda p, t, loc: normal.get_cumulative_hazards(p[0], p[1], t),
+        lambda p, loc: np.where(p[1] > 0.0, p[0], np.nan),
+    ),
+    "weibull": (
+        lambda p, t, loc: weibull.get_hazard_rates(p[0], p[1], t, location=loc),
+        lambda p, t, loc: weibull.get_survivals(p[0], p[1], t, location=loc),
+        lambda p, t, loc: weibull.get_cumulative_hazards(p[0], p[1], t, location=loc),
+        lambda p, loc: np.where(
+            (p[0] > 0.0) & (p[1] > 0.0), loc + p[1] * gamma(1.0 + 1.0 / p[0]), np.nan
+        ),
+    ),
+}
+
+
+def do_calculate_time_grid(
+    distribution: str,
+    parameters: Sequence[Any],
+    time: Any,
+    location: Any = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Calculate the reliability functions of many parameter sets at many times.
+
+    Each parameter (and the location) may be a scalar or an array with one
+    element per parameter set.  The parameter sets are broadcast against the
+    time grid so each function is returned as a matrix with one row per
+    parameter set and one column per time.
+
+        >>> _grid = do_calculate_time_grid(
+        ...     "weibull", [[1.0, 2.5], 525.0], [105.0, 210.0]
+        ... )
+        >>> _grid["survival"]
+        array([[0.81873075, 0.67032005],
+               [0.98227051, 0.90375869]])
+
+    :param distribution: the name of the distribution; one of exponential,
+        lognormal, normal, or weibull.
+    :param parameters: the distribution parameters in the same order as the
+        distribution's get_hazard_rates() function.
+    :param time: the time grid.
+    :param location: the location parameter(s).  Ignored for the normal
+        distribution.
+    :return: the hazard_rate, survival, and cumulative_hazard matrices and the
+        mtbf array with one element per parameter set.
+    :rtype: dict
+    :raise: KeyError if passed an unknown distribution.
+    """
+    _hazard_rate, _survival, _cumulative_hazard, _mtbf = DISTRIBUTIONS[distribution]
+
+    _parameters = [
+        np.asarray(_parameter, dtype=float).reshape(-1, 1) for _parameter in parameters
+    ]
+    _location = np.asarray(location, dtype=float).reshape(-1, 1)
+    _time = np.asarray(time, dtype=float).reshape(1, -1)
+
+    _results = {
+        "hazard_rate": _hazard_rate(_parameters, _time, _location),
+        "survival": _survival(_parameters, _time, _location),
+        "cumulative_hazard": _cumulative_hazard(_parameters, _time, _location),
+    }
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _results["mtbf"] = np.broadcast_to(
+            _mtbf(_parameters, _location), (_results["survival"].shape[0], 1)
+        )[:, 0].copy()
+
+    return _results
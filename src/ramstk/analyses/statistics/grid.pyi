@@ -0,0 +1,14 @@
+# Standard Library Imports
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# Third Party Imports
+import numpy as np
+
+DISTRIBUTIONS: Dict[str, Tuple[Callable, Callable, Callable, Callable]]
+
+def do_calculate_time_grid(
+    distribution: str,
+    parameters: Sequence[Any],
+    time: Any,
+    location: Any = ...,
+) -> Dict[str, np.ndarray]: ...
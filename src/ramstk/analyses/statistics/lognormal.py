@@ -8,11 +8,58 @@
 """Exponential Module."""
 
 # Standard Library Imports
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
 # Third Party Imports
+import numpy as np
 import scipy
-from scipy.stats import lognorm
+from scipy.special import log_ndtr, ndtr
+from scipy.stats import lognorm, norm
+
+
+def _get_standard_normal(
+    shape: Any, scale: Any, time: Any, location: Any
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Transform times to standard normal variates.
+
+    :return: (_z, _w, _valid); the times less the location, the standard normal
+        variates, and whether the parameters are valid.
+    :rtype: tuple
+    """
+    _z = np.asarray(time, dtype=float) - location
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _w = (np.log(np.maximum(_z, 0.0)) - np.log(scale)) / shape
+
+    return _z, _w, (np.asarray(shape) > 0.0) & (np.asarray(scale) > 0.0)
+
+
+def get_cumulative_hazards(
+    shape: Any, scale: Any, time: Any, location: Any = 0.0
+) -> np.ndarray:
+    """Calculate the cumulative hazard function at each time.
+
+    The parameters and times are broadcast against each other like any other
+    NumPy operation so passing a column of parameters and a row of times
+    returns one row per parameter set and one column per time.  The cumulative
+    hazard is zero up to the location and nan for invalid parameters.
+
+        >>> get_cumulative_hazards(0.9663, 33.65, [0.0, 4.0])
+        array([0.        , 0.01385799])
+
+    :param shape: the value(s) of the shape (sigma) parameter.
+    :param scale: the value(s) of the scale (exp(mu)) parameter.
+    :param time: the time(s) at which to calculate the cumulative hazard.
+    :param location: the value(s) of the location parameter.
+    :return: the cumulative hazard at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z, _w, _valid = _get_standard_normal(shape, scale, time, location)
+
+    with np.errstate(invalid="ignore"):
+        _cumulative_hazard = np.where(_z > 0.0, -log_ndtr(-_w), 0.0)
+
+    return np.where(_valid, _cumulative_hazard, np.nan)
 
 
 def get_hazard_rate(
@@ -24,10 +71,10 @@ def get_hazard_rate(
     optionally, a location parameter.
 
         >>> get_hazard_rate(0.9663, 4, scale=33.65)
-        0.6610467490673426
+        0.009224547565823771
 
         >>> get_hazard_rate(0.9663, 4, location=1.85, scale=33.65)
-        1.5117773383839221
+        0.003348937724573275
 
         >>> get_hazard_rate(0, 4, scale=33.65)
         nan
@@ -46,14 +93,71 @@ def get_hazard_rate(
     :return: _hazard_rate; the hazard rate.
     :rtype: float
     """
-    if time <= 0.0:
-        _hazard_rate = 0.0
-    else:
-        _hazard_rate = lognorm.pdf(
-            time, shape, loc=location, scale=scale
-        ) / lognorm.cdf(time, shape, loc=location, scale=scale)
+    return float(get_hazard_rates(shape, scale, time, location=location))
+
+
+def get_hazard_rates(
+    shape: Any, scale: Any, time: Any, location: Any = 0.0
+) -> np.ndarray:
+    """Calculate the hazard rate at each time.
+
+    This is the closed-form, broadcasting version of get_hazard_rate().  The
+    hazard rate is zero up to the location and nan for invalid parameters.
+
+        >>> get_hazard_rates(0.9663, 33.65, [0.0, 4.0])
+        array([0.        , 0.00922455])
 
-    return _hazard_rate
+    :param shape: the value(s) of the shape (sigma) parameter.
+    :param scale: the value(s) of the scale (exp(mu)) parameter.
+    :param time: the time(s) at which to calculate the hazard rate.
+    :param location: the value(s) of the location parameter.
+    :return: the hazard rate at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z, _w, _valid = _get_standard_normal(shape, scale, time, location)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        _hazard_rate = np.where(
+            _z > 0.0,
+            np.exp(-0.5 * _w ** 2 - log_ndtr(-_w))
+            / (np.sqrt(2.0 * np.pi) * np.asarray(shape, dtype=float) * _z),
+            0.0,
+        )
+
+    return np.where(_valid, _hazard_rate, np.nan)
+
+
+def get_log_likelihood_gradient(
+    shape: float,
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = None,
+    location: float = 0.0,
+) -> np.ndarray:
+    """Calculate the gradient of the log-likelihood of each record.
+
+    Failures contribute the log of the pdf and suspensions (right censored
+    records) contribute the log of the survival function.  The gradient is
+    calculated in closed form over the entire data array at once.
+
+    :param shape: the value of the shape (sigma) parameter.
+    :param scale: the value of the scale parameter; exp(mu).
+    :param time: the array of failure and suspension times.
+    :param failed: the array indicating whether each record is a failure (True)
+        or a suspension (False).  Defaults to all failures.
+    :param location: the value of the location parameter.  It is not estimated.
+    :return: the gradient with respect to the shape and scale parameters; one
+        row per parameter with one column per record.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z = (np.log(np.asarray(time, dtype=float) - location) - np.log(scale)) / shape
+    _failed = np.ones_like(_z) if failed is None else np.asarray(failed, dtype=float)
+    _hazard = np.exp(norm.logpdf(_z) - norm.logsf(_z))
+
+    _d_mu = np.where(_failed > 0.0, _z, _hazard) / shape
+    _d_sigma = np.where(_failed > 0.0, _z ** 2 - 1.0, _z * _hazard) / shape
+
+    return np.array([_d_sigma, _d_mu / scale])
 
 
 def get_mtbf(shape: float, location: float = 0.0, scale: float = 1.0) -> float:
@@ -104,6 +208,29 @@ def get_survival(
     return lognorm.sf(time, shape, loc=location, scale=scale)
 
 
+def get_survivals(shape: Any, scale: Any, time: Any, location: Any = 0.0) -> np.ndarray:
+    """Calculate the value of the survival function at each time.
+
+    This is the closed-form, broadcasting version of get_survival().
+
+        >>> get_survivals(0.9663, 33.65, [0.0, 4.0])
+        array([1.        , 0.98623759])
+
+    :param shape: the value(s) of the shape (sigma) parameter.
+    :param scale: the value(s) of the scale (exp(mu)) parameter.
+    :param time: the time(s) at which to calculate the survival function.
+    :param location: the value(s) of the location parameter.
+    :return: the value of the survival function at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z, _w, _valid = _get_standard_normal(shape, scale, time, location)
+
+    with np.errstate(invalid="ignore"):
+        _survival = np.where(_z > 0.0, ndtr(-_w), 1.0)
+
+    return np.where(_valid, _survival, np.nan)
+
+
 def do_fit(data, **kwargs) -> Tuple[float, float, float]:
     """Fits the provided data to the LOGN distribution and estimates scale and
     location.
@@ -8,13 +8,38 @@
 """Exponential Module."""
 
 # Standard Library Imports
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
 # Third Party Imports
+import numpy as np
 import scipy
+from scipy.special import log_ndtr, ndtr
 from scipy.stats import norm
 
 
+def get_cumulative_hazards(location: Any, scale: Any, time: Any) -> np.ndarray:
+    """Calculate the cumulative hazard function at each time.
+
+    The parameters and times are broadcast against each other like any other
+    NumPy operation so passing a column of parameters and a row of times
+    returns one row per parameter set and one column per time.  The cumulative
+    hazard is nan for invalid parameters.
+
+        >>> get_cumulative_hazards(100.0, 10.0, [85.0, 100.0])
+        array([0.06914346, 0.69314718])
+
+    :param location: the value(s) of the location (mu) parameter.
+    :param scale: the value(s) of the scale (sigma) parameter.
+    :param time: the time(s) at which to calculate the cumulative hazard.
+    :return: the cumulative hazard at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _w = (np.asarray(time, dtype=float) - location) / scale
+
+        return np.where(np.asarray(scale) > 0.0, -log_ndtr(-_w), np.nan)
+
+
 def get_hazard_rate(location: float, scale: float, time: float) -> float:
     """Calculates the hazard rate given a location and scale parameter.
 
@@ -22,13 +47,13 @@ def get_hazard_rate(location: float, scale: float, time: float) -> float:
     optionally, a location parameter.
 
         >>> get_hazard_rate(100.0, 10.0, 85.0)
-        0.013878975045885079
+        0.013878975045885075
 
         >>> get_hazard_rate(0.0, 10.0, 85.0)
-        0.8614595320165236
+        0.8614595320165261
 
         >>> get_hazard_rate(100.0, 0.0, 85.0)
-        0.0
+        nan
 
     :param location: the value of the location (mu) parameter.
     :param scale: the value of the scale (sigma) parameter.
@@ -36,13 +61,63 @@ def get_hazard_rate(location: float, scale: float, time: float) -> float:
     :return: _hazard_rate; the hazard rate.
     :rtype: float
     """
-    _hazard_rate = norm.pdf(time, loc=location, scale=scale,) / norm.sf(
-        time,
-        loc=location,
-        scale=scale,
-    )
+    return float(get_hazard_rates(location, scale, time))
+
+
+def get_hazard_rates(location: Any, scale: Any, time: Any) -> np.ndarray:
+    """Calculate the hazard rate at each time.
+
+    This is the closed-form, broadcasting version of get_hazard_rate().  The
+    hazard rate is nan for invalid parameters.
+
+        >>> get_hazard_rates(100.0, [[10.0], [20.0]], [85.0, 100.0])
+        array([[0.01387898, 0.07978846],
+               [0.0194691 , 0.03989423]])
+
+    :param location: the value(s) of the location (mu) parameter.
+    :param scale: the value(s) of the scale (sigma) parameter.
+    :param time: the time(s) at which to calculate the hazard rate.
+    :return: the hazard rate at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        _w = (np.asarray(time, dtype=float) - location) / scale
+        _hazard_rate = np.exp(-0.5 * _w ** 2 - log_ndtr(-_w)) / (
+            np.sqrt(2.0 * np.pi) * np.asarray(scale, dtype=float)
+        )
 
-    return _hazard_rate
+    return np.where(np.asarray(scale) > 0.0, _hazard_rate, np.nan)
+
+
+def get_log_likelihood_gradient(
+    location: float,
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Calculate the gradient of the log-likelihood of each record.
+
+    Failures contribute the log of the pdf and suspensions (right censored
+    records) contribute the log of the survival function.  The gradient is
+    calculated in closed form over the entire data array at once.
+
+    :param location: the value of the location (mu) parameter.
+    :param scale: the value of the scale (sigma) parameter.
+    :param time: the array of failure and suspension times.
+    :param failed: the array indicating whether each record is a failure (True)
+        or a suspension (False).  Defaults to all failures.
+    :return: the gradient with respect to the location and scale parameters;
+        one row per parameter with one column per record.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _z = (np.asarray(time, dtype=float) - location) / scale
+    _failed = np.ones_like(_z) if failed is None else np.asarray(failed, dtype=float)
+    _hazard = np.exp(norm.logpdf(_z) - norm.logsf(_z))
+
+    _d_mu = np.where(_failed > 0.0, _z, _hazard) / scale
+    _d_sigma = np.where(_failed > 0.0, _z ** 2 - 1.0, _z * _hazard) / scale
+
+    return np.array([_d_mu, _d_sigma])
 
 
 def get_mtbf(location: float, scale: float) -> float:
@@ -93,6 +168,26 @@ def get_survival(
     return norm.sf(time, location, scale)
 
 
+def get_survivals(location: Any, scale: Any, time: Any) -> np.ndarray:
+    """Calculate the value of the survival function at each time.
+
+    This is the closed-form, broadcasting version of get_survival().
+
+        >>> get_survivals(100.0, 10.0, [85.0, 100.0])
+        array([0.9331928, 0.5      ])
+
+    :param location: the value(s) of the location (mu) parameter.
+    :param scale: the value(s) of the scale (sigma) parameter.
+    :param time: the time(s) at which to calculate the survival function.
+    :return: the value of the survival function at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _w = (np.asarray(time, dtype=float) - location) / scale
+
+        return np.where(np.asarray(scale) > 0.0, ndtr(-_w), np.nan)
+
+
 def do_fit(data, **kwargs) -> Tuple[float, float]:
     """Fits the provided data to the EXP distribution and estimates scale and location.
 
@@ -1,7 +1,19 @@
 # Standard Library Imports
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
+# Third Party Imports
+import numpy as np
+
+def get_cumulative_hazards(location: Any, scale: Any, time: Any) -> np.ndarray: ...
 def get_hazard_rate(location: float, scale: float, time: float) -> float: ...
+def get_hazard_rates(location: Any, scale: Any, time: Any) -> np.ndarray: ...
 def get_mtbf(location: float, scale: float) -> float: ...
 def get_survival(location: float, scale: float, time: float) -> float: ...
+def get_survivals(location: Any, scale: Any, time: Any) -> np.ndarray: ...
+def get_log_likelihood_gradient(
+    location: float,
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = ...,
+) -> np.ndarray: ...
 def do_fit(data: Any, **kwargs: Any) -> Tuple[float, float]: ...
@@ -8,13 +8,46 @@
 """Exponential Module."""
 
 # Standard Library Imports
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
 # Third Party Imports
+import numpy as np
 import scipy
 from scipy.stats import weibull_min
 
 
+def get_cumulative_hazards(
+    shape: Any, scale: Any, time: Any, location: Any = 0.0
+) -> np.ndarray:
+    """Calculate the cumulative hazard function at each time.
+
+    The parameters and times are broadcast against each other like any other
+    NumPy operation so passing a column of parameters and a row of times
+    returns one row per parameter set and one column per time.  The cumulative
+    hazard is zero up to the location and nan for invalid parameters.
+
+        >>> get_cumulative_hazards(2.5, 525.0, [0.0, 105.0])
+        array([0.        , 0.01788854])
+
+    :param shape: the value(s) of the shape (beta) parameter.
+    :param scale: the value(s) of the scale (eta) parameter.
+    :param time: the time(s) at which to calculate the cumulative hazard.
+    :param location: the value(s) of the location (gamma) parameter.
+    :return: the cumulative hazard at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _shape = np.asarray(shape, dtype=float)
+    _scale = np.asarray(scale, dtype=float)
+    _z = np.asarray(time, dtype=float) - location
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _cumulative_hazard = np.where(
+            _z > 0.0, (np.maximum(_z, 0.0) / _scale) ** _shape, 0.0
+        )
+
+    return np.where((_shape > 0.0) & (_scale > 0.0), _cumulative_hazard, np.nan)
+
+
 def get_hazard_rate(
     shape: float, scale: float, time: float, location: float = 0.0
 ) -> float:
@@ -24,16 +57,16 @@ def get_hazard_rate(
     optionally, a location parameter.
 
         >>> get_hazard_rate(2.5, 525.0, 105.0)
-        0.02359719987177253
+        0.00042591770999996
 
         >>> get_hazard_rate(2.5, 525.0, 105.0, location=18.5)
-        0.028742792496007755
+        0.00031846808129185294
 
         >>> get_hazard_rate(0.0, 525.0, 105.0)
         nan
 
         >>> get_hazard_rate(2.5, 0.0, 105.0)
-        0.0
+        nan
 
         >>> get_hazard_rate(2.5, 525.0, 0.0)
         0.0
@@ -50,14 +83,78 @@ def get_hazard_rate(
     :return: _hazard_rate; the hazard rate.
     :rtype: float
     """
-    if time <= 0.0:
-        _hazard_rate = 0.0
-    else:
-        _hazard_rate = weibull_min.pdf(
-            time, shape, loc=location, scale=scale
-        ) / weibull_min.cdf(time, shape, loc=location, scale=scale)
+    return float(get_hazard_rates(shape, scale, time, location=location))
+
+
+def get_hazard_rates(
+    shape: Any, scale: Any, time: Any, location: Any = 0.0
+) -> np.ndarray:
+    """Calculate the hazard rate at each time.
+
+    This is the closed-form, broadcasting version of get_hazard_rate().  The
+    hazard rate is zero up to the location and nan for invalid parameters.
+
+        >>> get_hazard_rates([[1.0], [2.5]], 525.0, [105.0, 210.0])
+        array([[0.00190476, 0.00190476],
+               [0.00042592, 0.00120468]])
+
+    :param shape: the value(s) of the shape (beta) parameter.
+    :param scale: the value(s) of the scale (eta) parameter.
+    :param time: the time(s) at which to calculate the hazard rate.
+    :param location: the value(s) of the location (gamma) parameter.
+    :return: the hazard rate at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _shape = np.asarray(shape, dtype=float)
+    _scale = np.asarray(scale, dtype=float)
+    _z = np.asarray(time, dtype=float) - location
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _hazard_rate = np.where(
+            _z > 0.0,
+            _shape / _scale * (np.maximum(_z, 0.0) / _scale) ** (_shape - 1.0),
+            0.0,
+        )
 
-    return _hazard_rate
+    return np.where((_shape > 0.0) & (_scale > 0.0), _hazard_rate, np.nan)
+
+
+def get_log_likelihood_gradient(
+    shape: float,
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = None,
+    location: float = 0.0,
+) -> np.ndarray:
+    """Calculate the gradient of the log-likelihood of each record.
+
+    Failures contribute the log of the pdf and suspensions (right censored
+    records) contribute the log of the survival function.  The gradient is
+    calculated in closed form over the entire data array at once.
+
+    :param shape: the value of the shape (beta) parameter.
+    :param scale: the value of the scale (eta) parameter.
+    :param time: the array of failure and suspension times.
+    :param failed: the array indicating whether each record is a failure (True)
+        or a suspension (False).  Defaults to all failures.
+    :param location: the value of the location (gamma) parameter.  It is not
+        estimated.
+    :return: the gradient with respect to the shape and scale parameters; one
+        row per parameter with one column per record.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _log_u = np.log(np.asarray(time, dtype=float) - location) - np.log(scale)
+    _u_beta = np.exp(shape * _log_u)
+    _failed = (
+        np.ones_like(_log_u) if failed is None else np.asarray(failed, dtype=float)
+    )
+
+    return np.array(
+        [
+            _failed * (1.0 / shape + _log_u) - _u_beta * _log_u,
+            shape / scale * (_u_beta - _failed),
+        ]
+    )
 
 
 def get_mtbf(shape: float, scale: float, location: float = 0.0) -> float:
@@ -114,6 +211,24 @@ def get_survival(
     return weibull_min.sf(time, shape, loc=location, scale=scale)
 
 
+def get_survivals(shape: Any, scale: Any, time: Any, location: Any = 0.0) -> np.ndarray:
+    """Calculate the value of the survival function at each time.
+
+    This is the closed-form, broadcasting version of get_survival().
+
+        >>> get_survivals(2.5, 525.0, [0.0, 105.0])
+        array([1.        , 0.98227051])
+
+    :param shape: the value(s) of the shape (beta) parameter.
+    :param scale: the value(s) of the scale (eta) parameter.
+    :param time: the time(s) at which to calculate the survival function.
+    :param location: the value(s) of the location (gamma) parameter.
+    :return: the value of the survival function at each time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.exp(-get_cumulative_hazards(shape, scale, time, location=location))
+
+
 def do_fit(data, **kwargs) -> Tuple[float, float, float]:
     """Fits the provided data to the WEI distribution and estimates scale and location.
 
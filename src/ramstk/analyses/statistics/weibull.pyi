@@ -1,11 +1,30 @@
 # Standard Library Imports
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
+# Third Party Imports
+import numpy as np
+
+def get_cumulative_hazards(
+    shape: Any, scale: Any, time: Any, location: Any = ...
+) -> np.ndarray: ...
 def get_hazard_rate(
     shape: float, scale: float, time: float, location: float = ...
 ) -> float: ...
+def get_hazard_rates(
+    shape: Any, scale: Any, time: Any, location: Any = ...
+) -> np.ndarray: ...
 def get_mtbf(shape: float, scale: float, location: float = ...) -> float: ...
 def get_survival(
     shape: float, scale: float, time: float, location: float = ...
 ) -> float: ...
+def get_survivals(
+    shape: Any, scale: Any, time: Any, location: Any = ...
+) -> np.ndarray: ...
+def get_log_likelihood_gradient(
+    shape: float,
+    scale: float,
+    time: np.ndarray,
+    failed: Optional[np.ndarray] = ...,
+    location: float = ...,
+) -> np.ndarray: ...
 def do_fit(data: Any, **kwargs: Any) -> Tuple[float, float, float]: ...
@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.cli.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""The headless command line program for RAMSTK batch calculations.
+
+This program opens one or more RAMSTK Program databases, selects a revision,
+and runs a pipeline of analyses on it without a display.  For example::
+
+    ramstk-batch --revision 1 --steps prediction,criticality --jobs 4 db1 db2
+
+Each database is processed in its own worker process and the elapsed time
+and status of each are reported when it finishes.
+"""
+
+# Standard Library Imports
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third Party Imports
+from pubsub import pub
+
+# RAMSTK Package Imports
+from ramstk.application import do_connect_to_site_db, do_initialize_databases
+from ramstk.configuration import RAMSTKSiteConfiguration, RAMSTKUserConfiguration
+from ramstk.db import BaseDatabase
+from ramstk.db.common import do_load_variables
+from ramstk.models import RAMSTKProgramDB
+
+
+def _get_hazard_rates(program_db: RAMSTKProgramDB) -> Dict[int, float]:
+    """Return the active hazard rate of every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: the active hazard rate of each hardware item keyed by hardware ID.
+    :rtype: dict
+    """
+    return {
+        _node.identifier: _node.data["reliability"].hazard_rate_active
+        for _node in program_db.dic_tables["reliability"].tree.all_nodes()[1:]
+    }
+
+
+def do_run_allocation(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the reliability goals and allocations of every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: None
+    :rtype: None
+    """
+    pub.sendMessage(
+        "request_calculate_all_allocations",
+        hazard_rates=_get_hazard_rates(program_db),
+    )
+
+
+def do_run_criticality(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the MIL-STD-1629A criticality of every failure mode.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: None
+    :rtype: None
+    """
+    pub.sendMessage(
+        "request_calculate_all_criticality",
+        hazard_rates=_get_hazard_rates(program_db),
+    )
+
+
+def do_run_prediction(
+    program_db: RAMSTKProgramDB,  # pylint: disable=unused-argument
+) -> None:
+    """Predict the reliability of every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: None
+    :rtype: None
+    """
+    pub.sendMessage("request_calculate_all_hardware")
+
+
+def do_run_roll_up(program_db: RAMSTKProgramDB) -> None:
+    """Roll up the cost, part count, and power of every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: None
+    :rtype: None
+    """
+    _tree = program_db.dic_views["hardwarebom"].tree
+    for _node in _tree.children(_tree.root):
+        pub.sendMessage("request_roll_up_hardware", node_id=_node.identifier)
+
+
+def do_run_similar_item(program_db: RAMSTKProgramDB) -> None:
+    """Perform the similar item analysis of every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the selected revision loaded.
+    :return: None
+    :rtype: None
+    """
+    pub.sendMessage(
+        "request_calculate_all_similar_items",
+        hazard_rates=_get_hazard_rates(program_db),
+    )
+
+
+# The pipeline steps in the order they are run.  The prediction comes first
+# because the other analyses use the predicted hazard rates.
+STEPS: Dict[str, Callable[[RAMSTKProgramDB], None]] = {
+    "rollup": do_run_roll_up,
+    "prediction": do_run_prediction,
+    "allocation": do_run_allocation,
+    "similar_item": do_run_similar_item,
+    "criticality": do_run_criticality,
+}
+DEFAULT_STEPS: List[str] = ["prediction", "allocation", "similar_item", "criticality"]
+
+
+def do_read_configurations() -> Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration]:
+    """Read the site and user configurations without raising any dialogs.
+
+    :return: the site and user configuration instances.
+    :rtype: tuple
+    :raise: RuntimeError if the site database connection hasn't been set up.
+    """
+    _site_configuration = RAMSTKSiteConfiguration()
+    _site_configuration.set_site_directories()
+    _site_configuration.get_site_configuration()
+
+    if _site_configuration.RAMSTK_COM_INFO["user"] == "first_run":
+        raise RuntimeError(
+            "The RAMSTK site database connection has not been set up.  Run "
+            "ramstk once to set it up."
+        )
+
+    _user_configuration = RAMSTKUserConfiguration()
+    _user_configuration.set_user_directories()
+    _user_configuration.get_user_configuration()
+
+    return _site_configuration, _user_configuration
+
+
+def do_parse_steps(steps: str) -> List[str]:
+    """Convert a comma-separated list of step names to a list of steps.
+
+    The steps are returned in pipeline order no matter what order they were
+    passed in.
+
+    :param steps: the comma-separated names of the steps to run.
+    :return: the names of the steps to run.
+    :rtype: list
+    :raise: argparse.ArgumentTypeError if passed an unknown step name.
+    """
+    _steps = {_step.strip() for _step in steps.split(",") if _step.strip()}
+
+    _unknown = _steps.difference(STEPS)
+    if _unknown:
+        raise argparse.ArgumentTypeError(
+            "unknown step(s) {0}; choose from {1}.".format(
+                ", ".join(sorted(_unknown)), ", ".join(STEPS)
+            )
+        )
+
+    return [_step for _step in STEPS if _step in _steps]
+
+
+def do_open_database(
+    database: str,
+    configurations: Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration],
+) -> RAMSTKProgramDB:
+    """Connect to the site database and open one RAMSTK Program database.
+
+    :param database: the name of the RAMSTK Program database.
+    :param configurations: the site and user configuration instances.
+    :return: _program_db; the RAMSTKProgramDB() with the program open.
+    :rtype: :class:`ramstk.models.RAMSTKProgramDB`
+    """
+    _site_configuration, _user_configuration = configurations
+
+    _site_db = do_connect_to_site_db(_site_configuration.RAMSTK_COM_INFO)
+    do_load_variables(_site_db, _user_configuration)
+    _program_db = do_initialize_databases(_user_configuration, _site_db)
+
+    _database = dict(_user_configuration.RAMSTK_PROG_INFO)
+    _database["database"] = database
+    pub.sendMessage(
+        "request_open_program", program_db=BaseDatabase(), database=_database
+    )
+
+    return _program_db
+
+
+def do_run_steps(
+    program_db: RAMSTKProgramDB, revision_id: int, steps: Sequence[str]
+) -> Dict[str, float]:
+    """Select a revision and run the pipeline steps on it.
+
+    :param program_db: the RAMSTKProgramDB() with the program open.
+    :param revision_id: the ID of the revision to analyze.
+    :param steps: the names of the steps to run.
+    :return: _elapsed; the elapsed time of each step keyed by step name.
+    :rtype: dict
+    """
+    _elapsed: Dict[str, float] = {}
+
+    pub.sendMessage("selected_revision", attributes={"revision_id": revision_id})
+    for _step in steps:
+        _start = time.perf_counter()
+        STEPS[_step](program_db)
+        _elapsed[_step] = time.perf_counter() - _start
+
+    return _elapsed
+
+
+def do_run_database(
+    database: str,
+    revision_id: int,
+    steps: Sequence[str],
+    save: bool = True,
+    configurations: Optional[
+        Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration]
+    ] = None,
+) -> Dict[str, Any]:
+    """Run the pipeline on one RAMSTK Program database.
+
+    Any fail_* message sent while the pipeline is running is recorded as an
+    error.  The site database is disconnected and every listener is
+    unsubscribed when the database is finished so the next database run in
+    the same process starts clean.
+
+    :param database: the name of the RAMSTK Program database.
+    :param revision_id: the ID of the revision to analyze.
+    :param steps: the names of the steps to run.
+    :param save: whether or not to save the results to the database.
+    :param configurations: the site and user configuration instances.
+        Defaults to reading them with do_read_configurations().
+    :return: the name, status, total elapsed time, elapsed time of each step,
+        and errors for the database.  The status is 0 if there were no errors
+        and 1 otherwise.
+    :rtype: dict
+    """
+    _errors: List[str] = []
+    _result: Dict[str, Any] = {
+        "database": database,
+        "status": 0,
+        "elapsed": 0.0,
+        "steps": {},
+        "errors": _errors,
+    }
+
+    def on_fail(topic=pub.AUTO_TOPIC, **kwargs: Any) -> None:
+        """Record the error message of every fail_* message.
+
+        :param topic: the topic of the message that was sent.
+        :return: None
+        :rtype: None
+        """
+        if topic.getName().startswith("fail_"):
+            _errors.append(kwargs.get("error_message", topic.getName()))
+
+    pub.subscribe(on_fail, pub.ALL_TOPICS)
+
+    _start = time.perf_counter()
+    try:
+        _program_db = do_open_database(
+            database, configurations or do_read_configurations()
+        )
+
+        if not _errors:
+            _result["steps"] = do_run_steps(_program_db, revision_id, steps)
+
+            if save:
+                pub.sendMessage("request_save_project")
+            pub.sendMessage("request_close_program")
+        _program_db.dic_tables["options"].dao.do_disconnect()
+    except Exception as _error:  # pylint: disable=broad-except
+        _errors.append(str(_error))
+    finally:
+        pub.unsubAll()
+
+    _result["elapsed"] = time.perf_counter() - _start
+    _result["status"] = int(bool(_errors))
+
+    return _result
+
+
+def do_run_databases(
+    databases: Sequence[str],
+    revision_id: int,
+    steps: Sequence[str],
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Run the pipeline on each RAMSTK Program database.
+
+    :param databases: the names of the RAMSTK Program databases.
+    :param revision_id: the ID of the revision to analyze in each database.
+    :param steps: the names of the steps to run.
+    :keyword max_workers: the maximum number of worker processes.  Set to 1 to
+        run in the calling process.  Defaults to one.
+    :keyword save: whether or not to save the results.  Defaults to True.
+    :keyword configurations: the site and user configuration instances passed
+        to do_run_database().  Defaults to each worker reading them.
+    :return: the results of do_run_database() for each database in the order
+        they were passed.
+    :rtype: list
+    """
+    _max_workers = kwargs.get("max_workers", 1)
+    _save = kwargs.get("save", True)
+    _configurations = kwargs.get("configurations", None)
+
+    if _max_workers == 1:
+        return [
+            do_run_database(_database, revision_id, steps, _save, _configurations)
+            for _database in databases
+        ]
+
+    with ProcessPoolExecutor(max_workers=_max_workers) as _executor:
+        _futures = [
+            _executor.submit(
+                do_run_database,
+                _database,
+                revision_id,
+                steps,
+                _save,
+                _configurations,
+            )
+            for _database in databases
+        ]
+        return [_future.result() for _future in _futures]
+
+
+def do_make_parser() -> argparse.ArgumentParser:
+    """Create the command line argument parser.
+
+    :return: the argument parser.
+    :rtype: :class:`argparse.ArgumentParser`
+    """
+    _parser = argparse.ArgumentParser(
+        prog="ramstk-batch",
+        description="Run RAMSTK analyses on one or more program databases "
+        "without a display.",
+    )
+    _parser.add_argument(
+        "databases",
+        nargs="+",
+        help="the names of the RAMSTK program databases to analyze.",
+    )
+    _parser.add_argument(
+        "-r",
+        "--revision",
+        type=int,
+        default=1,
+        help="the ID of the revision to analyze (default: %(default)s).",
+    )
+    _parser.add_argument(
+        "-s",
+        "--steps",
+        type=do_parse_steps,
+        default=DEFAULT_STEPS,
+        help="comma-separated steps to run from {0} (default: {1}).".format(
+            ", ".join(STEPS), ",".join(DEFAULT_STEPS)
+        ),
+    )
+    _parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="the number of databases to analyze at once (default: %(default)s).",
+    )
+    _parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="run the analyses but don't save the results.",
+    )
+
+    return _parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Execute the headless batch calculation program.
+
+    :param argv: the command line arguments.  Defaults to sys.argv.
+    :return: 0 if every database was analyzed without errors, 1 otherwise.
+    :rtype: int
+    """
+    _args = do_make_parser().parse_args(argv)
+
+    _results = do_run_databases(
+        _args.databases,
+        _args.revision,
+        _args.steps,
+        max_workers=max(1, min(_args.jobs, len(_args.databases))),
+        save=not _args.dry_run,
+    )
+
+    for _result in _results:
+        print(
+            "{0}: {1} in {2:.2f}s ({3})".format(
+                _result["database"],
+                "FAILED" if _result["status"] else "OK",
+                _result["elapsed"],
+                ", ".join(
+                    "{0} {1:.2f}s".format(_step, _elapsed)
+                    for _step, _elapsed in _result["steps"].items()
+                ),
+            )
+        )
+        for _error in _result["errors"]:
+            print("    {0}".format(_error))
+
+    return int(any(_result["status"] for _result in _results))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+# Standard Library Imports
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# RAMSTK Package Imports
+from ramstk.application import do_connect_to_site_db as do_connect_to_site_db
+from ramstk.application import do_initialize_databases as do_initialize_databases
+from ramstk.configuration import RAMSTKSiteConfiguration as RAMSTKSiteConfiguration
+from ramstk.configuration import RAMSTKUserConfiguration as RAMSTKUserConfiguration
+from ramstk.db import BaseDatabase as BaseDatabase
+from ramstk.db.common import do_load_variables as do_load_variables
+from ramstk.models import RAMSTKProgramDB as RAMSTKProgramDB
+
+def _get_hazard_rates(program_db: RAMSTKProgramDB) -> Dict[int, float]: ...
+def do_run_allocation(program_db: RAMSTKProgramDB) -> None: ...
+def do_run_criticality(program_db: RAMSTKProgramDB) -> None: ...
+def do_run_prediction(program_db: RAMSTKProgramDB) -> None: ...
+def do_run_roll_up(program_db: RAMSTKProgramDB) -> None: ...
+def do_run_similar_item(program_db: RAMSTKProgramDB) -> None: ...
+
+STEPS: Dict[str, Callable[[RAMSTKProgramDB], None]]
+DEFAULT_STEPS: List[str]
+
+def do_read_configurations() -> (
+    Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration]
+): ...
+def do_parse_steps(steps: str) -> List[str]: ...
+def do_open_database(
+    database: str,
+    configurations: Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration],
+) -> RAMSTKProgramDB: ...
+def do_run_steps(
+    program_db: RAMSTKProgramDB, revision_id: int, steps: Sequence[str]
+) -> Dict[str, float]: ...
+def do_run_database(
+    database: str,
+    revision_id: int,
+    steps: Sequence[str],
+    save: bool = ...,
+    configurations: Optional[
+        Tuple[RAMSTKSiteConfiguration, RAMSTKUserConfiguration]
+    ] = ...,
+) -> Dict[str, Any]: ...
+def do_run_databases(
+    databases: Sequence[str],
+    revision_id: int,
+    steps: Sequence[str],
+    **kwargs: Any,
+) -> List[Dict[str, Any]]: ...
+def do_make_parser() -> argparse.ArgumentParser: ...
+def main(argv: Optional[Sequence[str]] = ...) -> int: ...
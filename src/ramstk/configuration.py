@@ -347,6 +347,12 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             | password | User password                 |
             +----------+-------------------------------+
 
+    :ivar dict RAMSTK_LOAD_POLICY: Dictionary containing the policy to use when
+        loading each RAMSTK work stream module's records.  Keys are the name of
+        the module, values are either *eager* to load every record when a
+        revision is selected or *lazy* to load only the record IDs and load
+        the records as they're used.  Modules missing from the dictionary
+        are loaded eagerly.
     :ivar dict RAMSTK_PROG_INFO: Dictionary for RAMSTK Program database
         connection information.  The information contained is:
 
@@ -554,6 +560,7 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
 
         self.RAMSTK_COLORS: Dict[str, str] = {}
         self.RAMSTK_FORMAT_FILE: Dict[str, str] = {}
+        self.RAMSTK_LOAD_POLICY: Dict[str, str] = {}
         self.RAMSTK_PAGE_NUMBER: Dict[int, str] = {
             0: "revision",
             1: "function",
@@ -824,6 +831,36 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "validationbg": "#FFFFFF",
                 "validationfg": "#000000",
             },
+            "loading": {
+                "action": "eager",
+                "allocation": "eager",
+                "cause": "eager",
+                "control": "eager",
+                "design_electric": "eager",
+                "design_mechanic": "eager",
+                "environment": "eager",
+                "failure_definition": "eager",
+                "function": "eager",
+                "hardware": "eager",
+                "hazards": "eager",
+                "mechanism": "eager",
+                "milhdbk217f": "eager",
+                "mission": "eager",
+                "mission_phase": "eager",
+                "mode": "eager",
+                "nswc": "eager",
+                "opload": "eager",
+                "opstress": "eager",
+                "program_info": "eager",
+                "program_status": "eager",
+                "reliability": "eager",
+                "requirement": "eager",
+                "revision": "eager",
+                "similar_item": "eager",
+                "stakeholder": "eager",
+                "test_method": "eager",
+                "validation": "eager",
+            },
             "stress": {
                 "integratedcircuit": [
                     0.8,
@@ -877,6 +914,11 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             for _file in self._lst_format_files:
                 self.RAMSTK_FORMAT_FILE[_file] = _config["layouts"][_file]
 
+            # Configuration files created before the loading policy was
+            # added won't have a loading section.  All modules are loaded
+            # eagerly in that case.
+            self.RAMSTK_LOAD_POLICY = dict(_config.get("loading", {}))
+
             # Hardware categories are stored as integers, but configuration
             # file keys are human-readable nouns.  This converts the noun key
             # to the equivalent integer key.
@@ -994,6 +1036,7 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "validationbg": self.RAMSTK_COLORS["validationbg"],
                 "validationfg": self.RAMSTK_COLORS["validationfg"],
             },
+            "loading": self.RAMSTK_LOAD_POLICY,
             "stress": {
                 "integratedcircuit": self.RAMSTK_STRESS_LIMITS[1],
                 "semiconductor": self.RAMSTK_STRESS_LIMITS[2],
@@ -75,6 +75,7 @@ class RAMSTKUserConfiguration:
     RAMSTK_VALIDATION_TYPE: Any = ...
     RAMSTK_COLORS: Any = ...
     RAMSTK_FORMAT_FILE: Any = ...
+    RAMSTK_LOAD_POLICY: Any = ...
     RAMSTK_PAGE_NUMBER: Any = ...
     RAMSTK_PROG_INFO: Any = ...
     RAMSTK_TABPOS: Any = ...
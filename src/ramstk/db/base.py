@@ -8,7 +8,7 @@
 
 # Standard Library Imports
 import sqlite3
-from typing import Any, Dict, List, TextIO, Tuple
+from typing import Any, Dict, List, Set, TextIO, Tuple
 
 # Third Party Imports
 import psycopg2  # type: ignore
@@ -17,18 +17,278 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT  # type: ignore
 from pubsub import pub
 
 # noinspection PyPackageRequirements
-from sqlalchemy import create_engine, exc
+from sqlalchemy import create_engine, event, exc, inspect, text
 
 # noinspection PyPackageRequirements,PyProtectedMember
 from sqlalchemy.engine import Engine  # type: ignore
 
 # noinspection PyPackageRequirements
-from sqlalchemy.orm import query, scoped_session, sessionmaker  # type: ignore
-from sqlalchemy.orm.exc import FlushError  # type: ignore
+from sqlalchemy.orm import (  # type: ignore
+    object_session,
+    query,
+    scoped_session,
+    sessionmaker,
+)
+from sqlalchemy.orm.exc import FlushError, StaleDataError  # type: ignore
 
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError
 
+# The secondary indexes of a RAMSTK Program database as (name, table,
+# columns).  Every table is loaded by filtering on the revision ID and
+# ordering by the table's ID so those indexes cover both.  The others are on
+# the parent foreign keys used to find child records, including by the ON
+# DELETE CASCADE constraints.
+PROGRAM_DB_INDEXES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("idx_action_cause", "ramstk_action", ("fld_cause_id",)),
+    ("idx_action_revision", "ramstk_action", ("fld_revision_id", "fld_action_id")),
+    (
+        "idx_allocation_revision",
+        "ramstk_allocation",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    ("idx_cause_mechanism", "ramstk_cause", ("fld_mechanism_id",)),
+    ("idx_cause_mode", "ramstk_cause", ("fld_mode_id",)),
+    ("idx_cause_revision", "ramstk_cause", ("fld_revision_id", "fld_cause_id")),
+    ("idx_control_cause", "ramstk_control", ("fld_cause_id",)),
+    ("idx_control_revision", "ramstk_control", ("fld_revision_id", "fld_control_id")),
+    (
+        "idx_design_electric_revision",
+        "ramstk_design_electric",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    (
+        "idx_design_mechanic_revision",
+        "ramstk_design_mechanic",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    ("idx_environment_mission", "ramstk_environment", ("fld_mission_id",)),
+    ("idx_environment_phase", "ramstk_environment", ("fld_phase_id",)),
+    (
+        "idx_environment_revision",
+        "ramstk_environment",
+        ("fld_revision_id", "fld_environment_id"),
+    ),
+    (
+        "idx_failure_definition_revision",
+        "ramstk_failure_definition",
+        ("fld_revision_id", "fld_definition_id"),
+    ),
+    (
+        "idx_function_revision",
+        "ramstk_function",
+        ("fld_revision_id", "fld_function_id"),
+    ),
+    (
+        "idx_hardware_revision",
+        "ramstk_hardware",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    ("idx_hazard_analysis_function", "ramstk_hazard_analysis", ("fld_function_id",)),
+    (
+        "idx_hazard_analysis_revision",
+        "ramstk_hazard_analysis",
+        ("fld_revision_id", "fld_hazard_id"),
+    ),
+    ("idx_mechanism_mode", "ramstk_mechanism", ("fld_mode_id",)),
+    (
+        "idx_mechanism_revision",
+        "ramstk_mechanism",
+        ("fld_revision_id", "fld_mechanism_id"),
+    ),
+    (
+        "idx_mil_hdbk_f_revision",
+        "ramstk_mil_hdbk_f",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    ("idx_mission_phase_mission", "ramstk_mission_phase", ("fld_mission_id",)),
+    (
+        "idx_mission_phase_revision",
+        "ramstk_mission_phase",
+        ("fld_revision_id", "fld_phase_id"),
+    ),
+    ("idx_mission_revision", "ramstk_mission", ("fld_revision_id", "fld_mission_id")),
+    ("idx_mode_hardware", "ramstk_mode", ("fld_hardware_id",)),
+    ("idx_mode_revision", "ramstk_mode", ("fld_revision_id", "fld_mode_id")),
+    ("idx_nswc_revision", "ramstk_nswc", ("fld_revision_id", "fld_hardware_id")),
+    ("idx_op_load_mechanism", "ramstk_op_load", ("fld_mechanism_id",)),
+    ("idx_op_load_revision", "ramstk_op_load", ("fld_revision_id", "fld_load_id")),
+    ("idx_op_stress_load", "ramstk_op_stress", ("fld_load_id",)),
+    (
+        "idx_op_stress_revision",
+        "ramstk_op_stress",
+        ("fld_revision_id", "fld_stress_id"),
+    ),
+    (
+        "idx_program_status_revision",
+        "ramstk_program_status",
+        ("fld_revision_id", "fld_status_id"),
+    ),
+    (
+        "idx_reliability_revision",
+        "ramstk_reliability",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    (
+        "idx_requirement_revision",
+        "ramstk_requirement",
+        ("fld_revision_id", "fld_requirement_id"),
+    ),
+    (
+        "idx_similar_item_revision",
+        "ramstk_similar_item",
+        ("fld_revision_id", "fld_hardware_id"),
+    ),
+    (
+        "idx_stakeholder_revision",
+        "ramstk_stakeholder",
+        ("fld_revision_id", "fld_stakeholder_id"),
+    ),
+    ("idx_test_method_load", "ramstk_test_method", ("fld_load_id",)),
+    (
+        "idx_test_method_revision",
+        "ramstk_test_method",
+        ("fld_revision_id", "fld_test_id"),
+    ),
+    (
+        "idx_validation_revision",
+        "ramstk_validation",
+        ("fld_revision_id", "fld_validation_id"),
+    ),
+]
+
+# The tables copied when a revision is cloned, parents before children, as
+# (table, ID column, {reference column: referenced table}).  The records of a
+# table are given new IDs by adding the same offset to each of their IDs so
+# the reference columns are remapped by adding the referenced table's offset.
+# Tables without an ID column of their own share the hardware ID.
+REVISION_CLONE_TABLES: List[Tuple[str, str, Dict[str, str]]] = [
+    ("ramstk_failure_definition", "fld_definition_id", {}),
+    ("ramstk_mission", "fld_mission_id", {}),
+    ("ramstk_mission_phase", "fld_phase_id", {"fld_mission_id": "ramstk_mission"}),
+    (
+        "ramstk_environment",
+        "fld_environment_id",
+        {"fld_mission_id": "ramstk_mission", "fld_phase_id": "ramstk_mission_phase"},
+    ),
+    ("ramstk_function", "fld_function_id", {"fld_parent_id": "ramstk_function"}),
+    (
+        "ramstk_hazard_analysis",
+        "fld_hazard_id",
+        {"fld_function_id": "ramstk_function"},
+    ),
+    (
+        "ramstk_requirement",
+        "fld_requirement_id",
+        {"fld_parent_id": "ramstk_requirement"},
+    ),
+    (
+        "ramstk_stakeholder",
+        "fld_stakeholder_id",
+        {"fld_requirement_id": "ramstk_requirement"},
+    ),
+    ("ramstk_validation", "fld_validation_id", {}),
+    ("ramstk_hardware", "fld_hardware_id", {"fld_parent_id": "ramstk_hardware"}),
+    (
+        "ramstk_allocation",
+        "",
+        {"fld_hardware_id": "ramstk_hardware", "fld_parent_id": "ramstk_hardware"},
+    ),
+    ("ramstk_design_electric", "", {"fld_hardware_id": "ramstk_hardware"}),
+    ("ramstk_design_mechanic", "", {"fld_hardware_id": "ramstk_hardware"}),
+    ("ramstk_mil_hdbk_f", "", {"fld_hardware_id": "ramstk_hardware"}),
+    ("ramstk_nswc", "", {"fld_hardware_id": "ramstk_hardware"}),
+    ("ramstk_reliability", "", {"fld_hardware_id": "ramstk_hardware"}),
+    (
+        "ramstk_similar_item",
+        "",
+        {"fld_hardware_id": "ramstk_hardware", "fld_parent_id": "ramstk_hardware"},
+    ),
+    ("ramstk_mode", "fld_mode_id", {"fld_hardware_id": "ramstk_hardware"}),
+    (
+        "ramstk_mechanism",
+        "fld_mechanism_id",
+        {"fld_hardware_id": "ramstk_hardware", "fld_mode_id": "ramstk_mode"},
+    ),
+    (
+        "ramstk_cause",
+        "fld_cause_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+        },
+    ),
+    (
+        "ramstk_control",
+        "fld_control_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+            "fld_cause_id": "ramstk_cause",
+        },
+    ),
+    (
+        "ramstk_action",
+        "fld_action_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+            "fld_cause_id": "ramstk_cause",
+        },
+    ),
+    (
+        "ramstk_op_load",
+        "fld_load_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+        },
+    ),
+    (
+        "ramstk_op_stress",
+        "fld_stress_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+            "fld_load_id": "ramstk_op_load",
+        },
+    ),
+    (
+        "ramstk_test_method",
+        "fld_test_id",
+        {
+            "fld_hardware_id": "ramstk_hardware",
+            "fld_mode_id": "ramstk_mode",
+            "fld_mechanism_id": "ramstk_mechanism",
+            "fld_load_id": "ramstk_op_load",
+        },
+    ),
+]
+
+# The reference columns that don't always refer to a record in the revision;
+# zero means a top-level record for example.  These are only remapped when
+# they match the ID of a record in the revision being cloned.
+REVISION_CLONE_OPTIONAL: List[Tuple[str, str]] = [
+    ("ramstk_allocation", "fld_parent_id"),
+    ("ramstk_function", "fld_parent_id"),
+    ("ramstk_hardware", "fld_parent_id"),
+    ("ramstk_requirement", "fld_parent_id"),
+    ("ramstk_similar_item", "fld_parent_id"),
+    ("ramstk_stakeholder", "fld_requirement_id"),
+]
+
+# The pragmas set on every SQLite connection.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,
+}
+
 
 def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     """Create a shiny new, unpopulated RAMSTK program database.
@@ -85,9 +345,73 @@ def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     conn.close()
 
 
+def do_create_program_db_indexes(engine: Engine) -> None:
+    """Add any missing secondary indexes to a RAMSTK Program database.
+
+    Indexes that already exist are left alone and indexes on tables or
+    columns that don't exist in an older database are skipped.
+
+    :param engine: the SQLAlchemy Engine connected to the program database.
+    :type engine: :class:`sqlalchemy.engine.Engine`
+    :return: None
+    :rtype: None
+    :raise: sqlalchemy.exc.DBAPIError if the user can't create indexes.
+    """
+    _inspector = inspect(engine)
+    _tables = set(_inspector.get_table_names())
+    _columns: Dict[str, List[str]] = {}
+
+    with engine.begin() as _connection:
+        for _name, _table, _index_columns in PROGRAM_DB_INDEXES:
+            if _table not in _tables:
+                continue
+            if _table not in _columns:
+                _columns[_table] = [
+                    _column["name"] for _column in _inspector.get_columns(_table)
+                ]
+            if not set(_index_columns).issubset(_columns[_table]):
+                continue
+
+            _connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS {0} ON {1} ({2})".format(
+                        _name, _table, ", ".join(_index_columns)
+                    )
+                )
+            )
+
+
+def _do_set_sqlite_pragmas(dbapi_connection: Any, __connection_record: Any) -> None:
+    """Set the SQLITE_PRAGMAS on a new SQLite connection.
+
+    A pragma SQLite refuses, such as WAL journaling on a read-only database,
+    is skipped so the connection can still be used.
+
+    :param dbapi_connection: the new sqlite3 connection.
+    :param __connection_record: the pool's record of the connection.
+    :return: None
+    :rtype: None
+    """
+    _cursor = dbapi_connection.cursor()
+    for _pragma, _value in SQLITE_PRAGMAS.items():
+        try:
+            _cursor.execute("PRAGMA {0}={1}".format(_pragma, _value))
+        except sqlite3.DatabaseError:
+            pass
+    _cursor.close()
+
+
 def do_open_session(database: str) -> Tuple[Engine, scoped_session]:
     """Create a session to be used with an instance of the BaseDatabase."""
-    engine: Any = create_engine(database)
+    # Have psycopg2 send executemany() statements as multi-row VALUES lists
+    # rather than one statement per row.  This is what makes the bulk insert
+    # and update methods fast against PostgreSQL.
+    if database.startswith("postgresql+psycopg2"):
+        engine: Any = create_engine(database, executemany_mode="values")
+    else:
+        engine = create_engine(database)
+    if database.startswith("sqlite"):
+        event.listen(engine, "connect", _do_set_sqlite_pragmas)
     # deepcode ignore missing~close~connect: engines are disposed
     engine.connect()
 
@@ -112,6 +436,8 @@ class BaseDatabase:
     }
 
     # Define public class scalar attributes.
+    batch_size: int = 1000
+    id_block_size: int = 25
     engine: Engine = None  # type: ignore
     session: scoped_session = None  # type: ignore
     database: str = ""
@@ -125,6 +451,11 @@ class BaseDatabase:
         """Initialize an instance of the BaseDatabase."""
 
         # Initialize private dictionary instance attributes.
+        # Key is the (table, ID column) tuple, value is the [next ID,
+        # last reserved ID] list for the block of IDs being handed out.  The
+        # last reserved ID is None when the entire range above the table's
+        # high-water mark belongs to this connection.
+        self._dic_id_blocks: Dict[Tuple[str, str], List[Any]] = {}
 
         # Initialize private list instance attributes.
 
@@ -136,6 +467,91 @@ class BaseDatabase:
 
         # Initialize public scalar instance attributes.
 
+    def do_clone_revision(self, revision_id: int, new_revision_id: int) -> None:
+        """Copy a revision and all of its records to a new revision.
+
+        The records are copied inside the database with one INSERT ... SELECT
+        statement per table in a single transaction; they're never loaded.
+        Each table's copied records are given new IDs by adding an offset to
+        their IDs.  The offset moves the copies into a range of IDs reserved
+        for the table so they can't collide with records added by anyone else.
+
+        :param revision_id: the ID of the revision to copy.
+        :param new_revision_id: the ID to give the new revision.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if the revision can't be copied.  Nothing is
+            copied if any table fails.
+        """
+        try:
+            _inspector = inspect(self.engine)
+            _tables = set(_inspector.get_table_names())
+        except AttributeError as _error:
+            raise DataAccessError(
+                "dao.do_clone_revision: No database connected when attempting to "
+                "copy a revision."
+            ) from _error
+
+        try:
+            _offsets = self._do_reserve_clone_ids(revision_id, _tables)
+
+            _parameters = {
+                "revision_id": revision_id,
+                "new_revision_id": new_revision_id,
+                **_offsets,
+            }
+
+            if not self.session.execute(
+                text(
+                    self._get_clone_statement(
+                        "ramstk_revision",
+                        _inspector.get_columns("ramstk_revision"),
+                        {},
+                    )
+                ),
+                _parameters,
+            ).rowcount:
+                self.session.rollback()
+                raise DataAccessError(
+                    "dao.do_clone_revision: Revision {0} doesn't exist.".format(
+                        revision_id
+                    )
+                )
+            for _table, _id_column, _references in REVISION_CLONE_TABLES:
+                if _table not in _tables:
+                    continue
+                if _id_column:
+                    _references = {**_references, _id_column: _table}
+                self.session.execute(
+                    text(
+                        self._get_clone_statement(
+                            _table, _inspector.get_columns(_table), _references
+                        )
+                    ),
+                    _parameters,
+                )
+            self.session.commit()
+        except exc.SQLAlchemyError as _error:
+            self.session.rollback()
+            raise DataAccessError(
+                "dao.do_clone_revision: Database error when attempting to copy "
+                "revision {0}.  Database returned:\n\t{1:s}".format(
+                    revision_id, str(getattr(_error, "orig", _error)).strip()
+                )
+            ) from _error
+
+    def do_close_session(self) -> None:
+        """Close the calling thread's session.
+
+        Sessions are thread-local, so a worker thread that used the database
+        should call this when it's finished so its connection is returned to
+        the pool.  Don't call this from the thread that owns the records.
+
+        :return: None
+        :rtype: None
+        """
+        self.session.remove()
+
     def do_connect(self, database: Dict) -> None:
         """Connect to the database.
 
@@ -182,6 +598,7 @@ class BaseDatabase:
 
         if self.database != "":
             self.engine, self.session = do_open_session(self.database)
+            self._dic_id_blocks = {}
 
     def do_delete(self, item: object) -> None:
         """Delete a record from the RAMSTK Program database.
@@ -237,6 +654,7 @@ class BaseDatabase:
         # noinspection PyTypeChecker
         self.session = None  # type: ignore
         self.database = ""
+        self._dic_id_blocks = {}
 
     def do_insert(self, record: object) -> None:
         """Add a new record to a database table.
@@ -248,6 +666,7 @@ class BaseDatabase:
         try:
             self.session.add(record)
             self.session.commit()
+            self._do_update_id_blocks([record])
         except AttributeError as _error:
             # This exception is raised when there is no database connection.
             _error_message = (
@@ -302,19 +721,94 @@ class BaseDatabase:
             )
             raise DataAccessError(_error_message) from _error
 
-    def do_insert_many(self, records: List[object]) -> None:
-        """Add a group of new records to a database table.
+    def do_insert_many(self, records: List[object], batch_size: int = 0) -> None:
+        """Add a group of new records to the database in a single transaction.
 
-        :param list records: the list of objects to add to the RAMSTK database.
+        The records are written in chunks of batch_size records.  If any chunk
+        fails, the entire transaction is rolled back and the error message
+        identifies the chunk that failed.
+
+        :param records: the list of objects to add to the RAMSTK database.
+        :param batch_size: the number of records to write in each chunk.
+            Defaults to the batch_size attribute when zero.
         :return: None
         :rtype: None
+        :raise: DataAccessError if any chunk can't be written.
         """
-        for _record in records:
-            self.do_insert(_record)
+        self._do_write_many("insert", records, batch_size)
+
+    def do_update_many(self, records: List[object], batch_size: int = 0) -> None:
+        """Update a group of records in the database in a single transaction.
+
+        The records are written in chunks of batch_size records.  If any chunk
+        fails, the entire transaction is rolled back and the error message
+        identifies the chunk that failed.
+
+        :param records: the list of objects to update in the RAMSTK database.
+        :param batch_size: the number of records to write in each chunk.
+            Defaults to the batch_size attribute when zero.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if any chunk can't be written.
+        """
+        self._do_write_many("update", records, batch_size)
+
+    def do_release_id(self, table: str, id_column: str, record_id: int) -> None:
+        """Return an allocated ID that was never written to the database.
+
+        Only the most recently allocated ID is returned to the block so IDs
+        handed out after it aren't reused.
+
+        :param table: the name of the table the ID was allocated for.
+        :param id_column: the name of the field to use as the ID column.
+        :param record_id: the ID to release.
+        :return: None
+        :rtype: None
+        """
+        if id_column[0:4] != "fld_":
+            id_column = "fld_" + id_column
+
+        _block = self._dic_id_blocks.get((table, id_column))
+        if _block is not None and _block[0] - 1 == record_id:
+            _block[0] = record_id
+
+    def do_reserve_ids(self, table: str, id_column: str, count: int) -> int:
+        """Reserve a range of IDs for records written without get_next_id().
+
+        IDs handed out later by get_next_id() on this or any other connection
+        won't fall in the reserved range.
+
+        :param table: the name of the table to reserve the IDs for.
+        :param id_column: the name of the field to use as the ID column.
+        :param count: the number of IDs to reserve.
+        :return: the first ID of the reserved range.
+        :rtype: int
+        :raise: DataAccessError if there is no database connection or the
+            range of IDs can't be reserved.
+        """
+        if id_column[0:4] != "fld_":
+            id_column = "fld_" + id_column
+
+        _first_id: int = self._do_reserve_ids(table, id_column, count)[0]
+
+        # An unlimited block starts at the high-water mark so move it past the
+        # reserved range.  Limited blocks come from the same sequence as the
+        # reserved range so they can't overlap it.
+        _block = self._dic_id_blocks.get((table, id_column))
+        if _block is not None and _block[1] is None:
+            _first_id = max(_first_id, _block[0])
+            _block[0] = _first_id + count
+
+        return _first_id
 
     def do_select_all(self, table, **kwargs) -> query.Query:
         """Select all records from the RAMSTK database for table.
 
+        A list value in the value kwarg selects the records whose key field
+        is any of the values in the list.  Pass a list of attribute names in
+        the columns kwarg to select only those fields rather than entire
+        records.
+
         :param table: the database table object to select all from.
         :return: a list of table instances; one for each record.
         """
@@ -322,13 +816,24 @@ class BaseDatabase:
         _values: List[Any] = kwargs.get("value", None)
         _order: Any = kwargs.get("order", None)
         _all: bool = kwargs.get("_all", True)
+        _columns: List[str] = kwargs.get("columns", None)
 
         _filters = {}
+        _in_filters = []
         if _values[0] is not None:
             for _idx, _key in enumerate(_keys):
-                _filters[_key] = _values[_idx]
+                if isinstance(_values[_idx], list):
+                    _in_filters.append(getattr(table, _key).in_(_values[_idx]))
+                else:
+                    _filters[_key] = _values[_idx]
 
-        _results = self.session.query(table).filter_by(**_filters)
+        if _columns:
+            _results = self.session.query(
+                *[getattr(table, _column) for _column in _columns]
+            )
+        else:
+            _results = self.session.query(table)
+        _results = _results.filter_by(**_filters).filter(*_in_filters)
         if isinstance(_order, list):
             _results = _results.order_by(*_order)
         else:
@@ -370,6 +875,51 @@ class BaseDatabase:
             pub.sendMessage("fail_update_record", error_message=_error_message)
             raise DataAccessError(_error_message) from _error
 
+    def do_update_mappings(
+        self, table: Any, mappings: List[Dict[str, Any]], batch_size: int = 0
+    ) -> None:
+        """Update a group of records from dicts of their column values.
+
+        No record instances are involved so this can be called from a worker
+        thread, which has its own session.  No messages are sent; the caller
+        is responsible for reporting any error.
+
+        :param table: the database table object the records belong to.
+        :param mappings: the column values of each record, including the
+            primary key columns.
+        :param batch_size: the number of records to write in each chunk.
+            Defaults to the batch_size attribute when zero.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if any chunk can't be written.
+        """
+        _batch_size = batch_size or self.batch_size
+
+        _start = 0
+        _end = 0
+        try:
+            for _start in range(0, len(mappings), _batch_size):
+                _end = min(_start + _batch_size, len(mappings))
+                self.session.bulk_update_mappings(table, mappings[_start:_end])
+            self.session.commit()
+        except AttributeError as _error:
+            # This exception is raised when there is no database connection.
+            raise DataAccessError(
+                "dao.do_update_mappings: No database connected when attempting to "
+                "update records."
+            ) from _error
+        except (exc.InvalidRequestError, exc.StatementError, StaleDataError) as _error:
+            self.session.rollback()
+            raise DataAccessError(
+                "do_update_mappings: Database error when attempting to update records "
+                "{0:d} through {1:d}; no records were written.  Database "
+                "returned:\n\t{2:s}".format(
+                    _start + 1,
+                    _end,
+                    str(getattr(_error, "orig", _error)).strip(),
+                )
+            ) from _error
+
     def get_database_list(self, database: Dict[str, str]) -> List:
         """Retrieve the list of program databases available to RAMSTK.
 
@@ -412,6 +962,36 @@ class BaseDatabase:
 
         return _databases
 
+    def get_next_id(self, table: str, id_column: str) -> int:
+        """Allocate the next unused value of the ID column.
+
+        IDs are handed out from memory.  The table's high-water mark is read
+        from the database the first time an ID is requested for a table.
+        When connected to a PostgreSQL database, blocks of id_block_size IDs
+        are reserved from a database sequence instead so several users can
+        add records to the same program database without colliding.
+
+        :param table: the name of the table to allocate the ID for.
+        :param id_column: the name of the field to use as the ID column.
+        :return: _next_id; the allocated value of the ID column.
+        :rtype: int
+        :raise: DataAccessError if there is no database connection or the
+            block of IDs can't be reserved.
+        """
+        if id_column[0:4] != "fld_":
+            id_column = "fld_" + id_column
+
+        _key = (table, id_column)
+        _block = self._dic_id_blocks.get(_key)
+        if _block is None or (_block[1] is not None and _block[0] > _block[1]):
+            _block = self._do_reserve_ids(table, id_column)
+            self._dic_id_blocks[_key] = _block
+
+        _next_id: int = _block[0]
+        _block[0] += 1
+
+        return _next_id
+
     def get_last_id(self, table: str, id_column: str) -> Any:
         """Retrieve the last used value of the ID column.
 
@@ -442,3 +1022,242 @@ class BaseDatabase:
             _last_id = 0
 
         return _last_id
+
+    def _do_write_many(self, verb: str, records: List[object], batch_size: int) -> None:
+        """Write a group of records to the database in chunks.
+
+        Each chunk is flushed to the database as a group of executemany()
+        statements and the transaction is committed once after the last chunk.
+        Like do_insert() and do_update(), this uses the shared session so any
+        other changes pending in it are committed along with the records.  The
+        records are set aside while those changes are flushed so each chunk's
+        flush writes only the records in that chunk.
+
+        :param verb: the operation being performed; insert or update.
+        :param records: the list of objects to write to the RAMSTK database.
+        :param batch_size: the number of records to write in each chunk.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if any chunk can't be written.
+        """
+        _batch_size = batch_size or self.batch_size
+        _fail_topic = "fail_{}_record".format(verb)
+
+        _records = "records"
+        _set_aside: List[object] = []
+        try:
+            _set_aside = [
+                _record
+                for _record in records
+                if object_session(_record) is self.session.registry()
+            ]
+            for _record in _set_aside:
+                self.session.expunge(_record)
+            self.session.flush()
+            for _start in range(0, len(records), _batch_size):
+                _end = min(_start + _batch_size, len(records))
+                _records = "records {0:d} through {1:d}".format(_start + 1, _end)
+                self.session.add_all(records[_start:_end])
+                self.session.flush()
+
+            # Any error now is from the commit, not from one of the chunks.
+            _records = "records"
+            self.session.commit()
+            if verb == "insert":
+                self._do_update_id_blocks(records)
+        except AttributeError as _error:
+            # This exception is raised when there is no database connection.
+            _error_message = (
+                "dao.do_{0}_many: No database connected when attempting to {0} "
+                "records.".format(verb)
+            )
+            pub.sendMessage(_fail_topic, error_message=_error_message)
+            raise DataAccessError(_error_message) from _error
+        except (
+            exc.InvalidRequestError,
+            exc.StatementError,
+            FlushError,
+            StaleDataError,
+        ) as _error:
+            # Put any records that were set aside back in the session so the
+            # rollback expires them like the rest of the session.
+            self.session.add_all(_set_aside)
+            self.session.rollback()
+            _error_message = (
+                "do_{0}_many: Database error when attempting to {0} {1:s}; no "
+                "records were written.  Database returned:\n\t{2:s}".format(
+                    verb,
+                    _records,
+                    str(getattr(_error, "orig", _error)).strip(),
+                )
+            )
+            pub.sendMessage(_fail_topic, error_message=_error_message)
+            raise DataAccessError(_error_message) from _error
+
+    def _do_reserve_clone_ids(
+        self, revision_id: int, tables: Set[str]
+    ) -> Dict[str, int]:
+        """Reserve the IDs for the records of a revision that's being copied.
+
+        :param revision_id: the ID of the revision being copied.
+        :param tables: the names of the tables in the database.
+        :return: the offset to add to the IDs of each table's records to move
+            them into the reserved range keyed by the table name.
+        :rtype: dict
+        """
+        _offsets: Dict[str, int] = {}
+
+        for _table, _id_column, __ in REVISION_CLONE_TABLES:
+            if not _id_column:
+                continue
+            _offsets[_table] = 0
+            if _table not in tables:
+                continue
+
+            _first_id, _last_id = self.session.execute(
+                text(
+                    "SELECT MIN({1:s}), MAX({1:s}) FROM {0:s} "
+                    "WHERE fld_revision_id = :revision_id".format(_table, _id_column)
+                ),
+                {"revision_id": revision_id},
+            ).first()
+            if _first_id is None:
+                continue
+
+            _offsets[_table] = (
+                self.do_reserve_ids(_table, _id_column, _last_id - _first_id + 1)
+                - _first_id
+            )
+
+        return _offsets
+
+    @staticmethod
+    def _get_clone_statement(
+        table: str, columns: List[Dict[str, Any]], references: Dict[str, str]
+    ) -> str:
+        """Build the INSERT ... SELECT statement that copies a table's records.
+
+        :param table: the name of the table to copy the records of.
+        :param columns: the table's columns as returned by the SQLAlchemy
+            inspector.
+        :param references: the table whose ID offset is added to each ID
+            column.
+        :return: the statement with the revision_id and new_revision_id bind
+            parameters and an offset bind parameter for each referenced table.
+        :rtype: str
+        """
+        _id_columns = {_table: _column for _table, _column, __ in REVISION_CLONE_TABLES}
+
+        _names = [_column["name"] for _column in columns]
+        _values = []
+        for _name in _names:
+            if _name == "fld_revision_id":
+                _values.append(":new_revision_id")
+            elif (table, _name) in REVISION_CLONE_OPTIONAL:
+                _values.append(
+                    "CASE WHEN {0:s} IN (SELECT {1:s} FROM {2:s} WHERE "
+                    "fld_revision_id = :revision_id) THEN {0:s} + :{2:s} ELSE "
+                    "{0:s} END".format(
+                        _name, _id_columns[references[_name]], references[_name]
+                    )
+                )
+            elif _name in references:
+                _values.append("{0:s} + :{1:s}".format(_name, references[_name]))
+            else:
+                _values.append(_name)
+
+        return (
+            "INSERT INTO {0:s} ({1:s}) SELECT {2:s} FROM {0:s} "
+            "WHERE fld_revision_id = :revision_id".format(
+                table, ", ".join(_names), ", ".join(_values)
+            )
+        )
+
+    def _do_reserve_ids(self, table: str, id_column: str, count: int = 0) -> List[Any]:
+        """Reserve a block of IDs for a table.
+
+        For PostgreSQL, the block is reserved from a sequence named for the
+        table and ID column while holding an advisory lock.  The sequence is
+        moved past the table's high-water mark first in case records were
+        added without reserving IDs.  For all other databases the entire
+        range above the table's high-water mark is reserved.
+
+        :param table: the name of the table to reserve IDs for.
+        :param id_column: the name of the field to use as the ID column.
+        :param count: the number of IDs to reserve.  Defaults to the
+            id_block_size attribute when zero.
+        :return: the [next ID, last reserved ID] list for the block.
+        :rtype: list
+        :raise: DataAccessError if there is no database connection or the
+            block of IDs can't be reserved.
+        """
+        try:
+            _dialect = self.engine.dialect.name
+        except AttributeError as _error:
+            raise DataAccessError(
+                "dao.get_next_id: No database connected when attempting to "
+                "allocate an ID."
+            ) from _error
+
+        if _dialect != "postgresql":
+            return [self.get_last_id(table, id_column) + 1, None]
+
+        _count = count or self.id_block_size
+        _sequence = "{0}_{1}_block_seq".format(table, id_column)
+        try:
+            with self.engine.begin() as _connection:
+                _connection.execute(
+                    text(
+                        "CREATE SEQUENCE IF NOT EXISTS {0:s} MINVALUE 0 "
+                        "START 0".format(_sequence)
+                    )
+                )
+                _connection.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:sequence))"),
+                    sequence=_sequence,
+                )
+                _last_id = _connection.execute(
+                    text(
+                        "SELECT setval(:sequence, GREATEST((SELECT "
+                        "COALESCE(MAX({1:s}), 0) FROM {0:s}), (SELECT last_value "
+                        "FROM {2:s})) + :count)".format(table, id_column, _sequence)
+                    ),
+                    sequence=_sequence,
+                    count=_count,
+                ).scalar()
+        except exc.SQLAlchemyError as _error:
+            raise DataAccessError(
+                "dao.get_next_id: Database error when attempting to reserve IDs "
+                "for {0:s}.  Database returned:\n\t{1:s}".format(
+                    table, str(getattr(_error, "orig", _error)).strip()
+                )
+            ) from _error
+
+        return [_last_id - _count + 1, _last_id]
+
+    def _do_update_id_blocks(self, records: List[object]) -> None:
+        """Move the ID blocks past the IDs of records that were just written.
+
+        Records can be written with IDs that weren't handed out by
+        get_next_id(), by an import for example.  Skipping past them keeps the
+        next allocated ID from colliding with them.
+
+        :param records: the list of records that were written.
+        :return: None
+        :rtype: None
+        """
+        if not self._dic_id_blocks:
+            return
+
+        for _record in records:
+            _table = getattr(_record, "__tablename__", "")
+            for (_block_table, _id_column), _block in self._dic_id_blocks.items():
+                if _block_table != _table:
+                    continue
+                _record_id = getattr(_record, _id_column[4:], None)
+                if (
+                    isinstance(_record_id, int)
+                    and _record_id >= _block[0]
+                    and (_block[1] is None or _record_id <= _block[1])
+                ):
+                    _block[0] = _record_id + 1
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, List, TextIO, Tuple
+from typing import Any, Dict, List, Set, TextIO, Tuple
 
 # Third Party Imports
 from sqlalchemy.engine import Engine
@@ -9,22 +9,55 @@ from sqlalchemy.orm import scoped_session
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError as DataAccessError
 
+PROGRAM_DB_INDEXES: List[Tuple[str, str, Tuple[str, ...]]]
+REVISION_CLONE_TABLES: List[Tuple[str, str, Dict[str, str]]]
+REVISION_CLONE_OPTIONAL: List[Tuple[str, str]]
+SQLITE_PRAGMAS: Dict[str, Any]
+
 def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None: ...
+def do_create_program_db_indexes(engine: Engine) -> None: ...
+def _do_set_sqlite_pragmas(dbapi_connection: Any, __connection_record: Any) -> None: ...
 def do_open_session(database: str) -> Tuple[Engine, scoped_session]: ...
 
 class BaseDatabase:
     cxnargs: Dict[str, str] = ...
+    batch_size: int = ...
+    id_block_size: int = ...
     engine: Engine = ...
     session: scoped_session = ...
     database: str = ...
+    _dic_id_blocks: Dict[Tuple[str, str], List[Any]] = ...
     sqlstatements: Dict[str, str] = ...
     def __init__(self) -> None: ...
+    def do_clone_revision(self, revision_id: int, new_revision_id: int) -> None: ...
+    def do_close_session(self) -> None: ...
     def do_connect(self, database: Dict) -> None: ...
     def do_delete(self, item: object) -> None: ...
     def do_disconnect(self) -> None: ...
     def do_insert(self, record: object) -> None: ...
-    def do_insert_many(self, records: List[object]) -> None: ...
+    def do_insert_many(self, records: List[object], batch_size: int = ...) -> None: ...
+    def do_release_id(self, table: str, id_column: str, record_id: int) -> None: ...
+    def do_reserve_ids(self, table: str, id_column: str, count: int) -> int: ...
     def do_select_all(self, table: Any, **kwargs: Any) -> query.Query: ...
     def do_update(self, record: object = ...) -> None: ...
+    def do_update_many(self, records: List[object], batch_size: int = ...) -> None: ...
+    def do_update_mappings(
+        self, table: Any, mappings: List[Dict[str, Any]], batch_size: int = ...
+    ) -> None: ...
     def get_database_list(self, database: Dict[str, str]) -> List: ...
+    def get_next_id(self, table: str, id_column: str) -> int: ...
     def get_last_id(self, table: str, id_column: str) -> Any: ...
+    def _do_write_many(
+        self, verb: str, records: List[object], batch_size: int
+    ) -> None: ...
+    def _do_reserve_clone_ids(
+        self, revision_id: int, tables: Set[str]
+    ) -> Dict[str, int]: ...
+    @staticmethod
+    def _get_clone_statement(
+        table: str, columns: List[Dict[str, Any]], references: Dict[str, str]
+    ) -> str: ...
+    def _do_reserve_ids(
+        self, table: str, id_column: str, count: int = ...
+    ) -> List[Any]: ...
+    def _do_update_id_blocks(self, records: List[object]) -> None: ...
@@ -9,13 +9,14 @@
 
 # Standard Library Imports
 import gettext
+import json
 import os
 from datetime import date, datetime, timedelta
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third Party Imports
 from pubsub import pub
-from sqlalchemy import exc
+from sqlalchemy import exc, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session
 
@@ -1315,6 +1316,62 @@ RAMSTK_TYPES: Dict[int, Tuple[str, str, str]] = {
 }
 
 
+# The site database tables the global configuration variables are loaded from.
+SITE_TABLES = [
+    RAMSTKCategory,
+    RAMSTKFailureMode,
+    RAMSTKGroup,
+    RAMSTKHazards,
+    RAMSTKLoadHistory,
+    RAMSTKManufacturer,
+    RAMSTKMeasurement,
+    RAMSTKMethod,
+    RAMSTKModel,
+    RAMSTKRPN,
+    RAMSTKStakeholders,
+    RAMSTKStatus,
+    RAMSTKSubCategory,
+    RAMSTKType,
+    RAMSTKUser,
+]
+
+# The RAMSTKUserConfiguration variables loaded by do_load_variables().
+SITE_VARIABLES = [
+    "RAMSTK_ACTION_CATEGORY",
+    "RAMSTK_ACTION_STATUS",
+    "RAMSTK_AFFINITY_GROUPS",
+    "RAMSTK_CATEGORIES",
+    "RAMSTK_DAMAGE_MODELS",
+    "RAMSTK_DETECTION_METHODS",
+    "RAMSTK_FAILURE_MODES",
+    "RAMSTK_HAZARDS",
+    "RAMSTK_INCIDENT_CATEGORY",
+    "RAMSTK_INCIDENT_STATUS",
+    "RAMSTK_INCIDENT_TYPE",
+    "RAMSTK_LOAD_HISTORY",
+    "RAMSTK_MANUFACTURERS",
+    "RAMSTK_MEASURABLE_PARAMETERS",
+    "RAMSTK_MEASUREMENT_UNITS",
+    "RAMSTK_REQUIREMENT_TYPE",
+    "RAMSTK_RPN_DETECTION",
+    "RAMSTK_RPN_OCCURRENCE",
+    "RAMSTK_RPN_SEVERITY",
+    "RAMSTK_SEVERITY",
+    "RAMSTK_STAKEHOLDERS",
+    "RAMSTK_STRESS_LIMITS",
+    "RAMSTK_SUBCATEGORIES",
+    "RAMSTK_USERS",
+    "RAMSTK_VALIDATION_TYPE",
+    "RAMSTK_WORKGROUPS",
+]
+
+# The name of the site variable snapshot file in the user's configuration
+# directory.  Increment the version whenever the snapshot format or the way a
+# variable is built changes so old snapshots are ignored.
+SITE_SNAPSHOT_FILE = "site_variables.json"
+SITE_SNAPSHOT_VERSION = 2
+
+
 def _load_fmea_tables(session: scoped_session) -> None:
     """Load RAMSTKFailureMode and RAMSTKRPN."""
     _rpn = Tuple[str, str, str, int]
@@ -1615,8 +1672,44 @@ def do_make_commondb_tables(engine: Engine) -> None:
     RAMSTKUser.__table__.create(bind=engine)
 
 
+def _do_select_site_tables(
+    site_db: BaseDatabase, tables: Optional[List[Any]] = None
+) -> Dict[Any, List[Any]]:
+    """Select every record in each of the site database tables.
+
+    Each table is read with a single query and the records are grouped in
+    memory by the loaders rather than querying for each group.
+
+    :param site_db: the RAMSTK Site Database to read the records from.
+    :param tables: the tables to read.  Defaults to SITE_TABLES.
+    :return: the records of each table keyed by the table.
+    :rtype: dict
+    """
+    return {
+        _table: site_db.session.query(_table).all()
+        for _table in (tables or SITE_TABLES)
+    }
+
+
+def _get_records(
+    tables: Dict[Any, List[Any]], table: Any, column: str, value: Any
+) -> List[Any]:
+    """Return the records of a table whose column has the value.
+
+    :param tables: the records of each table keyed by the table.
+    :param table: the table whose records are to be returned.
+    :param column: the name of the attribute to filter on.
+    :param value: the value of the attribute to return records for.
+    :return: the matching records.
+    :rtype: list
+    """
+    return [_record for _record in tables[table] if getattr(_record, column) == value]
+
+
 def _do_load_action_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RAMSTK_ACTION_CATEGORY variable.
 
@@ -1624,14 +1717,14 @@ def _do_load_action_variables(
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKCategory)
-        .filter(RAMSTKCategory.category_type == "action")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(site_db, [RAMSTKCategory, RAMSTKStatus])
+
+    for _record in _get_records(tables, RAMSTKCategory, "category_type", "action"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_ACTION_CATEGORY[_record.category_id] = (
             _attributes["name"],
@@ -1639,11 +1732,7 @@ def _do_load_action_variables(
             _attributes["category_type"],
             _attributes["value"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKStatus)
-        .filter(RAMSTKStatus.status_type == "action")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKStatus, "status_type", "action"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_ACTION_STATUS[_record.status_id] = (
             _attributes["name"],
@@ -1653,7 +1742,9 @@ def _do_load_action_variables(
 
 
 def _do_load_hardware_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load variables associated with hardware categories and failure modes.
 
@@ -1661,15 +1752,27 @@ def _do_load_hardware_variables(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKCategory)
-        .filter(RAMSTKCategory.category_type == "hardware")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(
+        site_db, [RAMSTKCategory, RAMSTKSubCategory, RAMSTKFailureMode]
+    )
 
+    # Group the subcategories by category and the failure modes by
+    # subcategory once rather than searching for each group.
+    _subcategories: Dict[int, List[Any]] = {}
+    for _subcat in tables[RAMSTKSubCategory]:
+        _subcategories.setdefault(_subcat.category_id, []).append(_subcat)
+    _failure_modes: Dict[Tuple[int, int], List[Any]] = {}
+    for _mode in tables[RAMSTKFailureMode]:
+        _failure_modes.setdefault((_mode.category_id, _mode.subcategory_id), []).append(
+            _mode
+        )
+
+    for _record in _get_records(tables, RAMSTKCategory, "category_type", "hardware"):
         _subcats = {}
         user_configuration.RAMSTK_FAILURE_MODES[_record.category_id] = {}
         user_configuration.RAMSTK_STRESS_LIMITS[_record.category_id] = (
@@ -1684,39 +1787,30 @@ def _do_load_hardware_variables(
             _record.harsh_maxt_limit,
             _record.mild_maxt_limit,
         )
-        for _subcat in (
-            site_db.session.query(RAMSTKSubCategory)
-            .filter(RAMSTKSubCategory.category_id == _record.category_id)
-            .all()
-        ):
+        for _subcat in _subcategories.get(_record.category_id, []):
             _subcats[_subcat.subcategory_id] = _subcat.description
 
-            _modes = {}
             user_configuration.RAMSTK_FAILURE_MODES[_record.category_id][
                 _subcat.subcategory_id
-            ] = {}
-            for _mode in (
-                site_db.session.query(RAMSTKFailureMode)
-                .filter(RAMSTKFailureMode.category_id == _record.category_id)
-                .filter(RAMSTKFailureMode.subcategory_id == _subcat.subcategory_id)
-                .all()
-            ):
-                _modes[_mode.mode_id] = [
+            ] = {
+                _mode.mode_id: [
                     _mode.description,
                     _mode.mode_ratio,
                     _mode.source,
                 ]
-
-            user_configuration.RAMSTK_FAILURE_MODES[_record.category_id][
-                _subcat.subcategory_id
-            ] = _modes
+                for _mode in _failure_modes.get(
+                    (_record.category_id, _subcat.subcategory_id), []
+                )
+            }
 
         user_configuration.RAMSTK_CATEGORIES[_record.category_id] = _record.description
         user_configuration.RAMSTK_SUBCATEGORIES[_record.category_id] = _subcats
 
 
 def _do_load_incident_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RAMSTK_INCIDENT_CATEGORY variable.
 
@@ -1724,14 +1818,16 @@ def _do_load_incident_variables(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKCategory)
-        .filter(RAMSTKCategory.category_type == "incident")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(
+        site_db, [RAMSTKCategory, RAMSTKStatus, RAMSTKType]
+    )
+
+    for _record in _get_records(tables, RAMSTKCategory, "category_type", "incident"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_CATEGORY[_record.category_id] = (
             _attributes["name"],
@@ -1739,22 +1835,14 @@ def _do_load_incident_variables(
             _attributes["category_type"],
             _attributes["value"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKStatus)
-        .filter(RAMSTKStatus.status_type == "incident")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKStatus, "status_type", "incident"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_STATUS[_record.status_id] = (
             _attributes["name"],
             _attributes["description"],
             _attributes["status_type"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKType)
-        .filter(RAMSTKType.type_type == "incident")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKType, "type_type", "incident"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_TYPE[_record.type_id] = (
             _attributes["code"],
@@ -1764,7 +1852,9 @@ def _do_load_incident_variables(
 
 
 def _do_load_miscellaneous_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load miscellaneous variables that don't fit in another grouping.
 
@@ -1772,49 +1862,50 @@ def _do_load_miscellaneous_variables(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKMethod)
-        .filter(RAMSTKMethod.method_type == "detection")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(
+        site_db,
+        [
+            RAMSTKHazards,
+            RAMSTKManufacturer,
+            RAMSTKMeasurement,
+            RAMSTKMethod,
+            RAMSTKType,
+        ],
+    )
+
+    for _record in _get_records(tables, RAMSTKMethod, "method_type", "detection"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_DETECTION_METHODS[_record.method_id] = (
             _attributes["name"],
             _attributes["description"],
             _attributes["method_type"],
         )
-    for _record in site_db.session.query(RAMSTKHazards).all():
+    for _record in tables[RAMSTKHazards]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_HAZARDS[_record.hazard_id] = (
             _attributes["hazard_category"],
             _attributes["hazard_subcategory"],
         )
-    for _record in site_db.session.query(RAMSTKManufacturer).all():
+    for _record in tables[RAMSTKManufacturer]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MANUFACTURERS[_record.manufacturer_id] = (
             _attributes["description"],
             _attributes["location"],
             _attributes["cage_code"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKMeasurement)
-        .filter(RAMSTKMeasurement.measurement_type == "unit")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKMeasurement, "measurement_type", "unit"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MEASUREMENT_UNITS[_record.measurement_id] = (
             _attributes["code"],
             _attributes["description"],
             _attributes["measurement_type"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKType)
-        .filter(RAMSTKType.type_type == "validation")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKType, "type_type", "validation"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_VALIDATION_TYPE[_record.type_id] = (
             _attributes["code"],
@@ -1824,7 +1915,9 @@ def _do_load_miscellaneous_variables(
 
 
 def _do_load_pof_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RAMSTK_DAMAGE_MODELS variable.
 
@@ -1832,27 +1925,27 @@ def _do_load_pof_variables(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKModel)
-        .filter(RAMSTKModel.model_type == "damage")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(
+        site_db, [RAMSTKLoadHistory, RAMSTKMeasurement, RAMSTKModel]
+    )
+
+    for _record in _get_records(tables, RAMSTKModel, "model_type", "damage"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_DAMAGE_MODELS[_record.model_id] = _attributes[
             "description"
         ]
-    for _record in site_db.session.query(RAMSTKLoadHistory).all():
+    for _record in tables[RAMSTKLoadHistory]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_LOAD_HISTORY[_record.history_id] = _attributes[
             "description"
         ]
-    for _record in (
-        site_db.session.query(RAMSTKMeasurement)
-        .filter(RAMSTKMeasurement.measurement_type == "damage")
-        .all()
+    for _record in _get_records(
+        tables, RAMSTKMeasurement, "measurement_type", "damage"
     ):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MEASURABLE_PARAMETERS[_record.measurement_id] = (
@@ -1863,7 +1956,9 @@ def _do_load_pof_variables(
 
 
 def _do_load_requirement_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load variables related to requiremetents and stakeholders.
 
@@ -1871,31 +1966,29 @@ def _do_load_requirement_variables(
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKGroup)
-        .filter(RAMSTKGroup.group_type == "affinity")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(
+        site_db, [RAMSTKGroup, RAMSTKStakeholders, RAMSTKType]
+    )
+
+    for _record in _get_records(tables, RAMSTKGroup, "group_type", "affinity"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_AFFINITY_GROUPS[_record.group_id] = (
             _attributes["description"],
             _attributes["group_type"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKType)
-        .filter(RAMSTKType.type_type == "requirement")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKType, "type_type", "requirement"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_REQUIREMENT_TYPE[_record.type_id] = (
             _attributes["code"],
             _attributes["description"],
             _attributes["type_type"],
         )
-    for _record in site_db.session.query(RAMSTKStakeholders).all():
+    for _record in tables[RAMSTKStakeholders]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_STAKEHOLDERS[_record.stakeholders_id] = _attributes[
             "stakeholder"
@@ -1903,7 +1996,9 @@ def _do_load_requirement_variables(
 
 
 def _do_load_rpn_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RPN detection, occurremce, and severity variables.
 
@@ -1911,33 +2006,31 @@ def _do_load_rpn_variables(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKRPN).filter(RAMSTKRPN.rpn_type == "detection").all()
-    ):
+    tables = tables or _do_select_site_tables(site_db, [RAMSTKRPN])
+
+    for _record in _get_records(tables, RAMSTKRPN, "rpn_type", "detection"):
         user_configuration.RAMSTK_RPN_DETECTION[
             _record.value
         ] = _record.get_attributes()
 
-    for _record in (
-        site_db.session.query(RAMSTKRPN)
-        .filter(RAMSTKRPN.rpn_type == "occurrence")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKRPN, "rpn_type", "occurrence"):
         user_configuration.RAMSTK_RPN_OCCURRENCE[
             _record.value
         ] = _record.get_attributes()
 
-    for _record in (
-        site_db.session.query(RAMSTKRPN).filter(RAMSTKRPN.rpn_type == "severity").all()
-    ):
+    for _record in _get_records(tables, RAMSTKRPN, "rpn_type", "severity"):
         user_configuration.RAMSTK_RPN_SEVERITY[_record.value] = _record.get_attributes()
 
 
 def _do_load_severity(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RAMSTK_SEVERITY variable.
 
@@ -1945,14 +2038,14 @@ def _do_load_severity(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in (
-        site_db.session.query(RAMSTKCategory)
-        .filter(RAMSTKCategory.category_type == "risk")
-        .all()
-    ):
+    tables = tables or _do_select_site_tables(site_db, [RAMSTKCategory])
+
+    for _record in _get_records(tables, RAMSTKCategory, "category_type", "risk"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_SEVERITY[_record.category_id] = (
             _attributes["name"],
@@ -1963,7 +2056,9 @@ def _do_load_severity(
 
 
 def _do_load_user_workgroups(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = None,
 ) -> None:
     """Load the RAMSTK_USERS and RAMSTK_WORKGROUPS variables.
 
@@ -1971,10 +2066,14 @@ def _do_load_user_workgroups(
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param tables: the records of the site database tables already selected.
+        The tables are selected from site_db if not passed.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKUser).all():
+    tables = tables or _do_select_site_tables(site_db, [RAMSTKGroup, RAMSTKUser])
+
+    for _record in tables[RAMSTKUser]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_USERS[_record.user_id] = (
             _attributes["user_lname"],
@@ -1983,11 +2082,7 @@ def _do_load_user_workgroups(
             _attributes["user_phone"],
             _attributes["user_group_id"],
         )
-    for _record in (
-        site_db.session.query(RAMSTKGroup)
-        .filter(RAMSTKGroup.group_type == "workgroup")
-        .all()
-    ):
+    for _record in _get_records(tables, RAMSTKGroup, "group_type", "workgroup"):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_WORKGROUPS[_record.group_id] = (
             _attributes["description"],
@@ -1995,11 +2090,148 @@ def _do_load_user_workgroups(
         )
 
 
+def _do_get_change_stamp(site_db: BaseDatabase) -> str:
+    """Return a value that changes whenever the site tables change.
+
+    PostgreSQL calculates an MD5 digest of the contents of every table in
+    SITE_TABLES in one query so only the digest crosses the network.  SQLite
+    uses the size and modification time of the database file and its
+    write-ahead log.
+
+    :param site_db: the RAMSTK Site Database.
+    :return: the change stamp or an empty string if one can't be calculated.
+    :rtype: str
+    """
+    _dialect = site_db.engine.dialect.name
+
+    if _dialect == "postgresql":
+        _digests = ", ".join(
+            "(SELECT md5(coalesce(string_agg(_t::text, ',' ORDER BY _t::text), "
+            "'')) FROM {0} AS _t)".format(_table.__tablename__)
+            for _table in SITE_TABLES
+        )
+        try:
+            return site_db.session.execute(
+                text("SELECT md5(concat_ws('|', {0}))".format(_digests))
+            ).scalar()
+        except exc.SQLAlchemyError:
+            site_db.session.rollback()
+    elif _dialect == "sqlite" and site_db.engine.url.database:
+        _stamps = []
+        for _file in [
+            site_db.engine.url.database,
+            site_db.engine.url.database + "-wal",
+        ]:
+            try:
+                _stat = os.stat(_file)
+                _stamps.append("{0}:{1}".format(_stat.st_size, _stat.st_mtime_ns))
+            except OSError:
+                pass
+        return ";".join(_stamps)
+
+    return ""
+
+
+def _do_decode_snapshot(value: Dict[str, Any]) -> Any:
+    """Restore a JSON object read from the snapshot file.
+
+    This is the object_hook for json.load().  Tuples come back as tuples and
+    the integer keys JSON turned into strings come back as integers.
+
+    :param value: the JSON object as decoded by json.load().
+    :return: the tuple or dict the JSON object was written for.
+    :rtype: tuple or dict
+    """
+    if "__tuple__" in value:
+        return tuple(value["__tuple__"])
+
+    return {
+        int(_key) if _key.isdigit() else _key: _value for _key, _value in value.items()
+    }
+
+
+def _do_encode_snapshot(value: Any) -> Any:
+    """Prepare a value to be written to the snapshot file as JSON.
+
+    JSON has no tuples and only string keys, so tuples are written as a
+    tagged object and every key as a string.  _do_decode_snapshot() undoes
+    both.
+
+    :param value: the value to prepare.
+    :return: the value with only JSON types in it.
+    :rtype: any
+    """
+    if isinstance(value, dict):
+        return {
+            str(_key): _do_encode_snapshot(_value) for _key, _value in value.items()
+        }
+    if isinstance(value, tuple):
+        return {"__tuple__": [_do_encode_snapshot(_value) for _value in value]}
+    if isinstance(value, list):
+        return [_do_encode_snapshot(_value) for _value in value]
+
+    return value
+
+
+def _do_read_site_snapshot(
+    snapshot_file: str, key: Tuple[Any, ...]
+) -> Optional[Dict[str, Any]]:
+    """Read the site variables from the snapshot file.
+
+    :param snapshot_file: the absolute path to the snapshot file.
+    :param key: the version, site database, and change stamp the snapshot
+        must have been written for.
+    :return: the site variables or None if the snapshot is missing, stale,
+        or unreadable.
+    :rtype: dict
+    """
+    try:
+        with open(snapshot_file, "r", encoding="utf-8") as _file:
+            _snapshot = json.load(_file, object_hook=_do_decode_snapshot)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(_snapshot, dict) or _snapshot.get("key") != key:
+        return None
+
+    return _snapshot.get("variables")
+
+
+def _do_write_site_snapshot(
+    snapshot_file: str, key: Tuple[Any, ...], variables: Dict[str, Any]
+) -> None:
+    """Write the site variables to the snapshot file.
+
+    The snapshot is written to a temporary file first and then renamed so a
+    RAMSTK that's starting at the same time never reads half a snapshot.  A
+    snapshot that can't be written is skipped; it only makes the next start
+    slower.
+
+    :param snapshot_file: the absolute path to the snapshot file.
+    :param key: the version, site database, and change stamp of the snapshot.
+    :param variables: the site variables keyed by the variable name.
+    :return: None
+    :rtype: None
+    """
+    _temp_file = "{0}.{1}".format(snapshot_file, os.getpid())
+    try:
+        with open(_temp_file, "w", encoding="utf-8") as _file:
+            json.dump(_do_encode_snapshot({"key": key, "variables": variables}), _file)
+        os.replace(_temp_file, snapshot_file)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(_temp_file):
+            os.remove(_temp_file)
+
+
 def do_load_variables(
     site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
 ) -> None:
     """Load the RAMSTKUserConfiguration global variables from the site db.
 
+    Each site table is read with one query.  The variables are then saved to
+    a snapshot file in the user's configuration directory and loaded from the
+    snapshot on later starts until the site database changes.
+
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
@@ -2013,15 +2245,43 @@ def do_load_variables(
         message="Loading global RAMSTK configuration variables.",
     )
 
-    _do_load_action_variables(site_db, user_configuration)
-    _do_load_hardware_variables(site_db, user_configuration)
-    _do_load_incident_variables(site_db, user_configuration)
-    _do_load_miscellaneous_variables(site_db, user_configuration)
-    _do_load_pof_variables(site_db, user_configuration)
-    _do_load_requirement_variables(site_db, user_configuration)
-    _do_load_rpn_variables(site_db, user_configuration)
-    _do_load_severity(site_db, user_configuration)
-    _do_load_user_workgroups(site_db, user_configuration)
+    _snapshot_file = os.path.join(
+        user_configuration.RAMSTK_CONF_DIR, SITE_SNAPSHOT_FILE
+    )
+    _stamp = _do_get_change_stamp(site_db)
+    _key = (SITE_SNAPSHOT_VERSION, repr(site_db.engine.url), _stamp)
+
+    _variables = _do_read_site_snapshot(_snapshot_file, _key) if _stamp else None
+    if _variables is not None:
+        for _name, _value in _variables.items():
+            getattr(user_configuration, _name).update(_value)
+
+        pub.sendMessage(
+            "do_log_info_msg",
+            logger_name="INFO",
+            message="Loaded global RAMSTK configuration variables from "
+            "{0:s}.".format(_snapshot_file),
+        )
+        return
+
+    _tables = _do_select_site_tables(site_db)
+
+    _do_load_action_variables(site_db, user_configuration, _tables)
+    _do_load_hardware_variables(site_db, user_configuration, _tables)
+    _do_load_incident_variables(site_db, user_configuration, _tables)
+    _do_load_miscellaneous_variables(site_db, user_configuration, _tables)
+    _do_load_pof_variables(site_db, user_configuration, _tables)
+    _do_load_requirement_variables(site_db, user_configuration, _tables)
+    _do_load_rpn_variables(site_db, user_configuration, _tables)
+    _do_load_severity(site_db, user_configuration, _tables)
+    _do_load_user_workgroups(site_db, user_configuration, _tables)
+
+    if _stamp:
+        _do_write_site_snapshot(
+            _snapshot_file,
+            _key,
+            {_name: getattr(user_configuration, _name) for _name in SITE_VARIABLES},
+        )
 
     pub.sendMessage(
         "do_log_info_msg",
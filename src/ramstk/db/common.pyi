@@ -1,6 +1,6 @@
 # Standard Library Imports
 import gettext
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third Party Imports
 from sqlalchemy.engine import Engine as Engine
@@ -43,6 +43,10 @@ RAMSTK_STAKEHOLDERS: Any
 RAMSTK_STATUSES: Any
 RAMSTK_SUBCATEGORIES: Any
 RAMSTK_TYPES: Dict[int, Tuple[str, str, str]]
+SITE_TABLES: List[Any]
+SITE_VARIABLES: List[str]
+SITE_SNAPSHOT_FILE: str
+SITE_SNAPSHOT_VERSION: int
 
 def _load_fmea_tables(session: scoped_session) -> None: ...
 def _load_hazard_analysis_tables(session: scoped_session) -> None: ...
@@ -54,32 +58,65 @@ def _load_site_info(session: scoped_session) -> None: ...
 def do_add_administrator(session: scoped_session) -> None: ...
 def do_create_common_db(engine: Engine, session: scoped_session) -> None: ...
 def do_make_commondb_tables(engine: Engine) -> None: ...
+def _do_select_site_tables(
+    site_db: BaseDatabase, tables: Optional[List[Any]] = ...
+) -> Dict[Any, List[Any]]: ...
+def _get_records(
+    tables: Dict[Any, List[Any]], table: Any, column: str, value: Any
+) -> List[Any]: ...
 def _do_load_action_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_hardware_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_incident_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_miscellaneous_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_pof_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_requirement_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_rpn_variables(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_severity(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
 ) -> None: ...
 def _do_load_user_workgroups(
-    site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
+    site_db: BaseDatabase,
+    user_configuration: RAMSTKUserConfiguration,
+    tables: Optional[Dict[Any, List[Any]]] = ...,
+) -> None: ...
+def _do_get_change_stamp(site_db: BaseDatabase) -> str: ...
+def _do_decode_snapshot(value: Dict[str, Any]) -> Any: ...
+def _do_encode_snapshot(value: Any) -> Any: ...
+def _do_read_site_snapshot(
+    snapshot_file: str, key: Tuple[Any, ...]
+) -> Optional[Dict[str, Any]]: ...
+def _do_write_site_snapshot(
+    snapshot_file: str, key: Tuple[Any, ...], variables: Dict[str, Any]
 ) -> None: ...
 def do_load_variables(
     site_db: BaseDatabase, user_configuration: RAMSTKUserConfiguration
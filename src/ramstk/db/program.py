@@ -11,6 +11,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session
 
 # RAMSTK Package Imports
+from ramstk.db import do_create_program_db_indexes
 from ramstk.models import (
     RAMSTKActionRecord,
     RAMSTKAllocationRecord,
@@ -44,7 +45,7 @@ from ramstk.models import (
 
 
 def do_make_programdb_tables(engine: Engine) -> None:
-    """Create all the tables in the RAMSTK Program database.
+    """Create all the tables and indexes in the RAMSTK Program database.
 
     :param engine: the SQLAlchemy database engine to use to create the program
         database tables.
@@ -85,6 +86,8 @@ def do_make_programdb_tables(engine: Engine) -> None:
 
     RAMSTKValidationRecord.__table__.create(bind=engine)
 
+    do_create_program_db_indexes(engine)
+
 
 def do_create_program_db(engine: Engine, session: scoped_session) -> None:
     """Create and initialize a RAMSTK Program database.
@@ -3,6 +3,7 @@ from sqlalchemy.engine import Engine as Engine
 from sqlalchemy.orm import scoped_session as scoped_session
 
 # RAMSTK Package Imports
+from ramstk.db import do_create_program_db_indexes as do_create_program_db_indexes
 from ramstk.models import RAMSTKActionRecord as RAMSTKActionRecord
 from ramstk.models import RAMSTKAllocationRecord as RAMSTKAllocationRecord
 from ramstk.models import RAMSTKCauseRecord as RAMSTKCauseRecord
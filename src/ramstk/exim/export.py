@@ -7,31 +7,55 @@
 """The RAMSTK Export module."""
 
 # Standard Library Imports
+import inspect
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Type
 
 # Third Party Imports
 # noinspection PyPackageRequirements
 import pandas as pd
 
 # noinspection PyPackageRequirements
-from openpyxl import load_workbook
+from openpyxl import Workbook
 from pubsub import pub
-from treelib import Tree
+from sqlalchemy import inspect as sa_inspect
+
+# RAMSTK Package Imports
+from ramstk.db.base import BaseDatabase
+from ramstk.models import (
+    RAMSTKFunctionRecord,
+    RAMSTKHardwareRecord,
+    RAMSTKRequirementRecord,
+    RAMSTKValidationRecord,
+)
 
 
 class Export:
-    """Contains the methods for exporting data from a program database."""
+    """Contains the methods for exporting data from a program database.
+
+    Nothing is loaded until an export is requested.  The data for each module
+    is then selected directly from the program database into a DataFrame with
+    one row per record and one column per attribute and all the modules are
+    written in a single pass.
+    """
+
+    # The record class for each module that can be exported.
+    _dic_records: Dict[str, Type[object]] = {
+        "function": RAMSTKFunctionRecord,
+        "requirement": RAMSTKRequirementRecord,
+        "hardware": RAMSTKHardwareRecord,
+        "validation": RAMSTKValidationRecord,
+    }
 
     def __init__(self) -> None:
         """Initialize an Export module instance."""
         # Initialize private dictionary attributes.
-        self._dic_output_data: Dict[str, Dict[int, Dict[Any, Any]]] = {}
 
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._df_output_data: pd.DataFrame = pd.DataFrame()
+        self._dao: BaseDatabase = BaseDatabase()
+        self._revision_id: int = 0
 
         # Initialize public dictionary attributes.
 
@@ -40,102 +64,207 @@ class Export:
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(self._do_load_data, "succeed_get_function_tree")
-        pub.subscribe(self._do_load_data, "succeed_get_requirement_tree")
-        pub.subscribe(self._do_load_data, "succeed_get_hardware_tree")
-        pub.subscribe(self._do_load_data, "succeed_get_validation_tree")
+        pub.subscribe(self._do_connect, "succeed_connect_program_database")
+        pub.subscribe(self._do_set_revision, "selected_revision")
         pub.subscribe(self._do_export, "request_export_data")
 
-    def _do_export(self, file_type: str, file_name: str) -> None:
+    def _do_connect(self, dao: BaseDatabase) -> None:
+        """Connect data manager to a database.
+
+        :param dao: the BaseDatabase() instance (data access object)
+            representing the connected RAMSTK Program database.
+        """
+        self._dao = dao
+
+    def _do_export(
+        self, file_type: str, file_name: str, modules: Optional[List[str]] = None
+    ) -> None:
         """Export selected RAMSTK module data to external file.
 
         :param file_type: the type of file to export the data to.
             Supported files types are:
                 - CSV (using a semi-colon (;) delimiter)
                 - Excel
+                - Feather (requires pyarrow)
+                - Parquet (requires pyarrow)
                 - Text (using a blank space delimiter)
         :param file_name: the name, with full path, of the file to export
             the RAMSTK Program database data to.
+        :param modules: the names of the RAMSTK modules to export.  Defaults
+            to all the modules.
         :return: None
         :rtype: None
         """
-        if file_type == "csv":
-            self._do_export_to_delimited_text(file_name, separator=";")
-        elif file_type == "excel":
-            self._do_export_to_excel(file_name)
-        elif file_type == "text":
-            self._do_export_to_delimited_text(file_name, separator=" ")
+        try:
+            _frames = self._do_load_data(modules or list(self._dic_records))
+        except AttributeError:
+            _method_name: str = inspect.currentframe().f_code.co_name  # type: ignore
+            _error_msg: str = (
+                "{0}: There was a problem exporting data.  Make sure a program "
+                "database is open."
+            ).format(_method_name)
+            pub.sendMessage(
+                "fail_export_data",
+                error_message=_error_msg,
+            )
+            return
+
+        try:
+            if file_type == "csv":
+                self._do_export_to_delimited_text(_frames, file_name, separator=";")
+            elif file_type == "excel":
+                self._do_export_to_excel(_frames, file_name)
+            elif file_type == "feather":
+                self._do_export_to_columnar(_frames, file_name, "feather")
+            elif file_type == "parquet":
+                self._do_export_to_columnar(_frames, file_name, "parquet")
+            elif file_type == "text":
+                self._do_export_to_delimited_text(_frames, file_name, separator=" ")
+        except ImportError as _error:
+            _method_name = inspect.currentframe().f_code.co_name  # type: ignore
+            _error_msg = (
+                "{0}: There was a problem exporting data to a {1} file: {2}"
+            ).format(_method_name, file_type, _error)
+            pub.sendMessage(
+                "fail_export_data",
+                error_message=_error_msg,
+            )
+
+    @staticmethod
+    def _do_export_to_columnar(
+        frames: Dict[str, pd.DataFrame], file_name: str, file_type: str
+    ) -> None:
+        """Export RAMSTK project data to Feather or Parquet files.
 
-    def _do_export_to_delimited_text(self, file_name: str, separator: str):
-        """Export RAMSTK project data to a delimited text file.
+        Each module is written to its own file.
 
+        :param frames: the DataFrame for each module to export.
         :param file_name: the name of the file to export data.
-        :param separator: the field delimiter to use.
+        :param file_type: the type of file to write; feather or parquet.
         :return: None
         :rtype: None
         """
-        for (
-            __,  # pylint: disable=unused-variable
-            _data,
-        ) in self._dic_output_data.items():
-            self._df_output_data = pd.DataFrame(_data)
+        for _module, _frame in frames.items():
+            _file_name = _get_module_file_name(frames, file_name, _module)
+            if file_type == "feather":
+                _frame.to_feather(_file_name)
+            else:
+                _frame.to_parquet(_file_name, index=False)
 
-            self._df_output_data.to_csv(file_name, sep=separator, index=True)
+    @staticmethod
+    def _do_export_to_delimited_text(
+        frames: Dict[str, pd.DataFrame], file_name: str, separator: str
+    ) -> None:
+        """Export RAMSTK project data to delimited text files.
+
+        Each module is written to its own file.
+
+        :param frames: the DataFrame for each module to export.
+        :param file_name: the name of the file to export data.
+        :param separator: the field delimiter to use.
+        :return: None
+        :rtype: None
+        """
+        for _module, _frame in frames.items():
+            _frame.to_csv(
+                _get_module_file_name(frames, file_name, _module),
+                sep=separator,
+                index=False,
+            )
 
     # pylint: disable=abstract-class-instantiated
-    def _do_export_to_excel(self, file_name: str) -> None:
+    @staticmethod
+    def _do_export_to_excel(frames: Dict[str, pd.DataFrame], file_name: str) -> None:
         """Export RAMSTK project data to an Excel file.
 
+        Each module is written to its own worksheet.  Excel 2007+ workbooks are
+        written in openpyxl's write-only mode so rows are streamed to the file
+        rather than held in memory as cells.
+
+        :param frames: the DataFrame for each module to export.
         :param file_name: the name of the file to export data.
         :return: None
         :rtype: None
         """
         _file, _extension = os.path.splitext(file_name)
 
-        for (
-            _key,
-            _data,
-        ) in self._dic_output_data.items():
-            self._df_output_data = pd.DataFrame(_data)
-            if _extension == ".xls":
-                # xlwt can't write each module to a separate sheet so we'll
-                # have to make a separate workbook for each work stream module.
-                _writer = pd.ExcelWriter(f"{_file}_{_key}.xls", engine="xlwt")
-            elif _extension in [".xlsx", ".xlsm"]:
-                _writer = pd.ExcelWriter(file_name, engine="openpyxl")
-                # Set the writer workbook if it already exists, otherwise
-                # just continue.  This allows each work stream module to be
-                # written to it's own worksheet.  If the workbook doesn't
-                # exist it will be created when the first module is written.
-                try:
-                    _workbook = load_workbook(file_name)
-                    _writer.book = _workbook
-                except FileNotFoundError:
-                    pass
-            else:
+        if _extension in [".xlsx", ".xlsm"]:
+            _workbook = Workbook(write_only=True)
+            for _module, _frame in frames.items():
+                _sheet = _workbook.create_sheet(_module)
+                _sheet.append(list(_frame.columns))
+                for _row in (
+                    _frame.astype(object)
+                    .where(_frame.notna(), None)
+                    .itertuples(index=False, name=None)
+                ):
+                    _sheet.append(_row)
+            _workbook.save(file_name)
+        else:
+            if _extension != ".xls":
                 file_name = _file + ".xls"
-                _writer = pd.ExcelWriter(file_name, engine="xlwt")
-            self._df_output_data.to_excel(_writer, f"{_key}", index=True)
-            _writer.save()
+            with pd.ExcelWriter(file_name, engine="xlwt") as _writer:
+                for _module, _frame in frames.items():
+                    _frame.to_excel(_writer, sheet_name=_module, index=False)
+
+    def _do_load_data(self, modules: List[str]) -> Dict[str, pd.DataFrame]:
+        """Select the attribute data for each module into a Pandas DataFrame.
+
+        :param modules: the names of the RAMSTK modules to load.
+        :return: the DataFrame for each module.
+        :rtype: dict
+        :raise: AttributeError if not connected to a program database.
+        :raise: KeyError if passed an unknown module.
+        """
+        _frames: Dict[str, pd.DataFrame] = {}
+
+        # The session doesn't autoflush, so write any pending changes to the
+        # records in the module trees before selecting them.
+        self._dao.session.flush()  # type: ignore
+
+        for _module in modules:
+            _record = self._dic_records[_module]
+            _mapper = sa_inspect(_record)
+            _columns = [_attribute.key for _attribute in _mapper.column_attrs]
 
-            _writer.close()
+            _query = (
+                self._dao.session.query(  # type: ignore
+                    *[getattr(_record, _column) for _column in _columns]
+                )
+                .filter(_record.revision_id == self._revision_id)  # type: ignore
+                .order_by(*_mapper.primary_key)
+            )
+            _frames[_module] = pd.DataFrame(_query.all(), columns=_columns)
 
-    def _do_load_data(self, tree: Tree) -> None:
-        """Load the attribute data into a Pandas DataFrame.
+        return _frames
 
-        :param tree: the data manager tree for the module to export.
+    def _do_set_revision(self, attributes: Dict[str, Any]) -> None:
+        """Set the ID of the revision to export.
+
+        :param attributes: the attributes dict for the selected revision.
         :return: None
         :rtype: None
         """
-        _module = tree.get_node(0).tag.lower()
-        self._dic_output_data[_module] = {}
-
-        # pylint: disable=unused-variable
-        for _node in tree.all_nodes()[1:]:
-            _tag = _node.tag
-            try:
-                self._dic_output_data[_module][_node.identifier] = _node.data[
-                    _tag
-                ].get_attributes()
-            except (KeyError, TypeError):
-                pass
+        self._revision_id = attributes["revision_id"]
+
+
+def _get_module_file_name(
+    frames: Dict[str, pd.DataFrame], file_name: str, module: str
+) -> str:
+    """Return the name of the file to export a module to.
+
+    When exporting more than one module, the module name is appended to the
+    file name so each module is written to its own file.
+
+    :param frames: the DataFrame for each module to export.
+    :param file_name: the name of the file to export data.
+    :param module: the name of the module to export.
+    :return: the name of the module's file.
+    :rtype: str
+    """
+    if len(frames) == 1:
+        return file_name
+
+    _file, _extension = os.path.splitext(file_name)
+
+    return f"{_file}_{module}{_extension}"
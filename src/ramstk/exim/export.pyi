@@ -1,14 +1,40 @@
 # Standard Library Imports
-from typing import Any
+from typing import Any, Dict, List, Optional, Type
 
 # Third Party Imports
-from treelib import Tree as Tree
+import pandas as pd
+
+# RAMSTK Package Imports
+from ramstk.db.base import BaseDatabase as BaseDatabase
+from ramstk.models import RAMSTKFunctionRecord as RAMSTKFunctionRecord
+from ramstk.models import RAMSTKHardwareRecord as RAMSTKHardwareRecord
+from ramstk.models import RAMSTKRequirementRecord as RAMSTKRequirementRecord
+from ramstk.models import RAMSTKValidationRecord as RAMSTKValidationRecord
 
 class Export:
-    _dic_output_data: Any = ...
-    _df_output_data: Any = ...
+    _dic_records: Dict[str, Type[object]]
+    _dao: BaseDatabase
+    _revision_id: int
     def __init__(self) -> None: ...
-    def _do_export(self, file_type: str, file_name: str) -> None: ...
-    def _do_export_to_delimited_text(self, file_name: str, separator: str) -> Any: ...
-    def _do_export_to_excel(self, file_name: str) -> None: ...
-    def _do_load_data(self, tree: Tree) -> None: ...
+    def _do_connect(self, dao: BaseDatabase) -> None: ...
+    def _do_export(
+        self, file_type: str, file_name: str, modules: Optional[List[str]] = ...
+    ) -> None: ...
+    @staticmethod
+    def _do_export_to_columnar(
+        frames: Dict[str, pd.DataFrame], file_name: str, file_type: str
+    ) -> None: ...
+    @staticmethod
+    def _do_export_to_delimited_text(
+        frames: Dict[str, pd.DataFrame], file_name: str, separator: str
+    ) -> None: ...
+    @staticmethod
+    def _do_export_to_excel(
+        frames: Dict[str, pd.DataFrame], file_name: str
+    ) -> None: ...
+    def _do_load_data(self, modules: List[str]) -> Dict[str, pd.DataFrame]: ...
+    def _do_set_revision(self, attributes: Dict[str, Any]) -> None: ...
+
+def _get_module_file_name(
+    frames: Dict[str, pd.DataFrame], file_name: str, module: str
+) -> str: ...
@@ -11,12 +11,15 @@ import inspect
 import math
 from collections import OrderedDict
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 # Third Party Imports
 # noinspection PyPackageRequirements
 import numpy as np
 
+# noinspection PyPackageRequirements
+import openpyxl
+
 # noinspection PyPackageRequirements
 import pandas as pd
 
@@ -95,6 +98,96 @@ def _get_input_value(
     return _value
 
 
+def _get_input_column(
+    data: pd.DataFrame, position: Optional[int], default: Any
+) -> List[Any]:
+    """Retrieve the input values for a field from every row of the input data.
+
+    This is the column-wise version of _get_input_value().
+
+    :param data: the pandas DataFrame containing the input data.
+    :param position: the position of the field's column in the input data or
+        None if the field isn't mapped to a column.
+    :param default: the default value to assign to the field.
+    :return: the list of values of the requested input field with NaN values
+        replaced by the default.
+    :rtype: list
+    """
+    if position is None:
+        return [default] * len(data.index)
+
+    _values = data.iloc[:, position]
+
+    # If it's supposed to be a date, make it a date.
+    if default == date.today():
+        return [
+            default if pd.isna(_value) else _value.to_pydatetime()
+            for _value in pd.to_datetime(_values, errors="coerce")
+        ]
+
+    return _values.astype(object).where(_values.notna(), default).tolist()
+
+
+def _get_column_positions(data: pd.DataFrame) -> Dict[Any, int]:
+    """Map each input data column header to the column's position.
+
+    :param data: the pandas DataFrame containing the input data.
+    :return: the position of each column keyed by the column header.
+    :rtype: dict
+    """
+    return {_column: _position for _position, _column in enumerate(data.columns)}
+
+
+def _do_read_chunks(
+    file_type: str, file_name: str, chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    """Read the contents of an input file chunk_size rows at a time.
+
+    CSV and text files are read with the pandas chunked reader.  Excel
+    workbooks are read one row at a time in read-only mode and collected into
+    chunks.  Legacy Excel (*.xls) workbooks are read whole and then split into
+    chunks.
+
+    :param file_type: the type of file to import from.  Supported files types
+        are the same as Import._do_read_file().
+    :param file_name: the name, with full path, of the file to read.
+    :param chunk_size: the number of rows in each chunk.
+    :return: a generator of pandas DataFrames with the rows in each chunk.
+    :rtype: generator
+    """
+    if file_type in ["csv", "text"]:
+        yield from pd.read_csv(
+            file_name,
+            sep={"csv": ";", "text": " "}[file_type],
+            na_values=[""],
+            parse_dates=True,
+            chunksize=chunk_size,
+        )
+    elif file_type == "excel" and file_name.endswith(".xls"):
+        _data = pd.read_excel(file_name)
+        for _start in range(0, len(_data.index), chunk_size):
+            _end = _start + chunk_size
+            yield _data.iloc[_start:_end]
+    elif file_type == "excel":
+        _workbook = openpyxl.load_workbook(file_name, read_only=True, data_only=True)
+        try:
+            _rows = _workbook.active.iter_rows(values_only=True)
+            _header = [
+                "Unnamed: {}".format(_position) if _column is None else _column
+                for _position, _column in enumerate(next(_rows, ()))
+            ]
+            _chunk: List[Tuple[Any, ...]] = []
+            for _row in _rows:
+                _chunk.append(_row)
+                if len(_chunk) == chunk_size:
+                    yield pd.DataFrame(_chunk, columns=_header)
+                    _chunk = []
+            if _chunk:
+                yield pd.DataFrame(_chunk, columns=_header)
+        finally:
+            _workbook.close()
+
+
 class Import:
     """Contains the methods for importing data to a program database."""
 
@@ -329,9 +422,396 @@ class Import:
         ),
     }
 
+    # The records built from each row of an import file for each module.  Each
+    # record attribute is (attribute name, field map, RAMSTK field, default).
+    # Date defaults are replaced with the date of the import.
+    _dic_record_fields: Dict[
+        str, List[Tuple[Type[object], List[Tuple[str, str, str, Any]]]]
+    ] = {
+        "Function": [
+            (
+                RAMSTKFunctionRecord,
+                [
+                    ("revision_id", "Function", "Revision ID", 1),
+                    ("function_id", "Function", "Function ID", 1),
+                    ("function_code", "Function", "Function Code", ""),
+                    ("level", "Function", "Level", 0),
+                    ("name", "Function", "Function Name", ""),
+                    ("parent_id", "Function", "Parent", 1),
+                    ("remarks", "Function", "Remarks", ""),
+                    ("safety_critical", "Function", "Safety Critical", 0),
+                    ("type_id", "Function", "Type", ""),
+                ],
+            ),
+        ],
+        "Requirement": [
+            (
+                RAMSTKRequirementRecord,
+                [
+                    ("revision_id", "Requirement", "Revision ID", 1),
+                    ("requirement_id", "Requirement", "Requirement ID", 1),
+                    ("derived", "Requirement", "Derived?", 0),
+                    ("description", "Requirement", "Requirement", ""),
+                    ("figure_number", "Requirement", "Figure Number", ""),
+                    ("owner", "Requirement", "Owner", ""),
+                    ("page_number", "Requirement", "Page Number", ""),
+                    ("parent_id", "Requirement", "Parent ID", 1),
+                    ("priority", "Requirement", "Priority", 1),
+                    ("requirement_code", "Requirement", "Requirement Code", ""),
+                    ("specification", "Requirement", "Specification", ""),
+                    ("requirement_type", "Requirement", "Requirement Type", ""),
+                    ("validated", "Requirement", "Validated?", 0),
+                    ("validated_date", "Requirement", "Validated Date", date.today()),
+                ],
+            ),
+        ],
+        "Hardware": [
+            (
+                RAMSTKHardwareRecord,
+                [
+                    ("revision_id", "Hardware", "Revision ID", 1),
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    ("alt_part_number", "Hardware", "Alternate Part Number", ""),
+                    ("cage_code", "Hardware", "CAGE Code", ""),
+                    ("category_id", "Hardware", "Category ID", 0),
+                    ("comp_ref_des", "Hardware", "Composite Ref. Des.", ""),
+                    ("cost", "Hardware", "Cost", 0.0),
+                    ("cost_type_id", "Hardware", "Cost Type", 0),
+                    ("description", "Hardware", "Description", ""),
+                    ("duty_cycle", "Hardware", "Duty Cycle", 100.0),
+                    ("figure_number", "Hardware", "Figure Number", ""),
+                    ("lcn", "Hardware", "LCN", ""),
+                    ("level", "Hardware", "Level", 0),
+                    ("manufacturer_id", "Hardware", "Manufacturer", 0),
+                    ("mission_time", "Hardware", "Mission Time", 24.0),
+                    ("name", "Hardware", "Name", ""),
+                    ("nsn", "Hardware", "NSN", ""),
+                    ("page_number", "Hardware", "Page Number", ""),
+                    ("parent_id", "Hardware", "Parent Assembly", 1),
+                    ("part", "Hardware", "Part", 0),
+                    ("part_number", "Hardware", "Part Number", ""),
+                    ("quantity", "Hardware", "Quantity", 1),
+                    ("ref_des", "Hardware", "Reference Designator", ""),
+                    ("remarks", "Hardware", "Remarks", ""),
+                    ("repairable", "Hardware", "Repairable", 1),
+                    ("specification_number", "Hardware", "Specification", ""),
+                    ("subcategory_id", "Hardware", "Subcategory ID", 0),
+                    ("tagged_part", "Hardware", "Tagged Part", 0),
+                    ("year_of_manufacture", "Hardware", "Year of Manufacture", 1900),
+                ],
+            ),
+            (
+                RAMSTKAllocationRecord,
+                [
+                    ("revision_id", "Hardware", "Revision ID", 1),
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    ("parent_id", "Hardware", "Parent Assembly", 1),
+                ],
+            ),
+            (
+                RAMSTKSimilarItemRecord,
+                [
+                    ("revision_id", "Hardware", "Revision ID", 1),
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    ("parent_id", "Hardware", "Parent Assembly", 1),
+                ],
+            ),
+            (
+                RAMSTKDesignElectricRecord,
+                [
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    ("application_id", "Design Electric", "Application ID", 0),
+                    ("area", "Design Electric", "Area", 0.0),
+                    ("capacitance", "Design Electric", "Capacitance", 1e-06),
+                    ("configuration_id", "Design Electric", "Configuration ID", 0),
+                    ("construction_id", "Design Electric", "Construction ID", 0),
+                    ("contact_form_id", "Design Electric", "Contact Form ID", 0),
+                    ("contact_gauge", "Design Electric", "Contact Gauge", 20),
+                    ("contact_rating_id", "Design Electric", "Contact Rating ID", 0),
+                    ("current_operating", "Design Electric", "Current Operating", 0.0),
+                    ("current_rated", "Design Electric", "Current Rated", 0.0),
+                    ("current_ratio", "Design Electric", "Current Ratio", 0.0),
+                    (
+                        "environment_active_id",
+                        "Design Electric",
+                        "Environment Active ID",
+                        0,
+                    ),
+                    (
+                        "environment_dormant_id",
+                        "Design Electric",
+                        "Environment Dormant ID",
+                        0,
+                    ),
+                    ("family_id", "Design Electric", "Family ID", 0),
+                    ("feature_size", "Design Electric", "Feature Size", 1.0),
+                    (
+                        "frequency_operating",
+                        "Design Electric",
+                        "Frequency Operating",
+                        0.0,
+                    ),
+                    ("insert_id", "Design Electric", "Insert ID", 0),
+                    ("insulation_id", "Design Electric", "Insulation ID", 0),
+                    ("manufacturing_id", "Design Electric", "Manufacturing ID", 0),
+                    ("matching_id", "Design Electric", "Matching ID", 0),
+                    ("n_active_pins", "Design Electric", "N Active Pins", 0),
+                    ("n_circuit_planes", "Design Electric", "N Circuit Planes", 1),
+                    ("n_cycles", "Design Electric", "N Cycles", 0),
+                    ("n_elements", "Design Electric", "N Elements", 0),
+                    ("n_hand_soldered", "Design Electric", "N Hand Soldered", 0),
+                    ("n_wave_soldered", "Design Electric", "N Wave Soldered", 0),
+                    ("operating_life", "Design Electric", "Operating Life", 0.0),
+                    ("overstress", "Design Electric", "Overstress", 0),
+                    ("package_id", "Design Electric", "Package ID", 0),
+                    ("power_operating", "Design Electric", "Power Operating", 0.0),
+                    ("power_rated", "Design Electric", "Power Rated", 0.0),
+                    ("power_ratio", "Design Electric", "Power Ratio", 0.0),
+                    ("reason", "Design Electric", "Reason", ""),
+                    ("resistance", "Design Electric", "Resistance", 0.0),
+                    ("specification_id", "Design Electric", "Specification ID", 0),
+                    ("technology_id", "Design Electric", "Technology ID", 0),
+                    (
+                        "temperature_active",
+                        "Design Electric",
+                        "Temperature, Active",
+                        30.0,
+                    ),
+                    ("temperature_case", "Design Electric", "Temperature, Case", 0.0),
+                    (
+                        "temperature_dormant",
+                        "Design Electric",
+                        "Temperature, Dormant",
+                        25.0,
+                    ),
+                    (
+                        "temperature_hot_spot",
+                        "Design Electric",
+                        "Temperature, Hot Spot",
+                        0.0,
+                    ),
+                    (
+                        "temperature_junction",
+                        "Design Electric",
+                        "Temperature, Junction",
+                        0.0,
+                    ),
+                    ("temperature_knee", "Design Electric", "Temperature, Knee", 25.0),
+                    (
+                        "temperature_rated_max",
+                        "Design Electric",
+                        "Temperature, Rated Max",
+                        0.0,
+                    ),
+                    (
+                        "temperature_rated_min",
+                        "Design Electric",
+                        "Temperature, Rated Min",
+                        0.0,
+                    ),
+                    ("temperature_rise", "Design Electric", "Temperature Rise", 0.0),
+                    ("theta_jc", "Design Electric", "Theta JC", 0.0),
+                    ("type_id", "Design Electric", "Type ID", 0),
+                    (
+                        "voltage_ac_operating",
+                        "Design Electric",
+                        "Voltage, AC Operating",
+                        0.0,
+                    ),
+                    (
+                        "voltage_dc_operating",
+                        "Design Electric",
+                        "Voltage, DC Operating",
+                        0.0,
+                    ),
+                    ("voltage_esd", "Design Electric", "Voltage ESD", 0.0),
+                    ("voltage_rated", "Design Electric", "Voltage, Rated", 0.0),
+                    ("voltage_ratio", "Design Electric", "Voltage Ratio", 0.0),
+                    ("weight", "Design Electric", "Weight", 1.0),
+                    (
+                        "years_in_production",
+                        "Design Electric",
+                        "Years in Production",
+                        2,
+                    ),
+                ],
+            ),
+            (
+                RAMSTKMilHdbk217FRecord,
+                [
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                ],
+            ),
+            (
+                RAMSTKDesignMechanicRecord,
+                [
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    (
+                        "altitude_operating",
+                        "Design Mechanic",
+                        "Altitude, Operating",
+                        0.0,
+                    ),
+                    ("application_id", "Design Mechanic", "Application ID", 0),
+                    ("balance_id", "Design Mechanic", "Balance ID", 0),
+                    ("clearance", "Design Mechanic", "Clearance", 0.0),
+                    ("casing_id", "Design Mechanic", "Casing ID", 0),
+                    ("contact_pressure", "Design Mechanic", "Contact Pressure", 0.0),
+                    ("deflection", "Design Mechanic", "Deflection", 0.0),
+                    ("diameter_coil", "Design Mechanic", "Diameter, Coil", 0.0),
+                    ("diameter_inner", "Design Mechanic", "Diameter, Inner", 0.0),
+                    ("diameter_outer", "Design Mechanic", "Diameter, Outer", 0.0),
+                    ("diameter_wire", "Design Mechanic", "Diameter, Wire", 0.0),
+                    ("filter_size", "Design Mechanic", "Filter Size", 0.0),
+                    ("flow_design", "Design Mechanic", "Flow, Design", 0.0),
+                    ("flow_operating", "Design Mechanic", "Flow, Operating", 0.0),
+                    (
+                        "frequency_operating",
+                        "Design Mechanic",
+                        "Frequency, Operating",
+                        0.0,
+                    ),
+                    ("friction", "Design Mechanic", "Friction", 0.0),
+                    ("impact_id", "Design Mechanic", "Impact ID", 0),
+                    ("leakage_allowable", "Design Mechanic", "Allowable Leakage", 0.0),
+                    ("length", "Design Mechanic", "Length", 0.0),
+                    ("length_compressed", "Design Mechanic", "Length, Compressed", 0.0),
+                    ("length_relaxed", "Design Mechanic", "Length, Relaxed", 0.0),
+                    ("load_design", "Design Mechanic", "Design Load", 0.0),
+                    ("load_id", "Design Mechanic", "Load ID", 0),
+                    ("load_operating", "Design Mechanic", "Operating Load", 0.0),
+                    ("lubrication_id", "Design Mechanic", "Lubrication ID", 0),
+                    ("manufacturing_id", "Design Mechanic", "Manufacturing ID", 0),
+                    ("material_id", "Design Mechanic", "Material ID", 0),
+                    ("meyer_hardness", "Design Mechanic", "Meyer Hardness", 0.0),
+                    (
+                        "misalignment_angle",
+                        "Design Mechanic",
+                        "Misalignment Angle",
+                        0.0,
+                    ),
+                    ("n_ten", "Design Mechanic", "N Ten", 0),
+                    ("n_cycles", "Design Mechanic", "N Cycles", 0.0),
+                    ("n_elements", "Design Mechanic", "N Elements", 0),
+                    ("offset", "Design Mechanic", "Offset", 0.0),
+                    ("particle_size", "Design Mechanic", "Particle Size", 0.0),
+                    ("pressure_contact", "Design Mechanic", "Contact Pressure", 0.0),
+                    ("pressure_delta", "Design Mechanic", "Differential Pressure", 0.0),
+                    (
+                        "pressure_downstream",
+                        "Design Mechanic",
+                        "Downstream Pressure",
+                        0.0,
+                    ),
+                    ("pressure_rated", "Design Mechanic", "Rated Pressure", 0.0),
+                    ("pressure_upstream", "Design Mechanic", "Upstream Pressure", 0.0),
+                    ("rpm_design", "Design Mechanic", "Design RPM", 0.0),
+                    ("rpm_operating", "Design Mechanic", "Operating RPM", 0.0),
+                    ("service_id", "Design Mechanic", "Service ID", 0),
+                    ("spring_index", "Design Mechanic", "Spring Index", 0),
+                    ("surface_finish", "Design Mechanic", "Surface Finish", 0.0),
+                    ("technology_id", "Design Mechanic", "Technology ID", 0),
+                    ("thickness", "Design Mechanic", "Thickness", 0.0),
+                    ("torque_id", "Design Mechanic", "Torque ID", 0),
+                    ("type_id", "Design Mechanic", "Type ID", 0),
+                    ("viscosity_design", "Design Mechanic", "Design Viscosity", 0.0),
+                    ("viscosity_dynamic", "Design Mechanic", "Dynamic Viscosity", 0.0),
+                    ("water_per_cent", "Design Mechanic", "% Water", 0.0),
+                    ("width_minimum", "Design Mechanic", "Minimum Width", 0.0),
+                ],
+            ),
+            (
+                RAMSTKNSWCRecord,
+                [
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                ],
+            ),
+            (
+                RAMSTKReliabilityRecord,
+                [
+                    ("hardware_id", "Hardware", "Hardware ID", 1),
+                    (
+                        "add_adj_factor",
+                        "Reliability",
+                        "Additive Adjustment Factor",
+                        0.0,
+                    ),
+                    (
+                        "failure_distribution_id",
+                        "Reliability",
+                        "Failure Distribution ID",
+                        0,
+                    ),
+                    (
+                        "hazard_rate_method_id",
+                        "Reliability",
+                        "Failure Rate Method ID",
+                        0,
+                    ),
+                    ("hazard_rate_model", "Reliability", "Failure Rate Model", ""),
+                    (
+                        "hazard_rate_specified",
+                        "Reliability",
+                        "Specified Failure Rate",
+                        0.0,
+                    ),
+                    ("hazard_rate_type_id", "Reliability", "Failure Rate Type ID", 0),
+                    ("location_parameter", "Reliability", "Location Parameter", 0.0),
+                    ("mtbf_specified", "Reliability", "Specified MTBF", 0.0),
+                    (
+                        "mult_adj_factor",
+                        "Reliability",
+                        "Multiplicative Adjustment Factor",
+                        1.0,
+                    ),
+                    ("quality_id", "Reliability", "Quality ID", 0),
+                    ("reliability_goal", "Reliability", "Reliability Goal", 100.0),
+                    (
+                        "reliability_goal_measure_id",
+                        "Reliability",
+                        "Reliability Goal Measure ID",
+                        0,
+                    ),
+                    ("scale_parameter", "Reliability", "Scale Parameter", 0.0),
+                    ("shape_parameter", "Reliability", "Shape Parameter", 0.0),
+                    ("survival_analysis_id", "Reliability", "Survival Analysis ID", 0),
+                ],
+            ),
+        ],
+        "Validation": [
+            (
+                RAMSTKValidationRecord,
+                [
+                    ("revision_id", "Validation", "Revision ID", 1),
+                    ("validation_id", "Validation", "Validation ID", 1),
+                    ("acceptable_maximum", "Validation", "Acceptable Maximum", 0.0),
+                    ("acceptable_mean", "Validation", "Acceptable Mean", 0.0),
+                    ("acceptable_minimum", "Validation", "Acceptable Minimum", 0.0),
+                    ("acceptable_variance", "Validation", "Acceptable Variance", 0.0),
+                    ("confidence", "Validation", "s-Confidence", 75.0),
+                    ("cost_average", "Validation", "Average Task Cost", 0.0),
+                    ("cost_maximum", "Validation", "Maximum Task Cost", 0.0),
+                    ("cost_minimum", "Validation", "Minimum Task Cost", 0.0),
+                    ("date_start", "Validation", "Start Date", date.today()),
+                    ("date_end", "Validation", "End Date", date.today()),
+                    ("description", "Validation", "Task Description", ""),
+                    ("measurement_unit", "Validation", "Unit of Measure", ""),
+                    ("name", "Validation", "Name", ""),
+                    ("status", "Validation", "Task Status", 0.0),
+                    ("task_type", "Validation", "Task Type", ""),
+                    ("task_specification", "Validation", "Task Specification", ""),
+                    ("time_average", "Validation", "Average Task Time", 0.0),
+                    ("time_maximum", "Validation", "Maximum Task Time", 0.0),
+                    ("time_minimum", "Validation", "Minimum Task Time", 0.0),
+                ],
+            ),
+        ],
+    }
+
     def __init__(self) -> None:
         """Initialize an ImportProject module instance."""
         # Initialize private dictionary attributes.
+        self._dic_import_errors: Dict[int, str] = {}
 
         # Initialize private list attributes.
 
@@ -344,6 +824,7 @@ class Import:
         # Initialize public list attributes.
 
         # Initialize public scalar attributes.
+        self.chunk_size: int = 5000
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self._do_connect, "succeed_connect_program_database")
@@ -351,6 +832,7 @@ class Import:
         pub.subscribe(self._do_read_db_fields, "request_db_fields")
         pub.subscribe(self._do_read_file, "request_read_import_file")
         pub.subscribe(self._do_import, "request_import")
+        pub.subscribe(self._do_import_file, "request_import_file")
 
     def _do_connect(self, dao: BaseDatabase) -> None:
         """Connect data manager to a database.
@@ -360,6 +842,43 @@ class Import:
         """
         self._dao = dao
 
+    def _do_build_records(
+        self, module: str, data: pd.DataFrame, columns: Dict[Any, int]
+    ) -> List[object]:
+        """Build the records for each row of the input data.
+
+        Each mapped column is converted to a list of values once, with NaN
+        values replaced by the field's default, and the records are built from
+        those lists.  All the records of one type are built before the records
+        of the next type.
+
+        :param module: the name of the RAMSTK module to build records for.
+        :param data: the pandas DataFrame containing the input data.
+        :param columns: the position of each input data column keyed by the
+            column header.
+        :return: _records; the list of records built from the input data.
+        :rtype: list
+        """
+        _records: List[object] = []
+
+        for _record_class, _fields in self._dic_record_fields.get(module, []):
+            _attributes = [_field[0] for _field in _fields]
+            _values = [
+                _get_input_column(
+                    data,
+                    columns.get(self._dic_field_map[_map].get(_field)),
+                    date.today() if isinstance(_default, date) else _default,
+                )
+                for __, _map, _field, _default in _fields
+            ]
+            for _row in zip(*_values):
+                _record = _record_class()
+                for _attribute, _value in zip(_attributes, _row):
+                    setattr(_record, _attribute, _value)
+                _records.append(_record)
+
+        return _records
+
     def _do_import(self, module: str) -> None:
         """Insert a new entity to the RAMSTK db with values from external file.
 
@@ -367,36 +886,11 @@ class Import:
         :return: None
         :rtype: None
         """
-        _entities = []
-
-        # pylint: disable=unused-variable
-        for __, _row in self._df_input_data.iterrows():
-            if module == "Function":
-                _entity = self._do_insert_function(_row)
-                _entities.append(_entity)
-            elif module == "Requirement":
-                _entity = self._do_insert_requirement(_row)
-                _entities.append(_entity)
-            elif module == "Hardware":
-                _entity = self._do_insert_hardware(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_allocation(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_similar_item(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_electric(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_mil_hdbk_f(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_mechanic(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_nswc(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_reliability(_row)
-                _entities.append(_entity)
-            elif module == "Validation":
-                _entity = self._do_insert_validation(_row)
-                _entities.append(_entity)
+        _entities = self._do_build_records(
+            module,
+            self._df_input_data,
+            _get_column_positions(self._df_input_data),
+        )
 
         try:
             self._dao.do_insert_many(_entities)  # type: ignore
@@ -416,487 +910,74 @@ class Import:
                 error_message=_error_msg,
             )
 
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocationRecord:
-        """Insert a new Allocation record to the RAMSTK database.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _allocation; an instance of the RAMSTKAllocationRecord database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKAllocationRecord`
-        """
-        _allocation = RAMSTKAllocationRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _allocation.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _allocation.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _allocation.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-
-        return _allocation
-
-    def _do_insert_design_electric(self, row: pd.Series) -> RAMSTKDesignElectricRecord:
-        """Insert a new Design Electric entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignElectric`
-        """
-        _design_electric = RAMSTKDesignElectricRecord()
-
-        _map = self._dic_field_map["Hardware"]
-
-        _design_electric.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Design Electric"]
-        _design_electric.set_attributes(
-            {
-                "application_id": _get_input_value(_map, row, "Application ID", 0),
-                "area": _get_input_value(_map, row, "Area", 0.0),
-                "capacitance": _get_input_value(_map, row, "Capacitance", 0.000001),
-                "configuration_id": _get_input_value(_map, row, "Configuration ID", 0),
-                "construction_id": _get_input_value(_map, row, "Construction ID", 0),
-                "contact_form_id": _get_input_value(_map, row, "Contact Form ID", 0),
-                "contact_gauge": _get_input_value(_map, row, "Contact Gauge", 20),
-                "contact_rating_id": _get_input_value(
-                    _map, row, "Contact Rating ID", 0
-                ),
-                "current_operating": _get_input_value(
-                    _map, row, "Current Operating", 0.0
-                ),
-                "current_rated": _get_input_value(_map, row, "Current Rated", 0.0),
-                "current_ratio": _get_input_value(_map, row, "Current Ratio", 0.0),
-                "environment_active_id": _get_input_value(
-                    _map, row, "Environment Active ID", 0
-                ),
-                "environment_dormant_id": _get_input_value(
-                    _map, row, "Environment Dormant ID", 0
-                ),
-                "family_id": _get_input_value(_map, row, "Family ID", 0),
-                "feature_size": _get_input_value(_map, row, "Feature Size", 1.0),
-                "frequency_operating": _get_input_value(
-                    _map, row, "Frequency Operating", 0.0
-                ),
-                "insert_id": _get_input_value(_map, row, "Insert ID", 0),
-                "insulation_id": _get_input_value(_map, row, "Insulation ID", 0),
-                "manufacturing_id": _get_input_value(_map, row, "Manufacturing ID", 0),
-                "matching_id": _get_input_value(_map, row, "Matching ID", 0),
-                "n_active_pins": _get_input_value(_map, row, "N Active Pins", 0),
-                "n_circuit_planes": _get_input_value(_map, row, "N Circuit Planes", 1),
-                "n_cycles": _get_input_value(_map, row, "N Cycles", 0),
-                "n_elements": _get_input_value(_map, row, "N Elements", 0),
-                "n_hand_soldered": _get_input_value(_map, row, "N Hand Soldered", 0),
-                "n_wave_soldered": _get_input_value(_map, row, "N Wave Soldered", 0),
-                "operating_life": _get_input_value(_map, row, "Operating Life", 0.0),
-                "overstress": _get_input_value(_map, row, "Overstress", 0),
-                "package_id": _get_input_value(_map, row, "Package ID", 0),
-                "power_operating": _get_input_value(_map, row, "Power Operating", 0.0),
-                "power_rated": _get_input_value(_map, row, "Power Rated", 0.0),
-                "power_ratio": _get_input_value(_map, row, "Power Ratio", 0.0),
-                "reason": _get_input_value(_map, row, "Reason", ""),
-                "resistance": _get_input_value(_map, row, "Resistance", 0.0),
-                "specification_id": _get_input_value(_map, row, "Specification ID", 0),
-                "technology_id": _get_input_value(_map, row, "Technology ID", 0),
-                "temperature_active": _get_input_value(
-                    _map, row, "Temperature, Active", 30.0
-                ),
-                "temperature_case": _get_input_value(
-                    _map, row, "Temperature, Case", 0.0
-                ),
-                "temperature_dormant": _get_input_value(
-                    _map, row, "Temperature, Dormant", 25.0
-                ),
-                "temperature_hot_spot": _get_input_value(
-                    _map, row, "Temperature, Hot Spot", 0.0
-                ),
-                "temperature_junction": _get_input_value(
-                    _map, row, "Temperature, Junction", 0.0
-                ),
-                "temperature_knee": _get_input_value(
-                    _map, row, "Temperature, Knee", 25.0
-                ),
-                "temperature_rated_max": _get_input_value(
-                    _map, row, "Temperature, Rated Max", 0.0
-                ),
-                "temperature_rated_min": _get_input_value(
-                    _map, row, "Temperature, Rated Min", 0.0
-                ),
-                "temperature_rise": _get_input_value(
-                    _map, row, "Temperature Rise", 0.0
-                ),
-                "theta_jc": _get_input_value(_map, row, "Theta JC", 0.0),
-                "type_id": _get_input_value(_map, row, "Type ID", 0),
-                "voltage_ac_operating": _get_input_value(
-                    _map, row, "Voltage, AC Operating", 0.0
-                ),
-                "voltage_dc_operating": _get_input_value(
-                    _map, row, "Voltage, DC Operating", 0.0
-                ),
-                "voltage_esd": _get_input_value(_map, row, "Voltage ESD", 0.0),
-                "voltage_rated": _get_input_value(_map, row, "Voltage, Rated", 0.0),
-                "voltage_ratio": _get_input_value(_map, row, "Voltage Ratio", 0.0),
-                "weight": _get_input_value(_map, row, "Weight", 1.0),
-                "years_in_production": _get_input_value(
-                    _map, row, "Years in Production", 2
-                ),
-            }
-        )
-
-        return _design_electric
-
-    def _do_insert_design_mechanic(self, row: pd.Series) -> RAMSTKDesignMechanicRecord:
-        """Insert a new Design Mechanic entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignMechanic`
-        """
-        _design_mechanic = RAMSTKDesignMechanicRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _design_mechanic.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Design Mechanic"]
-        _design_mechanic.set_attributes(
-            {
-                "altitude_operating": _get_input_value(
-                    _map, row, "Altitude, Operating", 0.0
-                ),
-                "application_id": _get_input_value(_map, row, "Application ID", 0),
-                "balance_id": _get_input_value(_map, row, "Balance ID", 0),
-                "clearance": _get_input_value(_map, row, "Clearance", 0.0),
-                "casing_id": _get_input_value(_map, row, "Casing ID", 0),
-                "contact_pressure": _get_input_value(
-                    _map, row, "Contact Pressure", 0.0
-                ),
-                "deflection": _get_input_value(_map, row, "Deflection", 0.0),
-                "diameter_coil": _get_input_value(_map, row, "Diameter, Coil", 0.0),
-                "diameter_inner": _get_input_value(_map, row, "Diameter, Inner", 0.0),
-                "diameter_outer": _get_input_value(_map, row, "Diameter, Outer", 0.0),
-                "diameter_wire": _get_input_value(_map, row, "Diameter, Wire", 0.0),
-                "filter_size": _get_input_value(_map, row, "Filter Size", 0.0),
-                "flow_design": _get_input_value(_map, row, "Flow, Design", 0.0),
-                "flow_operating": _get_input_value(_map, row, "Flow, Operating", 0.0),
-                "frequency_operating": _get_input_value(
-                    _map, row, "Frequency, Operating", 0.0
-                ),
-                "friction": _get_input_value(_map, row, "Friction", 0.0),
-                "impact_id": _get_input_value(_map, row, "Impact ID", 0),
-                "leakage_allowable": _get_input_value(
-                    _map, row, "Allowable Leakage", 0.0
-                ),
-                "length": _get_input_value(_map, row, "Length", 0.0),
-                "length_compressed": _get_input_value(
-                    _map, row, "Length, Compressed", 0.0
-                ),
-                "length_relaxed": _get_input_value(_map, row, "Length, Relaxed", 0.0),
-                "load_design": _get_input_value(_map, row, "Design Load", 0.0),
-                "load_id": _get_input_value(_map, row, "Load ID", 0),
-                "load_operating": _get_input_value(_map, row, "Operating Load", 0.0),
-                "lubrication_id": _get_input_value(_map, row, "Lubrication ID", 0),
-                "manufacturing_id": _get_input_value(_map, row, "Manufacturing ID", 0),
-                "material_id": _get_input_value(_map, row, "Material ID", 0),
-                "meyer_hardness": _get_input_value(_map, row, "Meyer Hardness", 0.0),
-                "misalignment_angle": _get_input_value(
-                    _map, row, "Misalignment Angle", 0.0
-                ),
-                "n_ten": _get_input_value(_map, row, "N Ten", 0),
-                "n_cycles": _get_input_value(_map, row, "N Cycles", 0.0),
-                "n_elements": _get_input_value(_map, row, "N Elements", 0),
-                "offset": _get_input_value(_map, row, "Offset", 0.0),
-                "particle_size": _get_input_value(_map, row, "Particle Size", 0.0),
-                "pressure_contact": _get_input_value(
-                    _map, row, "Contact Pressure", 0.0
-                ),
-                "pressure_delta": _get_input_value(
-                    _map, row, "Differential Pressure", 0.0
-                ),
-                "pressure_downstream": _get_input_value(
-                    _map, row, "Downstream Pressure", 0.0
-                ),
-                "pressure_rated": _get_input_value(_map, row, "Rated Pressure", 0.0),
-                "pressure_upstream": _get_input_value(
-                    _map, row, "Upstream Pressure", 0.0
-                ),
-                "rpm_design": _get_input_value(_map, row, "Design RPM", 0.0),
-                "rpm_operating": _get_input_value(_map, row, "Operating RPM", 0.0),
-                "service_id": _get_input_value(_map, row, "Service ID", 0),
-                "spring_index": _get_input_value(_map, row, "Spring Index", 0),
-                "surface_finish": _get_input_value(_map, row, "Surface Finish", 0.0),
-                "technology_id": _get_input_value(_map, row, "Technology ID", 0),
-                "thickness": _get_input_value(_map, row, "Thickness", 0.0),
-                "torque_id": _get_input_value(_map, row, "Torque ID", 0),
-                "type_id": _get_input_value(_map, row, "Type ID", 0),
-                "viscosity_design": _get_input_value(
-                    _map, row, "Design Viscosity", 0.0
-                ),
-                "viscosity_dynamic": _get_input_value(
-                    _map, row, "Dynamic Viscosity", 0.0
-                ),
-                "water_per_cent": _get_input_value(_map, row, "% Water", 0.0),
-                "width_minimum": _get_input_value(_map, row, "Minimum Width", 0.0),
-            }
-        )
-
-        return _design_mechanic
-
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunctionRecord:
-        """Insert a new Function entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramskfunction.RAMSTKFunction`
-        """
-        _function = RAMSTKFunctionRecord()
-        _map = self._dic_field_map["Function"]
-
-        _function.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _function.function_id = _get_input_value(_map, row, "Function ID", 1)
-        _function.function_code = _get_input_value(_map, row, "Function Code", "")
-        _function.level = _get_input_value(_map, row, "Level", 0)
-        _function.name = _get_input_value(_map, row, "Function Name", "")
-        _function.parent_id = _get_input_value(_map, row, "Parent", 1)
-        _function.remarks = _get_input_value(_map, row, "Remarks", "")
-        _function.safety_critical = _get_input_value(_map, row, "Safety Critical", 0)
-        _function.type_id = _get_input_value(_map, row, "Type", "")
-
-        return _function
-
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardwareRecord:
-        """Insert a new Hardware entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramstkhardware.RAMSTKHardware`
-        """
-        _hardware = RAMSTKHardwareRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _hardware.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _hardware.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _hardware.alt_part_number = _get_input_value(
-            _map, row, "Alternate Part Number", ""
-        )
-        _hardware.cage_code = _get_input_value(_map, row, "CAGE Code", "")
-        _hardware.category_id = _get_input_value(_map, row, "Category ID", 0)
-        _hardware.comp_ref_des = _get_input_value(_map, row, "Composite Ref. Des.", "")
-        _hardware.cost = _get_input_value(_map, row, "Cost", 0.0)
-        _hardware.cost_type_id = _get_input_value(_map, row, "Cost Type", 0)
-        _hardware.description = _get_input_value(_map, row, "Description", "")
-        _hardware.duty_cycle = _get_input_value(_map, row, "Duty Cycle", 100.0)
-        _hardware.figure_number = _get_input_value(_map, row, "Figure Number", "")
-        _hardware.lcn = _get_input_value(_map, row, "LCN", "")
-        _hardware.level = _get_input_value(_map, row, "Level", 0)
-        _hardware.manufacturer_id = _get_input_value(_map, row, "Manufacturer", 0)
-        _hardware.mission_time = _get_input_value(_map, row, "Mission Time", 24.0)
-        _hardware.name = _get_input_value(_map, row, "Name", "")
-        _hardware.nsn = _get_input_value(_map, row, "NSN", "")
-        _hardware.page_number = _get_input_value(_map, row, "Page Number", "")
-        _hardware.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-        _hardware.part = _get_input_value(_map, row, "Part", 0)
-        _hardware.part_number = _get_input_value(_map, row, "Part Number", "")
-        _hardware.quantity = _get_input_value(_map, row, "Quantity", 1)
-        _hardware.ref_des = _get_input_value(_map, row, "Reference Designator", "")
-        _hardware.remarks = _get_input_value(_map, row, "Remarks", "")
-        _hardware.repairable = _get_input_value(_map, row, "Repairable", 1)
-        _hardware.specification_number = _get_input_value(
-            _map, row, "Specification", ""
-        )
-        _hardware.subcategory_id = _get_input_value(_map, row, "Subcategory ID", 0)
-        _hardware.tagged_part = _get_input_value(_map, row, "Tagged Part", 0)
-        _hardware.year_of_manufacture = _get_input_value(
-            _map, row, "Year of Manufacture", 1900
-        )
-
-        return _hardware
-
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbk217FRecord:
-        """Insert a new MIL-HDBK-217F entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKMilHdbkF`
-        """
-        _mil_hdbk_f = RAMSTKMilHdbk217FRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _mil_hdbk_f.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        return _mil_hdbk_f
+    def _do_import_file(self, module: str, file_type: str, file_name: str) -> None:
+        """Insert new entities to the RAMSTK db from an external file in chunks.
 
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWCRecord:
-        """Insert a new NSWC entity to the RAMSTK db.
+        This is the streaming version of _do_import() for large files.  The
+        file is read chunk_size rows at a time and each chunk's records are
+        inserted and committed before the next chunk is read so memory use is
+        bounded by the chunk size.  A chunk that can't be inserted is rolled
+        back and reported and the import continues with the next chunk.  Parent
+        records must come before their children in the file.
 
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.nswc.RAMSTKNSWCRecord`
-        """
-        _nswc = RAMSTKNSWCRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _nswc.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        return _nswc
-
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliabilityRecord:
-        """Insert a new Reliability entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKReliability`
-        """
-        _reliability = RAMSTKReliabilityRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _reliability.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Reliability"]
-        _reliability.add_adj_factor = _get_input_value(
-            _map, row, "Additive Adjustment Factor", 0.0
-        )
-        _reliability.failure_distribution_id = _get_input_value(
-            _map, row, "Failure Distribution ID", 0
-        )
-        _reliability.hazard_rate_method_id = _get_input_value(
-            _map, row, "Failure Rate Method ID", 0
-        )
-        _reliability.hazard_rate_model = _get_input_value(
-            _map, row, "Failure Rate Model", ""
-        )
-        _reliability.hazard_rate_specified = _get_input_value(
-            _map, row, "Specified Failure Rate", 0.0
-        )
-        _reliability.hazard_rate_type_id = _get_input_value(
-            _map, row, "Failure Rate Type ID", 0
-        )
-        _reliability.location_parameter = _get_input_value(
-            _map, row, "Location Parameter", 0.0
-        )
-        _reliability.mtbf_specified = _get_input_value(_map, row, "Specified MTBF", 0.0)
-        _reliability.mult_adj_factor = _get_input_value(
-            _map, row, "Multiplicative Adjustment Factor", 1.0
-        )
-        _reliability.quality_id = _get_input_value(_map, row, "Quality ID", 0)
-        _reliability.reliability_goal = _get_input_value(
-            _map, row, "Reliability Goal", 100.0
-        )
-        _reliability.reliability_goal_measure_id = _get_input_value(
-            _map, row, "Reliability Goal Measure ID", 0
-        )
-        _reliability.scale_parameter = _get_input_value(
-            _map, row, "Scale Parameter", 0.0
-        )
-        _reliability.shape_parameter = _get_input_value(
-            _map, row, "Shape Parameter", 0.0
-        )
-        _reliability.survival_analysis_id = _get_input_value(
-            _map, row, "Survival Analysis ID", 0
-        )
-
-        return _reliability
-
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirementRecord:
-        """Insert a new Requirement entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKRequirement`
-        """
-        _requirement = RAMSTKRequirementRecord()
-        _map = self._dic_field_map["Requirement"]
-
-        _requirement.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _requirement.requirement_id = _get_input_value(_map, row, "Requirement ID", 1)
-        _requirement.derived = _get_input_value(_map, row, "Derived?", 0)
-        _requirement.description = _get_input_value(_map, row, "Requirement", "")
-        _requirement.figure_number = _get_input_value(_map, row, "Figure Number", "")
-        _requirement.owner = _get_input_value(_map, row, "Owner", "")
-        _requirement.page_number = _get_input_value(_map, row, "Page Number", "")
-        _requirement.parent_id = _get_input_value(_map, row, "Parent ID", 1)
-        _requirement.priority = _get_input_value(_map, row, "Priority", 1)
-        _requirement.requirement_code = _get_input_value(
-            _map, row, "Requirement Code", ""
-        )
-        _requirement.specification = _get_input_value(_map, row, "Specification", "")
-        _requirement.requirement_type = _get_input_value(
-            _map, row, "Requirement Type", ""
-        )
-        _requirement.validated = _get_input_value(_map, row, "Validated?", 0)
-        _requirement.validated_date = _get_input_value(
-            _map, row, "Validated Date", date.today()
-        )
-
-        return _requirement
-
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItemRecord:
-        """Insert a new Similar Item record to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _similar_item; an instance of the RAMSTKSimilarItem database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKSimilarItem`
-        """
-        _similar_item = RAMSTKSimilarItemRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _similar_item.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _similar_item.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _similar_item.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-
-        return _similar_item
-
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidationRecord:
-        """Insert a new Validation entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKValidation.RAMSTKValidation`
+        :param module: the name of the RAMSTK module to import.
+        :param file_type: the type of file to import from.  Supported files
+            types are the same as _do_read_file().
+        :param file_name: the name, with full path, of the file to import.
+        :return: None
+        :rtype: None
         """
-        _validation = RAMSTKValidationRecord()
-        _map = self._dic_field_map["Validation"]
-
-        _validation.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _validation.validation_id = _get_input_value(_map, row, "Validation ID", 1)
-        _validation.acceptable_maximum = _get_input_value(
-            _map, row, "Acceptable Maximum", 0.0
-        )
-        _validation.acceptable_mean = _get_input_value(
-            _map, row, "Acceptable Mean", 0.0
-        )
-        _validation.acceptable_minimum = _get_input_value(
-            _map, row, "Acceptable Minimum", 0.0
-        )
-        _validation.acceptable_variance = _get_input_value(
-            _map, row, "Acceptable Variance", 0.0
-        )
-        _validation.confidence = _get_input_value(_map, row, "s-Confidence", 75.0)
-        _validation.cost_average = _get_input_value(_map, row, "Average Task Cost", 0.0)
-        _validation.cost_maximum = _get_input_value(_map, row, "Maximum Task Cost", 0.0)
-        _validation.cost_minimum = _get_input_value(_map, row, "Minimum Task Cost", 0.0)
-        _validation.date_start = _get_input_value(_map, row, "Start Date", date.today())
-        _validation.date_end = _get_input_value(_map, row, "End Date", date.today())
-        _validation.description = _get_input_value(_map, row, "Task Description", "")
-        _validation.measurement_unit = _get_input_value(
-            _map, row, "Unit of Measure", ""
-        )
-        _validation.name = _get_input_value(_map, row, "Name", "")
-        _validation.status = _get_input_value(_map, row, "Task Status", 0.0)
-        _validation.task_type = _get_input_value(_map, row, "Task Type", "")
-        _validation.task_specification = _get_input_value(
-            _map, row, "Task Specification", ""
-        )
-        _validation.time_average = _get_input_value(_map, row, "Average Task Time", 0.0)
-        _validation.time_maximum = _get_input_value(_map, row, "Maximum Task Time", 0.0)
-        _validation.time_minimum = _get_input_value(_map, row, "Minimum Task Time", 0.0)
-
-        return _validation
+        _columns: Optional[Dict[Any, int]] = None
+        _n_rows = 0
+
+        self._dic_import_errors = {}
+        for _chunk_id, _chunk in enumerate(
+            _do_read_chunks(file_type, file_name, self.chunk_size), start=1
+        ):
+            if _columns is None:
+                _columns = _get_column_positions(_chunk)
+
+            try:
+                self._dao.do_insert_many(
+                    self._do_build_records(module, _chunk, _columns)
+                )
+                _n_rows += len(_chunk.index)
+                pub.sendMessage(
+                    "succeed_import_chunk",
+                    module=module,
+                    chunk_id=_chunk_id,
+                    n_rows=_n_rows,
+                )
+            except (AttributeError, DataAccessError) as _error:
+                self._dic_import_errors[_chunk_id] = str(_error)
+                pub.sendMessage(
+                    "fail_import_chunk",
+                    module=module,
+                    chunk_id=_chunk_id,
+                    error_message=str(_error),
+                )
+
+        if self._dic_import_errors:
+            _method_name: str = inspect.currentframe().f_code.co_name  # type: ignore
+            _error_msg: str = (
+                "{1}: There was a problem importing {0} records in chunk(s) {2}; "
+                "the other chunks were imported.  This is usually caused by key "
+                "violations; check the ID and/or parent ID fields in the import "
+                "file."
+            ).format(
+                module,
+                _method_name,
+                ", ".join(str(_chunk_id) for _chunk_id in self._dic_import_errors),
+            )
+            pub.sendMessage(
+                "fail_import_module",
+                error_message=_error_msg,
+            )
+        else:
+            pub.sendMessage(
+                "succeed_import_module",
+                module=module,
+            )
 
     def _do_map_to_field(
         self, module: str, import_field: str, format_field: str
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 # Third Party Imports
 import pandas as pd
@@ -23,29 +23,30 @@ def _do_replace_nan(value: Any, default: Any) -> Any: ...
 def _get_input_value(
     mapper: Dict[str, Any], df_row: pd.Series, field: str, default: Any
 ) -> Any: ...
+def _get_input_column(
+    data: pd.DataFrame, position: Optional[int], default: Any
+) -> List[Any]: ...
+def _get_column_positions(data: pd.DataFrame) -> Dict[Any, int]: ...
+def _do_read_chunks(
+    file_type: str, file_name: str, chunk_size: int
+) -> Iterator[pd.DataFrame]: ...
 
 class Import:
     _dic_field_map: Any
+    _dic_record_fields: Dict[
+        str, List[Tuple[Type[object], List[Tuple[str, str, str, Any]]]]
+    ]
+    _dic_import_errors: Dict[int, str]
     _dao: Any
     _df_input_data: Any
+    chunk_size: int
     def __init__(self) -> None: ...
+    def _do_build_records(
+        self, module: str, data: pd.DataFrame, columns: Dict[Any, int]
+    ) -> List[object]: ...
     def _do_connect(self, dao: BaseDatabase) -> None: ...
     def _do_import(self, module: str) -> None: ...
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocationRecord: ...
-    def _do_insert_design_electric(
-        self, row: pd.Series
-    ) -> RAMSTKDesignElectricRecord: ...
-    def _do_insert_design_mechanic(
-        self, row: pd.Series
-    ) -> RAMSTKDesignMechanicRecord: ...
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunctionRecord: ...
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardwareRecord: ...
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbk217FRecord: ...
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWCRecord: ...
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliabilityRecord: ...
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirementRecord: ...
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItemRecord: ...
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidationRecord: ...
+    def _do_import_file(self, module: str, file_type: str, file_name: str) -> None: ...
     def _do_map_to_field(
         self, module: str, import_field: str, format_field: str
     ) -> None: ...
@@ -42,6 +42,7 @@ class RAMSTKLogManager:
         self.log_file = log_file
 
         # Subscribe to PyPubSub messages.
+        pub.subscribe(self._do_log_fail_message, "fail_clone_revision")
         pub.subscribe(self._do_log_fail_message, "fail_connect_program_database")
         pub.subscribe(self._do_log_fail_message, "fail_delete_environment")
         pub.subscribe(self._do_log_fail_message, "fail_delete_failure_definition")
@@ -51,6 +52,7 @@ class RAMSTKLogManager:
         pub.subscribe(self._do_log_fail_message, "fail_delete_mission")
         pub.subscribe(self._do_log_fail_message, "fail_delete_mission_phase")
         pub.subscribe(self._do_log_fail_message, "fail_delete_revision")
+        pub.subscribe(self._do_log_fail_message, "fail_export_data")
         pub.subscribe(self._do_log_fail_message, "fail_import_module")
         pub.subscribe(self._do_log_fail_message, "fail_insert_action")
         pub.subscribe(self._do_log_fail_message, "fail_insert_cause")
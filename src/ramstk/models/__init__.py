@@ -73,3 +73,4 @@ from .programdb.test_method.table import RAMSTKTestMethodTable
 from .programdb.usage_profile.view import RAMSTKUsageProfileView
 from .programdb.validation.record import RAMSTKValidationRecord
 from .programdb.validation.table import RAMSTKValidationTable
+from .treeindex import RAMSTKTree, RAMSTKTreeIndex
@@ -8,16 +8,24 @@
 
 # Standard Library Imports
 import inspect
-from typing import Any, Callable, Dict, List, Type
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type
 
 # Third Party Imports
 import treelib
 from pubsub import pub
+
+# noinspection PyPackageRequirements
+from sqlalchemy.orm.attributes import (  # type: ignore
+    instance_state,
+    set_committed_value,
+)
 from treelib.exceptions import NodeIDAbsentError
 
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
 from ramstk.exceptions import DataAccessError
+from ramstk.models.treeindex import RAMSTKTree
 from ramstk.utilities import none_to_default
 
 
@@ -34,6 +42,45 @@ def do_clear_tree(tree: treelib.Tree) -> treelib.Tree:
     return tree
 
 
+class RAMSTKLazyData(dict):
+    """Node data package that loads its record on first access.
+
+    Lazy table models create their tree nodes with an empty data package.
+    The first time the record is requested from the data package, the loader
+    is called to select the record from the database and add it.
+    """
+
+    def __init__(self, tag: str, loader: Callable[[int], None], node_id: int) -> None:
+        """Initialize a lazy node data package.
+
+        :param tag: the data package key the record is stored under.
+        :param loader: the function to call with the node ID to load the
+            record.
+        :param node_id: the ID of the node the data package belongs to.
+        """
+        super().__init__()
+
+        # Initialize private scalar attributes.
+        self._loader: Callable[[int], None] = loader
+        self._node_id: int = node_id
+        self._tag: str = tag
+
+    def __missing__(self, key: str) -> Any:
+        """Load the record the first time it is requested.
+
+        :param key: the data package key being requested.
+        :return: the record loaded for the node.
+        :raise: KeyError if the key isn't the record's key or the record no
+            longer exists in the database.
+        """
+        if key != self._tag:
+            raise KeyError(key)
+
+        self._loader(self._node_id)
+
+        return dict.__getitem__(self, key)
+
+
 class RAMSTKBaseRecord:
     """Meta-class for all RAMSTK Record models."""
 
@@ -94,6 +141,7 @@ class RAMSTKBaseTable:
         self._lst_id_columns: List[str] = []
 
         # Initialize private scalar attributes.
+        self._batch_depth: int = 0
         self._parent_id: int = 0
         self._record: Type[object]
         self._revision_id: int = 0
@@ -105,6 +153,8 @@ class RAMSTKBaseTable:
         # Initialize public scalar attributes.
         self.dao: BaseDatabase = BaseDatabase()
         self.last_id: int = 0
+        self.lazy: bool = bool(kwargs.get("lazy", False))
+        self.page_size: int = 250
         self.pkey: str = ""
         self.tree: treelib.Tree = treelib.Tree()
         self.do_get_new_record: Callable[[Dict[str, Any]], object]
@@ -139,6 +189,27 @@ class RAMSTKBaseTable:
         pub.subscribe(self.do_update_all, "request_update_all_{}".format(self._tag))
         pub.subscribe(self.do_update_all, "request_save_project")
 
+    @contextmanager
+    def do_batch_changes(self) -> Iterator[None]:
+        """Coalesce attribute change notifications.
+
+        Use as a context manager around a group of do_set_attributes() calls.
+        The succeed_get_<module>_tree message each call would send is sent
+        once when the outermost context exits instead.  Contexts may be
+        nested.
+
+        :return: None
+        :rtype: None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # noinspection PyUnresolvedReferences
+                self.do_get_tree()  # type: ignore
+
     def do_connect(self, dao: BaseDatabase) -> None:
         """Connect data manager to a database.
 
@@ -175,7 +246,7 @@ class RAMSTKBaseTable:
             self.dao.do_delete(_record)
 
             self.tree.remove_node(node_id)
-            self.last_id = self.dao.get_last_id(self._db_tablename, self._db_id_colname)
+            self.last_id = max(self.tree.nodes)
 
             pub.sendMessage(
                 "succeed_delete_{}".format(self._tag),
@@ -225,6 +296,37 @@ class RAMSTKBaseTable:
                 error_message=_error_msg,
             )
 
+    def do_get_changes(self) -> List[Dict[str, Any]]:
+        """Return the column values of every record changed since it was saved.
+
+        The values are copied so they can be written by a worker thread with
+        the DAO's do_update_mappings() while the records stay with the session
+        of the thread that loaded them.
+
+        :return: the column values of each changed record.
+        :rtype: list
+        """
+        _changes: List[Dict[str, Any]] = []
+        for _node in self.tree.all_nodes():
+            if (
+                _node.identifier == self._root
+                or _node.data is None
+                or self._tag not in _node.data
+            ):
+                continue
+
+            _record = _node.data[self._tag]
+            _state = instance_state(_record)
+            if any(_attribute.history.has_changes() for _attribute in _state.attrs):
+                _changes.append(
+                    {
+                        _key: getattr(_record, _key)
+                        for _key in _state.mapper.column_attrs.keys()
+                    }
+                )
+
+        return _changes
+
     def do_get_tree(self) -> None:
         """Retrieve the records tree.
 
@@ -248,10 +350,16 @@ class RAMSTKBaseTable:
             for _id in self._lst_id_columns:
                 attributes.pop(_id)
             _record.set_attributes(attributes)  # type: ignore
-            _identifier = self.last_id + 1
+            _identifier = getattr(_record, self.pkey)
 
-            self.dao.do_insert(_record)
-            self.last_id = self.dao.get_last_id(self._db_tablename, self._db_id_colname)
+            try:
+                self.dao.do_insert(_record)
+            except DataAccessError:
+                self.dao.do_release_id(
+                    self._db_tablename, self._db_id_colname, _identifier
+                )
+                raise
+            self.last_id = max(self.last_id, _identifier)
 
             self.tree.create_node(
                 tag=self._tag,
@@ -286,6 +394,26 @@ class RAMSTKBaseTable:
                 error_message=str(_error),
             )
 
+    def do_load_subtree(self, node_id: int) -> None:
+        """Load the records for every node in the subtree rooted at node ID.
+
+        This is a no-op for records that are already loaded.  The records are
+        selected from the database in pages of page_size records.
+
+        :param node_id: the ID of the node at the top of the subtree to load.
+        :return: None
+        :rtype: None
+        """
+        _node_ids = [
+            _node_id
+            for _node_id in self.tree.expand_tree(node_id)
+            if _node_id != self._root
+            and self._tag not in self.tree.get_node(_node_id).data
+        ]
+        for _start in range(0, len(_node_ids), self.page_size):
+            _end = _start + self.page_size
+            self._do_load_records(_node_ids[_start:_end])
+
     def do_select(self, node_id: Any) -> Any:
         """Retrieve the RAMSTK data table record for the Node ID passed.
 
@@ -330,27 +458,30 @@ class RAMSTKBaseTable:
             except KeyError:
                 self._revision_id = 0
 
-        for _record in self.dao.do_select_all(
-            self._record,
-            key=[
-                self._lst_id_columns[0],
-            ],
-            value=[
-                self._revision_id,
-            ],
-            order=self._db_id_colname,
-        ):
-            try:
-                self._parent_id = _record.get_attributes()["parent_id"]
-            except KeyError:
-                self._parent_id = 0
-
-            self.tree.create_node(
-                tag=self._tag,
-                identifier=_record.get_attributes()[self.pkey],
-                parent=self._parent_id,
-                data={self._tag: _record},
-            )
+        if self.lazy:
+            self._do_select_all_lazy()
+        else:
+            for _record in self.dao.do_select_all(
+                self._record,
+                key=[
+                    self._lst_id_columns[0],
+                ],
+                value=[
+                    self._revision_id,
+                ],
+                order=self._db_id_colname,
+            ):
+                try:
+                    self._parent_id = _record.get_attributes()["parent_id"]
+                except KeyError:
+                    self._parent_id = 0
+
+                self.tree.create_node(
+                    tag=self._tag,
+                    identifier=_record.get_attributes()[self.pkey],
+                    parent=self._parent_id,
+                    data={self._tag: _record},
+                )
         self.last_id = self.dao.get_last_id(self._db_tablename, self._db_id_colname)
 
         pub.sendMessage(
@@ -406,8 +537,9 @@ class RAMSTKBaseTable:
 
             self.do_select(_node_id).set_attributes(_attributes)
 
-        # noinspection PyUnresolvedReferences
-        self.do_get_tree()  # type: ignore
+        if self._batch_depth == 0:
+            # noinspection PyUnresolvedReferences
+            self.do_get_tree()  # type: ignore
 
     def do_set_attributes_all(self, attributes: Dict[str, Any]) -> None:
         """Set all the attributes of the record associated with the Module ID.
@@ -417,11 +549,39 @@ class RAMSTKBaseTable:
         :return: None
         :rtype: None
         """
-        for _key in attributes:
-            self.do_set_attributes(
-                node_id=[attributes[self.pkey]],
-                package={_key: attributes[_key]},
-            )
+        with self.do_batch_changes():
+            for _key in attributes:
+                self.do_set_attributes(
+                    node_id=[attributes[self.pkey]],
+                    package={_key: attributes[_key]},
+                )
+
+    def do_set_saved(self, changes: List[Dict[str, Any]]) -> None:
+        """Mark the values returned by do_get_changes() as saved.
+
+        Call this once the values have been written.  Values that changed
+        again after they were copied are still changed so the next save writes
+        them.
+
+        :param changes: the column values of each record that was written.
+        :return: None
+        :rtype: None
+        """
+        for _values in changes:
+            _node = self.tree.get_node(_values[self.pkey])
+            if _node is None or _node.data is None or self._tag not in _node.data:
+                continue
+
+            _record = _node.data[self._tag]
+            for _key, _value in _values.items():
+                if getattr(_record, _key) == _value:
+                    set_committed_value(_record, _key, _value)
+
+        pub.sendMessage(
+            "succeed_update_{}".format(self._tag),
+            tree=self.tree,
+        )
+        pub.sendMessage("succeed_update_all")
 
     def do_set_tree(self, tree: treelib.Tree) -> None:
         """Set the MODULE treelib Tree().
@@ -503,22 +663,134 @@ class RAMSTKBaseTable:
     def do_update_all(self) -> None:
         """Update all MODULE data table records in the RAMSTK Program database.
 
+        All the records are written in a single transaction using the DAO's bulk
+        update method.  If any record can't be written, none of them are.
+
         :return: None
         :rtype: None
         """
-        for _node in self.tree.all_nodes():
-            try:
-                self.do_update(_node.identifier, table=self._tag[:-1])  # type: ignore
-            except TypeError:
-                self.do_update(_node.identifier)  # type: ignore
+        _records: List[object] = [
+            _node.data[self._tag]
+            for _node in self.tree.all_nodes()
+            if _node.identifier != self._root
+            and _node.data is not None
+            and self._tag in _node.data
+        ]
 
-        pub.sendMessage("succeed_update_all")
+        try:
+            self.dao.do_update_many(_records)
+            pub.sendMessage(
+                "succeed_update_{}".format(self._tag),
+                tree=self.tree,
+            )
+            pub.sendMessage("succeed_update_all")
+        except DataAccessError as _error:
+            _error_msg: str = str(_error)
+            pub.sendMessage(
+                "do_log_debug",
+                logger_name="DEBUG",
+                message=_error_msg,
+            )
+            pub.sendMessage(
+                "fail_update_{}".format(self._tag),
+                error_message=_error_msg,
+            )
+
+    def do_write_changes(self, changes: List[Dict[str, Any]]) -> None:
+        """Write the values returned by do_get_changes() to the database.
+
+        No messages are sent and the records tree isn't touched so this can be
+        called from a worker thread.
+
+        :param changes: the column values of each changed record.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if the records can't be written.
+        """
+        self.dao.do_update_mappings(self._record, changes)
+
+    def _do_load_page(self, node_id: int) -> None:
+        """Load the record for node ID along with a page of its siblings.
+
+        This is the loader for the lazy node data packages.  Siblings are
+        loaded with the requested node since they're usually displayed
+        together when a subtree is expanded.
+
+        :param node_id: the ID of the node whose record was requested.
+        :return: None
+        :rtype: None
+        """
+        _node_ids = [node_id]
+        for _node in self.tree.siblings(node_id):
+            if len(_node_ids) >= self.page_size:
+                break
+            if self._tag not in _node.data:
+                _node_ids.append(_node.identifier)
+
+        self._do_load_records(_node_ids)
+
+    def _do_load_records(self, node_ids: List[int]) -> None:
+        """Select the records for a list of nodes and add them to the tree.
+
+        :param node_ids: the list of node IDs to load the records for.
+        :return: None
+        :rtype: None
+        """
+        for _record in self.dao.do_select_all(
+            self._record,
+            key=[self.pkey],
+            value=[node_ids],
+            order=self._db_id_colname,
+        ):
+            _node = self.tree.get_node(getattr(_record, self.pkey))
+            if _node is not None and self._tag not in _node.data:
+                dict.__setitem__(_node.data, self._tag, _record)
+
+    def _do_select_all_lazy(self) -> None:
+        """Build the records tree from the record IDs and parent IDs only.
+
+        The records themselves are loaded the first time they're requested
+        from a node's data package.
+
+        :return: None
+        :rtype: None
+        """
+        _columns = [self.pkey]
+        if hasattr(self._record, "parent_id"):
+            _columns.append("parent_id")
+
+        for _row in self.dao.do_select_all(
+            self._record,
+            key=[
+                self._lst_id_columns[0],
+            ],
+            value=[
+                self._revision_id,
+            ],
+            order=self._db_id_colname,
+            columns=_columns,
+        ):
+            _node_id = getattr(_row, self.pkey)
+            self.tree.create_node(
+                tag=self._tag,
+                identifier=_node_id,
+                parent=getattr(_row, "parent_id", self._root),
+                data=RAMSTKLazyData(self._tag, self._do_load_page, _node_id),
+            )
 
 
 class RAMSTKBaseView:
-    """Meta-class for all RAMSTK View models."""
+    """Meta-class for all RAMSTK View models.
+
+    View models that join child modules to their parents set _dic_parents to
+    a dict of {child module: (parent module, parent ID attribute)}.  The child
+    records are then indexed by parent ID each time the view is built so each
+    load function only visits its own children.  A single inserted or deleted
+    record is added to or removed from the view tree without rebuilding it.
+    """
 
     # Define private dictionary class attributes.
+    _dic_parents: Dict[str, Tuple[str, str]] = {}
 
     # Define private list class attributes.
 
@@ -537,7 +809,9 @@ class RAMSTKBaseView:
     def __init__(self, **kwargs: Dict[str, Any]) -> None:
         """Initialize a RAMSTK view model instance."""
         # Initialize private dictionary attributes.
+        self._dic_children: Dict[str, Dict[Any, List[Any]]] = {}
         self._dic_load_functions: Dict[str, Callable[..., object]] = {}
+        self._dic_node_ids: Dict[str, Dict[Any, Any]] = {}
         self._dic_trees: Dict[str, treelib.Tree] = {}
 
         # Initialize private list attributes.
@@ -552,7 +826,7 @@ class RAMSTKBaseView:
 
         # Initialize public scalar attributes.
         self.dao: BaseDatabase = BaseDatabase()
-        self.tree: treelib.Tree = treelib.Tree()
+        self.tree: RAMSTKTree = RAMSTKTree()
 
         # Add the root to the Tree().  This is necessary to allow multiple
         # entries at the top level as there can only be one root in a treelib
@@ -572,22 +846,80 @@ class RAMSTKBaseView:
         self._dic_trees[tree.get_node(0).tag] = tree
         self.on_select_all()
 
-    # pylint: disable=unused-argument
-    # noinspection PyUnusedLocal
+    def on_delete(self, tree: treelib.Tree) -> None:
+        """Remove deleted records of a constituent module from the view tree.
+
+        Only the nodes of the deleted records, and their children, are
+        removed.  The view tree is rebuilt instead if the module isn't joined
+        by parent ID or the view tree hasn't been built yet.
+
+        :param tree: the treelib Tree() passed by the calling message.
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+        self._dic_trees[_module] = tree
+
+        if (
+            not self._do_is_incremental(_module)
+            or self._dic_trees[self._lst_modules[0]].depth() == 0
+        ):
+            self.on_select_all()
+            return
+
+        for _record_id, _node_id in list(self._dic_node_ids[_module].items()):
+            if not tree.contains(_record_id):
+                if self.tree.contains(_node_id):
+                    self.tree.remove_node(_node_id)
+                self._dic_node_ids[_module].pop(_record_id)
+
+        if _module in self._dic_parents:
+            self._do_build_index(_module)
+
+        pub.sendMessage(
+            "succeed_retrieve_{}".format(self._tag),
+            tree=self.tree,
+        )
+
     def on_insert(self, tree: treelib.Tree, node_id: int) -> None:
-        """Wrap _do_set_<module>_tree() on insert.
+        """Add an inserted record of a constituent module to the view tree.
 
-        succeed_insert_<module> messages have node_id in the broadcast data
-        so this method is needed to wrap the _do_set_tree() method.
+        The new record is added to the parent ID index and loaded below its
+        parent node.  The view tree is rebuilt instead if the module isn't
+        joined by parent ID or the view tree hasn't been built yet.
 
         :param tree: the treelib Tree() passed by the calling message.
         :param node_id: the node ID of the element that was inserted.
-            Unused in this method but required for compatibility with the
-            'succeed_insert_<module>' message data.
         :return: None
         :rtype: None
         """
-        return self.do_set_tree(tree)
+        _module = tree.get_node(0).tag
+
+        if not self._do_is_incremental(_module):
+            self.do_set_tree(tree)
+            return
+
+        self._dic_trees[_module] = tree
+
+        if _module in self._dic_parents:
+            _record = tree.get_node(node_id).data[_module]
+            _parent_module, _parent_key = self._dic_parents[_module]
+            _parent_id = getattr(_record, _parent_key)
+            self._dic_children[_module].setdefault(_parent_id, []).append(_record)
+
+            _parent_node_id = self._dic_node_ids[_parent_module].get(_parent_id)
+            if _parent_node_id is not None and self.tree.contains(_parent_node_id):
+                self._dic_load_functions[_module](  # type: ignore
+                    _parent_id,
+                    _parent_node_id,
+                )
+        else:
+            self._dic_load_functions[_module]()  # type: ignore
+
+        pub.sendMessage(
+            "succeed_retrieve_{}".format(self._tag),
+            tree=self.tree,
+        )
 
     def on_select_all(self) -> None:
         """Build the usage profile treelib Tree().
@@ -601,6 +933,10 @@ class RAMSTKBaseView:
         for _node in self.tree.children(self.tree.root):
             self.tree.remove_node(_node.identifier)
 
+        self._dic_node_ids = {_module: {} for _module in self._lst_modules}
+        for _module in self._dic_parents:
+            self._do_build_index(_module)
+
         if self._dic_trees[self._lst_modules[0]].depth() > 0:
             self._dic_load_functions[self._lst_modules[0]]()  # type: ignore
 
@@ -608,3 +944,65 @@ class RAMSTKBaseView:
                 "succeed_retrieve_{}".format(self._tag),
                 tree=self.tree,
             )
+
+    def _do_add_node(
+        self, module: str, record: Any, record_id: Any, node_id: Any, parent_id: Any
+    ) -> bool:
+        """Add a record to the view tree unless it is already loaded.
+
+        :param module: the name of the module the record belongs to.
+        :param record: the record to add.
+        :param record_id: the ID of the record in its module tree.
+        :param node_id: the ID of the new node in the view tree.
+        :param parent_id: the ID of the parent node in the view tree.
+        :return: True if the node was added, False if it was already loaded.
+        :rtype: bool
+        """
+        if self.tree.contains(node_id):
+            return False
+
+        self.tree.create_node(
+            tag=module,
+            identifier=node_id,
+            parent=parent_id,
+            data={self._tag: record},
+        )
+        self._dic_node_ids[module][record_id] = node_id
+
+        return True
+
+    def _do_build_index(self, module: str) -> None:
+        """Index the records of a child module by their parent ID.
+
+        :param module: the name of the child module to index.
+        :return: None
+        :rtype: None
+        """
+        _parent_key = self._dic_parents[module][1]
+
+        self._dic_children[module] = {}
+        for _node in self._dic_trees[module].all_nodes()[1:]:
+            _record = _node.data[module]
+            self._dic_children[module].setdefault(
+                getattr(_record, _parent_key), []
+            ).append(_record)
+
+    def _do_get_children(self, module: str, parent_id: Any) -> List[Any]:
+        """Return the records of a child module belonging to a parent record.
+
+        :param module: the name of the child module.
+        :param parent_id: the ID of the parent record.
+        :return: the child records in the order they appear in their module.
+        :rtype: list
+        """
+        return self._dic_children.get(module, {}).get(parent_id, [])
+
+    def _do_is_incremental(self, module: str) -> bool:
+        """Return whether a module's changes can be applied to the view tree.
+
+        :param module: the name of the module that changed.
+        :return: True if the view tree is built and joins the module by
+            parent ID.
+        :rtype: bool
+        """
+        return bool(self._dic_parents) and module in self._dic_node_ids
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 # Third Party Imports
 import treelib
@@ -7,10 +7,20 @@ import treelib
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase as BaseDatabase
 from ramstk.exceptions import DataAccessError as DataAccessError
+from ramstk.models.treeindex import RAMSTKTree as RAMSTKTree
 from ramstk.utilities import none_to_default as none_to_default
 
 def do_clear_tree(tree: treelib.Tree) -> treelib.Tree: ...
 
+class RAMSTKLazyData(dict):
+    _loader: Callable[[int], None]
+    _node_id: int
+    _tag: str
+    def __init__(
+        self, tag: str, loader: Callable[[int], None], node_id: int
+    ) -> None: ...
+    def __missing__(self, key: str) -> Any: ...
+
 class RAMSTKBaseRecord:
     def set_attributes(self, attributes: Any) -> None: ...
 
@@ -23,33 +33,47 @@ class RAMSTKBaseTable:
     _fkey: Any = ...
     _pkey: Any = ...
     _lst_id_columns: Any = ...
+    _batch_depth: int = ...
     _parent_id: int = ...
     _record: Any
     _revision_id: int = ...
     dao: Any = ...
     last_id: int = ...
+    lazy: bool = ...
+    page_size: int = ...
     pkey: str = ...
     tree: Any = ...
     do_get_new_record: Any
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
+    def do_batch_changes(self) -> Iterator[None]: ...
     def do_connect(self, dao: BaseDatabase) -> None: ...
     def do_create_all_codes(self, prefix: str) -> None: ...
     def do_delete(self, node_id: int) -> None: ...
     def do_get_attributes(self, node_id: int, table: str = ...) -> None: ...
+    def do_get_changes(self) -> List[Dict[str, Any]]: ...
     def do_get_tree(self) -> None: ...
     def do_insert(self, attributes: Dict[str, Any]) -> None: ...
+    def do_load_subtree(self, node_id: int) -> None: ...
     def do_select(self, node_id: Any) -> Any: ...
     def do_select_all(self, attributes: Dict[str, Any]) -> None: ...
     def do_set_attributes(self, node_id: List, package: Dict[str, Any]) -> None: ...
     def do_set_attributes_all(self, attributes: Dict[str, Any]) -> None: ...
+    def do_set_saved(self, changes: List[Dict[str, Any]]) -> None: ...
     def do_set_tree(self, tree: treelib.Tree) -> None: ...
     def do_update(self, node_id: int, table: str = ...) -> None: ...
     def do_update_all(self) -> None: ...
+    def do_write_changes(self, changes: List[Dict[str, Any]]) -> None: ...
+    def _do_load_page(self, node_id: int) -> None: ...
+    def _do_load_records(self, node_ids: List[int]) -> None: ...
+    def _do_select_all_lazy(self) -> None: ...
 
 class RAMSTKBaseView:
+    _dic_parents: Dict[str, Tuple[str, str]] = ...
     _root: int = ...
     _tag: str = ...
+    _dic_children: Dict[str, Dict[Any, List[Any]]] = ...
     _dic_load_functions: Any = ...
+    _dic_node_ids: Dict[str, Dict[Any, Any]] = ...
     _dic_trees: Any = ...
     _lst_modules: Any = ...
     _revision_id: int = ...
@@ -57,5 +81,12 @@ class RAMSTKBaseView:
     tree: Any = ...
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
     def do_set_tree(self, tree: treelib.Tree) -> None: ...
+    def on_delete(self, tree: treelib.Tree) -> None: ...
     def on_insert(self, tree: treelib.Tree, node_id: int) -> None: ...
     def on_select_all(self) -> None: ...
+    def _do_add_node(
+        self, module: str, record: Any, record_id: Any, node_id: Any, parent_id: Any
+    ) -> bool: ...
+    def _do_build_index(self, module: str) -> None: ...
+    def _do_get_children(self, module: str, parent_id: Any) -> List[Any]: ...
+    def _do_is_incremental(self, module: str) -> bool: ...
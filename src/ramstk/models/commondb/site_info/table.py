@@ -9,6 +9,9 @@
 # Standard Library Imports
 from typing import Type
 
+# Third Party Imports
+from pubsub import pub
+
 # RAMSTK Package Imports
 from ramstk.models import RAMSTKBaseTable, RAMSTKSiteInfoRecord
 
@@ -53,4 +56,6 @@ class RAMSTKSiteInfoTable(RAMSTKBaseTable):
         # Initialize public scalar attributes.
         self.pkey = "site_id"
 
-        # Subscribe to PyPubSub messages.
+        # Subscribe to PyPubSub messages.  The site information stays in the
+        # site database when a program database is opened.
+        pub.unsubscribe(self.do_connect, "succeed_connect_program_database")
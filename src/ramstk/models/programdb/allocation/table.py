@@ -78,6 +78,9 @@ class RAMSTKAllocationTable(RAMSTKBaseTable):
         pub.subscribe(
             self.do_calculate_allocation_goals, "request_calculate_allocation_goals"
         )
+        pub.subscribe(
+            self.do_calculate_all_allocations, "request_calculate_all_allocations"
+        )
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]
@@ -98,6 +101,46 @@ class RAMSTKAllocationTable(RAMSTKBaseTable):
 
         return _new_record
 
+    def do_calculate_all_allocations(self, hazard_rates: Dict[int, float]) -> None:
+        """Calculate the goals and allocations for every record at once.
+
+        Records are visited from the top of the tree down so each allocation
+        uses its parent's newly allocated goal.  Records without children have
+        nothing to allocate.  A record using the ARINC method that can't be
+        allocated because its hazard rate is zero is skipped and reported.
+
+        :param hazard_rates: the hazard rate of each hardware item keyed by
+            record ID.  Records without a hazard rate use 0.0.
+        :return: None
+        :rtype: None
+        """
+        for _node_id in list(self.tree.expand_tree(self._root))[1:]:
+            if not self.tree.children(_node_id):
+                continue
+
+            self.do_calculate_allocation_goals(_node_id)
+
+            _record = self.tree.get_node(_node_id).data[self._tag]
+            if _record.allocation_method_id == 1:
+                self.do_calculate_equal_allocation(_node_id)
+            elif _record.allocation_method_id == 2:
+                self.do_calculate_agree_allocation(_node_id, _record.duty_cycle)
+            elif _record.allocation_method_id == 3:
+                self._system_hazard_rate = hazard_rates.get(_node_id, 0.0)
+                try:
+                    self.do_calculate_arinc_allocation(_node_id)
+                except ZeroDivisionError:
+                    pub.sendMessage(
+                        "fail_calculate_allocation",
+                        error_message=(
+                            "Failed to allocate reliability for hardware ID {0} "
+                            "using the ARINC method because its hazard rate is "
+                            "zero."
+                        ).format(_node_id),
+                    )
+            elif _record.allocation_method_id == 4:
+                self.do_calculate_foo_allocation(_node_id)
+
     def do_calculate_allocation_goals(self, node_id: int) -> None:
         """Calculate the allocation goals.
 
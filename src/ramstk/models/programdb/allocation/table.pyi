@@ -17,6 +17,7 @@ class RAMSTKAllocationTable(RAMSTKBaseTable):
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
     _parent_id: Any
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
+    def do_calculate_all_allocations(self, hazard_rates: Dict[int, float]) -> None: ...
     def do_calculate_allocation_goals(self, node_id: int) -> None: ...
     def do_calculate_agree_allocation(
         self, node_id: int, duty_cycle: float
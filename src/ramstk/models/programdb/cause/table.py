@@ -78,7 +78,9 @@ class RAMSTKCauseTable(RAMSTKBaseTable):
         _new_record.hardware_id = attributes["hardware_id"]
         _new_record.mode_id = attributes["mode_id"]
         _new_record.mechanism_id = attributes["mechanism_id"]
-        _new_record.cause_id = self.last_id + 1
+        _new_record.cause_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
         _new_record.parent_id = attributes["mechanism_id"]
 
         return _new_record
@@ -7,7 +7,9 @@
 """The RAMSTK program Database model."""
 
 # Standard Library Imports
-from typing import Dict
+import threading
+from functools import partial
+from typing import Any, Dict, List
 
 # Third Party Imports
 from pubsub import pub
@@ -23,6 +25,7 @@ from sqlalchemy.exc import (  # type: ignore
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.db import BaseDatabase, do_create_program_db
 from ramstk.exceptions import DataAccessError
+from ramstk.tasks import RAMSTKTask, RAMSTKTaskQueue
 
 
 class RAMSTKProgramDB:
@@ -41,6 +44,10 @@ class RAMSTKProgramDB:
     :ivar program_dao: the BaseDatabase() object that will connect to the
         RAMSTK program database.
     :type program_dao: :class:`ramstk.db.base.BaseDatabase`
+    :ivar tasks: the RAMSTKTaskQueue() that runs long operations on worker
+        threads.  Set its dispatch attribute to GLib.idle_add() when running
+        the GUI so task callbacks run on the GTK main loop.
+    :type tasks: :class:`ramstk.tasks.RAMSTKTaskQueue`
     """
 
     def __init__(self) -> None:
@@ -50,6 +57,9 @@ class RAMSTKProgramDB:
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
+        self._n_save_done: int = 0
+        self._n_save_tasks: int = 0
+        self._save_lock: threading.Lock = threading.Lock()
 
         # Initialize public dictionary attributes.
         self.dic_tables: Dict[str, object] = {
@@ -97,6 +107,7 @@ class RAMSTKProgramDB:
         # Initialize public scalar attributes.
         self.user_configuration: RAMSTKUserConfiguration = RAMSTKUserConfiguration()
         self.program_dao: BaseDatabase = BaseDatabase()
+        self.tasks: RAMSTKTaskQueue = RAMSTKTaskQueue()
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_create_program, "request_create_program")
@@ -104,6 +115,10 @@ class RAMSTKProgramDB:
         pub.subscribe(self.do_open_program, "succeed_create_program_database")
         pub.subscribe(self.do_close_program, "request_close_program")
         pub.subscribe(self.do_save_program, "request_update_program")
+        pub.subscribe(
+            self.do_save_program_in_background, "request_save_project_in_background"
+        )
+        pub.subscribe(self.do_cancel_tasks, "request_cancel_tasks")
 
     def do_create_program(
         self, program_db: BaseDatabase, database: Dict[str, str]
@@ -169,6 +184,21 @@ class RAMSTKProgramDB:
         except DataAccessError as _error:
             pub.sendMessage("fail_connect_program_database", error_message=_error.msg)
 
+    def do_cancel_tasks(self, wait: bool = False) -> None:
+        """Cancel the running and pending background tasks.
+
+        A running task stops only when it checks whether it was cancelled, so
+        a table that's being written is still written.
+
+        :param wait: whether or not to wait for the running tasks to finish.
+        :return: None
+        :rtype: None
+        """
+        self.tasks.do_cancel_all()
+
+        if wait:
+            self.tasks.do_wait()
+
     def do_close_program(self) -> None:
         """Close the open RAMSTK Program database.
 
@@ -198,3 +228,98 @@ class RAMSTKProgramDB:
         pub.sendMessage("request_update_all_stakeholders")
         pub.sendMessage("request_update_all_hardware")
         pub.sendMessage("request_update_all_validation")
+
+    def do_save_program_in_background(self) -> None:
+        """Save the open RAMSTK Program database without blocking the caller.
+
+        The changed records of each table are copied on the calling thread
+        and written by a background task keyed by the table name, so saves of
+        the same table are serialized.  The progress is sent with the
+        request_set_progress message as each table is written and the
+        succeed_save_project message is sent when every table is written.
+
+        :return: None
+        :rtype: None
+        """
+        _saves = []
+        for _name, _table in self.dic_tables.items():
+            try:
+                _changes = _table.do_get_changes()  # type: ignore
+            except AttributeError:
+                continue
+
+            if _changes:
+                _saves.append((_name, _table, _changes))
+
+        if not _saves:
+            pub.sendMessage("succeed_save_project")
+            return
+
+        # Count every task before submitting any so a task that finishes
+        # before the others are submitted doesn't report the save finished.
+        with self._save_lock:
+            self._n_save_tasks += len(_saves)
+
+        for _name, _table, _changes in _saves:
+            self.tasks.do_submit(
+                "Saving {0}".format(_name),
+                partial(self._do_write_changes, _table, _changes),
+                key=_name,
+                on_done=partial(self._on_save_table, _table, _changes),
+            )
+
+    @staticmethod
+    def _do_write_changes(
+        table: Any, changes: List[Dict[str, Any]], task: RAMSTKTask
+    ) -> None:
+        """Write the changed records of a table on a worker thread.
+
+        The worker thread's database session is closed when the records are
+        written so it doesn't hold a connection while it's idle.
+
+        :param table: the table the changed records belong to.
+        :param changes: the column values of each changed record.
+        :param task: the RAMSTKTask() writing the records.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if the records can't be written.
+        """
+        if task.cancelled:
+            return
+
+        try:
+            table.do_write_changes(changes)
+        finally:
+            table.dao.do_close_session()
+
+    def _on_save_table(
+        self, table: Any, changes: List[Dict[str, Any]], task: RAMSTKTask
+    ) -> None:
+        """Respond to a table being written by a background task.
+
+        :param table: the table the changed records belong to.
+        :param changes: the column values of each changed record.
+        :param task: the RAMSTKTask() that wrote the records.
+        :return: None
+        :rtype: None
+        """
+        if task.status == "done":
+            table.do_set_saved(changes)
+        elif task.status == "failed":
+            pub.sendMessage(
+                "fail_save_project",
+                error_message="{0} failed: {1}".format(task.name, task.error),
+            )
+
+        with self._save_lock:
+            self._n_save_done += 1
+            _progress = self._n_save_done / self._n_save_tasks
+            _finished = self._n_save_done == self._n_save_tasks
+            if _finished:
+                self._n_save_done = 0
+                self._n_save_tasks = 0
+
+        pub.sendMessage("request_set_progress", progress=_progress)
+
+        if _finished:
+            pub.sendMessage("succeed_save_project")
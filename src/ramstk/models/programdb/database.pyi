@@ -1,14 +1,21 @@
 # Standard Library Imports
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List
 
 # RAMSTK Package Imports
 from ramstk.db import BaseDatabase
+from ramstk.tasks import RAMSTKTask as RAMSTKTask
+from ramstk.tasks import RAMSTKTaskQueue as RAMSTKTaskQueue
 
 class RAMSTKProgramDB:
     dic_tables: Any
     dic_views: Any
     user_configuration: Any
     program_dao: Any
+    tasks: RAMSTKTaskQueue
+    _n_save_done: int
+    _n_save_tasks: int
+    _save_lock: threading.Lock
     def __init__(self) -> None: ...
     def do_create_program(
         self, program_db: BaseDatabase, database: Dict[str, str]
@@ -16,6 +23,15 @@ class RAMSTKProgramDB:
     def do_open_program(
         self, program_db: BaseDatabase, database: Dict[str, str]
     ) -> None: ...
+    def do_cancel_tasks(self, wait: bool = ...) -> None: ...
     def do_close_program(self) -> None: ...
     @staticmethod
     def do_save_program() -> None: ...
+    def do_save_program_in_background(self) -> None: ...
+    @staticmethod
+    def _do_write_changes(
+        table: Any, changes: List[Dict[str, Any]], task: RAMSTKTask
+    ) -> None: ...
+    def _on_save_table(
+        self, table: Any, changes: List[Dict[str, Any]], task: RAMSTKTask
+    ) -> None: ...
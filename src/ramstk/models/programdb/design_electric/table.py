@@ -11,6 +11,8 @@
 from typing import Any, Dict, List, Tuple, Type
 
 # Third Party Imports
+import numpy as np
+import pandas as pd
 from pubsub import pub
 
 # RAMSTK Package Imports
@@ -108,6 +110,7 @@ class RAMSTKDesignElectricTable(RAMSTKBaseTable):
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_derating_analysis, "request_derating_analysis")
         pub.subscribe(self.do_stress_analysis, "request_stress_analysis")
+        pub.subscribe(self.do_screen_all_stresses, "request_screen_all_stresses")
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]
@@ -294,6 +297,101 @@ class RAMSTKDesignElectricTable(RAMSTKBaseTable):
             package={"reason": _reason},
         )
 
+    def do_screen_all_stresses(
+        self, attributes: Dict[int, Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Perform the stress and derating analyses for every part at once.
+
+        This is the batch form of do_stress_analysis() and
+        do_derating_analysis().  The current, power, and voltage ratios
+        applicable to each part's category are calculated as array operations,
+        every ratio is checked against the category's stress limits in a
+        single pass, and the overstress flag and reason are written back to the
+        records.  Ratios with a rated value of zero are left unchanged.
+
+        :param attributes: the dict of hardware attributes keyed by record ID.
+            Each must contain the category_id.
+        :return: _violations; the table of violations with one row per
+            hardware ID, stress type, environment, and limit that was
+            exceeded.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        _node_ids: List[int] = [
+            _node.identifier
+            for _node in self.tree.all_nodes()[1:]
+            if _node.identifier in attributes
+        ]
+        _records = [
+            self.tree.get_node(_node_id).data[self._tag] for _node_id in _node_ids
+        ]
+        _category_id = np.array(
+            [attributes[_node_id]["category_id"] for _node_id in _node_ids],
+            dtype=int,
+        )
+
+        def _get_field(name: str) -> np.ndarray:
+            """Return the values of one design electric field as an array."""
+            return np.array(
+                [getattr(_record, name) for _record in _records], dtype=float
+            )
+
+        _ratios = derating.do_calculate_stress_ratios(
+            _category_id,
+            np.column_stack(
+                [
+                    _get_field("current_operating"),
+                    _get_field("power_operating"),
+                    _get_field("voltage_ac_operating")
+                    + _get_field("voltage_dc_operating"),
+                ]
+            ),
+            np.column_stack(
+                [
+                    _get_field("current_rated"),
+                    _get_field("power_rated"),
+                    _get_field("voltage_rated"),
+                ]
+            ),
+            np.column_stack(
+                [
+                    _get_field("current_ratio"),
+                    _get_field("power_ratio"),
+                    _get_field("voltage_ratio"),
+                ]
+            ),
+        )
+        _overstress = derating.do_screen_overstress(
+            _category_id,
+            _ratios,
+            derating.get_stress_limits(self._dic_stress_limits),
+        )
+
+        for _record, _record_ratios, _record_overstress, _reason in zip(
+            _records,
+            _ratios.tolist(),
+            _overstress.any(axis=(1, 2, 3)).tolist(),
+            derating.get_overstress_reasons(_overstress),
+        ):
+            (
+                _record.current_ratio,
+                _record.power_ratio,
+                _record.voltage_ratio,
+            ) = _record_ratios
+            _record.overstress = _record_overstress
+            _record.reason = _reason
+
+        _violations = pd.DataFrame(
+            derating.get_overstress_violations(_node_ids, _ratios, _overstress)
+        ).rename(columns={"component_id": "hardware_id"})
+
+        pub.sendMessage(
+            "succeed_screen_all_stresses",
+            tree=self.tree,
+            violations=_violations,
+        )
+
+        return _violations
+
     def do_stress_analysis(self, node_id: int, category_id: int) -> None:
         """Perform a stress analysis.
 
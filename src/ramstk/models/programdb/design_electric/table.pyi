@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Any, Dict, List, Tuple
 
+# Third Party Imports
+import pandas as pd
+
 # RAMSTK Package Imports
 from ramstk.analyses import derating as derating
 from ramstk.analyses import stress as stress
@@ -26,4 +29,7 @@ class RAMSTKDesignElectricTable(RAMSTKBaseTable):
     def do_calculate_power_ratio(self, node_id: int) -> None: ...
     def do_calculate_voltage_ratio(self, node_id: int) -> None: ...
     def do_derating_analysis(self, node_id: int, category_id: int) -> None: ...
+    def do_screen_all_stresses(
+        self, attributes: Dict[int, Dict[str, Any]]
+    ) -> pd.DataFrame: ...
     def do_stress_analysis(self, node_id: int, category_id: int) -> None: ...
@@ -71,6 +71,8 @@ class RAMSTKEnvironmentTable(RAMSTKBaseTable):
         _new_record.revision_id = attributes["revision_id"]
         _new_record.mission_id = attributes["mission_id"]
         _new_record.phase_id = attributes["phase_id"]
-        _new_record.environment_id = self.last_id + 1
+        _new_record.environment_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
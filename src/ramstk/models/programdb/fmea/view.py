@@ -25,6 +25,12 @@ class RAMSTKFMEAView(RAMSTKBaseView):
     """
 
     # Define private dictionary class attributes.
+    _dic_parents = {
+        "mechanism": ("mode", "mode_id"),
+        "cause": ("mechanism", "mechanism_id"),
+        "control": ("cause", "cause_id"),
+        "action": ("cause", "cause_id"),
+    }
 
     # Define private list class attributes.
 
@@ -86,11 +92,11 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         pub.subscribe(super().do_set_tree, "succeed_retrieve_causes")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_controls")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_actions")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mode")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_delete_cause")
-        pub.subscribe(super().do_set_tree, "succeed_delete_control")
-        pub.subscribe(super().do_set_tree, "succeed_delete_action")
+        pub.subscribe(super().on_delete, "succeed_delete_mode")
+        pub.subscribe(super().on_delete, "succeed_delete_mechanism")
+        pub.subscribe(super().on_delete, "succeed_delete_cause")
+        pub.subscribe(super().on_delete, "succeed_delete_control")
+        pub.subscribe(super().on_delete, "succeed_delete_action")
 
     def _do_load_modes(self) -> None:
         """Load the failure modes into the tree.
@@ -102,43 +108,31 @@ class RAMSTKFMEAView(RAMSTKBaseView):
             _mode = _node.data["mode"]
             _node_id = "{}".format(_mode.mode_id)
 
-            self.tree.create_node(
-                tag="mode",
-                identifier=_node_id,
-                parent=self._root,
-                data={self._tag: _mode},
-            )
-
-            if self._dic_trees["mechanism"].depth() > 0:
+            if self._do_add_node("mode", _mode, _mode.mode_id, _node_id, self._root):
                 self._dic_load_functions["mechanism"](  # type: ignore
                     _mode.mode_id,
+                    _node_id,
                 )
 
-    def _do_load_mechanisms(self, mode_id: int) -> None:
+    def _do_load_mechanisms(self, mode_id: int, parent_id: str) -> None:
         """Load the failure mechanisms into the tree.
 
         :param mode_id: the ID of the parent failure mode.
+        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["mechanism"].all_nodes()[1:]:
-            _mechanism = _node.data["mechanism"]
-            _node_id = "{}.{}".format(mode_id, _mechanism.mechanism_id)
-
-            if _mechanism.mode_id == mode_id:
-                self.tree.create_node(
-                    tag="mechanism",
-                    identifier=_node_id,
-                    parent="{}".format(mode_id),
-                    data={self._tag: _mechanism},
+        for _mechanism in self._do_get_children("mechanism", mode_id):
+            _node_id = "{}.{}".format(parent_id, _mechanism.mechanism_id)
+
+            if self._do_add_node(
+                "mechanism", _mechanism, _mechanism.mechanism_id, _node_id, parent_id
+            ):
+                self._dic_load_functions["cause"](  # type: ignore
+                    _mechanism.mechanism_id,
+                    _node_id,
                 )
 
-                if self._dic_trees["cause"].depth() > 0:
-                    self._dic_load_functions["cause"](  # type: ignore
-                        _mechanism.mechanism_id,
-                        _node_id,
-                    )
-
     def _do_load_causes(self, mechanism_id: int, parent_id: str) -> None:
         """Load the failure causes into the tree for the passed mechanism ID.
 
@@ -147,29 +141,18 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["cause"].all_nodes()[1:]:
-            _cause = _node.data["cause"]
+        for _cause in self._do_get_children("cause", mechanism_id):
             _node_id = "{}.{}".format(parent_id, _cause.cause_id)
 
-            if _cause.mechanism_id == mechanism_id:
-                self.tree.create_node(
-                    tag="cause",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={self._tag: _cause},
+            if self._do_add_node("cause", _cause, _cause.cause_id, _node_id, parent_id):
+                self._dic_load_functions["control"](  # type: ignore
+                    _cause.cause_id,
+                    _node_id,
+                )
+                self._dic_load_functions["action"](  # type: ignore
+                    _cause.cause_id,
+                    _node_id,
                 )
-
-                if self._dic_trees["control"].depth() > 0:
-                    self._dic_load_functions["control"](  # type: ignore
-                        _cause.cause_id,
-                        _node_id,
-                    )
-
-                if self._dic_trees["action"].depth() > 0:
-                    self._dic_load_functions["action"](  # type: ignore
-                        _cause.cause_id,
-                        _node_id,
-                    )
 
     def _do_load_controls(self, cause_id: int, parent_id: str) -> None:
         """Load the FNEA controls into the tree.
@@ -179,17 +162,12 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["control"].all_nodes()[1:]:
-            _control = _node.data["control"]
+        for _control in self._do_get_children("control", cause_id):
             _node_id = "{}.{}c".format(parent_id, _control.control_id)
 
-            if _control.cause_id == cause_id:
-                self.tree.create_node(
-                    tag="control",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={self._tag: _control},
-                )
+            self._do_add_node(
+                "control", _control, _control.control_id, _node_id, parent_id
+            )
 
     def _do_load_actions(self, cause_id: int, parent_id: str) -> None:
         """Load the FMEA actions into the tree.
@@ -199,14 +177,7 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["action"].all_nodes()[1:]:
-            _action = _node.data["action"]
+        for _action in self._do_get_children("action", cause_id):
             _node_id = "{}.{}a".format(parent_id, _action.action_id)
 
-            if _action.cause_id == cause_id:
-                self.tree.create_node(
-                    tag="action",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={self._tag: _action},
-                )
+            self._do_add_node("action", _action, _action.action_id, _node_id, parent_id)
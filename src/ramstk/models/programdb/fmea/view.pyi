@@ -12,7 +12,7 @@ class RAMSTKFMEAView(RAMSTKBaseView):
     _lst_modules: Any = ...
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
     def _do_load_modes(self) -> None: ...
-    def _do_load_mechanisms(self, mode_id: int) -> None: ...
+    def _do_load_mechanisms(self, mode_id: int, parent_id: str) -> None: ...
     def _do_load_causes(self, mechanism_id: int, parent_id: str) -> None: ...
     def _do_load_controls(self, cause_id: int, parent_id: str) -> None: ...
     def _do_load_actions(self, cause_id: int, parent_id: str) -> None: ...
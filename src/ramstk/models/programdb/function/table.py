@@ -69,7 +69,9 @@ class RAMSTKFunctionTable(RAMSTKBaseTable):
 
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
-        _new_record.function_id = self.last_id + 1
+        _new_record.function_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
         _new_record.parent_id = attributes["parent_id"]
 
         return _new_record
@@ -7,15 +7,17 @@
 """Hardware Package View Model."""
 
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third Party Imports
+import numpy as np
+import treelib
 from pubsub import pub
 from sqlalchemy.orm.exc import ObjectDeletedError
 from treelib import Tree
 
 # RAMSTK Package Imports
-from ramstk.analyses.milhdbk217f import milhdbk217f
+from ramstk.analyses.milhdbk217f import batch, milhdbk217f, montecarlo
 from ramstk.models import RAMSTKBaseView
 
 
@@ -82,31 +84,85 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(super().on_insert, "succeed_insert_hardware")
-        pub.subscribe(super().on_insert, "succeed_insert_design_electric")
-        pub.subscribe(super().on_insert, "succeed_insert_design_mechanic")
-        pub.subscribe(super().on_insert, "succeed_insert_milhdbk217f")
-        pub.subscribe(super().on_insert, "succeed_insert_nswc")
-        pub.subscribe(super().on_insert, "succeed_insert_reliability")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_hardwares")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_design_electrics")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_design_mechanics")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_milhdbk217fs")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_nswcs")
-        pub.subscribe(super().do_set_tree, "succeed_retrieve_reliabilitys")
-        pub.subscribe(super().do_set_tree, "succeed_delete_hardware")
-        pub.subscribe(super().do_set_tree, "succeed_delete_design_electric")
-        pub.subscribe(super().do_set_tree, "succeed_delete_design_mechanic")
-        pub.subscribe(super().do_set_tree, "succeed_delete_milhdbk217f")
-        pub.subscribe(super().do_set_tree, "succeed_delete_nswc")
-        pub.subscribe(super().do_set_tree, "succeed_delete_reliability")
+        pub.subscribe(self.on_insert, "succeed_insert_hardware")
+        pub.subscribe(self.on_insert, "succeed_insert_design_electric")
+        pub.subscribe(self.on_insert, "succeed_insert_design_mechanic")
+        pub.subscribe(self.on_insert, "succeed_insert_milhdbk217f")
+        pub.subscribe(self.on_insert, "succeed_insert_nswc")
+        pub.subscribe(self.on_insert, "succeed_insert_reliability")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_hardwares")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_design_electrics")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_design_mechanics")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_milhdbk217fs")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_nswcs")
+        pub.subscribe(self.do_set_tree, "succeed_retrieve_reliabilitys")
+        pub.subscribe(self.on_delete, "succeed_delete_hardware")
+        pub.subscribe(self.on_delete, "succeed_delete_design_electric")
+        pub.subscribe(self.on_delete, "succeed_delete_design_mechanic")
+        pub.subscribe(self.on_delete, "succeed_delete_milhdbk217f")
+        pub.subscribe(self.on_delete, "succeed_delete_nswc")
+        pub.subscribe(self.on_delete, "succeed_delete_reliability")
         pub.subscribe(self.do_calculate_hardware, "request_calculate_hardware")
+        pub.subscribe(self.do_calculate_all_hardware, "request_calculate_all_hardware")
         pub.subscribe(
             self.do_calculate_power_dissipation, "request_calculate_power_dissipation"
         )
         pub.subscribe(
             self.do_predict_active_hazard_rate, "request_predict_active_hazard_rate"
         )
+        pub.subscribe(
+            self.do_predict_all_active_hazard_rates,
+            "request_predict_all_active_hazard_rates",
+        )
+        pub.subscribe(self.do_propagate_uncertainty, "request_propagate_uncertainty")
+        pub.subscribe(self.do_roll_up, "request_roll_up_hardware")
+
+    def do_calculate_all_hardware(self) -> None:
+        """Calculate the reliability metrics for all the hardware in the BoM.
+
+        The whole BoM is rolled up, the MIL-HDBK-217F hazard rates are
+        predicted as a single batch, every part is screened for overstress as a
+        single batch by the design electric table, and then the reliability
+        metrics for every hardware item are calculated as a single batch by the
+        reliability table.
+        This replaces sending the do_calculate_hardware() cascade once per
+        hardware item.
+
+        :return: None
+        :rtype: None
+        """
+        for _node in self.tree.children(self._root):
+            self.do_roll_up(_node.identifier)
+
+        _hazard_rates = self.do_predict_all_active_hazard_rates()
+
+        _attributes: Dict[int, Dict[str, Any]] = {}
+        for _node in self.tree.all_nodes()[1:]:
+            if not all(_module in _node.data for _module in self._lst_modules):
+                continue
+
+            _hardware = _node.data["hardware"]
+            _design_electric = _node.data["design_electric"]
+            _attributes[_node.identifier] = {
+                "category_id": _hardware.category_id,
+                "subcategory_id": _hardware.subcategory_id,
+                "duty_cycle": _hardware.duty_cycle,
+                "quantity": _hardware.quantity,
+                "mission_time": _hardware.mission_time,
+                "environment_active_id": _design_electric.environment_active_id,
+                "environment_dormant_id": _design_electric.environment_dormant_id,
+                "hazard_rate_predicted": _hazard_rates.get(_node.identifier, 0.0),
+            }
+
+        pub.sendMessage(
+            "request_screen_all_stresses",
+            attributes=_attributes,
+        )
+        pub.sendMessage(
+            "request_calculate_all_reliability",
+            attributes=_attributes,
+            multiplier=self._hr_multiplier,
+        )
 
     def do_calculate_hardware(self, node_id: int) -> None:
         """Calculate all metrics for the hardware associated with node ID.
@@ -117,13 +173,11 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         """
         _record = self.tree.get_node(node_id)
 
-        self.do_calculate_power_dissipation(node_id)
+        self.do_roll_up(node_id)
 
         _hardware = _record.data["hardware"]
         _design_electric = _record.data["design_electric"]
 
-        pub.sendMessage("request_calculate_total_cost", node_id=node_id)
-        pub.sendMessage("request_calculate_total_part_count", node_id=node_id)
         pub.sendMessage(
             "request_stress_analysis",
             node_id=node_id,
@@ -213,17 +267,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         if _node.data["hardware"].part == 1 and _node.data[
             "reliability"
         ].hazard_rate_method_id in [1, 2]:
-            _attributes = {
-                **_node.data["hardware"].get_attributes(),
-                **_node.data["design_mechanic"].get_attributes(),
-                **_node.data["design_electric"].get_attributes(),
-                **_node.data["milhdbk217f"].get_attributes(),
-                **_node.data["nswc"].get_attributes(),
-                **_node.data["reliability"].get_attributes(),
-            }
-
             _hazard_rate_active = milhdbk217f.do_predict_active_hazard_rate(
-                **_attributes
+                **self._do_get_attributes(_node.identifier)
             )
 
             pub.sendMessage(
@@ -234,6 +279,360 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
         return _hazard_rate_active
 
+    def do_predict_all_active_hazard_rates(self) -> Dict[int, float]:
+        """Predict the active hazard rate of every part in the BoM at once.
+
+        All the parts using the MIL-HDBK-217F parts count or parts stress
+        method are calculated as a single batch.  The reliability records are
+        updated in place and a single message is sent when the batch is
+        complete rather than one message per part.
+
+        :return: _hazard_rates; the predicted active hazard rate for each
+            part keyed by hardware ID.  Parts that could not be calculated are
+            not included.
+        :rtype: dict
+        """
+        _node_ids: List[int] = [
+            _node.identifier
+            for _node in self.tree.all_nodes()[1:]
+            if all(_module in _node.data for _module in self._lst_modules)
+            and _node.data["hardware"].part == 1
+            and _node.data["reliability"].hazard_rate_method_id in [1, 2]
+        ]
+
+        _predictions = batch.do_predict_active_hazard_rate(
+            self._do_make_parts_array(_node_ids)
+        )
+
+        _hazard_rates: Dict[int, float] = {}
+        _failed: List[str] = []
+        for _node_id, _hazard_rate_active in zip(_node_ids, _predictions.tolist()):
+            if np.isnan(_hazard_rate_active):
+                _failed.append(str(_node_id))
+                continue
+            self.tree.get_node(_node_id).data[
+                "reliability"
+            ].hazard_rate_active = _hazard_rate_active
+            _hazard_rates[_node_id] = _hazard_rate_active
+
+        if _failed:
+            pub.sendMessage(
+                "fail_predict_reliability",
+                error_message=(
+                    "Failed to predict MIL-HDBK-217F hazard rate for hardware "
+                    "ID(s) {0}; one or more inputs has a negative, zero, or "
+                    "missing value."
+                ).format(", ".join(_failed)),
+            )
+
+        pub.sendMessage(
+            "succeed_predict_all_active_hazard_rates",
+            tree=self.tree,
+        )
+
+        return _hazard_rates
+
+    def do_propagate_uncertainty(
+        self,
+        distributions: Dict[str, Any],
+        n_samples: int,
+        **kwargs: Any,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Estimate the distribution of hazard rate and mission reliability.
+
+        The uncertain part attributes are sampled from the passed distributions
+        and every sample of the BoM is predicted and rolled up with
+        montecarlo.do_propagate_uncertainty().  The hardware records are not
+        changed; the results are sent with a single message.
+
+        :param distributions: the distribution of each uncertain attribute keyed
+            by attribute name.  See montecarlo.do_sample_parts().
+        :param n_samples: the number of samples to draw.
+        :keyword node_ids: the record IDs to report percentiles for.  Defaults
+            to the top-level hardware items.
+        :keyword block_size: passed to montecarlo.do_propagate_uncertainty().
+        :keyword max_workers: passed to montecarlo.do_propagate_uncertainty().
+        :keyword percentiles: passed to montecarlo.do_propagate_uncertainty().
+        :keyword seed: passed to montecarlo.do_propagate_uncertainty().
+        :return: _results; the mean and standard deviation of every hardware
+            item's hazard rate and the hazard rate and reliability percentiles
+            of the reported items keyed by hardware ID.
+        :rtype: dict
+        :raise: KeyError if passed an unknown distribution or attribute.
+        """
+        _node_ids: List[int] = [
+            _node.identifier
+            for _node in self.tree.all_nodes()[1:]
+            if all(_module in _node.data for _module in self._lst_modules)
+        ]
+        _rows = {_node_id: _idx for _idx, _node_id in enumerate(_node_ids)}
+
+        _report = [
+            _node_id
+            for _node_id in kwargs.pop(
+                "node_ids",
+                [_node.identifier for _node in self.tree.children(self._root)],
+            )
+            if _node_id in _rows
+        ]
+
+        _statistics = montecarlo.do_propagate_uncertainty(
+            self._do_make_parts_array(_node_ids),
+            [
+                _rows.get(self.tree.get_node(_node_id).data["hardware"].parent_id, -1)
+                for _node_id in _node_ids
+            ],
+            distributions,
+            n_samples,
+            quantity=[
+                self.tree.get_node(_node_id).data["hardware"].quantity
+                for _node_id in _node_ids
+            ],
+            mission_time=[
+                self.tree.get_node(_node_id).data["hardware"].mission_time
+                for _node_id in _node_ids
+            ],
+            report=[_rows[_node_id] for _node_id in _report],
+            **kwargs,
+        )
+
+        _results: Dict[int, Dict[str, Any]] = {
+            _node_id: {
+                "mean": _statistics["mean"][_idx],
+                "std": _statistics["std"][_idx],
+            }
+            for _node_id, _idx in _rows.items()
+        }
+        for _idx, _node_id in enumerate(_report):
+            _results[_node_id]["hazard_rate"] = dict(
+                zip(_statistics["percentiles"], _statistics["hazard_rate"][_idx])
+            )
+            _results[_node_id]["reliability"] = dict(
+                zip(_statistics["percentiles"], _statistics["reliability"][_idx])
+            )
+
+        pub.sendMessage(
+            "succeed_propagate_uncertainty",
+            results=_results,
+            n_invalid=_statistics["n_invalid"],
+        )
+
+        return _results
+
+    def do_roll_up(self, node_id: int = 1) -> None:
+        """Roll up the cost, part count, and power dissipation of hardware.
+
+        The hardware item and all its children are calculated in a single
+        post-order walk of the tree index.  Only the ancestors of the hardware item
+        are then re-aggregated, so a change to a single part only updates the
+        path from that part to the top of the tree.  Results are written
+        directly to the hardware records and a single message is sent when the
+        roll-up is complete.
+
+        :param node_id: the record ID of the hardware item to roll up.
+        :return: None
+        :rtype: None
+        """
+        for _node_id in self.tree.postorder(node_id):
+            self._do_roll_up_node(_node_id)
+
+        _node_id = self.tree.get_node(node_id).predecessor(self.tree.identifier)
+        while _node_id is not None and _node_id != self._root:
+            self._do_roll_up_node(_node_id)
+            _node_id = self.tree.get_node(_node_id).predecessor(self.tree.identifier)
+
+        pub.sendMessage(
+            "succeed_roll_up_hardware",
+            tree=self.tree,
+        )
+
+    def do_set_tree(self, tree: treelib.Tree) -> None:
+        """Assign the treelib Tree() for the constituent module.
+
+        The BoM tree is only rebuilt when the hardware tree is retrieved, for
+        example when a new revision is selected.  The records of the other
+        modules are re-attached to the existing hardware nodes.
+
+        :param tree: the calling module's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+
+        if _module == "hardware" or not self._do_is_loaded():
+            super().do_set_tree(tree)
+            return
+
+        self._dic_trees[_module] = tree
+        for _node in self.tree.all_nodes()[1:]:
+            _node.data.pop(_module, None)
+        self._dic_load_functions[_module]()  # type: ignore
+
+        pub.sendMessage(
+            "succeed_retrieve_{}".format(self._tag),
+            tree=self.tree,
+        )
+
+    def on_delete(self, tree: treelib.Tree) -> None:
+        """Remove the deleted records of a constituent module from the BoM.
+
+        Deleted hardware items are removed from the BoM tree along with their
+        children.  Deleted records of the other modules are detached from
+        their hardware node.
+
+        :param tree: the treelib Tree() passed by the calling message.
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+        self._dic_trees[_module] = tree
+
+        if not self._do_is_loaded():
+            self.on_select_all()
+            return
+
+        for _node_id in list(self.tree.preorder())[1:]:
+            if not self.tree.contains(_node_id) or tree.contains(_node_id):
+                continue
+
+            if _module == "hardware":
+                self.tree.remove_node(_node_id)
+            else:
+                self.tree.get_node(_node_id).data.pop(_module, None)
+
+        pub.sendMessage(
+            "succeed_retrieve_{}".format(self._tag),
+            tree=self.tree,
+        )
+
+    def on_insert(self, tree: treelib.Tree, node_id: int) -> None:
+        """Add an inserted record of a constituent module to the BoM.
+
+        A new hardware item is added below its parent along with any records
+        the other modules already have for it.  A new record of any other
+        module is attached to its hardware node.
+
+        :param tree: the treelib Tree() passed by the calling message.
+        :param node_id: the node ID of the element that was inserted.
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+        _record = tree.get_node(node_id).data[_module]
+        _hardware_id = _record.hardware_id
+        _parent_id = _record.parent_id if _module == "hardware" else _hardware_id
+
+        if not self._do_is_loaded() or not self.tree.contains(_parent_id):
+            self.do_set_tree(tree)
+            return
+
+        self._dic_trees[_module] = tree
+
+        if _module == "hardware":
+            _data = {"hardware": _record}
+            for _other in self._lst_modules[1:]:
+                _node = self._dic_trees[_other].get_node(_hardware_id)
+                if _node is not None:
+                    _data[_other] = _node.data[_other]
+            self.tree.create_node(
+                tag="hardware",
+                identifier=_hardware_id,
+                parent=_parent_id,
+                data=_data,
+            )
+        else:
+            self.tree.get_node(_hardware_id).data[_module] = _record
+
+        pub.sendMessage(
+            "succeed_retrieve_{}".format(self._tag),
+            tree=self.tree,
+        )
+
+    def _do_get_attributes(self, node_id: int) -> Dict[str, Any]:
+        """Merge the attributes of all the tables for the node ID.
+
+        :param node_id: the record ID to retrieve the attributes for.
+        :return: the merged attributes dict for the hardware item.
+        :rtype: dict
+        """
+        _node = self.tree.get_node(node_id)
+
+        return {
+            **_node.data["hardware"].get_attributes(),
+            **_node.data["design_mechanic"].get_attributes(),
+            **_node.data["design_electric"].get_attributes(),
+            **_node.data["milhdbk217f"].get_attributes(),
+            **_node.data["nswc"].get_attributes(),
+            **_node.data["reliability"].get_attributes(),
+        }
+
+    def _do_is_loaded(self) -> bool:
+        """Return whether the BoM tree has been built from the hardware tree.
+
+        :return: True if the hardware tree has been loaded into the BoM tree.
+        :rtype: bool
+        """
+        return (
+            len(self._dic_trees["hardware"]) > 1
+            and not self.tree.get_node(self._root).is_leaf()
+        )
+
+    def _do_make_parts_array(self, node_ids: List[int]) -> np.ndarray:
+        """Build the batch parts array for a list of hardware items.
+
+        :param node_ids: the record IDs of the hardware items to include.
+        :return: the structured array (PART_DTYPE) with one row for each
+            hardware item in the order passed.
+        :rtype: :class:`numpy.ndarray`
+        """
+        _columns: Dict[str, List[Any]] = {
+            _field: [] for _field in batch.PART_DTYPE.names
+        }
+        for _node_id in node_ids:
+            _attributes = self._do_get_attributes(_node_id)
+            for _field, _values in _columns.items():
+                _values.append(_attributes.get(_field, 0))
+
+        return batch.do_make_parts_array(_columns, len(node_ids))
+
+    def _do_roll_up_node(self, node_id: int) -> None:
+        """Aggregate the cost, part count, and power dissipation of one node.
+
+        Parts are calculated from their own attributes.  Assemblies are
+        calculated from the totals already stored in their children's records.
+
+        :param node_id: the record ID to aggregate.
+        :return: None
+        :rtype: None
+        """
+        _node = self.tree.get_node(node_id)
+        _hardware = _node.data["hardware"]
+
+        if _hardware.part == 1:
+            _total_cost = _hardware.cost
+            _total_part_count = 1
+            _total_power_dissipation = (
+                _node.data["design_electric"].power_operating
+                if "design_electric" in _node.data
+                else 0.0
+            )
+        else:
+            _total_cost = 0.0
+            _total_part_count = 0
+            _total_power_dissipation = 0.0
+            for _child_id in _node.successors(self.tree.identifier):
+                _child = self.tree.get_node(_child_id).data["hardware"]
+                _total_cost += _child.total_cost
+                _total_part_count += _child.total_part_count
+                _total_power_dissipation += _child.total_power_dissipation
+
+        if _hardware.cost_type_id == 2:
+            _hardware.total_cost = _total_cost * _hardware.quantity
+        _hardware.total_part_count = _total_part_count * _hardware.quantity
+        _hardware.total_power_dissipation = (
+            _total_power_dissipation * _hardware.quantity
+        )
+
     def _do_load_hardware(self) -> None:
         """Load the hardware data into the tree.
 
@@ -267,7 +666,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
             try:
                 _par_node = self.tree.get_node(_design_electric.hardware_id)
-                _par_node.data["design_electric"] = _design_electric
+                if _par_node is not None:
+                    _par_node.data["design_electric"] = _design_electric
             except ObjectDeletedError:
                 self._dic_trees["design_electric"].remove_node(_node.identifier)
 
@@ -282,7 +682,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
             try:
                 _par_node = self.tree.get_node(_design_mechanic.hardware_id)
-                _par_node.data["design_mechanic"] = _design_mechanic
+                if _par_node is not None:
+                    _par_node.data["design_mechanic"] = _design_mechanic
             except ObjectDeletedError:
                 self._dic_trees["design_mechanic"].remove_node(_node.identifier)
 
@@ -297,7 +698,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
             try:
                 _par_node = self.tree.get_node(_milhdbk217f.hardware_id)
-                _par_node.data["milhdbk217f"] = _milhdbk217f
+                if _par_node is not None:
+                    _par_node.data["milhdbk217f"] = _milhdbk217f
             except ObjectDeletedError:
                 self._dic_trees["milhdbk217f"].remove_node(_node.identifier)
 
@@ -312,7 +714,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
             try:
                 _par_node = self.tree.get_node(_nswc.hardware_id)
-                _par_node.data["nswc"] = _nswc
+                if _par_node is not None:
+                    _par_node.data["nswc"] = _nswc
             except ObjectDeletedError:
                 self._dic_trees["nswc"].remove_node(_node.identifier)
 
@@ -327,6 +730,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
             try:
                 _par_node = self.tree.get_node(_reliability.hardware_id)
-                _par_node.data["reliability"] = _reliability
+                if _par_node is not None:
+                    _par_node.data["reliability"] = _reliability
             except ObjectDeletedError:
                 self._dic_trees["reliability"].remove_node(_node.identifier)
@@ -1,8 +1,14 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+# Third Party Imports
+import numpy as np
+import treelib
 
 # RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import batch as batch
 from ramstk.analyses.milhdbk217f import milhdbk217f as milhdbk217f
+from ramstk.analyses.milhdbk217f import montecarlo as montecarlo
 from ramstk.models import RAMSTKBaseView as RAMSTKBaseView
 
 class RAMSTKHardwareBoMView(RAMSTKBaseView):
@@ -12,9 +18,22 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
     _lst_modules: Any = ...
     _hr_multiplier: Any = ...
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
+    def do_calculate_all_hardware(self) -> None: ...
     def do_calculate_hardware(self, node_id: int) -> None: ...
     def do_calculate_power_dissipation(self, node_id: int) -> float: ...
     def do_predict_active_hazard_rate(self, node_id: int) -> float: ...
+    def do_predict_all_active_hazard_rates(self) -> Dict[int, float]: ...
+    def do_propagate_uncertainty(
+        self, distributions: Dict[str, Any], n_samples: int, **kwargs: Any
+    ) -> Dict[int, Dict[str, Any]]: ...
+    def do_roll_up(self, node_id: int = ...) -> None: ...
+    def do_set_tree(self, tree: treelib.Tree) -> None: ...
+    def on_delete(self, tree: treelib.Tree) -> None: ...
+    def on_insert(self, tree: treelib.Tree, node_id: int) -> None: ...
+    def _do_get_attributes(self, node_id: int) -> Dict[str, Any]: ...
+    def _do_is_loaded(self) -> bool: ...
+    def _do_make_parts_array(self, node_ids: List[int]) -> np.ndarray: ...
+    def _do_roll_up_node(self, node_id: int) -> None: ...
     def _do_load_hardware(self) -> None: ...
     def _do_load_design_electric(self) -> None: ...
     def _do_load_design_mechanic(self) -> None: ...
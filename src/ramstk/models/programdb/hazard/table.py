@@ -8,7 +8,7 @@
 
 # Standard Library Imports
 from collections import OrderedDict
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Type
 
 # Third Party Imports
 from pubsub import pub
@@ -62,6 +62,7 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_calculate_fha, "request_calculate_fha")
+        pub.subscribe(self.do_calculate_all_fha, "request_calculate_all_fha")
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]
@@ -75,10 +76,47 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
         _new_record.function_id = attributes["function_id"]
-        _new_record.hazard_id = self.last_id + 1
+        _new_record.hazard_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
 
+    def do_calculate_all_fha(self) -> None:
+        """Perform a hazards analysis calculation for every hazard at once.
+
+        The hazard risk indices are calculated one hazard at a time.  The
+        user-defined hazard analyses are calculated together so each
+        user-defined equation is compiled once for the entire revision.  The
+        attribute changes are sent as a single message when the batch is done.
+        A user-defined equation that divides by zero leaves the user-defined
+        results unchanged and is reported with the fail message.
+
+        :return: None
+        :rtype: None
+        """
+        _node_ids: List[int] = [_node.identifier for _node in self.tree.all_nodes()[1:]]
+
+        with self.do_batch_changes():
+            for _node_id in _node_ids:
+                self._do_calculate_hri(_node_id)
+
+            try:
+                self._do_calculate_all_user_defined(_node_ids)
+            except ZeroDivisionError as _error:
+                pub.sendMessage(
+                    "fail_calculate_fha",
+                    error_message=(
+                        "Failed to calculate the user-defined hazard analysis for "
+                        "hazard IDs {0}.  {1}"
+                    ).format(_node_ids, str(_error)),
+                )
+
+        pub.sendMessage(
+            "succeed_calculate_all_fha",
+            tree=self.tree,
+        )
+
     def do_calculate_fha(self, node_id: int) -> None:
         """Perform a hazards analysis calculation for currently selected item.
 
@@ -87,13 +125,61 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
         :rtype: None
         """
         self._do_calculate_hri(node_id)
-        self._do_calculate_user_defined(node_id)
+        try:
+            self._do_calculate_user_defined(node_id)
+        except ZeroDivisionError as _error:
+            pub.sendMessage(
+                "fail_calculate_fha",
+                error_message=(
+                    "Failed to calculate the user-defined hazard analysis for "
+                    "hazard ID {0}.  {1}"
+                ).format(node_id, str(_error)),
+            )
+            return
 
         pub.sendMessage(
             "succeed_calculate_fha",
             node_id=node_id,
         )
 
+    def _do_calculate_all_user_defined(self, node_ids: List[int]) -> None:
+        """Calculate the user-defined hazard analysis for many hazards.
+
+        :param node_ids: the list of hazard IDs to calculate.
+        :return: None
+        :rtype: None
+        """
+        _records = [
+            self.tree.get_node(_node_id).data[self._tag] for _node_id in node_ids
+        ]
+
+        _fha: Dict[str, Any] = {}
+        for _idx in range(1, 4):
+            _fha["uf{}".format(_idx)] = [
+                float(getattr(_record, "user_float_{}".format(_idx)))
+                for _record in _records
+            ]
+            _fha["ui{}".format(_idx)] = [
+                int(getattr(_record, "user_int_{}".format(_idx)))
+                for _record in _records
+            ]
+        for _idx in range(1, 6):
+            # Empty functions are set to 0.0 just like set_user_defined_functions().
+            _fha["equation{}".format(_idx)] = [
+                str(getattr(_record, "function_{}".format(_idx))) or "0.0"
+                for _record in _records
+            ]
+            _fha["res{}".format(_idx)] = [
+                getattr(_record, "result_{}".format(_idx)) for _record in _records
+            ]
+
+        _fha = fha.calculate_all_user_defined(_fha)
+
+        for _idx in range(1, 6):
+            _key = "result_{}".format(_idx)
+            for _record, _result in zip(_records, _fha["res{}".format(_idx)].tolist()):
+                setattr(_record, _key, _result)
+
     def _do_calculate_hri(self, node_id: int) -> None:
         """Calculate the hazard risk index (HRI).
 
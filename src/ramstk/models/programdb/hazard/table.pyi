@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # RAMSTK Package Imports
 from ramstk.analyses import fha as fha
@@ -16,6 +16,8 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
     pkey: str
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
+    def do_calculate_all_fha(self) -> None: ...
     def do_calculate_fha(self, node_id: int) -> None: ...
+    def _do_calculate_all_user_defined(self, node_ids: List[int]) -> None: ...
     def _do_calculate_hri(self, node_id: int) -> None: ...
     def _do_calculate_user_defined(self, node_id: int) -> None: ...
@@ -76,7 +76,9 @@ class RAMSTKMechanismTable(RAMSTKBaseTable):
         _new_record.revision_id = attributes["revision_id"]
         _new_record.hardware_id = attributes["hardware_id"]
         _new_record.mode_id = attributes["mode_id"]
-        _new_record.mechanism_id = self.last_id + 1
+        _new_record.mechanism_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
 
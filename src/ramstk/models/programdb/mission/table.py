@@ -67,6 +67,8 @@ class RAMSTKMissionTable(RAMSTKBaseTable):
         """
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
-        _new_record.mission_id = self.last_id + 1
+        _new_record.mission_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
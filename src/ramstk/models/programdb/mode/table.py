@@ -65,6 +65,9 @@ class RAMSTKModeTable(RAMSTKBaseTable):
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_calculate_criticality, "request_calculate_criticality")
+        pub.subscribe(
+            self.do_calculate_all_criticality, "request_calculate_all_criticality"
+        )
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]
@@ -78,10 +81,50 @@ class RAMSTKModeTable(RAMSTKBaseTable):
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
         _new_record.hardware_id = attributes["hardware_id"]
-        _new_record.mode_id = self.last_id + 1
+        _new_record.mode_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
 
+    def do_calculate_all_criticality(self, hazard_rates: Dict[int, float]) -> None:
+        """Calculate MIL-STD-1629A, Task 102 criticality of every hardware item.
+
+        Each failure mode uses the hazard rate of the hardware item it belongs to.
+        Failure modes whose hardware item isn't in hazard_rates are skipped.
+
+        :param hazard_rates: the hazard rate of each hardware item keyed by
+            hardware ID.
+        :return: None
+        :rtype: None
+        """
+        _item_criticality: Dict[int, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        for _mode in self.tree.children(self._root):
+            _record = _mode.data["mode"]
+            try:
+                _item_hr = hazard_rates[_record.hardware_id]
+            except KeyError:
+                continue
+
+            _record.mode_hazard_rate = calculate_mode_hazard_rate(
+                _item_hr, _record.mode_ratio
+            )
+            _record.mode_criticality = calculate_mode_criticality(
+                _record.mode_hazard_rate,
+                _record.mode_op_time,
+                _record.effect_probability,
+            )
+            _item_criticality[_record.hardware_id][
+                _record.severity_class
+            ] += _record.mode_criticality
+
+        pub.sendMessage(
+            "succeed_calculate_all_mode_criticality",
+            item_criticality=_item_criticality,
+        )
+
     def do_calculate_criticality(self, item_hr: float) -> None:
         """Calculate MIL-STD-1629A, Task 102 criticality of a hardware item.
 
@@ -21,4 +21,5 @@ class RAMSTKModeTable(RAMSTKBaseTable):
     pkey: str
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
+    def do_calculate_all_criticality(self, hazard_rates: Dict[int, float]) -> None: ...
     def do_calculate_criticality(self, item_hr: float) -> None: ...
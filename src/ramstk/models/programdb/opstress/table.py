@@ -75,6 +75,8 @@ class RAMSTKOpStressTable(RAMSTKBaseTable):
         _new_record.mode_id = attributes["mode_id"]
         _new_record.mechanism_id = attributes["mechanism_id"]
         _new_record.load_id = attributes["load_id"]
-        _new_record.stress_id = self.last_id + 1
+        _new_record.stress_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
 
         return _new_record
@@ -25,6 +25,11 @@ class RAMSTKPoFView(RAMSTKBaseView):
     """
 
     # Define private dictionary class attributes.
+    _dic_parents = {
+        "opload": ("mechanism", "mechanism_id"),
+        "opstress": ("opload", "load_id"),
+        "test_method": ("opload", "load_id"),
+    }
 
     # Define private list class attributes.
 
@@ -81,10 +86,10 @@ class RAMSTKPoFView(RAMSTKBaseView):
         pub.subscribe(super().do_set_tree, "succeed_retrieve_oploads")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_opstresss")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_test_methods")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_delete_opload")
-        pub.subscribe(super().do_set_tree, "succeed_delete_opstress")
-        pub.subscribe(super().do_set_tree, "succeed_delete_test_method")
+        pub.subscribe(super().on_delete, "succeed_delete_mechanism")
+        pub.subscribe(super().on_delete, "succeed_delete_opload")
+        pub.subscribe(super().on_delete, "succeed_delete_opstress")
+        pub.subscribe(super().on_delete, "succeed_delete_test_method")
 
     def _do_load_mechanisms(self) -> None:
         """Load the mechanisms into the tree.
@@ -96,48 +101,36 @@ class RAMSTKPoFView(RAMSTKBaseView):
             _mechanism = _node.data["mechanism"]
             _node_id = "{}".format(_mechanism.mechanism_id)
 
-            self.tree.create_node(
-                tag="mechanism",
-                identifier=_node_id,
-                parent=self._root,
-                data={self._tag: _mechanism},
-            )
-
-            if self._dic_trees["opload"].depth() > 0:
+            if self._do_add_node(
+                "mechanism", _mechanism, _mechanism.mechanism_id, _node_id, self._root
+            ):
                 self._dic_load_functions["opload"](  # type: ignore
                     _mechanism.mechanism_id,
+                    _node_id,
                 )
 
-    def _do_load_oploads(self, mechanism_id: int) -> None:
+    def _do_load_oploads(self, mechanism_id: int, parent_id: str) -> None:
         """Load the operating loads into the tree for the passed mechanism ID.
 
         :param mechanism_id: the failure mechanism ID to add the new operating load.
+        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["opload"].all_nodes()[1:]:
-            _opload = _node.data["opload"]
-            _node_id = "{}.{}".format(mechanism_id, _opload.load_id)
-
-            if _opload.mechanism_id == mechanism_id:
-                self.tree.create_node(
-                    tag="opload",
-                    identifier=_node_id,
-                    parent="{}".format(mechanism_id),
-                    data={self._tag: _opload},
+        for _opload in self._do_get_children("opload", mechanism_id):
+            _node_id = "{}.{}".format(parent_id, _opload.load_id)
+
+            if self._do_add_node(
+                "opload", _opload, _opload.load_id, _node_id, parent_id
+            ):
+                self._dic_load_functions["opstress"](  # type: ignore
+                    _opload.load_id,
+                    _node_id,
+                )
+                self._dic_load_functions["test_method"](  # type: ignore
+                    _opload.load_id,
+                    _node_id,
                 )
-
-                if self._dic_trees["opstress"].depth() > 0:
-                    self._dic_load_functions["opstress"](  # type: ignore
-                        _opload.load_id,
-                        _node_id,
-                    )
-
-                if self._dic_trees["test_method"].depth() > 0:
-                    self._dic_load_functions["test_method"](  # type: ignore
-                        _opload.load_id,
-                        _node_id,
-                    )
 
     def _do_load_opstress(self, load_id: int, parent_id: str) -> None:
         """Load the operating stresses into the tree for the passed load ID.
@@ -147,17 +140,12 @@ class RAMSTKPoFView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["opstress"].all_nodes()[1:]:
-            _opstress = _node.data["opstress"]
+        for _opstress in self._do_get_children("opstress", load_id):
             _node_id = "{}.{}s".format(parent_id, _opstress.stress_id)
 
-            if _opstress.load_id == load_id:
-                self.tree.create_node(
-                    tag="opstress",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={self._tag: _opstress},
-                )
+            self._do_add_node(
+                "opstress", _opstress, _opstress.stress_id, _node_id, parent_id
+            )
 
     def _do_load_test_method(self, load_id: int, parent_id: str) -> None:
         """Load the operating stresses into the tree for the passed load ID.
@@ -167,14 +155,9 @@ class RAMSTKPoFView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["test_method"].all_nodes()[1:]:
-            _test_method = _node.data["test_method"]
+        for _test_method in self._do_get_children("test_method", load_id):
             _node_id = "{}.{}t".format(parent_id, _test_method.test_id)
 
-            if _test_method.load_id == load_id:
-                self.tree.create_node(
-                    tag="test_method",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={self._tag: _test_method},
-                )
+            self._do_add_node(
+                "test_method", _test_method, _test_method.test_id, _node_id, parent_id
+            )
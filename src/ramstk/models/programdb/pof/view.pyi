@@ -12,6 +12,6 @@ class RAMSTKPoFView(RAMSTKBaseView):
     _lst_modules: Any = ...
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
     def _do_load_mechanisms(self) -> None: ...
-    def _do_load_oploads(self, mechanism_id: int) -> None: ...
+    def _do_load_oploads(self, mechanism_id: int, parent_id: str) -> None: ...
     def _do_load_opstress(self, load_id: int, parent_id: str) -> None: ...
     def _do_load_test_method(self, load_id: int, parent_id: str) -> None: ...
@@ -75,7 +75,9 @@ class RAMSTKProgramStatusTable(RAMSTKBaseTable):
         """
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
-        _new_record.status_id = self.last_id + 1
+        _new_record.status_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
         _new_record.date_status = date.today()
 
         self._dic_status[_new_record.date_status] = _new_record.status_id
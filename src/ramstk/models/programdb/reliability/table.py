@@ -9,10 +9,12 @@
 
 # Standard Library Imports
 from math import exp
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Type
 
 # Third Party Imports
+import numpy as np
 from pubsub import pub
+from scipy.stats import expon
 
 # RAMSTK Package Imports
 from ramstk.analyses import dormancy
@@ -79,6 +81,13 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
         )
         pub.subscribe(self.do_calculate_mtbf, "request_calculate_mtbf")
         pub.subscribe(self.do_calculate_reliability, "request_calculate_reliability")
+        pub.subscribe(
+            self.do_calculate_all_reliability, "request_calculate_all_reliability"
+        )
+        pub.subscribe(
+            self.do_calculate_all_hazard_rate_dormant,
+            "request_calculate_all_hazard_rate_dormant",
+        )
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]
@@ -95,6 +104,103 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
 
         return _new_record
 
+    def do_calculate_all_reliability(
+        self, attributes: Dict[int, Dict[str, Any]], multiplier: float
+    ) -> None:
+        """Calculate the reliability metrics of many hardware items at once.
+
+        This is the batch form of do_calculate_hazard_rate_active(),
+        do_calculate_hazard_rate_dormant(), do_calculate_hazard_rate_logistics(),
+        do_calculate_hazard_rate_mission(), do_calculate_mtbf(), and
+        do_calculate_reliability().  The inputs are gathered into NumPy arrays, all
+        the metrics are calculated as array operations, and the results are
+        written back to the records in a single pass.  A single message is sent
+        when the batch is complete rather than one message per attribute per
+        hardware item.
+
+        The attributes dict for each hardware item must contain the duty_cycle,
+        quantity, mission_time, category_id, subcategory_id,
+        environment_active_id, and environment_dormant_id.  Items with a
+        predicted hazard rate (hazard_rate_type_id = 1) also use
+        hazard_rate_predicted, which defaults to 0.0 when it is missing.
+
+        :param attributes: the dict of hardware attributes keyed by record ID.
+        :param multiplier: the time multiplier for hazard rates and MTBF.
+            Typically set to 1.0 to work with failures/hour or 1000000.0 to work
+            with failures/10^6 hours.  Set the value in RAMSTK.toml.
+        :return: None
+        :rtype: None
+        """
+        _node_ids: List[int] = [
+            _node_id for _node_id in attributes if self.tree.contains(_node_id)
+        ]
+        _records = [
+            self.tree.get_node(_node_id).data[self._tag] for _node_id in _node_ids
+        ]
+
+        _results = self._do_calculate_reliability_metrics(
+            _records,
+            self._do_get_reliability_inputs(attributes, _node_ids, _records),
+            multiplier,
+        )
+
+        _columns = {_key: _values.tolist() for _key, _values in _results.items()}
+        for _idx, _record in enumerate(_records):
+            for _key, _values in _columns.items():
+                setattr(_record, _key, _values[_idx])
+
+        pub.sendMessage(
+            "succeed_calculate_all_reliability",
+            tree=self.tree,
+        )
+
+    def do_calculate_all_hazard_rate_dormant(
+        self, attributes: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Calculate the dormant hazard rate of every hardware item in the revision.
+
+        This is the batch form of do_calculate_hazard_rate_dormant().  The
+        dormant hazard rates are calculated from each record's active hazard rate
+        with a single lookup into the dormancy multiplier cube and a single
+        message is sent when the batch is complete.  Hardware items without an
+        attributes dict are skipped.
+
+        :param attributes: the dict of hardware attributes keyed by record ID.
+            Each must contain the category_id, subcategory_id,
+            environment_active_id, and environment_dormant_id.
+        :return: None
+        :rtype: None
+        """
+        _node_ids: List[int] = [
+            _node.identifier
+            for _node in self.tree.all_nodes()[1:]
+            if _node.identifier in attributes
+        ]
+        _records = [
+            self.tree.get_node(_node_id).data[self._tag] for _node_id in _node_ids
+        ]
+
+        _hazard_rate_dormant = dormancy.do_calculate_dormant_hazard_rates(
+            *[
+                [attributes[_node_id][_key] for _node_id in _node_ids]
+                for _key in [
+                    "category_id",
+                    "subcategory_id",
+                    "environment_active_id",
+                    "environment_dormant_id",
+                ]
+            ],
+            [_record.hazard_rate_active for _record in _records],
+        ).tolist()
+
+        for _record, _value in zip(_records, _hazard_rate_dormant):
+            _record.hazard_rate_dormant = _value
+
+        pub.sendMessage(
+            "succeed_calculate_all_hazard_rate_dormant",
+            tree=self.tree,
+        )
+
     def do_calculate_hazard_rate_active(
         self,
         node_id: int,
@@ -325,3 +431,169 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
             node_id=[node_id],
             package={"reliability_mission": _record.reliability_mission},
         )
+
+    @staticmethod
+    def _do_get_reliability_inputs(
+        attributes: Dict[int, Dict[str, Any]],
+        node_ids: List[int],
+        records: List[RAMSTKReliabilityRecord],
+    ) -> Dict[str, np.ndarray]:
+        """Gather the inputs to the batch reliability calculations.
+
+        :param attributes: the dict of hardware attributes keyed by record ID.
+        :param node_ids: the record IDs to gather the inputs of.
+        :param records: the reliability record of each record ID.
+        :return: the array of each hardware attribute and reliability record
+            field the calculations use keyed by name.
+        :rtype: dict
+        """
+        _inputs = {
+            _key: np.array(
+                [attributes[_node_id][_key] for _node_id in node_ids], dtype=float
+            )
+            for _key in [
+                "category_id",
+                "duty_cycle",
+                "environment_active_id",
+                "environment_dormant_id",
+                "mission_time",
+                "quantity",
+                "subcategory_id",
+            ]
+        }
+        _inputs["hazard_rate_predicted"] = np.array(
+            [
+                attributes[_node_id].get("hazard_rate_predicted", 0.0)
+                for _node_id in node_ids
+            ],
+            dtype=float,
+        )
+        for _key in [
+            "add_adj_factor",
+            "hazard_rate_software",
+            "hazard_rate_specified",
+            "hazard_rate_type_id",
+            "mtbf_specified",
+            "mult_adj_factor",
+        ]:
+            _inputs[_key] = np.array(
+                [getattr(_record, _key) for _record in records], dtype=float
+            )
+
+        return _inputs
+
+    def _do_calculate_reliability_metrics(
+        self,
+        records: List[RAMSTKReliabilityRecord],
+        inputs: Dict[str, np.ndarray],
+        multiplier: float,
+    ) -> Dict[str, np.ndarray]:
+        """Calculate the hazard rates, MTBF, and reliability of many records.
+
+        :param records: the list of reliability records to calculate.
+        :param inputs: the inputs from _do_get_reliability_inputs().
+        :param multiplier: the time multiplier for hazard rates and MTBF.
+        :return: the array of each calculated reliability field keyed by name.
+        :rtype: dict
+        """
+        _type_id = inputs["hazard_rate_type_id"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _hazard_rate_active = np.select(
+                [_type_id == 1, _type_id == 2, _type_id == 3, _type_id == 4],
+                [
+                    inputs["hazard_rate_predicted"],
+                    inputs["hazard_rate_specified"],
+                    1.0 / expon.mean(loc=0.0, scale=inputs["mtbf_specified"]),
+                    self._do_calculate_distribution_hazard_rates(
+                        records, inputs["mission_time"]
+                    ),
+                ],
+                default=0.0,
+            )
+        _hazard_rate_active = (
+            (_hazard_rate_active + inputs["add_adj_factor"])
+            * inputs["mult_adj_factor"]
+            * (inputs["duty_cycle"] / 100.0)
+            * inputs["quantity"]
+            * multiplier
+        )
+
+        _hazard_rate_dormant = dormancy.do_calculate_dormant_hazard_rates(
+            inputs["category_id"],
+            inputs["subcategory_id"],
+            inputs["environment_active_id"],
+            inputs["environment_dormant_id"],
+            _hazard_rate_active,
+        )
+
+        _hazard_rate_logistics = (
+            _hazard_rate_active + _hazard_rate_dormant + inputs["hazard_rate_software"]
+        )
+        _hazard_rate_mission = (
+            (_hazard_rate_active * inputs["duty_cycle"])
+            + (_hazard_rate_dormant * (1 - inputs["duty_cycle"]))
+            + inputs["hazard_rate_software"]
+        )
+
+        return {
+            "hazard_rate_active": _hazard_rate_active,
+            "hazard_rate_dormant": _hazard_rate_dormant,
+            "hazard_rate_logistics": _hazard_rate_logistics,
+            "hazard_rate_mission": _hazard_rate_mission,
+            "mtbf_logistics": np.divide(
+                multiplier,
+                _hazard_rate_logistics,
+                out=np.zeros(_type_id.size),
+                where=_hazard_rate_logistics != 0.0,
+            ),
+            "mtbf_mission": np.divide(
+                multiplier,
+                _hazard_rate_mission,
+                out=np.zeros(_type_id.size),
+                where=_hazard_rate_mission != 0.0,
+            ),
+            "reliability_logistics": np.exp(
+                -1.0 * _hazard_rate_logistics * inputs["mission_time"]
+            ),
+            "reliability_mission": np.exp(
+                -1.0 * _hazard_rate_mission * inputs["mission_time"]
+            ),
+        }
+
+    @staticmethod
+    def _do_calculate_distribution_hazard_rates(
+        records: List[RAMSTKReliabilityRecord], time: np.ndarray
+    ) -> np.ndarray:
+        """Calculate the hazard rate of each record's failure distribution.
+
+        The hazard rate is calculated for every distribution and the one
+        selected by each record's failure_distribution_id is returned.  Records
+        with an unknown failure distribution get a hazard rate of 0.0.
+
+        :param records: the list of reliability records to calculate.
+        :param time: the array of times at which to calculate the hazard rates.
+        :return: the array of hazard rates.
+        :rtype: :class:`numpy.ndarray`
+        """
+        _distribution_id = np.array(
+            [_record.failure_distribution_id for _record in records], dtype=float
+        )
+        _location = np.array(
+            [_record.location_parameter for _record in records], dtype=float
+        )
+        _scale = np.array([_record.scale_parameter for _record in records], dtype=float)
+        _shape = np.array([_record.shape_parameter for _record in records], dtype=float)
+
+        return np.select(
+            [_distribution_id == _idx for _idx in range(1, 8)],
+            [
+                1.0 / expon.mean(loc=0.0, scale=_scale),
+                1.0 / expon.mean(loc=_location, scale=_scale),
+                lognormal.get_hazard_rates(_shape, _scale, time),
+                lognormal.get_hazard_rates(_shape, _scale, time, location=_location),
+                normal.get_hazard_rates(_location, _scale, time),
+                weibull.get_hazard_rates(_shape, _scale, time),
+                weibull.get_hazard_rates(_shape, _scale, time, location=_location),
+            ],
+            default=0.0,
+        )
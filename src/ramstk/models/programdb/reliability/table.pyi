@@ -1,5 +1,8 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+# Third Party Imports
+import numpy as np
 
 # RAMSTK Package Imports
 from ramstk.analyses import dormancy as dormancy
@@ -20,6 +23,12 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
     pkey: str
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
+    def do_calculate_all_reliability(
+        self, attributes: Dict[int, Dict[str, Any]], multiplier: float
+    ) -> None: ...
+    def do_calculate_all_hazard_rate_dormant(
+        self, attributes: Dict[int, Dict[str, Any]]
+    ) -> None: ...
     def do_calculate_hazard_rate_active(
         self,
         node_id: int,
@@ -42,3 +51,19 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
     ) -> None: ...
     def do_calculate_mtbf(self, node_id: int, multiplier: float) -> None: ...
     def do_calculate_reliability(self, node_id: int, time: float) -> None: ...
+    @staticmethod
+    def _do_get_reliability_inputs(
+        attributes: Dict[int, Dict[str, Any]],
+        node_ids: List[int],
+        records: List[RAMSTKReliabilityRecord],
+    ) -> Dict[str, np.ndarray]: ...
+    def _do_calculate_reliability_metrics(
+        self,
+        records: List[RAMSTKReliabilityRecord],
+        inputs: Dict[str, np.ndarray],
+        multiplier: float,
+    ) -> Dict[str, np.ndarray]: ...
+    @staticmethod
+    def _do_calculate_distribution_hazard_rates(
+        records: List[RAMSTKReliabilityRecord], time: np.ndarray
+    ) -> np.ndarray: ...
@@ -9,7 +9,11 @@
 # Standard Library Imports
 from typing import Any, Dict, Type
 
+# Third Party Imports
+from pubsub import pub
+
 # RAMSTK Package Imports
+from ramstk.exceptions import DataAccessError
 from ramstk.models import RAMSTKBaseTable, RAMSTKRevisionRecord
 
 
@@ -54,6 +58,42 @@ class RAMSTKRevisionTable(RAMSTKBaseTable):
         self.pkey = "revision_id"
 
         # Subscribe to PyPubSub messages.
+        pub.subscribe(self.do_clone, "request_clone_revision")
+
+    def do_clone(self, node_id: int) -> None:
+        """Copy a revision and all of its records to a new revision.
+
+        The records are copied inside the database.  Only the revision list is
+        reloaded; the new revision's records are loaded when it's selected.
+
+        :param node_id: the ID of the revision to copy.
+        :return: None
+        :rtype: None
+        """
+        _new_id = self.dao.get_next_id(self._db_tablename, self._db_id_colname)
+
+        try:
+            self.dao.do_clone_revision(node_id, _new_id)
+        except DataAccessError as _error:
+            self.dao.do_release_id(self._db_tablename, self._db_id_colname, _new_id)
+            pub.sendMessage(
+                "do_log_debug",
+                logger_name="DEBUG",
+                message=_error.msg,
+            )
+            pub.sendMessage(
+                "fail_clone_revision",
+                error_message=_error.msg,
+            )
+            return
+
+        self.do_select_all(attributes={"revision_id": None})
+
+        pub.sendMessage(
+            "succeed_clone_revision",
+            node_id=_new_id,
+            tree=self.tree,
+        )
 
     def do_get_new_record(  # pylint: disable=method-hidden
         self, attributes: Dict[str, Any]  # pylint: disable=unused-argument
@@ -65,7 +105,9 @@ class RAMSTKRevisionTable(RAMSTKBaseTable):
         :rtype: None
         """
         _new_record = self._record()
-        _new_record.revision_id = self.last_id + 1
+        _new_record.revision_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
         _new_record.name = "New Revision"
 
         return _new_record
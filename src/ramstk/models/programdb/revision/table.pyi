@@ -13,4 +13,5 @@ class RAMSTKRevisionTable(RAMSTKBaseTable):
     _record: Any
     pkey: str
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
+    def do_clone(self, node_id: int) -> None: ...
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
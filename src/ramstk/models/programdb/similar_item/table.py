@@ -9,7 +9,7 @@
 
 # Standard Library Imports
 from collections import OrderedDict
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Type
 
 # Third Party Imports
 from pubsub import pub
@@ -63,6 +63,9 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_calculate_similar_item, "request_calculate_similar_item")
+        pub.subscribe(
+            self.do_calculate_all_similar_items, "request_calculate_all_similar_items"
+        )
         pub.subscribe(
             self.do_roll_up_change_descriptions, "request_roll_up_change_descriptions"
         )
@@ -85,6 +88,48 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
 
         return _new_record
 
+    def do_calculate_all_similar_items(self, hazard_rates: Dict[int, float]) -> None:
+        """Perform the similar item calculation for every record at once.
+
+        Records using the Topic 6.3.3 method are calculated one at a time.
+        Records using the user-defined method are calculated together so each
+        user-defined equation is compiled once for the entire revision.  The
+        attribute changes are sent as a single message when the batch is done.
+        A user-defined equation that divides by zero leaves the user-defined
+        results unchanged and is reported with the fail message.
+
+        :param hazard_rates: the hazard rate of each hardware item keyed by
+            record ID.  Records without a hazard rate use 0.0.
+        :return: None
+        :rtype: None
+        """
+        _node_ids: List[int] = []
+
+        with self.do_batch_changes():
+            for _node in self.tree.all_nodes()[1:]:
+                _method_id = _node.data[self._tag].similar_item_method_id
+                if _method_id == 1:
+                    self._node_hazard_rate = hazard_rates.get(_node.identifier, 0.0)
+                    self._do_calculate_topic_633(_node.identifier)
+                elif _method_id == 2:
+                    _node_ids.append(_node.identifier)
+
+            try:
+                self._do_calculate_all_user_defined(_node_ids, hazard_rates)
+            except ZeroDivisionError as _error:
+                pub.sendMessage(
+                    "fail_calculate_similar_item",
+                    error_message=(
+                        "Failed to calculate user-defined similar item reliability "
+                        "for hardware IDs {0}.  {1}"
+                    ).format(_node_ids, str(_error)),
+                )
+
+        pub.sendMessage(
+            "succeed_calculate_similar_item",
+            tree=self.tree,
+        )
+
     def do_calculate_similar_item(self, node_id: int) -> None:
         """Perform a similar item calculation for record ID.
 
@@ -122,6 +167,20 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
                 "fail_calculate_similar_item",
                 error_message=_error_msg,
             )
+        except ZeroDivisionError as _error:
+            _error_msg = (
+                "Failed to calculate similar item reliability for hardware ID "
+                "{0}.  {1}".format(node_id, str(_error))
+            )
+            pub.sendMessage(
+                "do_log_debug",
+                logger_name="DEBUG",
+                message=_error_msg,
+            )
+            pub.sendMessage(
+                "fail_calculate_similar_item",
+                error_message=_error_msg,
+            )
 
     def do_roll_up_change_descriptions(self, node_id: int) -> None:
         """Concatenate child change descriptions for the node ID similar item.
@@ -240,6 +299,53 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
             tree=self.tree,
         )
 
+    def _do_calculate_all_user_defined(
+        self, node_ids: List[int], hazard_rates: Dict[int, float]
+    ) -> None:
+        """Calculate the user-defined similar item hazard rate for many records.
+
+        :param node_ids: the list of record IDs to calculate.
+        :param hazard_rates: the hazard rate of each hardware item keyed by
+            record ID.  Records without a hazard rate use 0.0.
+        :return: None
+        :rtype: None
+        """
+        _records = [
+            self.tree.get_node(_node_id).data[self._tag] for _node_id in node_ids
+        ]
+
+        _sia: Dict[str, Any] = {
+            "hr": [hazard_rates.get(_node_id, 0.0) for _node_id in node_ids],
+        }
+        for _idx in range(1, 11):
+            _sia["pi{}".format(_idx)] = [
+                getattr(_record, "change_factor_{}".format(_idx))
+                for _record in _records
+            ]
+        for _idx in range(1, 6):
+            _sia["uf{}".format(_idx)] = [
+                float(getattr(_record, "user_float_{}".format(_idx)))
+                for _record in _records
+            ]
+            _sia["ui{}".format(_idx)] = [
+                int(getattr(_record, "user_int_{}".format(_idx)))
+                for _record in _records
+            ]
+            _sia["equation{}".format(_idx)] = [
+                str(getattr(_record, "function_{}".format(_idx)))
+                for _record in _records
+            ]
+            _sia["res{}".format(_idx)] = [
+                getattr(_record, "result_{}".format(_idx)) for _record in _records
+            ]
+
+        _sia = similaritem.calculate_all_user_defined(_sia)
+
+        for _idx in range(1, 6):
+            _key = "result_{}".format(_idx)
+            for _record, _result in zip(_records, _sia["res{}".format(_idx)].tolist()):
+                setattr(_record, _key, _result)
+
     def _do_calculate_topic_633(self, node_id: int) -> None:
         """Calculate the similar item hazard rate per topic 6.3.3.
 
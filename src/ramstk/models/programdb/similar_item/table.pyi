@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # RAMSTK Package Imports
 from ramstk.models import RAMSTKBaseTable
@@ -16,7 +16,13 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
     _parent_id: Any
     def do_get_new_record(self, attributes: Dict[str, Any]) -> object: ...
+    def do_calculate_all_similar_items(
+        self, hazard_rates: Dict[int, float]
+    ) -> None: ...
     def do_calculate_similar_item(self, node_id: int) -> None: ...
     def do_roll_up_change_descriptions(self, node_id: int) -> None: ...
+    def _do_calculate_all_user_defined(
+        self, node_ids: List[int], hazard_rates: Dict[int, float]
+    ) -> None: ...
     def _do_calculate_topic_633(self, node_id: int) -> None: ...
     def _do_calculate_user_defined(self, node_id: int) -> None: ...
@@ -25,6 +25,10 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
     """
 
     # Define private dictionary class attributes.
+    _dic_parents = {
+        "mission_phase": ("mission", "mission_id"),
+        "environment": ("mission_phase", "phase_id"),
+    }
 
     # Define private list class attributes.
 
@@ -76,9 +80,9 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         pub.subscribe(super().do_set_tree, "succeed_retrieve_environments")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_missions")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_mission_phases")
-        pub.subscribe(super().do_set_tree, "succeed_delete_environment")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mission")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mission_phase")
+        pub.subscribe(super().on_delete, "succeed_delete_environment")
+        pub.subscribe(super().on_delete, "succeed_delete_mission")
+        pub.subscribe(super().on_delete, "succeed_delete_mission_phase")
 
     def _do_load_environments(self, phase_id: int, parent_id: str) -> None:
         """Load the environments into the tree for the passed phase ID.
@@ -88,17 +92,16 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["environment"].all_nodes()[1:]:
-            _environment = _node.data["environment"]
+        for _environment in self._do_get_children("environment", phase_id):
             _node_id = "{}.{}".format(parent_id, _environment.environment_id)
 
-            if _environment.phase_id == phase_id:
-                self.tree.create_node(
-                    tag="environment",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={"usage_profile": _environment},
-                )
+            self._do_add_node(
+                "environment",
+                _environment,
+                _environment.environment_id,
+                _node_id,
+                parent_id,
+            )
 
     def _do_load_missions(self) -> None:
         """Load the missions into the tree for the passed mission ID.
@@ -110,39 +113,33 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
             _mission = _node.data["mission"]
             _node_id = "{}".format(_mission.mission_id)
 
-            self.tree.create_node(
-                tag="mission",
-                identifier=_node_id,
-                parent=self._root,
-                data={"usage_profile": _mission},
-            )
-
-            if self._dic_trees["mission_phase"].depth() > 0:
+            if self._do_add_node(
+                "mission", _mission, _mission.mission_id, _node_id, self._root
+            ):
                 self._dic_load_functions["mission_phase"](  # type: ignore
                     _mission.mission_id,
+                    _node_id,
                 )
 
-    def _do_load_mission_phases(self, mission_id: int) -> None:
+    def _do_load_mission_phases(self, mission_id: int, parent_id: str) -> None:
         """Load the mission phases into the tree for the passed mission ID.
 
         :param mission_id: the mission ID to add the new mission phase.
+        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["mission_phase"].all_nodes()[1:]:
-            _mission_phase = _node.data["mission_phase"]
-            _node_id = "{}.{}".format(mission_id, _mission_phase.phase_id)
-
-            if _mission_phase.mission_id == mission_id:
-                self.tree.create_node(
-                    tag="mission_phase",
-                    identifier=_node_id,
-                    parent="{}".format(mission_id),
-                    data={"usage_profile": _mission_phase},
+        for _mission_phase in self._do_get_children("mission_phase", mission_id):
+            _node_id = "{}.{}".format(parent_id, _mission_phase.phase_id)
+
+            if self._do_add_node(
+                "mission_phase",
+                _mission_phase,
+                _mission_phase.phase_id,
+                _node_id,
+                parent_id,
+            ):
+                self._dic_load_functions["environment"](  # type: ignore
+                    _mission_phase.phase_id,
+                    _node_id,
                 )
-
-                if self._dic_trees["environment"].depth() > 0:
-                    self._dic_load_functions["environment"](  # type: ignore
-                        _mission_phase.phase_id,
-                        _node_id,
-                    )
@@ -13,4 +13,4 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
     def __init__(self, **kwargs: Dict[Any, Any]) -> None: ...
     def _do_load_environments(self, phase_id: int, parent_id: str) -> None: ...
     def _do_load_missions(self) -> None: ...
-    def _do_load_mission_phases(self, mission_id: int) -> None: ...
+    def _do_load_mission_phases(self, mission_id: int, parent_id: str) -> None: ...
@@ -78,7 +78,9 @@ class RAMSTKValidationTable(RAMSTKBaseTable):
         """
         _new_record = self._record()
         _new_record.revision_id = attributes["revision_id"]
-        _new_record.validation_id = self.last_id + 1
+        _new_record.validation_id = self.dao.get_next_id(
+            self._db_tablename, self._db_id_colname
+        )
         _new_record.name = "New Validation Task"
 
         return _new_record
@@ -0,0 +1,960 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.models.treeindex.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Compact, array-backed hierarchy index and treelib compatibility adapter."""
+
+# Standard Library Imports
+import uuid
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+# Third Party Imports
+import treelib
+from treelib.exceptions import (
+    DuplicatedNodeIdError,
+    MultipleRootError,
+    NodeIDAbsentError,
+)
+
+NO_ROW: int = -1
+
+
+class RAMSTKTreeIndex:
+    """Store a hierarchy of record IDs in parallel integer arrays.
+
+    Each node occupies one row.  The row of a node's parent, first child, last
+    child, next sibling, and previous sibling are stored in parallel arrays so
+    walking the hierarchy never requires creating a Python object per node.
+    Rows freed by removing nodes are reused by later additions.  A dict maps
+    each record ID to its row.
+
+    :ivar root: the ID of the root node or None if the index is empty.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty hierarchy index."""
+        # Initialize private dictionary attributes.
+        self._dic_rows: Dict[Any, int] = {}
+
+        # Initialize private list attributes.
+        self._lst_free: List[int] = []
+        self._lst_ids: List[Any] = []
+
+        # Initialize private scalar attributes.
+        self._parent: array = array("l")
+        self._first_child: array = array("l")
+        self._last_child: array = array("l")
+        self._next_sibling: array = array("l")
+        self._prev_sibling: array = array("l")
+
+        # Initialize public scalar attributes.
+        self.root: Optional[Any] = None
+
+    def __contains__(self, node_id: Any) -> bool:
+        """Return whether the node ID is in the index."""
+        return node_id in self._dic_rows
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the node IDs in the order they were added."""
+        return iter(self._dic_rows)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the index."""
+        return len(self._dic_rows)
+
+    def add(self, node_id: Any, parent_id: Optional[Any] = None) -> int:
+        """Add a node as the last child of its parent.
+
+        :param node_id: the ID of the node to add.
+        :param parent_id: the ID of the parent node.  Pass None to add the
+            root node.
+        :return: _row; the row the node was stored in.
+        :rtype: int
+        :raise: KeyError if the parent ID is not in the index.
+        :raise: ValueError if the node ID is already in the index or a second
+            root node is added.
+        """
+        if node_id in self._dic_rows:
+            raise ValueError(f"Node {node_id} is already in the index.")
+
+        if parent_id is None:
+            if self.root is not None:
+                raise ValueError("The index already has a root node.")
+            _parent_row = NO_ROW
+        else:
+            _parent_row = self._dic_rows[parent_id]
+
+        if self._lst_free:
+            _row = self._lst_free.pop()
+            self._lst_ids[_row] = node_id
+            self._parent[_row] = _parent_row
+            self._first_child[_row] = NO_ROW
+            self._last_child[_row] = NO_ROW
+            self._next_sibling[_row] = NO_ROW
+            self._prev_sibling[_row] = NO_ROW
+        else:
+            _row = len(self._lst_ids)
+            self._lst_ids.append(node_id)
+            self._parent.append(_parent_row)
+            self._first_child.append(NO_ROW)
+            self._last_child.append(NO_ROW)
+            self._next_sibling.append(NO_ROW)
+            self._prev_sibling.append(NO_ROW)
+
+        if _parent_row == NO_ROW:
+            self.root = node_id
+        else:
+            _last_row = self._last_child[_parent_row]
+            if _last_row == NO_ROW:
+                self._first_child[_parent_row] = _row
+            else:
+                self._next_sibling[_last_row] = _row
+                self._prev_sibling[_row] = _last_row
+            self._last_child[_parent_row] = _row
+
+        self._dic_rows[node_id] = _row
+
+        return _row
+
+    def children(self, node_id: Any) -> Iterator[Any]:
+        """Iterate over the IDs of a node's children.
+
+        :param node_id: the ID of the parent node.
+        :return: an iterator over the child IDs in the order they were added.
+        :rtype: iterator
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _row = self._first_child[self._dic_rows[node_id]]
+        while _row != NO_ROW:
+            yield self._lst_ids[_row]
+            _row = self._next_sibling[_row]
+
+    def depth(self) -> int:
+        """Return the number of levels below the root node.
+
+        :return: the depth of the deepest node; zero for an index with only a
+            root node.
+        :rtype: int
+        """
+        _start = self._dic_rows.get(self.root, NO_ROW)
+        if _start == NO_ROW:
+            return 0
+
+        _depth = 0
+        _level = 0
+        _row = _start
+        while True:
+            if self._first_child[_row] != NO_ROW:
+                _row = self._first_child[_row]
+                _level += 1
+                _depth = max(_depth, _level)
+                continue
+
+            while _row != _start and self._next_sibling[_row] == NO_ROW:
+                _row = self._parent[_row]
+                _level -= 1
+            if _row == _start:
+                return _depth
+            _row = self._next_sibling[_row]
+
+    def find_row(self, node_id: Any) -> int:
+        """Return the row a node is stored in or NO_ROW if it isn't stored.
+
+        :param node_id: the ID of the node.
+        :return: the row of the node or NO_ROW.
+        :rtype: int
+        """
+        return self._dic_rows.get(node_id, NO_ROW)
+
+    def get_id(self, row: int) -> Any:
+        """Return the ID of the node stored in a row.
+
+        :param row: the row of the node.
+        :return: the node ID or None if the row is free.
+        :rtype: Any
+        :raise: IndexError if the row has never been used.
+        """
+        return self._lst_ids[row]
+
+    def get_row(self, node_id: Any) -> int:
+        """Return the row a node is stored in.
+
+        :param node_id: the ID of the node.
+        :return: the row of the node.
+        :rtype: int
+        :raise: KeyError if the node ID is not in the index.
+        """
+        return self._dic_rows[node_id]
+
+    def has_children(self, node_id: Any) -> bool:
+        """Return whether a node has any children.
+
+        :param node_id: the ID of the node.
+        :return: True if the node has at least one child.
+        :rtype: bool
+        :raise: KeyError if the node ID is not in the index.
+        """
+        return self._first_child[self._dic_rows[node_id]] != NO_ROW
+
+    def level(self, node_id: Any) -> int:
+        """Return the number of levels between a node and the root.
+
+        :param node_id: the ID of the node.
+        :return: the level of the node; zero for the root node.
+        :rtype: int
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _level = 0
+        _row = self._parent[self._dic_rows[node_id]]
+        while _row != NO_ROW:
+            _level += 1
+            _row = self._parent[_row]
+
+        return _level
+
+    def parent(self, node_id: Any) -> Optional[Any]:
+        """Return the ID of a node's parent.
+
+        :param node_id: the ID of the node.
+        :return: the parent ID or None for the root node.
+        :rtype: Any
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _row = self._parent[self._dic_rows[node_id]]
+
+        return None if _row == NO_ROW else self._lst_ids[_row]
+
+    def postorder(self, node_id: Optional[Any] = None) -> Iterator[Any]:
+        """Iterate over the IDs of a subtree with children before parents.
+
+        :param node_id: the ID of the top of the subtree.  Defaults to the
+            root node.
+        :return: an iterator over the node IDs.
+        :rtype: iterator
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _start = self._get_start_row(node_id)
+        if _start == NO_ROW:
+            return
+
+        _row = self._do_descend(_start)
+        while True:
+            yield self._lst_ids[_row]
+            if _row == _start:
+                return
+            if self._next_sibling[_row] != NO_ROW:
+                _row = self._do_descend(self._next_sibling[_row])
+            else:
+                _row = self._parent[_row]
+
+    def preorder(self, node_id: Optional[Any] = None) -> Iterator[Any]:
+        """Iterate over the IDs of a subtree with parents before children.
+
+        :param node_id: the ID of the top of the subtree.  Defaults to the
+            root node.
+        :return: an iterator over the node IDs.
+        :rtype: iterator
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _start = self._get_start_row(node_id)
+        if _start == NO_ROW:
+            return
+
+        _row = _start
+        while True:
+            yield self._lst_ids[_row]
+            if self._first_child[_row] != NO_ROW:
+                _row = self._first_child[_row]
+                continue
+
+            while _row != _start and self._next_sibling[_row] == NO_ROW:
+                _row = self._parent[_row]
+            if _row == _start:
+                return
+            _row = self._next_sibling[_row]
+
+    def remove(self, node_id: Any) -> List[Any]:
+        """Remove a node and all of its descendants.
+
+        :param node_id: the ID of the top of the subtree to remove.
+        :return: _lst_removed; the IDs of the removed nodes, children before
+            parents.
+        :rtype: list
+        :raise: KeyError if the node ID is not in the index.
+        """
+        _lst_removed = list(self.postorder(node_id))
+
+        _row = self._dic_rows[node_id]
+        _parent_row = self._parent[_row]
+        _prev_row = self._prev_sibling[_row]
+        _next_row = self._next_sibling[_row]
+        if _prev_row != NO_ROW:
+            self._next_sibling[_prev_row] = _next_row
+        elif _parent_row != NO_ROW:
+            self._first_child[_parent_row] = _next_row
+        if _next_row != NO_ROW:
+            self._prev_sibling[_next_row] = _prev_row
+        elif _parent_row != NO_ROW:
+            self._last_child[_parent_row] = _prev_row
+
+        for _node_id in _lst_removed:
+            _row = self._dic_rows.pop(_node_id)
+            self._lst_ids[_row] = None
+            self._lst_free.append(_row)
+
+        if node_id == self.root:
+            self.root = None
+
+        return _lst_removed
+
+    def rows(self) -> Iterator[int]:
+        """Iterate over the rows of the nodes in the order they were added.
+
+        :return: an iterator over the rows.
+        :rtype: iterator
+        """
+        return iter(self._dic_rows.values())
+
+    def _do_descend(self, row: int) -> int:
+        """Return the row of the first leaf below a row.
+
+        :param row: the row to start from.
+        :return: the row of the first leaf found by following first children.
+        :rtype: int
+        """
+        while self._first_child[row] != NO_ROW:
+            row = self._first_child[row]
+
+        return row
+
+    def _get_start_row(self, node_id: Optional[Any]) -> int:
+        """Return the row to start a traversal from.
+
+        :param node_id: the ID of the top of the subtree or None for the root.
+        :return: the row of the node or NO_ROW if the index is empty.
+        :rtype: int
+        :raise: KeyError if the node ID is not in the index.
+        """
+        if node_id is None:
+            return self._dic_rows.get(self.root, NO_ROW)
+
+        return self._dic_rows[node_id]
+
+
+class RAMSTKTreeNode:
+    """Expose one row of a RAMSTKTree() through the treelib Node() API.
+
+    Node objects are only created when a caller asks for one.  They hold no
+    state of their own so two node objects for the same row are
+    interchangeable.
+    """
+
+    __slots__ = ("_tree", "_row")
+
+    # Define public scalar class attributes.
+    expanded: bool = True
+
+    def __init__(self, tree: "RAMSTKTree", row: int) -> None:
+        """Initialize a view of one tree row.
+
+        :param tree: the RAMSTKTree() the node belongs to.
+        :param row: the row of the node in the tree's index.
+        """
+        self._tree = tree
+        self._row = row
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether two node objects view the same row of a tree."""
+        return (
+            isinstance(other, RAMSTKTreeNode)
+            and other._tree is self._tree
+            and other._row == self._row
+        )
+
+    def __hash__(self) -> int:
+        """Return the hash of the node ID."""
+        return hash(self.identifier)
+
+    def __lt__(self, other: "RAMSTKTreeNode") -> bool:
+        """Order nodes by tag the same way treelib does."""
+        return self.tag < other.tag
+
+    def __repr__(self) -> str:
+        """Return the representation of the node."""
+        return f"RAMSTKTreeNode(tag={self.tag!r}, identifier={self.identifier!r})"
+
+    @property
+    def data(self) -> Any:
+        """Return the data payload of the node."""
+        return self._tree.get_data(self._row)
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        """Set the data payload of the node."""
+        self._tree.set_data(self._row, value)
+
+    @property
+    def identifier(self) -> Any:
+        """Return the ID of the node."""
+        return self._tree.index.get_id(self._row)
+
+    @property
+    def tag(self) -> Any:
+        """Return the tag of the node."""
+        return self._tree.get_tag(self._row)
+
+    @tag.setter
+    def tag(self, value: Any) -> None:
+        """Set the tag of the node."""
+        self._tree.set_tag(self._row, value)
+
+    # pylint: disable=unused-argument
+    def is_leaf(self, tree_id: Optional[str] = None) -> bool:
+        """Return whether the node has no children.
+
+        :param tree_id: unused; accepted for compatibility with treelib.
+        :return: True if the node has no children.
+        :rtype: bool
+        """
+        return not self._tree.index.has_children(self.identifier)
+
+    # pylint: disable=unused-argument
+    def is_root(self, tree_id: Optional[str] = None) -> bool:
+        """Return whether the node is the root of the tree.
+
+        :param tree_id: unused; accepted for compatibility with treelib.
+        :return: True if the node has no parent.
+        :rtype: bool
+        """
+        return self._tree.index.parent(self.identifier) is None
+
+    # pylint: disable=unused-argument
+    def predecessor(self, tree_id: Optional[str] = None) -> Optional[Any]:
+        """Return the ID of the node's parent.
+
+        :param tree_id: unused; accepted for compatibility with treelib.
+        :return: the parent ID or None for the root node.
+        :rtype: Any
+        """
+        return self._tree.index.parent(self.identifier)
+
+    # pylint: disable=unused-argument
+    def successors(self, tree_id: Optional[str] = None) -> List[Any]:
+        """Return the IDs of the node's children.
+
+        :param tree_id: unused; accepted for compatibility with treelib.
+        :return: the child IDs in the order they were added.
+        :rtype: list
+        """
+        return list(self._tree.index.children(self.identifier))
+
+
+class RAMSTKTreeNodes(Mapping[Any, RAMSTKTreeNode]):
+    """A read-only view of the nodes of a RAMSTKTree() keyed by ID.
+
+    Looking up an ID creates only that node object, so indexing the view in a
+    loop costs the same as calling get_node().  The view always reflects the
+    current contents of the tree.
+    """
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, tree: "RAMSTKTree") -> None:
+        """Initialize a view of the nodes of a tree.
+
+        :param tree: the RAMSTKTree() whose nodes are viewed.
+        """
+        self._tree = tree
+
+    def __contains__(self, node_id: object) -> bool:
+        """Return whether the node ID is in the tree."""
+        return node_id in self._tree.index
+
+    def __getitem__(self, node_id: Any) -> RAMSTKTreeNode:
+        """Return the node with the ID.
+
+        :raise: KeyError if the ID is not in the tree.
+        """
+        return RAMSTKTreeNode(self._tree, self._tree.index.get_row(node_id))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the node IDs in the order they were added."""
+        return iter(self._tree.index)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the tree."""
+        return len(self._tree.index)
+
+
+class RAMSTKTree(treelib.Tree):  # pylint: disable=too-many-public-methods
+    """A treelib Tree() stored in a RAMSTKTreeIndex().
+
+    RAMSTKTree() implements the part of the treelib Tree() API used by the
+    RAMSTK models and views so it can be used in place of a treelib Tree().
+    Tags and data payloads are stored in lists parallel to the index rows and
+    node objects are created only when requested.  Use preorder() and
+    postorder() to walk the tree by ID without creating node objects.
+    """
+
+    def __init__(self, identifier: Optional[str] = None) -> None:
+        """Initialize an empty tree.
+
+        :param identifier: the ID of the tree.  A UUID is generated if None.
+        """
+        # Initialize private list attributes.
+        self._lst_data: List[Any] = []
+        self._lst_tags: List[Any] = []
+
+        # Initialize private scalar attributes.
+        self._index: RAMSTKTreeIndex = RAMSTKTreeIndex()
+        self._nodes_view: RAMSTKTreeNodes = RAMSTKTreeNodes(self)
+
+        # Initialize public scalar attributes.
+        self.root: Optional[Any] = None
+
+        super().__init__(identifier=identifier)
+
+    def __contains__(self, identifier: Any) -> bool:
+        """Return whether the node ID is in the tree."""
+        return identifier in self._index
+
+    def __getitem__(self, key: Any) -> RAMSTKTreeNode:
+        """Return the node with the ID.
+
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        return RAMSTKTreeNode(self, self._get_row(key))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the node IDs in the order they were added."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the tree."""
+        return len(self._index)
+
+    @property
+    def _nodes(self) -> RAMSTKTreeNodes:  # type: ignore[override]
+        """Return the node objects keyed by ID for inherited treelib methods."""
+        return self.nodes
+
+    @_nodes.setter
+    def _nodes(self, value: Dict[Any, Any]) -> None:
+        """Ignore the node dict treelib assigns when the tree is initialized."""
+
+    @property
+    def index(self) -> RAMSTKTreeIndex:
+        """Return the RAMSTKTreeIndex() holding the hierarchy of the tree."""
+        return self._index
+
+    @property
+    def nodes(self) -> RAMSTKTreeNodes:  # type: ignore[override]
+        """Return a read-only view of the node objects keyed by ID.
+
+        The view isn't a copy; it iterates over the IDs in the order they were
+        added and creates a node object only when one is looked up.
+        """
+        return self._nodes_view
+
+    @classmethod
+    def from_tree(cls, tree: treelib.Tree) -> "RAMSTKTree":
+        """Create a RAMSTKTree() from a treelib Tree().
+
+        :param tree: the treelib Tree() to copy.  Node data is shared, not
+            copied.
+        :return: _tree; the new RAMSTKTree().
+        :rtype: :class:`ramstk.models.RAMSTKTree`
+        """
+        _tree = cls()
+        if tree.root is not None:
+            for _node_id in tree.expand_tree(sorting=False):
+                _node = tree.get_node(_node_id)
+                _tree.create_node(
+                    tag=_node.tag,
+                    identifier=_node_id,
+                    parent=tree.parent(_node_id).identifier
+                    if _node_id != tree.root
+                    else None,
+                    data=_node.data,
+                )
+
+        return _tree
+
+    def add_node(self, node: treelib.Node, parent: Optional[Any] = None) -> None:
+        """Add the contents of a treelib Node() to the tree.
+
+        :param node: the treelib Node() to add.
+        :param parent: the ID of the parent node.
+        :return: None
+        :rtype: None
+        """
+        self.create_node(
+            tag=node.tag,
+            identifier=node.identifier,
+            parent=parent,
+            data=node.data,
+        )
+
+    def all_nodes(self) -> List[RAMSTKTreeNode]:
+        """Return all the nodes in the order they were added.
+
+        :return: the list of nodes.
+        :rtype: list
+        """
+        return list(self.all_nodes_itr())
+
+    def all_nodes_itr(self) -> Iterator[RAMSTKTreeNode]:  # type: ignore[override]
+        """Iterate over all the nodes in the order they were added.
+
+        :return: an iterator over the nodes.
+        :rtype: iterator
+        """
+        for _row in self._index.rows():
+            yield RAMSTKTreeNode(self, _row)
+
+    def children(self, nid: Any) -> List[RAMSTKTreeNode]:
+        """Return the children of a node.
+
+        :param nid: the ID of the parent node.
+        :return: the child nodes in the order they were added.
+        :rtype: list
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        return [self[_node_id] for _node_id in self.is_branch(nid)]
+
+    def contains(self, nid: Any) -> bool:
+        """Return whether the node ID is in the tree.
+
+        :param nid: the node ID to check.
+        :return: True if the node ID is in the tree.
+        :rtype: bool
+        """
+        return nid in self._index
+
+    def create_node(  # type: ignore[override]
+        self,
+        tag: Optional[Any] = None,
+        identifier: Optional[Any] = None,
+        parent: Optional[Any] = None,
+        data: Optional[Any] = None,
+    ) -> RAMSTKTreeNode:
+        """Create a node and add it as the last child of its parent.
+
+        :param tag: the tag of the new node.  Defaults to the node ID.
+        :param identifier: the ID of the new node.  A UUID is generated if
+            None.
+        :param parent: the ID of the parent node.  Pass None to create the
+            root node.
+        :param data: the data payload of the new node.
+        :return: the new node.
+        :rtype: :class:`ramstk.models.treeindex.RAMSTKTreeNode`
+        :raise: treelib.exceptions.DuplicatedNodeIdError if the ID is already
+            in the tree.
+        :raise: treelib.exceptions.MultipleRootError if a second root node is
+            created.
+        :raise: treelib.exceptions.NodeIDAbsentError if the parent ID is not in
+            the tree.
+        """
+        if identifier is None:
+            identifier = str(uuid.uuid1())
+        if identifier in self._index:
+            raise DuplicatedNodeIdError(f"Can't create node with ID '{identifier}'")
+        if parent is None and self._index.root is not None:
+            raise MultipleRootError("A tree takes one root merely.")
+        if parent is not None and parent not in self._index:
+            raise NodeIDAbsentError(f"Parent node '{parent}' is not in the tree")
+
+        _row = self._index.add(identifier, parent)
+        _tag = identifier if tag is None else tag
+        if _row == len(self._lst_tags):
+            self._lst_tags.append(_tag)
+            self._lst_data.append(data)
+        else:
+            self._lst_tags[_row] = _tag
+            self._lst_data[_row] = data
+        self.root = self._index.root
+
+        return RAMSTKTreeNode(self, _row)
+
+    def depth(self, node: Optional[Any] = None) -> int:
+        """Return the depth of the tree or the level of a node.
+
+        :param node: the node or node ID to return the level of.  Pass None to
+            return the depth of the deepest node.
+        :return: the depth of the tree or level of the node.
+        :rtype: int
+        """
+        if node is None:
+            return self._index.depth()
+
+        return self.level(getattr(node, "identifier", node))
+
+    # pylint: disable=redefined-builtin, too-many-arguments
+    def expand_tree(  # type: ignore[override]
+        self,
+        nid: Optional[Any] = None,
+        mode: int = treelib.Tree.DEPTH,
+        filter: Optional[Callable[[RAMSTKTreeNode], bool]] = None,
+        key: Optional[Callable[[RAMSTKTreeNode], Any]] = None,
+        reverse: bool = False,
+        sorting: bool = True,
+    ) -> Iterator[Any]:
+        """Iterate over the IDs of a subtree the same way treelib does.
+
+        :param nid: the ID of the top of the subtree.  Defaults to the root.
+        :param mode: the traversal mode; DEPTH or WIDTH.
+        :param filter: a function that returns False for nodes to skip along
+            with their descendants.
+        :param key: the function used to sort siblings when sorting is True.
+        :param reverse: whether to reverse the order of sorted siblings.
+        :param sorting: whether to sort siblings.  Siblings are returned in
+            the order they were added if False.
+        :return: an iterator over the node IDs.
+        :rtype: iterator
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        :raise: ValueError if the traversal mode is not supported.
+        """
+        nid = self.root if nid is None else nid
+        if nid is None:
+            return
+        self._get_row(nid)
+
+        if mode not in [self.DEPTH, self.WIDTH]:
+            raise ValueError(f"Traversal mode '{mode}' is not supported")
+
+        if mode == self.DEPTH and filter is None and not sorting:
+            yield from self._index.preorder(nid)
+            return
+
+        if filter is not None and not filter(self[nid]):
+            return
+
+        _lst_queue = [self[nid]]
+        while _lst_queue:
+            _node = _lst_queue.pop(0)
+            yield _node.identifier
+
+            _lst_children = [
+                _child
+                for _child in self.children(_node.identifier)
+                if filter is None or filter(_child)
+            ]
+            if sorting:
+                _lst_children.sort(key=key, reverse=reverse)
+
+            if mode == self.DEPTH:
+                _lst_queue = _lst_children + _lst_queue
+            else:
+                _lst_queue.extend(_lst_children)
+
+    def get_data(self, row: int) -> Any:
+        """Return the data payload stored in a row.
+
+        :param row: the row of the node.
+        :return: the data payload of the node.
+        :rtype: Any
+        """
+        return self._lst_data[row]
+
+    def get_node(self, nid: Any) -> Optional[RAMSTKTreeNode]:
+        """Return the node with the ID.
+
+        :param nid: the ID of the node.
+        :return: the node or None if the ID is not in the tree.
+        :rtype: :class:`ramstk.models.treeindex.RAMSTKTreeNode`
+        """
+        _row = self._index.find_row(nid)
+
+        return None if _row == NO_ROW else RAMSTKTreeNode(self, _row)
+
+    def get_tag(self, row: int) -> Any:
+        """Return the tag stored in a row.
+
+        :param row: the row of the node.
+        :return: the tag of the node.
+        :rtype: Any
+        """
+        return self._lst_tags[row]
+
+    def is_branch(self, nid: Any) -> List[Any]:
+        """Return the IDs of a node's children.
+
+        :param nid: the ID of the parent node.
+        :return: the child IDs in the order they were added.
+        :rtype: list
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        self._get_row(nid)
+
+        return list(self._index.children(nid))
+
+    def leaves(self, nid: Optional[Any] = None) -> List[RAMSTKTreeNode]:
+        """Return the nodes without children in a subtree.
+
+        :param nid: the ID of the top of the subtree.  Defaults to the root.
+        :return: the leaf nodes.
+        :rtype: list
+        """
+        return [
+            self[_node_id]
+            for _node_id in self.expand_tree(nid)
+            if not self._index.has_children(_node_id)
+        ]
+
+    # pylint: disable=unused-argument
+    def level(self, nid: Any, filter: Optional[Callable] = None) -> int:
+        """Return the number of levels between a node and the root.
+
+        :param nid: the ID of the node.
+        :param filter: unused; accepted for compatibility with treelib.
+        :return: the level of the node.
+        :rtype: int
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        self._get_row(nid)
+
+        return self._index.level(nid)
+
+    def parent(self, nid: Any) -> Optional[RAMSTKTreeNode]:
+        """Return the parent of a node.
+
+        :param nid: the ID of the node.
+        :return: the parent node or None for the root node.
+        :rtype: :class:`ramstk.models.treeindex.RAMSTKTreeNode`
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        self._get_row(nid)
+        _parent_id = self._index.parent(nid)
+
+        return None if _parent_id is None else self[_parent_id]
+
+    def postorder(self, nid: Optional[Any] = None) -> Iterator[Any]:
+        """Iterate over the IDs of a subtree with children before parents.
+
+        :param nid: the ID of the top of the subtree.  Defaults to the root.
+        :return: an iterator over the node IDs.
+        :rtype: iterator
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        if nid is not None:
+            self._get_row(nid)
+
+        return self._index.postorder(nid)
+
+    def preorder(self, nid: Optional[Any] = None) -> Iterator[Any]:
+        """Iterate over the IDs of a subtree with parents before children.
+
+        :param nid: the ID of the top of the subtree.  Defaults to the root.
+        :return: an iterator over the node IDs.
+        :rtype: iterator
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        if nid is not None:
+            self._get_row(nid)
+
+        return self._index.preorder(nid)
+
+    def remove_node(self, identifier: Any) -> int:
+        """Remove a node and all of its descendants.
+
+        :param identifier: the ID of the top of the subtree to remove.
+        :return: the number of nodes removed.
+        :rtype: int
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        self._get_row(identifier)
+
+        _lst_rows = [
+            self._index.get_row(_node_id)
+            for _node_id in self._index.postorder(identifier)
+        ]
+        self._index.remove(identifier)
+        for _row in _lst_rows:
+            self._lst_tags[_row] = None
+            self._lst_data[_row] = None
+        self.root = self._index.root
+
+        return len(_lst_rows)
+
+    def set_data(self, row: int, value: Any) -> None:
+        """Store the data payload of the node in a row.
+
+        :param row: the row of the node.
+        :param value: the data payload to store.
+        :return: None
+        :rtype: None
+        """
+        self._lst_data[row] = value
+
+    def set_tag(self, row: int, value: Any) -> None:
+        """Store the tag of the node in a row.
+
+        :param row: the row of the node.
+        :param value: the tag to store.
+        :return: None
+        :rtype: None
+        """
+        self._lst_tags[row] = value
+
+    def siblings(self, nid: Any) -> List[RAMSTKTreeNode]:
+        """Return the other children of a node's parent.
+
+        :param nid: the ID of the node.
+        :return: the sibling nodes.
+        :rtype: list
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        _parent = self.parent(nid)
+        if _parent is None:
+            return []
+
+        return [
+            self[_node_id]
+            for _node_id in self._index.children(_parent.identifier)
+            if _node_id != nid
+        ]
+
+    # pylint: disable=unused-argument
+    def size(self, level: Optional[int] = None) -> int:
+        """Return the number of nodes in the tree or at one level.
+
+        :param level: the level to count the nodes of.  Counts all nodes if
+            None.
+        :return: the number of nodes.
+        :rtype: int
+        """
+        if level is None:
+            return len(self._index)
+
+        return sum(
+            1
+            for _node_id in self._index.preorder()
+            if self._index.level(_node_id) == level
+        )
+
+    def _get_row(self, nid: Any) -> int:
+        """Return the row of a node, raising the treelib error if it is absent.
+
+        :param nid: the ID of the node.
+        :return: the row of the node.
+        :rtype: int
+        :raise: treelib.exceptions.NodeIDAbsentError if the ID is not in the
+            tree.
+        """
+        try:
+            return self._index.get_row(nid)
+        except KeyError as _error:
+            raise NodeIDAbsentError(f"Node '{nid}' is not in the tree") from _error
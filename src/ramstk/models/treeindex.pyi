@@ -0,0 +1,130 @@
+# Standard Library Imports
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+# Third Party Imports
+import treelib
+
+NO_ROW: int
+
+class RAMSTKTreeIndex:
+    _dic_rows: Dict[Any, int]
+    _lst_free: List[int]
+    _lst_ids: List[Any]
+    _parent: array
+    _first_child: array
+    _last_child: array
+    _next_sibling: array
+    _prev_sibling: array
+    root: Optional[Any]
+    def __init__(self) -> None: ...
+    def __contains__(self, node_id: Any) -> bool: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __len__(self) -> int: ...
+    def add(self, node_id: Any, parent_id: Optional[Any] = ...) -> int: ...
+    def children(self, node_id: Any) -> Iterator[Any]: ...
+    def depth(self) -> int: ...
+    def find_row(self, node_id: Any) -> int: ...
+    def get_id(self, row: int) -> Any: ...
+    def get_row(self, node_id: Any) -> int: ...
+    def has_children(self, node_id: Any) -> bool: ...
+    def level(self, node_id: Any) -> int: ...
+    def parent(self, node_id: Any) -> Optional[Any]: ...
+    def postorder(self, node_id: Optional[Any] = ...) -> Iterator[Any]: ...
+    def preorder(self, node_id: Optional[Any] = ...) -> Iterator[Any]: ...
+    def remove(self, node_id: Any) -> List[Any]: ...
+    def rows(self) -> Iterator[int]: ...
+    def _do_descend(self, row: int) -> int: ...
+    def _get_start_row(self, node_id: Optional[Any]) -> int: ...
+
+class RAMSTKTreeNode:
+    expanded: bool
+    _tree: RAMSTKTree
+    _row: int
+    def __init__(self, tree: RAMSTKTree, row: int) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __lt__(self, other: RAMSTKTreeNode) -> bool: ...
+    @property
+    def data(self) -> Any: ...
+    @data.setter
+    def data(self, value: Any) -> None: ...
+    @property
+    def identifier(self) -> Any: ...
+    @property
+    def tag(self) -> Any: ...
+    @tag.setter
+    def tag(self, value: Any) -> None: ...
+    def is_leaf(self, tree_id: Optional[str] = ...) -> bool: ...
+    def is_root(self, tree_id: Optional[str] = ...) -> bool: ...
+    def predecessor(self, tree_id: Optional[str] = ...) -> Optional[Any]: ...
+    def successors(self, tree_id: Optional[str] = ...) -> List[Any]: ...
+
+class RAMSTKTreeNodes(Mapping[Any, RAMSTKTreeNode]):
+    _tree: RAMSTKTree
+    def __init__(self, tree: RAMSTKTree) -> None: ...
+    def __contains__(self, node_id: object) -> bool: ...
+    def __getitem__(self, node_id: Any) -> RAMSTKTreeNode: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __len__(self) -> int: ...
+
+class RAMSTKTree(treelib.Tree):
+    _lst_data: List[Any]
+    _lst_tags: List[Any]
+    _index: RAMSTKTreeIndex
+    _nodes_view: RAMSTKTreeNodes
+    root: Optional[Any]
+    def __init__(self, identifier: Optional[str] = ...) -> None: ...
+    def __contains__(self, identifier: Any) -> bool: ...
+    def __getitem__(self, key: Any) -> RAMSTKTreeNode: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __len__(self) -> int: ...
+    @property
+    def index(self) -> RAMSTKTreeIndex: ...
+    @property
+    def nodes(self) -> RAMSTKTreeNodes: ...  # type: ignore[override]
+    @classmethod
+    def from_tree(cls, tree: treelib.Tree) -> RAMSTKTree: ...
+    def add_node(self, node: treelib.Node, parent: Optional[Any] = ...) -> None: ...
+    def all_nodes(self) -> List[RAMSTKTreeNode]: ...  # type: ignore[override]
+    def all_nodes_itr(self) -> Iterator[RAMSTKTreeNode]: ...  # type: ignore[override]
+    def children(self, nid: Any) -> List[RAMSTKTreeNode]: ...  # type: ignore[override]
+    def contains(self, nid: Any) -> bool: ...
+    def create_node(  # type: ignore[override]
+        self,
+        tag: Optional[Any] = ...,
+        identifier: Optional[Any] = ...,
+        parent: Optional[Any] = ...,
+        data: Optional[Any] = ...,
+    ) -> RAMSTKTreeNode: ...
+    def depth(self, node: Optional[Any] = ...) -> int: ...
+    def expand_tree(  # type: ignore[override]
+        self,
+        nid: Optional[Any] = ...,
+        mode: int = ...,
+        filter: Optional[Callable[[RAMSTKTreeNode], bool]] = ...,
+        key: Optional[Callable[[RAMSTKTreeNode], Any]] = ...,
+        reverse: bool = ...,
+        sorting: bool = ...,
+    ) -> Iterator[Any]: ...
+    def get_data(self, row: int) -> Any: ...
+    def get_node(  # type: ignore[override]
+        self, nid: Any
+    ) -> Optional[RAMSTKTreeNode]: ...
+    def get_tag(self, row: int) -> Any: ...
+    def is_branch(self, nid: Any) -> List[Any]: ...
+    def leaves(  # type: ignore[override]
+        self, nid: Optional[Any] = ...
+    ) -> List[RAMSTKTreeNode]: ...
+    def level(self, nid: Any, filter: Optional[Callable] = ...) -> int: ...
+    def parent(  # type: ignore[override]
+        self, nid: Any
+    ) -> Optional[RAMSTKTreeNode]: ...
+    def postorder(self, nid: Optional[Any] = ...) -> Iterator[Any]: ...
+    def preorder(self, nid: Optional[Any] = ...) -> Iterator[Any]: ...
+    def remove_node(self, identifier: Any) -> int: ...
+    def set_data(self, row: int, value: Any) -> None: ...
+    def set_tag(self, row: int, value: Any) -> None: ...
+    def siblings(self, nid: Any) -> List[RAMSTKTreeNode]: ...  # type: ignore[override]
+    def size(self, level: Optional[int] = ...) -> int: ...
+    def _get_row(self, nid: Any) -> int: ...
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.tasks.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTK Background Task Queue.
+
+Long operations are submitted to a RAMSTKTaskQueue and run on its worker
+threads so the thread that submitted them (the GTK main loop) isn't blocked.
+Progress and completion callbacks are passed to the queue's dispatch function
+to run on the submitting thread; the GUI uses GLib.idle_add().
+
+Tasks submitted with the same key run one at a time in the order they were
+submitted.  Use the name of the database table a task writes to as its key
+so conflicting writes to the same table are serialized.
+"""
+
+# Standard Library Imports
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+def do_call_now(callback: Callable[..., Any], *args: Any) -> bool:
+    """Call the callback immediately on the current thread.
+
+    This is the default dispatch function for a RAMSTKTaskQueue.  It has the
+    same signature as GLib.idle_add() so the two are interchangeable.
+
+    :param callback: the function to call.
+    :param args: the arguments to pass to the callback.
+    :return: False so an idle callback isn't repeated.
+    :rtype: bool
+    """
+    callback(*args)
+
+    return False
+
+
+class RAMSTKTask:
+    """A unit of work to run on a RAMSTKTaskQueue worker thread.
+
+    The work function is passed the task as its only argument so it can
+    report progress and check whether it has been cancelled.  Cancellation is
+    cooperative; a running task stops only if its work function checks the
+    cancelled attribute.
+
+    :ivar error: the exception raised by the work function, if any.
+    :ivar key: the key used to serialize this task with other tasks.
+    :ivar message: the most recent progress message.
+    :ivar name: the name of the task to display to the user.
+    :ivar progress: the most recent progress fraction between 0.0 and 1.0.
+    :ivar result: the value returned by the work function.
+    :ivar status: one of pending, running, done, failed, or cancelled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[["RAMSTKTask"], Any],
+        key: str = "",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize a RAMSTKTask instance.
+
+        :param name: the name of the task to display to the user.
+        :param func: the work function; it is passed this task.
+        :param key: the key used to serialize this task with other tasks.
+        :keyword dispatch: the function used to run the callbacks on the
+            submitting thread.  Defaults to do_call_now().
+        :keyword on_done: the function to call with this task when it is
+            finished, whether it succeeded, failed, or was cancelled.
+        :keyword on_progress: the function to call with this task when it
+            reports progress.
+        """
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+        self._cancel_event: threading.Event = threading.Event()
+        self._dispatch: Callable[..., Any] = kwargs.get("dispatch", do_call_now)
+        self._func: Callable[["RAMSTKTask"], Any] = func
+        self._on_done: Optional[Callable[["RAMSTKTask"], Any]] = kwargs.get(
+            "on_done", None
+        )
+        self._on_progress: Optional[Callable[["RAMSTKTask"], Any]] = kwargs.get(
+            "on_progress", None
+        )
+
+        # Initialize public dictionary attributes.
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+        self.error: Optional[Exception] = None
+        self.key: str = key
+        self.message: str = ""
+        self.name: str = name
+        self.progress: float = 0.0
+        self.result: Any = None
+        self.status: str = "pending"
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether or not the task has been cancelled.
+
+        :return: True if cancel() has been called.
+        :rtype: bool
+        """
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Request the task be cancelled.
+
+        A pending task won't run.  A running task stops the next time its
+        work function checks the cancelled attribute.
+
+        :return: None
+        :rtype: None
+        """
+        self._cancel_event.set()
+
+    def do_report_progress(self, progress: float, message: str = "") -> None:
+        """Report the progress of the task.
+
+        This is called by the work function on the worker thread.  The
+        on_progress callback is dispatched to the submitting thread.
+
+        :param progress: the fraction of the task completed.
+        :param message: a description of what the task is doing.
+        :return: None
+        :rtype: None
+        """
+        self.progress = progress
+        self.message = message
+
+        if self._on_progress is not None:
+            self._dispatch(self._do_callback, self._on_progress)
+
+    def do_run(self) -> None:
+        """Run the work function and dispatch the on_done callback.
+
+        :return: None
+        :rtype: None
+        """
+        if not self.cancelled:
+            self.status = "running"
+            try:
+                self.result = self._func(self)
+                self.status = "done"
+            except Exception as _error:  # pylint: disable=broad-except
+                self.error = _error
+                self.status = "failed"
+
+        if self.cancelled and self.status != "failed":
+            self.status = "cancelled"
+
+        if self._on_done is not None:
+            self._dispatch(self._do_callback, self._on_done)
+
+    def _do_callback(self, callback: Callable[["RAMSTKTask"], Any]) -> bool:
+        """Call a callback with this task.
+
+        :param callback: the on_done or on_progress callback.
+        :return: False so an idle callback isn't repeated.
+        :rtype: bool
+        """
+        callback(self)
+
+        return False
+
+
+class RAMSTKTaskQueue:
+    """Run RAMSTKTasks on a pool of worker threads.
+
+    Tasks with different keys may run at the same time.  Tasks with the same
+    key wait for the one before them to finish.  Each worker thread has its
+    own database session because the DAO sessions are thread-local.
+    """
+
+    def __init__(
+        self, dispatch: Callable[..., Any] = do_call_now, max_workers: int = 4
+    ) -> None:
+        """Initialize a RAMSTKTaskQueue instance.
+
+        :param dispatch: the function used to run task callbacks on the
+            submitting thread.  Pass GLib.idle_add() when running the GUI.
+        :param max_workers: the maximum number of worker threads.
+        """
+        # Initialize private dictionary attributes.
+        # Key is the task key, value is the tasks with that key waiting for
+        # the running task with that key to finish.
+        self._dic_pending: Dict[str, Deque[RAMSTKTask]] = {}
+        self._dic_running: Dict[str, RAMSTKTask] = {}
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ramstk-task"
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._idle: threading.Condition = threading.Condition(self._lock)
+
+        # Initialize public dictionary attributes.
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+        self.dispatch: Callable[..., Any] = dispatch
+
+    @property
+    def active(self) -> List[RAMSTKTask]:
+        """Return the running and pending tasks.
+
+        :return: the running tasks followed by the pending tasks.
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._dic_running.values()) + [
+                _task for _tasks in self._dic_pending.values() for _task in _tasks
+            ]
+
+    def do_cancel_all(self) -> None:
+        """Cancel every running and pending task.
+
+        :return: None
+        :rtype: None
+        """
+        for _task in self.active:
+            _task.cancel()
+
+    def do_wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every running and pending task to finish.
+
+        Tasks can still be submitted while waiting.  The dispatched callbacks
+        of the finished tasks may not have run when this returns.
+
+        :param timeout: the maximum number of seconds to wait.  Defaults to
+            waiting until the tasks are finished.
+        :return: True if the tasks finished, False if the wait timed out.
+        :rtype: bool
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._dic_running, timeout)
+
+    def do_shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads once the submitted tasks are finished.
+
+        :param wait: whether or not to wait for the tasks to finish.
+        :return: None
+        :rtype: None
+        """
+        self._executor.shutdown(wait=wait)
+
+    def do_submit(
+        self,
+        name: str,
+        func: Callable[[RAMSTKTask], Any],
+        key: str = "",
+        **kwargs: Any,
+    ) -> RAMSTKTask:
+        """Submit a task to run on a worker thread.
+
+        :param name: the name of the task to display to the user.
+        :param func: the work function; it is passed the task.
+        :param key: the key used to serialize the task with other tasks.  A
+            task without a key isn't serialized with any other task.
+        :keyword on_done: the function to call with the task when it is
+            finished.
+        :keyword on_progress: the function to call with the task when it
+            reports progress.
+        :return: the submitted task.
+        :rtype: :class:`ramstk.tasks.RAMSTKTask`
+        """
+        _task = RAMSTKTask(name, func, key, dispatch=self.dispatch, **kwargs)
+        _key = key or str(id(_task))
+
+        with self._lock:
+            if _key in self._dic_running:
+                self._dic_pending.setdefault(_key, deque()).append(_task)
+                return _task
+            self._dic_running[_key] = _task
+
+        self._executor.submit(self._do_run, _key, _task)
+
+        return _task
+
+    def _do_run(self, key: str, task: RAMSTKTask) -> None:
+        """Run a task and then start the next task with the same key.
+
+        :param key: the key the task is serialized by.
+        :param task: the task to run.
+        :return: None
+        :rtype: None
+        """
+        while task is not None:
+            task.do_run()
+
+            with self._lock:
+                try:
+                    task = self._dic_pending[key].popleft()
+                    self._dic_running[key] = task
+                    if not self._dic_pending[key]:
+                        del self._dic_pending[key]
+                except KeyError:
+                    del self._dic_running[key]
+                    task = None  # type: ignore
+                    if not self._dic_running:
+                        self._idle.notify_all()
@@ -0,0 +1,57 @@
+# Standard Library Imports
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+def do_call_now(callback: Callable[..., Any], *args: Any) -> bool: ...
+
+class RAMSTKTask:
+    _cancel_event: threading.Event
+    _dispatch: Callable[..., Any]
+    _func: Callable[[RAMSTKTask], Any]
+    _on_done: Optional[Callable[[RAMSTKTask], Any]]
+    _on_progress: Optional[Callable[[RAMSTKTask], Any]]
+    error: Optional[Exception]
+    key: str
+    message: str
+    name: str
+    progress: float
+    result: Any
+    status: str
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[RAMSTKTask], Any],
+        key: str = ...,
+        **kwargs: Any,
+    ) -> None: ...
+    @property
+    def cancelled(self) -> bool: ...
+    def cancel(self) -> None: ...
+    def do_report_progress(self, progress: float, message: str = ...) -> None: ...
+    def do_run(self) -> None: ...
+    def _do_callback(self, callback: Callable[[RAMSTKTask], Any]) -> bool: ...
+
+class RAMSTKTaskQueue:
+    _dic_pending: Dict[str, Deque[RAMSTKTask]]
+    _dic_running: Dict[str, RAMSTKTask]
+    _executor: ThreadPoolExecutor
+    _lock: threading.Lock
+    _idle: threading.Condition
+    dispatch: Callable[..., Any]
+    def __init__(
+        self, dispatch: Callable[..., Any] = ..., max_workers: int = ...
+    ) -> None: ...
+    @property
+    def active(self) -> List[RAMSTKTask]: ...
+    def do_cancel_all(self) -> None: ...
+    def do_wait(self, timeout: Optional[float] = ...) -> bool: ...
+    def do_shutdown(self, wait: bool = ...) -> None: ...
+    def do_submit(
+        self,
+        name: str,
+        func: Callable[[RAMSTKTask], Any],
+        key: str = ...,
+        **kwargs: Any,
+    ) -> RAMSTKTask: ...
+    def _do_run(self, key: str, task: RAMSTKTask) -> None: ...
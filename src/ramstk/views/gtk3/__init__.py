@@ -19,7 +19,7 @@ try:
 except ImportError:
     print("Failed to import package gi; exiting.")
     sys.exit(1)
-from gi.repository import Gdk, GdkPixbuf, GObject, Gtk, Pango  # isort:skip
+from gi.repository import Gdk, GdkPixbuf, GLib, GObject, Gtk, Pango  # isort:skip
 
 _ = gettext.gettext  # isort:skip
 
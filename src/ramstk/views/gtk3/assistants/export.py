@@ -54,9 +54,6 @@ class ExportProject(RAMSTKFileChooser):
 
         self.set_current_folder(self.RAMSTK_USER_CONFIGURATION.RAMSTK_PROG_DIR)
 
-        for _module in ["functions", "requirements", "hardwares", "validations"]:
-            pub.sendMessage("request_get_{0}_tree".format(_module))
-
         self._do_select_file()
 
     def _do_quit(self) -> None:
@@ -79,6 +76,8 @@ class ExportProject(RAMSTKFileChooser):
         if _filename is not None:
             _filetype = {
                 ".csv": "csv",
+                ".feather": "feather",
+                ".parquet": "parquet",
                 ".txt": "text",
                 ".xls": "excel",
                 ".xlsm": "excel",
@@ -50,6 +50,8 @@ class ImportProject(Gtk.Assistant):
         self._filechooser: Gtk.FileChooserButton = Gtk.FileChooserButton(
             action=Gtk.FileChooserAction.OPEN
         )
+        self._file_name: str = ""
+        self._file_type: str = ""
         self._module: str = ""
         self.tvwFieldMap: Gtk.TreeView = Gtk.TreeView()
 
@@ -137,13 +139,18 @@ class ImportProject(Gtk.Assistant):
     def _do_request_import(self, __assistant: Gtk.Assistant) -> None:
         """Request the data controller import new records.
 
+        The records are read from the selected file and inserted in chunks so
+        large files don't have to be held in memory.
+
         :param __assistant: this Gtk.Assistant() instance.
         :return: None
         :rtype: None
         """
         pub.sendMessage(
-            "request_import",
+            "request_import_file",
             module=self._module,
+            file_type=self._file_type,
+            file_name=self._file_name,
         )
 
     def _do_select_file(self, filechooser: Gtk.FileChooser) -> None:
@@ -168,6 +175,8 @@ class ImportProject(Gtk.Assistant):
             _file_type = "excel"
 
         if _file is not None:
+            self._file_name = _file
+            self._file_type = _file_type
             pub.sendMessage(
                 "request_read_import_file", file_type=_file_type, file_name=_file
             )
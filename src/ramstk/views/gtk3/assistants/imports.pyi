@@ -13,6 +13,8 @@ class ImportProject(Gtk.Assistant):
     RAMSTK_USER_CONFIGURATION: Any = ...
     cmbSelectModule: Any = ...
     _filechooser: Any = ...
+    _file_name: str = ...
+    _file_type: str = ...
     _module: str = ...
     tvwFieldMap: Any = ...
     def __init__(
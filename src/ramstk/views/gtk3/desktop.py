@@ -149,6 +149,8 @@ class RAMSTKDesktop(Gtk.Window):
         pub.subscribe(self._on_request_open, "request_open_program ")
         pub.subscribe(self._on_select, "request_set_title")
         pub.subscribe(self._do_set_status, "request_set_status")
+        pub.subscribe(self._do_set_progress, "request_set_progress")
+        pub.subscribe(self._on_save_project, "succeed_save_project")
 
     def _do_request_options_assistant(self, __widget: Gtk.ImageMenuItem) -> None:
         """Request the EditOptions assistant be launched.
@@ -490,10 +492,26 @@ class RAMSTKDesktop(Gtk.Window):
         )
         self.statusbar.push(2, _message)
 
-        pub.sendMessage("request_save_project")
-
         if end:
+            # Stop the background saves and wait for any table that's being
+            # written so an older copy of its records isn't written over this
+            # save.  Then save in the foreground so every table is written
+            # before quitting.
+            pub.sendMessage("request_cancel_tasks", wait=True)
+            pub.sendMessage("request_save_project")
             destroy(widget)
+        else:
+            self.progressbar.set_fraction(0.0)
+            pub.sendMessage("request_save_project_in_background")
+
+    def _do_set_progress(self, progress: float) -> None:
+        """Set the fraction of the progress bar.
+
+        :param progress: the fraction of the current operation completed.
+        :return: None
+        :rtype: None
+        """
+        self.progressbar.set_fraction(progress)
 
     def _do_set_status(self, status: str) -> None:
         """Set the status message.
@@ -575,6 +593,15 @@ class RAMSTKDesktop(Gtk.Window):
             )
         )
 
+    def _on_save_project(self) -> None:
+        """Clear the saving status message once the program is saved.
+
+        :return: None
+        :rtype: None
+        """
+        self.statusbar.pop(2)
+        self.progressbar.set_fraction(0.0)
+
     def _on_select(self, title: str) -> None:
         """Respond to load the Work View Gtk.Notebook() widgets.
 
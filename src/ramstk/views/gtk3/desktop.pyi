@@ -65,10 +65,12 @@ class RAMSTKDesktop(Gtk.Window):
     @staticmethod
     def _do_request_close_project(__widget: Gtk.Widget) -> None: ...
     def _do_request_save_project(self, widget: Gtk.Widget, end: bool = ...) -> None: ...
+    def _do_set_progress(self, progress: float) -> None: ...
     def _do_set_status(self, status: str) -> None: ...
     def _do_set_status_icon(self, connected: bool = ...) -> None: ...
     def _on_button_press(self, __book: object, event: Gdk.EventButton) -> None: ...
     def _on_request_open(self) -> None: ...
+    def _on_save_project(self) -> None: ...
     def _on_select(self, title: str) -> None: ...
     @staticmethod
     def _on_window_state_event(
@@ -105,6 +105,8 @@ class HazardsWorkView(RAMSTKWorkView):
         self.__make_ui()
 
         # Subscribe to PyPubSub messages.
+        pub.subscribe(super().do_set_cursor_active_on_fail, "fail_calculate_fha")
+
         pub.subscribe(self._do_set_record_id, "selected_hazard")
         pub.subscribe(self._on_select_function, "selected_function")
 
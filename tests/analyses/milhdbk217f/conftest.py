@@ -0,0 +1,97 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.conftest.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Fixtures for the MIL-HDBK-217F batch and Monte Carlo tests."""
+
+# Standard Library Imports
+import copy
+
+# Third Party Imports
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import batch
+
+ATTRIBUTES = {
+    "hardware_id": 12,
+    "category_id": 4,
+    "subcategory_id": 1,
+    "application_id": 1,
+    "area": 1.5,
+    "capacitance": 0.0000033,
+    "configuration_id": 1,
+    "construction_id": 1,
+    "contact_form_id": 1,
+    "contact_gauge": 20,
+    "contact_rating_id": 1,
+    "current_operating": 0.14,
+    "current_rated": 0.5,
+    "current_ratio": 0.28,
+    "duty_cycle": 100.0,
+    "environment_active_id": 3,
+    "family_id": 1,
+    "feature_size": 1.5,
+    "frequency_operating": 1.5,
+    "hazard_rate_method_id": 2,
+    "insert_id": 1,
+    "insulation_id": 1,
+    "matching_id": 1,
+    "n_active_pins": 14,
+    "n_circuit_planes": 3,
+    "n_cycles": 32,
+    "n_elements": 8,
+    "n_hand_soldered": 5,
+    "n_wave_soldered": 138,
+    "package_id": 1,
+    "power_operating": 0.5,
+    "power_rated": 0.75,
+    "power_ratio": 0.67,
+    "quality_id": 2,
+    "resistance": 22000.0,
+    "specification_id": 1,
+    "technology_id": 1,
+    "temperature_active": 45.0,
+    "temperature_case": 38.2,
+    "temperature_rated_max": 105.0,
+    "temperature_rise": 10.0,
+    "theta_jc": 12.0,
+    "type_id": 1,
+    "voltage_ac_operating": 0.04,
+    "voltage_dc_operating": 3.3,
+    "voltage_rated": 12.0,
+    "voltage_ratio": 0.54,
+    "weight": 0.5,
+    "years_in_production": 3,
+    "hazard_rate_active": 0.0,
+    "lambda_b": 0.0,
+    "piE": 2.0,
+    "piQ": 1.0,
+}
+
+
+@pytest.fixture(scope="function")
+def test_attributes():
+    """Get a copy of the attributes of a nominal part."""
+    yield copy.deepcopy(ATTRIBUTES)
+
+
+@pytest.fixture(scope="function")
+def make_parts():
+    """Get a function that builds a parts array from a list of attribute dicts."""
+
+    def _make_parts(parts):
+        return batch.do_make_parts_array(
+            {
+                _field: [_part[_field] for _part in parts]
+                for _field in ATTRIBUTES
+                if _field in batch.PART_DTYPE.names
+            },
+            len(parts),
+        )
+
+    yield _make_parts
@@ -0,0 +1,183 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.test_batch.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the MIL-HDBK-217F batch calculation module."""
+
+# Standard Library Imports
+import copy
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import batch, milhdbk217f
+
+
+def _predict_one(part):
+    """Predict the hazard rate of one part with the single part functions."""
+    if part["hazard_rate_method_id"] == 1:
+        return milhdbk217f._do_calculate_part_count(**copy.deepcopy(part))[
+            "hazard_rate_active"
+        ]
+
+    return milhdbk217f._do_calculate_part_stress(**copy.deepcopy(part))[
+        "hazard_rate_active"
+    ]
+
+
+def _make_variants(attributes, category_id, subcategories):
+    """Build a list of attribute dicts covering subcategories and stresses."""
+    _parts = []
+    for _subcategory_id in subcategories:
+        for _resistance, _voltage_ratio, _power_ratio in [
+            (80.0, 0.15, 0.1),
+            (22000.0, 0.54, 0.45),
+            (3.3e6, 0.95, 0.9),
+        ]:
+            _part = copy.deepcopy(attributes)
+            _part["category_id"] = category_id
+            _part["subcategory_id"] = _subcategory_id
+            _part["resistance"] = _resistance
+            _part["voltage_ratio"] = _voltage_ratio
+            _part["power_ratio"] = _power_ratio
+            _parts.append(_part)
+
+    return _parts
+
+
+@pytest.mark.unit
+def test_make_parts_array():
+    """do_make_parts_array() should return a structured array of parts."""
+    _parts = batch.do_make_parts_array(
+        {"hardware_id": [1, 2], "resistance": [10.0, 20.0], "not_a_field": [1, 2]}, 2
+    )
+
+    assert isinstance(_parts, np.ndarray)
+    assert _parts.dtype == batch.PART_DTYPE
+    assert _parts["hardware_id"].tolist() == [1, 2]
+    assert _parts["resistance"].tolist() == [10.0, 20.0]
+    assert _parts["capacitance"].tolist() == [0.0, 0.0]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_predict_resistor_part_stress(test_attributes, make_parts):
+    """do_predict_active_hazard_rate() should return the same hazard rates as the
+    single part calculation for resistors."""
+    _parts = _make_variants(
+        test_attributes, 3, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+    )
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    assert _hazard_rates == pytest.approx([_predict_one(_part) for _part in _parts])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_predict_capacitor_part_stress(test_attributes, make_parts):
+    """do_predict_active_hazard_rate() should return the same hazard rates as the
+    single part calculation for capacitors."""
+    _parts = _make_variants(test_attributes, 4, list(range(1, 20)))
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    assert _hazard_rates == pytest.approx([_predict_one(_part) for _part in _parts])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_predict_other_part_stress(test_attributes, make_parts):
+    """do_predict_active_hazard_rate() should fall back to the single part
+    calculation for categories without a batch model."""
+    _parts = _make_variants(test_attributes, 7, [1, 2]) + _make_variants(
+        test_attributes, 9, [1, 2]
+    )
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    assert _hazard_rates == pytest.approx([_predict_one(_part) for _part in _parts])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("category_id", [1, 3, 4, 5, 6, 7, 8, 9, 10])
+def test_predict_part_count(test_attributes, make_parts, category_id):
+    """do_predict_active_hazard_rate() should return the same hazard rates as the
+    single part calculation for the parts count method."""
+    _parts = _make_variants(test_attributes, category_id, [1, 2])
+    for _idx, _part in enumerate(_parts):
+        _part["hazard_rate_method_id"] = 1
+        _part["environment_active_id"] = _idx % 3 + 1
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    assert _hazard_rates == pytest.approx([_predict_one(_part) for _part in _parts])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("category_id", [3, 4, 5, 6, 7, 8, 9, 10])
+def test_predict_part_count_tables(test_attributes, make_parts, category_id):
+    """do_predict_active_hazard_rate() should return the same parts count hazard
+    rates from the compiled tables as the single part calculation."""
+    _parts = []
+    for _subcategory_id in range(1, 20):
+        for _type_id in [1, 2, 3]:
+            for _environment_id in [1, 7, 14]:
+                _part = copy.deepcopy(test_attributes)
+                _part["category_id"] = category_id
+                _part["subcategory_id"] = _subcategory_id
+                _part["hazard_rate_method_id"] = 1
+                _part["environment_active_id"] = _environment_id
+                _part["application_id"] = _type_id
+                _part["construction_id"] = _type_id
+                _part["family_id"] = _type_id
+                _part["specification_id"] = _type_id
+                _part["type_id"] = _type_id
+                _parts.append(_part)
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    for _hazard_rate, _part in zip(_hazard_rates, _parts):
+        try:
+            _expected = _predict_one(_part)
+        except (IndexError, KeyError, TypeError):
+            _expected = np.nan
+        assert _hazard_rate == pytest.approx(_expected, nan_ok=True)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_predict_not_217f(test_attributes, make_parts):
+    """do_predict_active_hazard_rate() should return the current hazard rate for
+    parts not using a MIL-HDBK-217F method."""
+    _part = copy.deepcopy(test_attributes)
+    _part["hazard_rate_method_id"] = 3
+    _part["hazard_rate_active"] = 0.0007829
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts([_part]))
+
+    assert _hazard_rates.tolist() == [0.0007829]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_predict_failed_parts(test_attributes, make_parts):
+    """do_predict_active_hazard_rate() should return nan for parts that can't be
+    calculated without affecting the rest of the batch."""
+    _parts = _make_variants(test_attributes, 3, [1])
+    _parts[1]["subcategory_id"] = 42
+    _parts[2]["quality_id"] = 12
+
+    _hazard_rates = batch.do_predict_active_hazard_rate(make_parts(_parts))
+
+    assert _hazard_rates[0] == pytest.approx(_predict_one(_parts[0]))
+    assert np.isnan(_hazard_rates[1])
+    assert np.isnan(_hazard_rates[2])
@@ -790,3 +790,34 @@ def test_do_calculate_active_hazard_rate_zero_input():
     pub.subscribe(on_message, "fail_predict_reliability")
 
     milhdbk217f.do_predict_active_hazard_rate(**ATTRIBUTES)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("category_id", [3, 4])
+def test_do_calculate_part_count(category_id):
+    """do_calculate_part_count() should return the component attribute dict with
+    the parts count active hazard rate."""
+    _attributes = ATTRIBUTES.copy()
+    _attributes["category_id"] = category_id
+    _attributes["subcategory_id"] = 1
+
+    assert (
+        milhdbk217f.do_calculate_part_count(**_attributes)["hazard_rate_active"]
+        == milhdbk217f._do_calculate_part_count(**_attributes)["hazard_rate_active"]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_part_stress_zero_input():
+    """do_calculate_part_stress() should raise a ZeroDivisionError rather than
+    broadcast a failure message when passed an input equal to 0.0."""
+    _attributes = ATTRIBUTES.copy()
+    _attributes["category_id"] = 4
+    _attributes["subcategory_id"] = 12
+    _attributes["voltage_ac_operating"] = 0.0
+    _attributes["voltage_dc_operating"] = 0.0
+
+    with pytest.raises(ZeroDivisionError):
+        milhdbk217f.do_calculate_part_stress(**_attributes)
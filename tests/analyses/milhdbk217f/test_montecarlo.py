@@ -0,0 +1,183 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.test_montecarlo.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the MIL-HDBK-217F Monte Carlo uncertainty module."""
+
+# Standard Library Imports
+import copy
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import batch, montecarlo
+
+# An assembly (row 0) with a sub-assembly (row 1) of a resistor and a capacitor
+# and two more capacitors (row 4).
+PARENTS = [-1, 0, 1, 1, 0]
+QUANTITY = [1, 2, 1, 1, 3]
+
+
+@pytest.fixture
+def test_parts(test_attributes, make_parts):
+    """Build a parts array for a small hardware tree."""
+    _parts = []
+    for _category_id in [4, 4, 3, 4, 4]:
+        _part = copy.deepcopy(test_attributes)
+        _part["category_id"] = _category_id
+        _parts.append(_part)
+
+    yield make_parts(_parts)
+
+
+@pytest.mark.unit
+def test_get_depths():
+    """_get_depths() should return the number of ancestors of each item."""
+    assert montecarlo._get_depths(np.array(PARENTS)).tolist() == [0, 1, 2, 2, 1]
+    assert montecarlo._get_depths(np.array([-1, -1])).tolist() == [0, 0]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_roll_up():
+    """_do_roll_up() should sum the children of each item times its quantity and
+    ignore the values of items with children."""
+    _totals = montecarlo._do_roll_up(
+        np.array([[9.0, 9.0, 1.0, 2.0, 3.0]]),
+        np.array(PARENTS),
+        np.array(QUANTITY, dtype=float),
+    )
+
+    assert _totals.tolist() == [[15.0, 6.0, 1.0, 2.0, 9.0]]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_sample_parts(test_parts):
+    """do_sample_parts() should draw samples of only the uncertain attributes."""
+    _samples = montecarlo.do_sample_parts(
+        test_parts,
+        {
+            "temperature_active": ("normal", 5.0),
+            "voltage_ratio": ("uniform", -0.1, 0.1),
+            "hazard_rate_active": ("lognormal", 0.5),
+        },
+        2000,
+        np.random.default_rng(0),
+    )
+
+    assert _samples.shape == (2000, 5)
+    assert _samples["temperature_active"].mean() == pytest.approx(45.0, abs=0.5)
+    assert _samples["temperature_active"].std() == pytest.approx(5.0, rel=0.1)
+    assert _samples["voltage_ratio"].min() >= 0.44
+    assert _samples["voltage_ratio"].max() <= 0.64
+    assert (_samples["power_ratio"] == 0.67).all()
+    assert (_samples["category_id"] == test_parts["category_id"]).all()
+
+
+@pytest.mark.unit
+def test_do_sample_parts_unknown(test_parts):
+    """do_sample_parts() should raise a KeyError for an unknown distribution or an
+    attribute that isn't real-valued."""
+    with pytest.raises(KeyError):
+        montecarlo.do_sample_parts(
+            test_parts, {"temperature_active": ("cauchy", 1.0)}, 2, None
+        )
+    with pytest.raises(KeyError):
+        montecarlo.do_sample_parts(
+            test_parts, {"quality_id": ("normal", 1.0)}, 2, np.random.default_rng()
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_propagate_no_uncertainty(test_parts):
+    """do_propagate_uncertainty() should return the rolled up point prediction
+    when there are no uncertain attributes."""
+    _hazard_rates = batch.do_predict_active_hazard_rate(test_parts)
+    _system = 2.0 * (_hazard_rates[2] + _hazard_rates[3]) + 3.0 * _hazard_rates[4]
+
+    _results = montecarlo.do_propagate_uncertainty(
+        test_parts, PARENTS, {}, 10, quantity=QUANTITY, mission_time=100.0
+    )
+
+    assert _results["n_invalid"] == 0
+    assert _results["mean"][0] == pytest.approx(_system)
+    assert _results["std"] == pytest.approx(0.0, abs=1.0e-12)
+    assert _results["hazard_rate"] == pytest.approx(np.full((1, 3), _system))
+    assert _results["reliability"] == pytest.approx(
+        np.full((1, 3), np.exp(-100.0 * _system))
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_propagate_uncertainty(test_parts):
+    """do_propagate_uncertainty() should return increasing hazard rate and
+    reliability percentiles for each reported item."""
+    _results = montecarlo.do_propagate_uncertainty(
+        test_parts,
+        PARENTS,
+        {"temperature_active": ("normal", 5.0)},
+        2500,
+        block_size=1000,
+        quantity=QUANTITY,
+        report=[0, 1],
+        percentiles=[10.0, 90.0],
+    )
+
+    assert _results["n_samples"] == 2500
+    assert _results["hazard_rate"].shape == (2, 2)
+    assert (_results["hazard_rate"][:, 0] < _results["hazard_rate"][:, 1]).all()
+    assert (_results["reliability"][:, 0] < _results["reliability"][:, 1]).all()
+    assert (_results["std"] > 0.0).all()
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_propagate_deterministic(test_parts):
+    """do_propagate_uncertainty() should return the same results for the same seed
+    whether it runs in the calling process or a process pool."""
+    _kwargs = {"block_size": 100, "quantity": QUANTITY, "seed": 42}
+    _distributions = {"temperature_active": ("triangular", -5.0, 0.0, 10.0)}
+
+    _serial = montecarlo.do_propagate_uncertainty(
+        test_parts, PARENTS, _distributions, 450, max_workers=1, **_kwargs
+    )
+    _parallel = montecarlo.do_propagate_uncertainty(
+        test_parts, PARENTS, _distributions, 450, max_workers=2, **_kwargs
+    )
+    _other = montecarlo.do_propagate_uncertainty(
+        test_parts, PARENTS, _distributions, 450, **{**_kwargs, "seed": 7}
+    )
+
+    assert _parallel["mean"] == pytest.approx(_serial["mean"])
+    assert _parallel["hazard_rate"] == pytest.approx(_serial["hazard_rate"])
+    assert _other["hazard_rate"][0, 1] != _serial["hazard_rate"][0, 1]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_propagate_invalid_samples(test_parts):
+    """do_propagate_uncertainty() should count samples that can't be calculated
+    and leave them out of the statistics."""
+    _results = montecarlo.do_propagate_uncertainty(
+        test_parts,
+        PARENTS,
+        {"capacitance": ("uniform", -1.0, -0.5)},
+        50,
+        quantity=QUANTITY,
+        report=[0, 2],
+    )
+
+    assert _results["n_invalid"] == 50
+    assert np.isnan(_results["mean"][[0, 1, 3, 4]]).all()
+    assert np.isnan(_results["hazard_rate"][0]).all()
+    assert _results["mean"][2] == pytest.approx(0.0009869168)
+    assert _results["hazard_rate"][1] == pytest.approx([0.0009869168] * 3)
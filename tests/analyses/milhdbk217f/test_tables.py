@@ -0,0 +1,179 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.test_tables.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the MIL-HDBK-217F compiled factor tables module."""
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import milhdbk217f, tables
+from ramstk.analyses.milhdbk217f.models import (
+    capacitor,
+    connection,
+    lamp,
+    resistor,
+    switch,
+)
+
+
+@pytest.mark.unit
+def test_get_size():
+    """_get_size() should return one more than the largest list length or dict
+    key at the requested depth."""
+    assert tables._get_size([1.0, 2.0, 3.0]) == 4
+    assert tables._get_size({2: [1.0], 7: [1.0, 2.0]}) == 8
+    assert tables._get_size({2: [1.0], 7: [1.0, 2.0]}, depth=1) == 3
+    assert tables._get_size(0.5) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "table",
+    [
+        tables.PI_E,
+        tables.PART_COUNT_LAMBDA_B,
+        tables.PART_COUNT_PI_Q,
+        tables.PART_STRESS_PI_Q,
+        tables.PI_R,
+        tables.PI_V,
+    ],
+)
+def test_compile(table):
+    """do_compile() should build a dense array of factors with nan for every
+    entry the validity mask flags as invalid."""
+    table.do_compile()
+
+    assert table.values.shape == table.valid.shape
+    assert table.valid.any()
+    assert np.isnan(table.values[~table.valid]).all()
+    assert not np.isnan(table.values[table.valid]).any()
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_pi_e():
+    """PI_E should hold the same environment factors as the model lists."""
+    assert tables.PI_E.lookup(4, 1, 1, np.arange(1, 15)).tolist() == capacitor.PI_E
+    assert tables.PI_E.lookup(3, 2, 1, np.arange(1, 15)).tolist() == resistor.PI_E[2]
+    assert (
+        tables.PI_E.lookup(8, 1, 2, np.arange(1, 15)).tolist() == connection.PI_E[1][2]
+    )
+    assert tables.PI_E.lookup(10, 4, 1, 3) == lamp.PI_E[2]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_part_count_lambda_b():
+    """PART_COUNT_LAMBDA_B should hold the same base hazard rates as the model
+    functions."""
+    assert (
+        tables.PART_COUNT_LAMBDA_B.get(3, 2, 1, 4)
+        == resistor.PART_COUNT_LAMBDA_B[2][1][3]
+    )
+    assert (
+        tables.PART_COUNT_LAMBDA_B.get(3, 1, 0, 4) == resistor.PART_COUNT_LAMBDA_B[1][3]
+    )
+    assert (
+        tables.PART_COUNT_LAMBDA_B.get(7, 5, 2, 6)
+        == switch.PART_COUNT_LAMBDA_B_BREAKER[2][5]
+    )
+    assert tables.PART_COUNT_LAMBDA_B.get(10, 4, 1, 3) == lamp.PART_COUNT_LAMBDA_B[1][2]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_quality_factors():
+    """PART_COUNT_PI_Q and PART_STRESS_PI_Q should hold the same quality factors
+    as the model lists."""
+    assert (
+        tables.PART_COUNT_PI_Q.lookup(3, 5, np.arange(1, 7)).tolist()
+        == resistor.PART_COUNT_PI_Q
+    )
+    assert tables.PART_COUNT_PI_Q.lookup(10, [3, 4], 1).tolist() == [1.0, 1.0]
+    assert (
+        tables.PART_STRESS_PI_Q.lookup(4, 3, np.arange(1, 8)).tolist()
+        == capacitor.PART_STRESS_PI_Q[3]
+    )
+    assert tables.PART_STRESS_PI_Q.lookup(8, 1, 2) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_resistor_factors():
+    """PI_R and PI_V should hold the same resistance and voltage factors as the
+    model lists."""
+    assert (
+        tables.PI_R.lookup(3, 6, 2, 3, [0, 1]).tolist() == resistor.PI_R[6][1][2][1:3]
+    )
+    assert tables.PI_R.lookup(3, 1, 0, 0, 2) == resistor.PI_R[1][3]
+    assert tables.PI_V.lookup(3, 13, [0, 1, 2]).tolist() == resistor.PI_V[13]
+    assert np.isnan(tables.PI_V.lookup(4, 13, 0))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_lookup_matches_scalar():
+    """lookup() should return the same factors as the single part functions for
+    every category, subcategory, quality, and environment."""
+    _category_id, _subcategory_id, _quality_id, _environment_id = np.meshgrid(
+        np.arange(1, 11),
+        np.arange(1, 20),
+        np.arange(1, 8),
+        np.arange(1, 15),
+        indexing="ij",
+    )
+
+    _pi_e = tables.PI_E.lookup(
+        _category_id, _subcategory_id, _quality_id, _environment_id
+    )
+    _pi_q = tables.PART_STRESS_PI_Q.lookup(_category_id, _subcategory_id, _quality_id)
+
+    for _index in np.ndindex(_pi_e.shape):
+        _ids = [
+            int(_category_id[_index]),
+            int(_subcategory_id[_index]),
+            int(_quality_id[_index]),
+            int(_environment_id[_index]),
+        ]
+        try:
+            _expected = milhdbk217f._get_environment_factor(
+                _ids[0], _ids[3], subcategory_id=_ids[1], quality_id=_ids[2]
+            )
+        except (IndexError, KeyError):
+            _expected = np.nan
+        assert _pi_e[_index] == pytest.approx(_expected, nan_ok=True)
+
+        try:
+            _expected = milhdbk217f._get_part_stress_quality_factor(*_ids[:3])
+        except (IndexError, KeyError):
+            _expected = np.nan
+        assert _pi_q[_index] == pytest.approx(_expected, nan_ok=True)
+
+
+@pytest.mark.unit
+def test_lookup_outside_table():
+    """lookup() should pass IDs outside the table to the nested lookup and return
+    nan where it has no factor."""
+    assert tables.PI_E.lookup(4, 1, 99, 2) == capacitor.PI_E[1]
+    assert tables.PI_E.lookup(4, 1, 1, 0) == capacitor.PI_E[-1]
+    assert np.isnan(tables.PI_E.lookup([4, 4], 1, 1, [99, 2])[0])
+    assert np.isnan(tables.PI_E.lookup(6, 1, 1, 1))
+
+
+@pytest.mark.unit
+def test_get_no_factor():
+    """get() should raise the same errors as the nested lookup when there is no
+    factor for the IDs."""
+    with pytest.raises(KeyError):
+        tables.PI_E.get(6, 1, 1, 1)
+    with pytest.raises(IndexError):
+        tables.PI_E.get(4, 1, 1, 99)
+    with pytest.raises(IndexError):
+        milhdbk217f._get_part_count_quality_factor(3, 1, 12)
@@ -11,12 +11,15 @@
 # Third Party Imports
 import numpy as np
 import pytest
-from scipy.stats import expon
+from scipy.stats import expon, lognorm, norm, weibull_min
 
 # RAMSTK Package Imports
 from ramstk.analyses.statistics.bounds import (
     do_calculate_beta_bounds,
+    do_calculate_fisher_bounds,
     do_calculate_fisher_information,
+    do_calculate_fisher_matrix,
+    get_parameter_covariance,
 )
 
 
@@ -161,7 +164,8 @@ class TestFisherInformation:
         ]
     )
 
-    @pytest.mark.skip
+    @pytest.mark.unit
+    @pytest.mark.calculation
     def test_calculate_fisher_information(self):
         """do_calculate_fisher_information() should return a list of lists on
         success."""
@@ -169,6 +173,163 @@ class TestFisherInformation:
         _fisher = do_calculate_fisher_information(log_pdf, _p0, self.EXP_TEST[:, 1])
 
         assert _fisher[0][0] == pytest.approx(7.56458685e05)
-        assert _fisher[0][1] == pytest.approx(5.16408922e-07)
-        assert _fisher[1][0] == pytest.approx(5.16408922e-07)
+        # The rate is the MLE so the cross terms are zero up to the rounding
+        # error of the central differences.
+        assert _fisher[0][1] == pytest.approx(0.0, abs=1.0e-5)
+        assert _fisher[1][0] == pytest.approx(0.0, abs=1.0e-5)
         assert _fisher[1][1] == pytest.approx(1.12858719e-02)
+
+
+def _numeric_fisher(logpdf, logsf, parameters, time, failed):
+    """Calculate the negative Hessian of the log-likelihood numerically."""
+    _parameters = np.asarray(parameters, dtype=float)
+
+    def _log_likelihood(theta):
+        return np.sum(np.where(failed, logpdf(time, *theta), logsf(time, *theta)))
+
+    _size = _parameters.size
+    _hessian = np.zeros((_size, _size))
+    for i in range(_size):
+        for j in range(_size):
+            _hi = np.zeros(_size)
+            _hj = np.zeros(_size)
+            _hi[i] = 1.0e-4 * max(abs(_parameters[i]), 1.0)
+            _hj[j] = 1.0e-4 * max(abs(_parameters[j]), 1.0)
+            _hessian[i, j] = (
+                _log_likelihood(_parameters + _hi + _hj)
+                - _log_likelihood(_parameters + _hi - _hj)
+                - _log_likelihood(_parameters - _hi + _hj)
+                + _log_likelihood(_parameters - _hi - _hj)
+            ) / (4.0 * _hi[i] * _hj[j])
+
+    return -_hessian
+
+
+class TestFisherMatrix:
+    """Class for the analytic Fisher matrix and Fisher bounds test suite."""
+
+    TIME = np.array([16.0, 34.0, 53.0, 75.0, 93.0, 120.0, 150.0, 191.0, 240.0, 339.0])
+    FAILED = np.array([1, 1, 1, 0, 1, 1, 0, 1, 1, 0], dtype=bool)
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_fisher_matrix_exponential(self):
+        """do_calculate_fisher_matrix() should return n / theta^2 at the MLE for
+        complete exponential data."""
+        _theta = self.TIME.mean()
+
+        _fisher = do_calculate_fisher_matrix("exponential", [_theta], self.TIME)
+
+        assert _fisher.shape == (1, 1)
+        assert _fisher[0, 0] == pytest.approx(self.TIME.size / _theta ** 2)
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    @pytest.mark.parametrize(
+        "distribution, parameters, logpdf, logsf",
+        [
+            (
+                "exponential",
+                [150.0],
+                lambda t, s: expon.logpdf(t, scale=s),
+                lambda t, s: expon.logsf(t, scale=s),
+            ),
+            (
+                "lognormal",
+                [0.9, 110.0],
+                lambda t, s, c: lognorm.logpdf(t, s, scale=c),
+                lambda t, s, c: lognorm.logsf(t, s, scale=c),
+            ),
+            (
+                "normal",
+                [120.0, 90.0],
+                lambda t, m, s: norm.logpdf(t, loc=m, scale=s),
+                lambda t, m, s: norm.logsf(t, loc=m, scale=s),
+            ),
+            (
+                "weibull",
+                [1.4, 150.0],
+                lambda t, b, e: weibull_min.logpdf(t, b, scale=e),
+                lambda t, b, e: weibull_min.logsf(t, b, scale=e),
+            ),
+        ],
+    )
+    def test_fisher_matrix_censored(self, distribution, parameters, logpdf, logsf):
+        """do_calculate_fisher_matrix() should return the negative Hessian of the
+        log-likelihood of censored data."""
+        _fisher = do_calculate_fisher_matrix(
+            distribution, parameters, self.TIME, failed=self.FAILED
+        )
+
+        assert _fisher == pytest.approx(
+            _numeric_fisher(logpdf, logsf, parameters, self.TIME, self.FAILED),
+            rel=1.0e-4,
+        )
+        assert get_parameter_covariance(_fisher) == pytest.approx(
+            np.linalg.inv(_fisher)
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_fisher_bounds(self):
+        """do_calculate_fisher_bounds() should return the covariance and bounds on
+        the survival and hazard functions over the time grid."""
+        _time_grid = np.array([0.0, 10.0, 100.0, 500.0])
+
+        _results = do_calculate_fisher_bounds(
+            "weibull",
+            [1.4, 150.0],
+            self.TIME,
+            _time_grid,
+            failed=self.FAILED,
+            alpha=95.0,
+        )
+
+        assert _results["covariance"].shape == (2, 2)
+        assert _results["survival"].shape == (3, 4)
+        assert _results["hazard"].shape == (3, 4)
+        assert _results["survival"][1] == pytest.approx(
+            weibull_min.sf(_time_grid, 1.4, scale=150.0)
+        )
+        assert _results["hazard"][1, 1:] == pytest.approx(
+            weibull_min.pdf(_time_grid[1:], 1.4, scale=150.0)
+            / weibull_min.sf(_time_grid[1:], 1.4, scale=150.0)
+        )
+        assert _results["survival"][:, 0].tolist() == [1.0, 1.0, 1.0]
+        assert _results["hazard"][:, 0].tolist() == [0.0, 0.0, 0.0]
+        assert np.all(_results["survival"][0, 1:] < _results["survival"][1, 1:])
+        assert np.all(_results["survival"][1, 1:] < _results["survival"][2, 1:])
+        assert np.all(_results["hazard"][0, 1:] < _results["hazard"][1, 1:])
+        assert np.all(_results["hazard"][1, 1:] < _results["hazard"][2, 1:])
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_fisher_bounds_exponential(self):
+        """do_calculate_fisher_bounds() should return the delta method bounds for
+        the exponential distribution."""
+        _theta = self.TIME.mean()
+
+        _results = do_calculate_fisher_bounds(
+            "exponential", [_theta], self.TIME, np.array([50.0])
+        )
+
+        # For the exponential, log(H(t)) = log(t) - log(theta) so the standard
+        # error of log(H(t)) is 1 / sqrt(n).
+        _se = 1.0 / np.sqrt(self.TIME.size)
+        _z = norm.ppf(0.975)
+        assert _results["covariance"][0, 0] == pytest.approx(
+            _theta ** 2 / self.TIME.size
+        )
+        assert _results["survival"][0, 0] == pytest.approx(
+            np.exp(-50.0 / _theta * np.exp(_z * _se))
+        )
+        assert _results["survival"][2, 0] == pytest.approx(
+            np.exp(-50.0 / _theta * np.exp(-_z * _se))
+        )
+
+    @pytest.mark.unit
+    def test_fisher_matrix_unknown_distribution(self):
+        """do_calculate_fisher_matrix() should raise a KeyError when passed an
+        unknown distribution."""
+        with pytest.raises(KeyError):
+            do_calculate_fisher_matrix("gumbel", [1.0, 1.0], self.TIME)
@@ -223,3 +223,62 @@ def test_fit_mm_method_no_floc(test_data):
 
     assert _location == 0.0
     assert _scale == pytest.approx(94.1309375)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_log_likelihood_gradient():
+    """should return the score of each record with respect to each parameter."""
+    _time = np.array([16.0, 53.0, 75.0, 120.0, 191.0])
+    _failed = np.array([1, 1, 0, 1, 0], dtype=bool)
+    _parameters = np.array([150.0])
+    _logpdf = lambda t, s: scipy.stats.expon.logpdf(t, scale=s)
+    _logsf = lambda t, s: scipy.stats.expon.logsf(t, scale=s)
+
+    _gradient = exponential.get_log_likelihood_gradient(150.0, _time, failed=_failed)
+
+    assert _gradient.shape == (1, 5)
+    for _idx, _parameter in enumerate(_parameters):
+        _step = np.zeros(_parameters.size)
+        _step[_idx] = 1.0e-6 * _parameter
+        _upper = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters + _step)),
+            _logsf(_time, *(_parameters + _step)),
+        )
+        _lower = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters - _step)),
+            _logsf(_time, *(_parameters - _step)),
+        )
+
+        assert _gradient[_idx] == pytest.approx(
+            (_upper - _lower) / (2.0 * _step[_idx]), rel=1.0e-5, abs=1.0e-9
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_reliability_functions_broadcast():
+    """should return the hazard rate, survival, and cumulative hazard of each
+    parameter set at each time."""
+    _time = np.array([25.0, 85.0, 105.0, 210.0])
+    _scale = np.array([[1000.0], [2500.0]])
+
+    _hazard_rate = exponential.get_hazard_rates(_scale, _time, location=10.0)
+    _survival = exponential.get_survivals(_scale, _time, location=10.0)
+    _cumulative_hazard = exponential.get_cumulative_hazards(
+        _scale, _time, location=10.0
+    )
+
+    assert _hazard_rate.shape == (2, 4)
+    assert _hazard_rate == pytest.approx(
+        scipy.stats.expon.pdf(_time, loc=10.0, scale=_scale)
+        / scipy.stats.expon.sf(_time, loc=10.0, scale=_scale)
+    )
+    assert _survival == pytest.approx(
+        scipy.stats.expon.sf(_time, loc=10.0, scale=_scale)
+    )
+    assert _cumulative_hazard == pytest.approx(
+        -scipy.stats.expon.logsf(_time, loc=10.0, scale=_scale)
+    )
@@ -0,0 +1,205 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.statistics.fitting_unit_test.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the censored data fitting module."""
+
+# Third Party Imports
+import numpy as np
+import pytest
+from scipy.stats import lognorm, norm, weibull_min
+
+# RAMSTK Package Imports
+from ramstk.analyses.statistics import fitting
+
+
+@pytest.fixture(scope="function")
+def test_data():
+    """Weibull distributed failure times with shape 1.8 and scale 400."""
+    yield weibull_min.rvs(1.8, scale=400.0, size=200, random_state=42)
+
+
+@pytest.fixture(scope="function")
+def test_cache():
+    """Empty the fit cache before and after each test."""
+    fitting.clear_fit_cache()
+
+    yield fitting._FIT_CACHE
+
+    fitting.clear_fit_cache()
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_log_likelihood(test_data):
+    """get_log_likelihood() should add the log of the pdf of each failure, the log
+    of the survival of each suspension, and the log of the probability of each
+    interval."""
+    _left = np.array([100.0, 200.0, 300.0, 0.0])
+    _right = np.array([100.0, np.inf, 400.0, 50.0])
+    _weights = np.array([1.0, 2.0, 3.0, 4.0])
+
+    _log_likelihood = fitting.get_log_likelihood(
+        "weibull", [1.8, 400.0], _left, _right, weights=_weights
+    )
+
+    assert _log_likelihood == pytest.approx(
+        weibull_min.logpdf(100.0, 1.8, scale=400.0)
+        + 2.0 * weibull_min.logsf(200.0, 1.8, scale=400.0)
+        + 3.0
+        * np.log(
+            weibull_min.cdf(400.0, 1.8, scale=400.0)
+            - weibull_min.cdf(300.0, 1.8, scale=400.0)
+        )
+        + 4.0 * weibull_min.logcdf(50.0, 1.8, scale=400.0)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize(
+    "distribution, fit",
+    [
+        ("lognormal", lambda t: lognorm.fit(t, floc=0.0)[::2]),
+        ("normal", norm.fit),
+        ("weibull", lambda t: weibull_min.fit(t, floc=0.0)[::2]),
+    ],
+)
+def test_do_fit_censored_exact(test_data, distribution, fit):
+    """do_fit_censored() should return the MLE for exact failure times."""
+    _fit = fitting.do_fit_censored(distribution, test_data)
+
+    assert _fit["distribution"] == distribution
+    assert _fit["converged"]
+    assert _fit["parameters"] == pytest.approx(fit(test_data), rel=1.0e-5)
+    assert _fit["aic"] == pytest.approx(4.0 - 2.0 * _fit["log_likelihood"])
+    assert _fit["bic"] == pytest.approx(
+        2.0 * np.log(200.0) - 2.0 * _fit["log_likelihood"]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_fit_censored_right_censored(test_data):
+    """do_fit_censored() should return the total time on test divided by the
+    number of failures for right censored exponential data."""
+    _left = np.minimum(test_data, 500.0)
+    _right = np.where(test_data > 500.0, np.inf, _left)
+
+    _fit = fitting.do_fit_censored("exponential", _left, _right)
+
+    assert _fit["parameters"][0] == pytest.approx(
+        np.sum(_left) / np.sum(test_data <= 500.0), rel=1.0e-6
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_fit_censored_weights(test_data):
+    """do_fit_censored() should give grouped data the same fit as the ungrouped
+    data."""
+    _time, _counts = np.unique(np.round(test_data, -1), return_counts=True)
+
+    _fit = fitting.do_fit_censored("weibull", _time, weights=_counts)
+
+    assert _fit["parameters"] == pytest.approx(
+        fitting.do_fit_censored("weibull", np.round(test_data, -1))["parameters"],
+        rel=1.0e-5,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_fit_censored_interval(test_data):
+    """do_fit_censored() should estimate the parameters from interval censored
+    data."""
+    _edges = np.arange(0.0, 2000.0, 100.0)
+    _index = np.digitize(test_data, _edges)
+
+    _fit = fitting.do_fit_censored("weibull", _edges[_index - 1], _edges[_index])
+
+    assert _fit["converged"]
+    assert _fit["parameters"] == pytest.approx(
+        weibull_min.fit(test_data, floc=0.0)[::2], rel=0.05
+    )
+
+
+@pytest.mark.unit
+def test_do_fit_censored_unknown_distribution(test_data):
+    """do_fit_censored() should raise a KeyError when passed an unknown
+    distribution."""
+    with pytest.raises(KeyError):
+        fitting.do_fit_censored("gumbel", test_data)
+
+
+@pytest.mark.unit
+def test_get_dataset_hash(test_data):
+    """get_dataset_hash() should return the same hash for the same data set."""
+    _hash = fitting.get_dataset_hash(test_data)
+
+    assert fitting.get_dataset_hash(test_data.copy()) == _hash
+    assert fitting.get_dataset_hash(test_data, test_data) != _hash
+    assert fitting.get_dataset_hash(test_data, weights=np.ones(200)) != _hash
+    assert fitting.get_dataset_hash(test_data[::-1]) != _hash
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_fit_all(test_data, test_cache):
+    """do_fit_all() should fit each distribution in a process pool and rank them
+    by the information criterion."""
+    _fits = fitting.do_fit_all(test_data)
+
+    assert [_fit["distribution"] for _fit in _fits][0] == "weibull"
+    assert sorted([_fit["distribution"] for _fit in _fits]) == [
+        "exponential",
+        "lognormal",
+        "normal",
+        "weibull",
+    ]
+    assert [_fit["aic"] for _fit in _fits] == sorted(_fit["aic"] for _fit in _fits)
+    assert _fits[0]["parameters"] == pytest.approx(
+        fitting.do_fit_censored("weibull", test_data)["parameters"]
+    )
+
+    _fits = fitting.do_fit_all(test_data, criterion="bic", max_workers=1)
+
+    assert [_fit["bic"] for _fit in _fits] == sorted(_fit["bic"] for _fit in _fits)
+
+
+@pytest.mark.unit
+def test_do_fit_all_cached(test_data, test_cache, monkeypatch):
+    """do_fit_all() should not refit a data set it has already fit."""
+    _calls = []
+    _do_fit_censored = fitting.do_fit_censored
+
+    def _count_calls(distribution, left, right=None, **kwargs):
+        _calls.append(distribution)
+        return _do_fit_censored(distribution, left, right, **kwargs)
+
+    monkeypatch.setattr(fitting, "do_fit_censored", _count_calls)
+
+    _fits = fitting.do_fit_all(
+        test_data, distributions=["exponential", "weibull"], max_workers=1
+    )
+
+    assert _calls == ["exponential", "weibull"]
+    assert len(test_cache) == 1
+    assert (
+        fitting.do_fit_all(
+            test_data.copy(), distributions=["exponential", "weibull"], max_workers=1
+        )
+        == _fits
+    )
+    assert _calls == ["exponential", "weibull"]
+
+    fitting.do_fit_all(
+        test_data, distributions=["exponential", "weibull"], max_workers=1, seed=1
+    )
+
+    assert _calls == ["exponential", "weibull", "exponential", "weibull"]
+    assert len(test_cache) == 2
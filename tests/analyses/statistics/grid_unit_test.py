@@ -0,0 +1,111 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.statistics.grid_unit_test.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the reliability function time grid module."""
+
+# Standard Library Imports
+import math
+
+# Third Party Imports
+import numpy as np
+import pytest
+from scipy.stats import expon, lognorm, norm, weibull_min
+
+# RAMSTK Package Imports
+from ramstk.analyses.statistics import do_calculate_time_grid
+
+TIME = np.array([10.0, 50.0, 105.0, 210.0, 500.0])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize(
+    "distribution, parameters, location, frozen",
+    [
+        (
+            "exponential",
+            [[525.0, 1000.0]],
+            [0.0, 5.0],
+            [expon(loc=0.0, scale=525.0), expon(loc=5.0, scale=1000.0)],
+        ),
+        (
+            "lognormal",
+            [[0.9663, 0.5], 100.0],
+            1.85,
+            [
+                lognorm(0.9663, loc=1.85, scale=100.0),
+                lognorm(0.5, loc=1.85, scale=100.0),
+            ],
+        ),
+        (
+            "normal",
+            [100.0, [50.0, 100.0]],
+            0.0,
+            [norm(loc=100.0, scale=50.0), norm(loc=100.0, scale=100.0)],
+        ),
+        (
+            "weibull",
+            [[0.8, 2.5], [525.0, 300.0]],
+            0.0,
+            [
+                weibull_min(0.8, loc=0.0, scale=525.0),
+                weibull_min(2.5, loc=0.0, scale=300.0),
+            ],
+        ),
+    ],
+)
+def test_do_calculate_time_grid(distribution, parameters, location, frozen):
+    """do_calculate_time_grid() should return one row per parameter set and one
+    column per time."""
+    _grid = do_calculate_time_grid(distribution, parameters, TIME, location=location)
+
+    assert _grid["hazard_rate"].shape == (2, 5)
+    assert _grid["survival"].shape == (2, 5)
+    assert _grid["cumulative_hazard"].shape == (2, 5)
+    assert _grid["mtbf"].shape == (2,)
+    for _row, _distribution in enumerate(frozen):
+        assert _grid["hazard_rate"][_row] == pytest.approx(
+            _distribution.pdf(TIME) / _distribution.sf(TIME)
+        )
+        assert _grid["survival"][_row] == pytest.approx(_distribution.sf(TIME))
+        assert _grid["cumulative_hazard"][_row] == pytest.approx(
+            -_distribution.logsf(TIME)
+        )
+        assert _grid["mtbf"][_row] == pytest.approx(_distribution.mean())
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_time_grid_before_location():
+    """do_calculate_time_grid() should return a hazard rate of zero and survival
+    of one up to the location."""
+    _grid = do_calculate_time_grid("weibull", [2.5, 525.0], [0.0, 10.0], location=18.5)
+
+    assert _grid["hazard_rate"].tolist() == [[0.0, 0.0]]
+    assert _grid["survival"].tolist() == [[1.0, 1.0]]
+    assert _grid["cumulative_hazard"].tolist() == [[0.0, 0.0]]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_time_grid_invalid_parameters():
+    """do_calculate_time_grid() should return nan for invalid parameter sets."""
+    _grid = do_calculate_time_grid("weibull", [[0.0, 2.5], 525.0], TIME)
+
+    assert np.isnan(_grid["hazard_rate"][0]).all()
+    assert np.isnan(_grid["survival"][0]).all()
+    assert math.isnan(_grid["mtbf"][0])
+    assert not np.isnan(_grid["survival"][1]).any()
+
+
+@pytest.mark.unit
+def test_do_calculate_time_grid_unknown_distribution():
+    """do_calculate_time_grid() should raise a KeyError when passed an unknown
+    distribution."""
+    with pytest.raises(KeyError):
+        do_calculate_time_grid("gumbel", [1.0, 1.0], TIME)
@@ -54,7 +54,7 @@ def test_data():
 def test_get_hazard_rate_defaults():
     """should calculate the (LOGN) hazard rate when using default confidence level."""
     assert lognormal.get_hazard_rate(0.9663, 4.0, scale=33.65) == pytest.approx(
-        0.6610467
+        0.009224548
     )
 
 
@@ -63,7 +63,7 @@ def test_get_hazard_rate_specified_location():
     """should calculate the (LOGN) hazard rate when specifying the location."""
     assert lognormal.get_hazard_rate(
         0.9663, 4.0, location=1.85, scale=33.65
-    ) == pytest.approx(1.5117773383839221)
+    ) == pytest.approx(0.003348938)
 
 
 @pytest.mark.unit
@@ -159,3 +159,63 @@ def test_do_fit_mm_method_no_floc(test_data):
     assert _shape == pytest.approx(0.599285)
     assert _location == 0.0
     assert _scale == pytest.approx(37.6032561)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_log_likelihood_gradient():
+    """should return the score of each record with respect to each parameter."""
+    _time = np.array([16.0, 53.0, 75.0, 120.0, 191.0])
+    _failed = np.array([1, 1, 0, 1, 0], dtype=bool)
+    _parameters = np.array([0.9, 110.0])
+    _logpdf = lambda t, s, c: scipy.stats.lognorm.logpdf(t, s, scale=c)
+    _logsf = lambda t, s, c: scipy.stats.lognorm.logsf(t, s, scale=c)
+
+    _gradient = lognormal.get_log_likelihood_gradient(0.9, 110.0, _time, failed=_failed)
+
+    assert _gradient.shape == (2, 5)
+    for _idx, _parameter in enumerate(_parameters):
+        _step = np.zeros(_parameters.size)
+        _step[_idx] = 1.0e-6 * _parameter
+        _upper = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters + _step)),
+            _logsf(_time, *(_parameters + _step)),
+        )
+        _lower = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters - _step)),
+            _logsf(_time, *(_parameters - _step)),
+        )
+
+        assert _gradient[_idx] == pytest.approx(
+            (_upper - _lower) / (2.0 * _step[_idx]), rel=1.0e-5, abs=1.0e-9
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_reliability_functions_broadcast():
+    """should return the hazard rate, survival, and cumulative hazard of each
+    parameter set at each time."""
+    _time = np.array([25.0, 85.0, 105.0, 210.0])
+    _shape = 0.9663
+    _scale = np.array([[33.65], [100.0]])
+
+    _hazard_rate = lognormal.get_hazard_rates(_shape, _scale, _time, location=1.85)
+    _survival = lognormal.get_survivals(_shape, _scale, _time, location=1.85)
+    _cumulative_hazard = lognormal.get_cumulative_hazards(
+        _shape, _scale, _time, location=1.85
+    )
+
+    assert _hazard_rate.shape == (2, 4)
+    assert _hazard_rate == pytest.approx(
+        scipy.stats.lognorm.pdf(_time, _shape, loc=1.85, scale=_scale)
+        / scipy.stats.lognorm.sf(_time, _shape, loc=1.85, scale=_scale)
+    )
+    assert _survival == pytest.approx(
+        scipy.stats.lognorm.sf(_time, _shape, loc=1.85, scale=_scale)
+    )
+    assert _cumulative_hazard == pytest.approx(
+        -scipy.stats.lognorm.logsf(_time, _shape, loc=1.85, scale=_scale)
+    )
@@ -45,22 +45,22 @@ def test_data():
 @pytest.mark.unit
 def test_get_hazard_rate_defaults():
     """should calculate the (WEI) hazard rate when using default confidence level."""
-    assert weibull.get_hazard_rate(0.8, 525.0, 105.0) == pytest.approx(0.006616111)
-    assert weibull.get_hazard_rate(1.0, 525.0, 105.0) == pytest.approx(0.008603153)
-    assert weibull.get_hazard_rate(2.5, 525.0, 105.0) == pytest.approx(0.0235972)
+    assert weibull.get_hazard_rate(0.8, 525.0, 105.0) == pytest.approx(0.002102445)
+    assert weibull.get_hazard_rate(1.0, 525.0, 105.0) == pytest.approx(0.001904762)
+    assert weibull.get_hazard_rate(2.5, 525.0, 105.0) == pytest.approx(0.0004259177)
 
 
 @pytest.mark.unit
 def test_get_hazard_rate_specified_location():
     """should calculate the (WEI) hazard rate when specifying the location."""
     assert weibull.get_hazard_rate(0.8, 525.0, 105.0, location=18.5) == pytest.approx(
-        0.008198783
+        0.002185543
     )
     assert weibull.get_hazard_rate(1.0, 525.0, 105.0, location=18.5) == pytest.approx(
-        0.01063445
+        0.001904762
     )
     assert weibull.get_hazard_rate(2.5, 525.0, 105.0, location=18.5) == pytest.approx(
-        0.02874279
+        0.0003184681
     )
 
 
@@ -179,3 +179,63 @@ def test_do_fit_mm_method_no_floc(test_data):
     assert _shape == pytest.approx(0.166558)
     assert _location == 0.0
     assert _scale == pytest.approx(0.00337509)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_log_likelihood_gradient():
+    """should return the score of each record with respect to each parameter."""
+    _time = np.array([16.0, 53.0, 75.0, 120.0, 191.0])
+    _failed = np.array([1, 1, 0, 1, 0], dtype=bool)
+    _parameters = np.array([1.4, 150.0])
+    _logpdf = lambda t, b, e: scipy.stats.weibull_min.logpdf(t, b, scale=e)
+    _logsf = lambda t, b, e: scipy.stats.weibull_min.logsf(t, b, scale=e)
+
+    _gradient = weibull.get_log_likelihood_gradient(1.4, 150.0, _time, failed=_failed)
+
+    assert _gradient.shape == (2, 5)
+    for _idx, _parameter in enumerate(_parameters):
+        _step = np.zeros(_parameters.size)
+        _step[_idx] = 1.0e-6 * _parameter
+        _upper = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters + _step)),
+            _logsf(_time, *(_parameters + _step)),
+        )
+        _lower = np.where(
+            _failed,
+            _logpdf(_time, *(_parameters - _step)),
+            _logsf(_time, *(_parameters - _step)),
+        )
+
+        assert _gradient[_idx] == pytest.approx(
+            (_upper - _lower) / (2.0 * _step[_idx]), rel=1.0e-5, abs=1.0e-9
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_reliability_functions_broadcast():
+    """should return the hazard rate, survival, and cumulative hazard of each
+    parameter set at each time."""
+    _time = np.array([25.0, 85.0, 105.0, 210.0])
+    _shape = 2.5
+    _scale = np.array([[525.0], [1050.0]])
+
+    _hazard_rate = weibull.get_hazard_rates(_shape, _scale, _time, location=18.5)
+    _survival = weibull.get_survivals(_shape, _scale, _time, location=18.5)
+    _cumulative_hazard = weibull.get_cumulative_hazards(
+        _shape, _scale, _time, location=18.5
+    )
+
+    assert _hazard_rate.shape == (2, 4)
+    assert _hazard_rate == pytest.approx(
+        scipy.stats.weibull_min.pdf(_time, _shape, loc=18.5, scale=_scale)
+        / scipy.stats.weibull_min.sf(_time, _shape, loc=18.5, scale=_scale)
+    )
+    assert _survival == pytest.approx(
+        scipy.stats.weibull_min.sf(_time, _shape, loc=18.5, scale=_scale)
+    )
+    assert _cumulative_hazard == pytest.approx(
+        -scipy.stats.weibull_min.logsf(_time, _shape, loc=18.5, scale=_scale)
+    )
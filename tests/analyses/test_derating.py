@@ -9,6 +9,7 @@
 """Test class for the stress derating module."""
 
 # Third Party Imports
+import numpy as np
 import pytest
 
 # RAMSTK Package Imports
@@ -152,3 +153,118 @@ def test_check_overstress_more_than_two_environs():
     assert _overstress["harsh"] == [False, False]
     assert _overstress["protected"] == [False, False]
     assert _overstress["daddy_doyle"] == [False, False]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_stress_limits():
+    """get_stress_limits() should return the lower and upper limits of each stress
+    and environment indexed by category ID."""
+    _limits = derating.get_stress_limits(
+        {1: [0.8, 0.9, 1.0, 1.0, 0.7, 0.9, 0.0, 0.0, 125.0, 125.0], 3: [0.1] * 6}
+    )
+
+    assert _limits.shape == (4, 3, 2, 2)
+    assert _limits[1, :, :, 1].tolist() == [[0.8, 0.9], [1.0, 1.0], [0.7, 0.9]]
+    assert (_limits[1, :, :, 0] == 0.0).all()
+    assert np.isnan(_limits[2]).all()
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_screen_overstress():
+    """do_screen_overstress() should return the same overstress conditions as
+    check_overstress() for every component."""
+    _stress_limits = {1: [0.8, 0.9, 1.0, 1.0, 0.7, 0.9], 2: [0.6, 0.7, 0.5, 0.9, 1, 1]}
+    _category_id = [1, 2, 2, 1]
+    _ratios = [[0.85, 0.2, 0.95], [-0.1, 0.6, 0.5], [0.1, 0.1, 0.1], [0.5, 1.1, 0.8]]
+
+    _overstress = derating.do_screen_overstress(
+        _category_id, _ratios, derating.get_stress_limits(_stress_limits)
+    )
+
+    assert _overstress.shape == (4, 3, 2, 2)
+    for _idx, _category in enumerate(_category_id):
+        for _stress in range(3):
+            _expected = derating.check_overstress(
+                _ratios[_idx][_stress],
+                {
+                    "harsh": [0.0, _stress_limits[_category][2 * _stress]],
+                    "mild": [0.0, _stress_limits[_category][2 * _stress + 1]],
+                },
+            )
+            assert _overstress[_idx, _stress].tolist() == [
+                _expected["harsh"],
+                _expected["mild"],
+            ]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_screen_overstress_no_limits():
+    """do_screen_overstress() should not flag components in a category without
+    stress limits."""
+    _overstress = derating.do_screen_overstress(
+        [0, 2, 9],
+        [[-1.0, 2.0, 2.0]] * 3,
+        derating.get_stress_limits({1: [0.8, 0.9, 1.0, 1.0, 0.7, 0.9]}),
+    )
+
+    assert not _overstress.any()
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_stress_ratios():
+    """do_calculate_stress_ratios() should only calculate the ratios that apply to
+    each component's category and have a non-zero rated value."""
+    _ratios = derating.do_calculate_stress_ratios(
+        [1, 3, 5, 8, 9],
+        [[0.1, 0.5, 5.0]] * 5,
+        [[0.2, 1.0, 10.0]] * 4 + [[0.2, 1.0, 0.0]],
+        [[0.3, 0.3, 0.3]] * 5,
+    )
+
+    assert _ratios.tolist() == [
+        [0.5, 0.3, 0.3],
+        [0.3, 0.5, 0.3],
+        [0.5, 0.3, 0.5],
+        [0.5, 0.3, 0.5],
+        [0.3, 0.3, 0.3],
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_overstress_reasons():
+    """get_overstress_reasons() should describe every overstress condition of each
+    component."""
+    _overstress = np.zeros((2, 3, 2, 2), dtype=bool)
+    _overstress[1, 0, 0, 0] = True
+    _overstress[1, 2, 1, 1] = True
+
+    assert derating.get_overstress_reasons(_overstress) == [
+        "",
+        "Operating current is less than limit in a harsh environment.\n"
+        "Operating voltage is greater than limit in a mild environment.\n",
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_overstress_violations():
+    """get_overstress_violations() should return one entry for each overstress
+    condition."""
+    _overstress = np.zeros((2, 3, 2, 2), dtype=bool)
+    _overstress[1, 0, 0, 0] = True
+    _overstress[1, 2, 1, 1] = True
+
+    _violations = derating.get_overstress_violations(
+        [10, 11], [[0.1, 0.2, 0.3], [-0.1, 0.5, 0.95]], _overstress
+    )
+
+    assert _violations["component_id"].tolist() == [11, 11]
+    assert _violations["stress"].tolist() == ["current", "voltage"]
+    assert _violations["environment"].tolist() == ["harsh", "mild"]
+    assert _violations["limit"].tolist() == ["lower", "upper"]
+    assert _violations["ratio"].tolist() == [-0.1, 0.95]
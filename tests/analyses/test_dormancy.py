@@ -9,6 +9,7 @@
 """Test class for the dormancy analysis module."""
 
 # Third Party Imports
+import numpy as np
 import pytest
 
 # RAMSTK Package Imports
@@ -41,3 +42,41 @@ def test_dormant_hazard_rate_bad_index():
         _hr_dormant = dormancy.do_calculate_dormant_hazard_rate(
             hw_info=[4, 5, 0.008642374], env_info=[3, 12]
         )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_dormant_hazard_rates():
+    """do_calculate_dormant_hazard_rates() should return the same dormant hazard
+    rates as do_calculate_dormant_hazard_rate() for every item."""
+    _hw_info = [[1, 1], [2, 1], [2, 3], [3, 4], [8, 2], [6, 1]]
+    _env_info = [[3, 2], [3, 2], [8, 1], [11, 4], [5, 3], [1, 1]]
+    _hazard_rates = np.linspace(0.001, 0.006, 6)
+
+    _hr_dormant = dormancy.do_calculate_dormant_hazard_rates(
+        [_hw[0] for _hw in _hw_info],
+        [_hw[1] for _hw in _hw_info],
+        [_env[0] for _env in _env_info],
+        [_env[1] for _env in _env_info],
+        _hazard_rates,
+    )
+
+    assert isinstance(_hr_dormant, np.ndarray)
+    assert _hr_dormant == pytest.approx(
+        [
+            dormancy.do_calculate_dormant_hazard_rate(_hw + [_hazard_rate], _env)
+            for _hw, _env, _hazard_rate in zip(_hw_info, _env_info, _hazard_rates)
+        ]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_dormant_hazard_rates_bad_index():
+    """do_calculate_dormant_hazard_rates() should return 0.0 for items with no
+    dormancy multiplier."""
+    _hr_dormant = dormancy.do_calculate_dormant_hazard_rates(
+        [4, 0, 9, 1], [5, 1, 1, 1], [3, 3, 3, 12], [12, 1, 1, 1], 0.008642374
+    )
+
+    assert _hr_dormant.tolist() == [0.0, 0.0, 0.0, 0.0]
@@ -0,0 +1,138 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.test_equation.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the user-defined equation module."""
+
+# Third Party Imports
+import numpy as np
+import pytest
+from sympy import SympifyError
+
+# RAMSTK Package Imports
+from ramstk.analyses import equation
+
+VARIABLES = ("uf1", "uf2", "res1", "res2")
+
+
+@pytest.mark.unit
+def test_get_compiled_equation():
+    """get_compiled_equation() should return a compiled function of the variables."""
+    _function = equation.get_compiled_equation("uf1*uf2", VARIABLES)
+
+    assert _function(1.5, 2.0, 0.0, 0.0) == 3.0
+    assert _function(np.array([1.0, 2.0]), 3.0, 0.0, 0.0).tolist() == [3.0, 6.0]
+
+
+@pytest.mark.unit
+def test_get_compiled_equation_cached():
+    """get_compiled_equation() should only compile an equation once."""
+    equation.get_compiled_equation.cache_clear()
+
+    _function = equation.get_compiled_equation("uf1+uf2", VARIABLES)
+
+    assert equation.get_compiled_equation("uf1+uf2", VARIABLES) is _function
+    assert equation.get_compiled_equation.cache_info().hits == 1
+    assert equation.get_compiled_equation.cache_info().misses == 1
+    assert (
+        equation.get_compiled_equation.cache_info().maxsize
+        == equation.EQUATION_CACHE_SIZE
+    )
+
+
+@pytest.mark.unit
+def test_get_compiled_equation_bad_equation():
+    """get_compiled_equation() should raise a SympifyError for a bad equation."""
+    with pytest.raises(SympifyError):
+        equation.get_compiled_equation("uf1*", VARIABLES)
+
+
+@pytest.mark.unit
+def test_do_calculate_equations():
+    """do_calculate_equations() should make each result available to the next
+    equation."""
+    _values = equation.do_calculate_equations(
+        {
+            "uf1": 1.5,
+            "uf2": 2.0,
+            "res1": 0.0,
+            "res2": 0.0,
+            "equation1": "uf1*uf2",
+            "equation2": "res1+1",
+        },
+        VARIABLES,
+        ["equation1", "equation2"],
+        ["res1", "res2"],
+    )
+
+    assert _values["res1"] == 3.0
+    assert _values["res2"] == 4.0
+    assert isinstance(_values["res2"], float)
+
+
+@pytest.mark.unit
+def test_do_calculate_all_equations():
+    """do_calculate_all_equations() should calculate each record with its own
+    equation."""
+    _values = equation.do_calculate_all_equations(
+        {
+            "uf1": [1.5, 2.0, 3.0],
+            "uf2": [2.0, 2.0, 2.0],
+            "res1": [0.0, 0.0, 0.0],
+            "res2": [0.0, 0.0, 8.0],
+            "equation1": ["uf1*uf2", "uf1+uf2", "uf1*uf2"],
+            "equation2": ["res1+1", "res1+1", "2"],
+        },
+        VARIABLES,
+        ["equation1", "equation2"],
+        ["res1", "res2"],
+    )
+
+    assert _values["res1"].tolist() == [3.0, 4.0, 6.0]
+    assert _values["res2"].tolist() == [4.0, 5.0, 2.0]
+
+
+@pytest.mark.unit
+def test_get_compiled_equation_divide_constant_by_zero():
+    """get_compiled_equation() should raise a ZeroDivisionError for an equation
+    that divides a constant by zero."""
+    with pytest.raises(ZeroDivisionError):
+        equation.get_compiled_equation("uf1/0", VARIABLES)
+
+
+@pytest.mark.unit
+def test_do_calculate_equations_divide_by_zero():
+    """do_calculate_equations() should raise a ZeroDivisionError when an equation
+    divides by zero."""
+    for _text in ["uf1/0", "uf1/uf2"]:
+        with pytest.raises(ZeroDivisionError):
+            equation.do_calculate_equations(
+                {"uf1": 1.5, "uf2": 0.0, "res1": 0.0, "res2": 0.0, "eq": _text},
+                VARIABLES,
+                ["eq"],
+                ["res1"],
+            )
+
+
+@pytest.mark.unit
+def test_do_calculate_all_equations_divide_by_zero():
+    """do_calculate_all_equations() should raise a ZeroDivisionError when an
+    equation divides by zero for any record just like do_calculate_equations()."""
+    for _text in ["uf1/0", "uf1/uf2"]:
+        with pytest.raises(ZeroDivisionError):
+            equation.do_calculate_all_equations(
+                {
+                    "uf1": [1.5, 1.5],
+                    "uf2": [2.0, 0.0],
+                    "res1": [0.0, 0.0],
+                    "res2": [0.0, 0.0],
+                    "eq": [_text, _text],
+                },
+                VARIABLES,
+                ["eq"],
+                ["res1"],
+            )
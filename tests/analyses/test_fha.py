@@ -196,3 +196,21 @@ def test_calculate_user_defined():
     assert _fha["res3"] == 0.0
     assert _fha["res4"] == 26.52
     assert _fha["res5"] == pytest.approx(90.168)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_all_user_defined():
+    """calculate_all_user_defined() should return the same results as
+    calculate_user_defined() for each hazard."""
+    _fha = fha.set_user_defined_functions(
+        TEST_FHA, ["uf1*uf2", "ui1+ui2", "res2*uf3", "res1-uf3", "res1*(ui3+uf1)"]
+    )
+    _fha = fha.set_user_defined_results(_fha, [0.0, 0.0, 0.0, 0.0, 0.0])
+    _expected = fha.calculate_user_defined(OrderedDict(_fha))
+
+    _all_fha = {_key: [_value] * 4 for _key, _value in _fha.items()}
+    _all_fha = fha.calculate_all_user_defined(_all_fha)
+
+    for _key in ["res1", "res2", "res3", "res4", "res5"]:
+        assert _all_fha[_key].tolist() == pytest.approx([_expected[_key]] * 4)
@@ -354,3 +354,26 @@ def test_calculate_user_defined():
     assert _sia["res3"] == 78.0
     assert _sia["res4"] == pytest.approx(0.00530604)
     assert _sia["res5"] == pytest.approx(0.00562275)
+
+
+@pytest.mark.unit
+def test_calculate_all_user_defined():
+    """calculate_all_user_defined() should return the same results as
+    calculate_user_defined() for each similar item."""
+    _sia = similaritem.set_user_defined_change_factors(
+        TEST_SIA, [1.2, 3.4, 5.6, 7.8, 9.10, 11.12, 13.14, 15.16, 17.18, 19.2]
+    )
+    _sia = similaritem.set_user_defined_functions(_sia, test_user_functions)
+    _sia = similaritem.set_user_defined_results(_sia, [0.0, 0.0, 0.0, 0.0, 0.0])
+    _expected = similaritem.calculate_user_defined(OrderedDict(_sia))
+
+    _all_sia = {_key: [_value, _value, _value] for _key, _value in _sia.items()}
+    _all_sia["hr"] = [0.0003825, 0.0003825, 0.001]
+    _all_sia["equation2"] = ["ui1+ui2", "ui1+ui2", "pi1*10"]
+    _all_sia = similaritem.calculate_all_user_defined(_all_sia)
+
+    for _key in ["res1", "res2", "res3", "res4", "res5"]:
+        assert _all_sia[_key][:2].tolist() == pytest.approx([_expected[_key]] * 2)
+    assert _all_sia["res1"][2] == pytest.approx(0.001 * 1.2 * 3.4 * _sia["uf1"])
+    assert _all_sia["res2"][2] == pytest.approx(12.0)
+    assert _all_sia["res3"][2] == pytest.approx(12.0 * 7.8)
@@ -832,6 +832,10 @@ def test_toml_user_configuration(make_home_config_dir):
             "validationbg": "#FFFFFF",
             "validationfg": "#000000",
         },
+        "loading": {
+            "function": "eager",
+            "mode": "lazy",
+        },
         "stress": {
             "integratedcircuit": [0.8, 0.9, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 125.0, 125.0],
             "semiconductor": [1.0, 1.0, 0.7, 0.9, 1.0, 1.0, 0.0, 0.0, 125.0, 125.0],
@@ -9,7 +9,10 @@
 """Test class for the BaseDatabase class algorithms and methods."""
 
 # Standard Library Imports
+import sqlite3
 import tempfile
+import threading
+import time
 
 # Third Party Imports
 import pytest
@@ -20,10 +23,18 @@ from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
 # RAMSTK Package Imports
-from ramstk.db.base import BaseDatabase
+from ramstk.db.base import (
+    PROGRAM_DB_INDEXES,
+    REVISION_CLONE_TABLES,
+    BaseDatabase,
+    do_create_program_db,
+    do_create_program_db_indexes,
+)
 from ramstk.exceptions import DataAccessError
 from ramstk.models import (
     RAMSTKFunctionRecord,
+    RAMSTKHardwareRecord,
+    RAMSTKReliabilityRecord,
     RAMSTKRevisionRecord,
     RAMSTKSiteInfoRecord,
 )
@@ -265,6 +276,82 @@ class TestInsertMethods:
 
         DUT.do_disconnect()
 
+    @pytest.mark.integration
+    def test_do_insert_many_chunked(self, test_program_dao):
+        """do_insert_many() should write all the records when they span several
+        chunks."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _revisions = []
+        for _revision_id in range(10, 15):
+            _revision = RAMSTKRevisionRecord()
+            _revision.revision_id = _revision_id
+            _revisions.append(_revision)
+
+        assert DUT.do_insert_many(_revisions, batch_size=2) is None
+        assert (
+            DUT.session.query(RAMSTKRevisionRecord)
+            .filter(RAMSTKRevisionRecord.revision_id.between(10, 14))
+            .count()
+            == 5
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_insert_many_duplicate_pk(self, test_program_dao):
+        """do_insert_many() should raise a DataAccessError naming the failed chunk
+        and write none of the records when one chunk fails."""
+
+        def on_fail_insert_record(error_message):
+            assert error_message.startswith(
+                "do_insert_many: Database error when attempting to insert records "
+                "3 through 4; no records were written."
+            )
+            print("\033[35m\nfail_insert_record topic was broadcast.")
+
+        pub.subscribe(on_fail_insert_record, "fail_insert_record")
+
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _revisions = []
+        for _revision_id in [20, 21, 22, 1]:
+            _revision = RAMSTKRevisionRecord()
+            _revision.revision_id = _revision_id
+            _revisions.append(_revision)
+
+        with pytest.raises(DataAccessError):
+            DUT.do_insert_many(_revisions, batch_size=2)
+
+        assert (
+            DUT.session.query(RAMSTKRevisionRecord)
+            .filter(RAMSTKRevisionRecord.revision_id.between(20, 22))
+            .count()
+            == 0
+        )
+
+        pub.unsubscribe(on_fail_insert_record, "fail_insert_record")
+
+        DUT.do_disconnect()
+
 
 @pytest.mark.usefixtures("test_common_dao", "test_program_dao")
 class TestDeleteMethods:
@@ -432,6 +519,269 @@ class TestUpdateMethods:
 
         DUT.do_disconnect()
 
+    @pytest.mark.integration
+    def test_do_update_many(self, test_common_dao):
+        """do_update_many() should return None when updating a group of records in
+        a database table."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _records = []
+        for _site_id in [4, 5, 6]:
+            _record = RAMSTKSiteInfoRecord()
+            _record.site_id = _site_id
+            _records.append(_record)
+        DUT.do_insert_many(_records)
+
+        for _record in _records:
+            _record.function_enabled = 1
+            _record.fta_enabled = 1
+
+        assert DUT.do_update_many(_records, batch_size=2) is None
+
+        DUT.session.expire_all()
+        for _record in (
+            DUT.session.query(RAMSTKSiteInfoRecord)
+            .filter(RAMSTKSiteInfoRecord.site_id.in_([4, 5, 6]))
+            .all()
+        ):
+            assert _record.function_enabled == 1
+            assert _record.fta_enabled == 1
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_many_wrong_data_type(self, test_common_dao):
+        """do_update_many() should raise a DataAccessError and send the fail message
+        when a record can't be written."""
+
+        def on_fail_update_record(error_message):
+            assert error_message.startswith(
+                "do_update_many: Database error when attempting to update records "
+                "1 through 1; no records were written."
+            )
+            print("\033[35m\nfail_update_record topic was broadcast.")
+
+        pub.subscribe(on_fail_update_record, "fail_update_record")
+
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _record = (
+            DUT.session.query(RAMSTKSiteInfoRecord)
+            .filter(RAMSTKSiteInfoRecord.site_id == 4)
+            .all()[0]
+        )
+        _record.expire_on = 0xA5
+
+        with pytest.raises(DataAccessError):
+            DUT.do_update_many([_record])
+
+        pub.unsubscribe(on_fail_update_record, "fail_update_record")
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_many_failed_chunk(self, test_common_dao):
+        """do_update_many() should flush only the records in each chunk so the
+        error message names the chunk with the record that can't be written."""
+
+        def on_fail_update_record(error_message):
+            assert error_message.startswith(
+                "do_update_many: Database error when attempting to update records "
+                "3 through 3; no records were written."
+            )
+            print("\033[35m\nfail_update_record topic was broadcast.")
+
+        pub.subscribe(on_fail_update_record, "fail_update_record")
+
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _records = (
+            DUT.session.query(RAMSTKSiteInfoRecord)
+            .filter(RAMSTKSiteInfoRecord.site_id.in_([4, 5, 6]))
+            .order_by(RAMSTKSiteInfoRecord.site_id)
+            .all()
+        )
+        _records[0].function_enabled = 0
+        _records[1].function_enabled = 0
+        _records[2].expire_on = 0xA5
+
+        with pytest.raises(DataAccessError):
+            DUT.do_update_many(_records, batch_size=2)
+
+        pub.unsubscribe(on_fail_update_record, "fail_update_record")
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_many_pending_changes(self, test_common_dao):
+        """do_update_many() should commit other changes pending in the session
+        along with the records."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _records = (
+            DUT.session.query(RAMSTKSiteInfoRecord)
+            .filter(RAMSTKSiteInfoRecord.site_id.in_([4, 5, 6]))
+            .order_by(RAMSTKSiteInfoRecord.site_id)
+            .all()
+        )
+        _records[0].rcm_enabled = 1
+        _records[1].rcm_enabled = 1
+        _records[2].rcm_enabled = 1
+
+        assert DUT.do_update_many(_records[:2], batch_size=1) is None
+
+        DUT.session.expire_all()
+        assert [_record.rcm_enabled for _record in _records] == [1, 1, 1]
+        assert not DUT.session.dirty
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_many_other_session(self, test_common_dao):
+        """do_update_many() should raise a DataAccessError when passed a record
+        attached to another session."""
+
+        def on_fail_update_record(error_message):
+            assert error_message.startswith(
+                "do_update_many: Database error when attempting to update records "
+                "1 through 2; no records were written."
+            )
+            print("\033[35m\nfail_update_record topic was broadcast.")
+
+        pub.subscribe(on_fail_update_record, "fail_update_record")
+
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _records = [
+            DUT.session.query(RAMSTKSiteInfoRecord).first(),
+            test_common_dao.session.query(RAMSTKSiteInfoRecord).first(),
+        ]
+        _records[0].rcm_enabled = 0
+
+        with pytest.raises(DataAccessError):
+            DUT.do_update_many(_records)
+
+        assert _records[0] in DUT.session
+
+        pub.unsubscribe(on_fail_update_record, "fail_update_record")
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_mappings_worker_thread(self, test_common_dao):
+        """do_update_mappings() should update records from a worker thread using
+        the worker thread's own session."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _mappings = [
+            {"site_id": _site_id, "function_enabled": 0, "fta_enabled": 0}
+            for _site_id in [4, 5, 6]
+        ]
+        _sessions = []
+
+        def _do_update():
+            _sessions.append(DUT.session())
+            DUT.do_update_mappings(RAMSTKSiteInfoRecord, _mappings, batch_size=2)
+            DUT.session.remove()
+
+        _worker = threading.Thread(target=_do_update)
+        _worker.start()
+        _worker.join()
+
+        assert _sessions[0] is not DUT.session()
+        for _record in (
+            DUT.session.query(RAMSTKSiteInfoRecord)
+            .filter(RAMSTKSiteInfoRecord.site_id.in_([4, 5, 6]))
+            .all()
+        ):
+            assert _record.function_enabled == 0
+            assert _record.fta_enabled == 0
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_update_mappings_wrong_data_type(self, test_common_dao):
+        """do_update_mappings() should raise a DataAccessError when a record can't
+        be written."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["dbname"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        with pytest.raises(DataAccessError):
+            DUT.do_update_mappings(
+                RAMSTKSiteInfoRecord, [{"site_id": 4, "expire_on": 0xA5}]
+            )
+
+        DUT.do_disconnect()
+
 
 @pytest.mark.usefixtures("test_common_dao")
 class TestSelectMethods:
@@ -582,6 +932,123 @@ class TestSelectMethods:
 
         assert _last_id == 0
 
+    @pytest.mark.integration
+    def test_get_next_id(self, test_program_dao):
+        """get_next_id() should allocate IDs above the table's high-water mark
+        without querying the table after each allocation."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _last_id = DUT.get_last_id("ramstk_revision", "fld_revision_id")
+
+        assert DUT.get_next_id("ramstk_revision", "fld_revision_id") == _last_id + 1
+        assert DUT.get_next_id("ramstk_revision", "revision_id") == _last_id + 2
+
+        DUT.do_release_id("ramstk_revision", "fld_revision_id", _last_id + 2)
+
+        assert DUT.get_next_id("ramstk_revision", "fld_revision_id") == _last_id + 2
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_get_next_id_multiple_users(self, test_program_dao):
+        """get_next_id() should reserve separate blocks of IDs for each
+        connection."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT1 = BaseDatabase()
+        DUT1.do_connect(config)
+        DUT2 = BaseDatabase()
+        DUT2.do_connect(config)
+
+        _ids1 = [DUT1.get_next_id("ramstk_function", "fld_function_id")]
+        _ids2 = [DUT2.get_next_id("ramstk_function", "fld_function_id")]
+        for __ in range(DUT1.id_block_size):
+            _ids1.append(DUT1.get_next_id("ramstk_function", "fld_function_id"))
+            _ids2.append(DUT2.get_next_id("ramstk_function", "fld_function_id"))
+
+        assert len(set(_ids1 + _ids2)) == 2 * (DUT1.id_block_size + 1)
+
+        DUT1.do_disconnect()
+        DUT2.do_disconnect()
+
+    @pytest.mark.integration
+    def test_get_next_id_after_insert(self, test_program_dao):
+        """get_next_id() should skip IDs used by records inserted without being
+        allocated."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _next_id = DUT.get_next_id("ramstk_revision", "fld_revision_id")
+
+        _revision = RAMSTKRevisionRecord()
+        _revision.revision_id = _next_id + 2
+        DUT.do_insert(_revision)
+
+        assert DUT.get_next_id("ramstk_revision", "fld_revision_id") == _next_id + 3
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_reserve_ids_multiple_users(self, test_program_dao):
+        """do_reserve_ids() should reserve a range of IDs that no other connection
+        hands out."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_program_dao.cxnargs["dbname"],
+        }
+        DUT1 = BaseDatabase()
+        DUT1.do_connect(config)
+        DUT2 = BaseDatabase()
+        DUT2.do_connect(config)
+
+        _id2 = DUT2.get_next_id("ramstk_function", "fld_function_id")
+        _first_id = DUT1.do_reserve_ids("ramstk_function", "fld_function_id", 100)
+        _ids2 = [_id2] + [
+            DUT2.get_next_id("ramstk_function", "fld_function_id")
+            for __ in range(2 * DUT2.id_block_size)
+        ]
+
+        assert not set(_ids2).intersection(range(_first_id, _first_id + 100))
+
+        DUT1.do_disconnect()
+        DUT2.do_disconnect()
+
+    @pytest.mark.integration
+    def test_get_next_id_no_database(self):
+        """get_next_id() should raise a DataAccessError when not connected to a
+        database."""
+        DUT = BaseDatabase()
+
+        with pytest.raises(DataAccessError):
+            DUT.get_next_id("ramstk_revision", "fld_revision_id")
+
     @pytest.mark.skip
     def test_get_database_list(self):
         """get_database_list() should return a list of database names available on the
@@ -604,3 +1071,397 @@ class TestSelectMethods:
         # How to test this now that the databases are being given a random name conf.py.
         assert "TestCommonDB" in _databases
         assert "TestProgramDB" in _databases
+
+
+def _do_connect_sqlite(database):
+    """Connect a BaseDatabase to a SQLite database file."""
+    _dao = BaseDatabase()
+    _dao.do_connect(
+        {
+            "dialect": "sqlite",
+            "user": "",
+            "password": "",
+            "host": "",
+            "port": "",
+            "database": str(database),
+        }
+    )
+
+    return _dao
+
+
+def _get_indexes(dao):
+    """Return the names of the indexes in a SQLite database."""
+    return {
+        _row[0]
+        for _row in dao.session.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
+        )
+    }
+
+
+class TestSchemaTuning:
+    """Class for the program database index and pragma test suite."""
+
+    @pytest.mark.unit
+    def test_do_connect_sqlite_pragmas(self, tmp_path):
+        """do_connect() should turn on WAL journaling, normal synchronization, and
+        memory mapping for SQLite databases and leave foreign keys alone."""
+        DUT = _do_connect_sqlite(tmp_path / "pragmas.ramstk")
+
+        assert DUT.session.execute("PRAGMA foreign_keys").scalar() == 0
+        assert DUT.session.execute("PRAGMA journal_mode").scalar() == "wal"
+        assert DUT.session.execute("PRAGMA synchronous").scalar() == 1
+        assert DUT.session.execute("PRAGMA mmap_size").scalar() > 0
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_do_create_program_db_indexes(self, tmp_path):
+        """do_create_program_db_indexes() should add the indexes to a database
+        and leave existing indexes alone when run again."""
+        DUT = _do_connect_sqlite(tmp_path / "indexes.ramstk")
+        RAMSTKRevisionRecord.__table__.create(bind=DUT.engine)
+        RAMSTKHardwareRecord.__table__.create(bind=DUT.engine)
+
+        assert do_create_program_db_indexes(DUT.engine) is None
+        assert do_create_program_db_indexes(DUT.engine) is None
+        assert _get_indexes(DUT) == {"idx_hardware_revision"}
+
+        _plan = " ".join(
+            str(_row[-1])
+            for _row in DUT.session.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM ramstk_hardware WHERE "
+                "fld_revision_id = 1 ORDER BY fld_hardware_id"
+            )
+        )
+        assert "USING INDEX idx_hardware_revision" in _plan
+        assert "TEMP B-TREE" not in _plan
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_do_create_program_db_indexes_old_schema(self, tmp_path):
+        """do_create_program_db_indexes() should skip the indexes on columns that
+        don't exist in an older program database."""
+        _database = str(tmp_path / "old.ramstk")
+        with open("./data/sqlite_program_db.sql", "r") as _sql_file:
+            do_create_program_db(
+                {"dialect": "sqlite", "database": _database}, _sql_file
+            )
+        DUT = _do_connect_sqlite(_database)
+        _indexes = _get_indexes(DUT)
+
+        do_create_program_db_indexes(DUT.engine)
+
+        assert "idx_hardware_revision" in _indexes
+        assert "idx_mode_revision" not in _indexes
+        assert _get_indexes(DUT) == _indexes
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_program_db_scripts_create_indexes(self):
+        """The postgres program database script should create every index."""
+        with open("./data/postgres_program_db.sql", "r") as _sql_file:
+            _script = _sql_file.read()
+
+        for _name, _table, _columns in PROGRAM_DB_INDEXES:
+            assert (
+                "CREATE INDEX {0} ON {1} ({2});".format(
+                    _name, _table, ", ".join(_columns)
+                )
+                in _script
+            )
+
+    @pytest.mark.unit
+    def test_program_db_migration_scripts(self):
+        """The index migration scripts should create the same indexes as the
+        program database scripts."""
+        for _dialect in ["sqlite", "postgres"]:
+            with open("./data/{0}_program_db.sql".format(_dialect), "r") as _sql_file:
+                _script = _sql_file.read()
+            with open(
+                "./data/{0}_program_db_indexes.sql".format(_dialect), "r"
+            ) as _sql_file:
+                _migration = _sql_file.read()
+
+            _indexes = [
+                _line.replace("CREATE INDEX ", "CREATE INDEX IF NOT EXISTS ")
+                for _line in _script.splitlines()
+                if _line.startswith("CREATE INDEX ")
+            ]
+            assert _indexes
+            assert [
+                _line
+                for _line in _migration.splitlines()
+                if _line.startswith("CREATE INDEX ")
+            ] == _indexes
+
+    @pytest.mark.unit
+    def test_sqlite_program_db_migration(self, tmp_path):
+        """The SQLite index migration script should add the indexes to an existing
+        program database and leave them alone when run again."""
+        _database = str(tmp_path / "migrate.ramstk")
+        with open("./data/sqlite_program_db.sql", "r") as _sql_file:
+            do_create_program_db(
+                {"dialect": "sqlite", "database": _database}, _sql_file
+            )
+        DUT = _do_connect_sqlite(_database)
+        _indexes = _get_indexes(DUT)
+        for _index in _indexes:
+            DUT.session.execute("DROP INDEX {0}".format(_index))
+        DUT.session.commit()
+        DUT.do_disconnect()
+
+        with open("./data/sqlite_program_db_indexes.sql", "r") as _sql_file:
+            _migration = _sql_file.read()
+        _connection = sqlite3.connect(_database)
+        _connection.executescript(_migration)
+        _connection.executescript(_migration)
+        _connection.close()
+
+        DUT = _do_connect_sqlite(_database)
+        assert _get_indexes(DUT) == _indexes
+
+        DUT.do_disconnect()
+
+    @pytest.mark.benchmark
+    def test_benchmark_revision_load(self, tmp_path):
+        """Report the time to load a revision from a 100,000 record database with
+        and without the indexes."""
+        DUT = _do_connect_sqlite(tmp_path / "benchmark.ramstk")
+        RAMSTKRevisionRecord.__table__.create(bind=DUT.engine)
+        RAMSTKHardwareRecord.__table__.create(bind=DUT.engine)
+        RAMSTKReliabilityRecord.__table__.create(bind=DUT.engine)
+
+        # Spread the records of 100 revisions through the tables the way they
+        # end up after years of edits.
+        DUT.engine.execute(
+            RAMSTKRevisionRecord.__table__.insert(),
+            [{"fld_revision_id": _revision_id} for _revision_id in range(1, 101)],
+        )
+        _records = [
+            {
+                "fld_revision_id": _hardware_id % 100 + 1,
+                "fld_hardware_id": _hardware_id,
+            }
+            for _hardware_id in range(1, 100001)
+        ]
+        DUT.engine.execute(RAMSTKHardwareRecord.__table__.insert(), _records)
+        DUT.engine.execute(RAMSTKReliabilityRecord.__table__.insert(), _records)
+
+        def _do_time_load():
+            """Return the median time to load revision 50 and its records."""
+            _times = []
+            for __ in range(7):
+                DUT.session.expunge_all()
+                _start = time.perf_counter()
+                _records = DUT.do_select_all(
+                    RAMSTKReliabilityRecord,
+                    key=["revision_id"],
+                    value=[50],
+                    order=RAMSTKReliabilityRecord.hardware_id,
+                )
+                _times.append(time.perf_counter() - _start)
+            return sorted(_times)[3], _records
+
+        _before, _records = _do_time_load()
+        assert len(_records) == 1000
+
+        do_create_program_db_indexes(DUT.engine)
+        _after, _records = _do_time_load()
+        assert len(_records) == 1000
+
+        _plan = " ".join(
+            str(_row[-1])
+            for _row in DUT.session.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM ramstk_reliability WHERE "
+                "fld_revision_id = 50 ORDER BY fld_hardware_id"
+            )
+        )
+        assert "USING INDEX idx_reliability_revision" in _plan
+
+        DUT.do_disconnect()
+
+        print(
+            "\033[36m\nRevision load from 100,000 records: {0:.1f} ms without "
+            "indexes, {1:.1f} ms with indexes.".format(
+                _before * 1000.0, _after * 1000.0
+            )
+        )
+
+
+def _do_make_clone_database(database, n_records=10):
+    """Create a SQLite program database with two revisions whose records are
+    interleaved.
+
+    Odd IDs belong to revision 1 and even IDs to revision 2.  The records with
+    the same ID refer to each other.  The first record of each revision is a
+    top-level record and the rest are its children.
+    """
+    with open("./data/postgres_program_db.sql", "r") as _sql_file:
+        do_create_program_db(
+            {"dialect": "sqlite", "database": str(database)}, _sql_file
+        )
+    _dao = _do_connect_sqlite(database)
+    _tables = RAMSTKRevisionRecord.metadata.tables
+
+    # Remove the records the script adds for a new program.
+    for _table, __, __ in reversed(REVISION_CLONE_TABLES):
+        _dao.engine.execute(_tables[_table].delete())
+    _dao.engine.execute(_tables["ramstk_revision"].delete())
+
+    _dao.engine.execute(
+        _tables["ramstk_revision"].insert(),
+        [
+            {"fld_revision_id": 1, "fld_name": "Original"},
+            {"fld_revision_id": 2, "fld_name": "Other"},
+        ],
+    )
+    for _table, _id_column, _references in REVISION_CLONE_TABLES:
+        _records = []
+        for _id in range(1, 2 * n_records + 1):
+            _record = {"fld_revision_id": 2 - _id % 2}
+            for _column in list(_references) + [_id_column or "fld_hardware_id"]:
+                _record[_column] = _id
+            if "fld_parent_id" in _references:
+                _record["fld_parent_id"] = 0 if _id < 3 else 2 - _id % 2
+            _records.append(_record)
+        _dao.engine.execute(_tables[_table].insert(), _records)
+
+    return _dao
+
+
+def _get_clone_ids(dao, table, column, revision_id):
+    """Return the sorted values of a column for a revision's records."""
+    return sorted(
+        _row[0]
+        for _row in dao.session.execute(
+            "SELECT {1} FROM {0} WHERE fld_revision_id = {2}".format(
+                table, column, revision_id
+            )
+        )
+    )
+
+
+class TestCloneRevision:
+    """Class for the revision clone test suite."""
+
+    @pytest.mark.unit
+    def test_do_clone_revision(self, tmp_path):
+        """do_clone_revision() should copy the revision and all its records with
+        new IDs that refer to the copied records."""
+        DUT = _do_make_clone_database(tmp_path / "clone.ramstk")
+
+        assert DUT.do_clone_revision(1, 3) is None
+
+        assert DUT.session.execute(
+            "SELECT fld_name FROM ramstk_revision WHERE fld_revision_id = 3"
+        ).scalar() == ("Original")
+        for _table, _id_column, _references in REVISION_CLONE_TABLES:
+            _id_column = _id_column or "fld_hardware_id"
+            _ids = _get_clone_ids(DUT, _table, _id_column, 3)
+
+            assert len(_ids) == 10
+            assert _ids[0] > 20
+            assert _get_clone_ids(DUT, _table, _id_column, 1) == list(range(1, 20, 2))
+            for _column, _referenced in _references.items():
+                _referenced_ids = _get_clone_ids(
+                    DUT,
+                    _referenced,
+                    dict((_t, _c) for _t, _c, __ in REVISION_CLONE_TABLES)[_referenced],
+                    3,
+                )
+                if _column == "fld_parent_id":
+                    assert (
+                        _get_clone_ids(DUT, _table, _column, 3)
+                        == [0] + [_referenced_ids[0]] * 9
+                    )
+                else:
+                    assert set(_get_clone_ids(DUT, _table, _column, 3)) <= set(
+                        _referenced_ids
+                    )
+        assert DUT.session.execute("PRAGMA foreign_key_check").fetchall() == []
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_do_clone_revision_next_id(self, tmp_path):
+        """do_clone_revision() should skip the IDs already handed out by
+        get_next_id() and get_next_id() should hand out IDs after the copied
+        records."""
+        DUT = _do_make_clone_database(tmp_path / "clone.ramstk")
+
+        assert DUT.get_next_id("ramstk_hardware", "fld_hardware_id") == 21
+
+        DUT.do_clone_revision(1, 3)
+
+        assert _get_clone_ids(DUT, "ramstk_hardware", "fld_hardware_id", 3) == list(
+            range(22, 41, 2)
+        )
+        assert DUT.get_next_id("ramstk_hardware", "fld_hardware_id") == 41
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_do_clone_revision_non_existent_id(self, tmp_path):
+        """do_clone_revision() should raise a DataAccessError and copy nothing
+        when the revision doesn't exist."""
+        DUT = _do_make_clone_database(tmp_path / "clone.ramstk")
+
+        with pytest.raises(DataAccessError):
+            DUT.do_clone_revision(10, 3)
+
+        assert _get_clone_ids(DUT, "ramstk_hardware", "fld_hardware_id", 3) == []
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_do_clone_revision_rollback(self, tmp_path):
+        """do_clone_revision() should raise a DataAccessError and copy nothing
+        when any table can't be copied."""
+        DUT = _do_make_clone_database(tmp_path / "clone.ramstk")
+
+        with pytest.raises(DataAccessError):
+            DUT.do_clone_revision(1, 2)
+
+        assert _get_clone_ids(DUT, "ramstk_hardware", "fld_hardware_id", 2) == list(
+            range(2, 21, 2)
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_clone_revision_postgres(self, test_program_dao):
+        """do_clone_revision() should copy a revision in a PostgreSQL database."""
+        _new_id = test_program_dao.get_next_id("ramstk_revision", "fld_revision_id")
+
+        test_program_dao.do_clone_revision(1, _new_id)
+
+        for _table, _id_column, __ in REVISION_CLONE_TABLES:
+            _id_column = _id_column or "fld_hardware_id"
+            assert len(
+                _get_clone_ids(test_program_dao, _table, _id_column, _new_id)
+            ) == len(_get_clone_ids(test_program_dao, _table, _id_column, 1))
+
+    @pytest.mark.benchmark
+    def test_benchmark_clone_revision(self, tmp_path):
+        """Report the time to copy a revision with 50,000 records in every
+        table."""
+        DUT = _do_make_clone_database(tmp_path / "benchmark.ramstk", 50000)
+
+        _start = time.perf_counter()
+        DUT.do_clone_revision(1, 3)
+        _elapsed = time.perf_counter() - _start
+
+        assert len(_get_clone_ids(DUT, "ramstk_test_method", "fld_test_id", 3)) == (
+            50000
+        )
+
+        DUT.do_disconnect()
+
+        print(
+            "\033[36m\nCopied a revision with 50,000 records per table in "
+            "{0:.1f} s.".format(_elapsed)
+        )
@@ -9,6 +9,8 @@
 """Test class for common database methods and operations."""
 
 # Standard Library Imports
+import json
+import os
 from datetime import date, timedelta
 
 # Third Party Imports
@@ -19,6 +21,9 @@ from pubsub import pub
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
 from ramstk.db.common import (
+    SITE_SNAPSHOT_FILE,
+    SITE_VARIABLES,
+    _do_get_change_stamp,
     _do_load_action_variables,
     _do_load_hardware_variables,
     _do_load_incident_variables,
@@ -27,6 +32,8 @@ from ramstk.db.common import (
     _do_load_rpn_variables,
     _do_load_severity,
     _do_load_user_workgroups,
+    _do_read_site_snapshot,
+    _do_write_site_snapshot,
     _load_fmea_tables,
     _load_hazard_analysis_tables,
     _load_incident_report_tables,
@@ -1043,3 +1050,78 @@ class TestLoadCommonTables:
     def test_do_load_variables(self, test_common_dao, test_toml_user_configuration):
         """_do_load_variables() should return None."""
         assert do_load_variables(test_common_dao, test_toml_user_configuration) is None
+
+    def test_do_load_variables_snapshot(
+        self, test_common_dao, test_toml_user_configuration
+    ):
+        """do_load_variables() should write a snapshot of the variables and load
+        the variables from it the next time."""
+        _snapshot_file = os.path.join(
+            test_toml_user_configuration.RAMSTK_CONF_DIR, SITE_SNAPSHOT_FILE
+        )
+        if os.path.exists(_snapshot_file):
+            os.remove(_snapshot_file)
+
+        do_load_variables(test_common_dao, test_toml_user_configuration)
+
+        assert os.path.exists(_snapshot_file)
+
+        _severity = dict(test_toml_user_configuration.RAMSTK_SEVERITY)
+        test_toml_user_configuration.RAMSTK_SEVERITY.clear()
+
+        do_load_variables(test_common_dao, test_toml_user_configuration)
+
+        assert test_toml_user_configuration.RAMSTK_SEVERITY == _severity
+
+    def test_do_get_change_stamp(self, test_common_dao):
+        """_do_get_change_stamp() should return the same stamp until a site table
+        changes."""
+        _stamp = _do_get_change_stamp(test_common_dao)
+
+        assert _stamp != ""
+        assert _do_get_change_stamp(test_common_dao) == _stamp
+
+        _user = test_common_dao.session.query(RAMSTKUser).first()
+        _phone = _user.user_phone
+        _user.user_phone = "555-555-1212"
+        test_common_dao.session.commit()
+
+        assert _do_get_change_stamp(test_common_dao) != _stamp
+
+        _user.user_phone = _phone
+        test_common_dao.session.commit()
+
+        assert _do_get_change_stamp(test_common_dao) == _stamp
+
+
+def test_do_read_site_snapshot(tmp_path):
+    """_do_read_site_snapshot() should return the variables written for the same
+    key and None for a different key or a missing file."""
+    _snapshot_file = str(tmp_path / SITE_SNAPSHOT_FILE)
+    _variables = {_name: {} for _name in SITE_VARIABLES}
+    _variables["RAMSTK_HAZARDS"] = {1: ("Common Causes", "Poorly Located")}
+    _variables["RAMSTK_FAILURE_MODES"] = {3: {24: {1: ["Open", 0.5, "FMD-97"]}}}
+
+    assert _do_read_site_snapshot(_snapshot_file, (1, "sqlite://", "1:2")) is None
+
+    _do_write_site_snapshot(_snapshot_file, (1, "sqlite://", "1:2"), _variables)
+
+    with open(_snapshot_file, "r") as _file:
+        assert json.load(_file)["variables"]["RAMSTK_HAZARDS"] == {
+            "1": {"__tuple__": ["Common Causes", "Poorly Located"]}
+        }
+
+    assert _do_read_site_snapshot(_snapshot_file, (1, "sqlite://", "1:2")) == (
+        _variables
+    )
+    assert _do_read_site_snapshot(_snapshot_file, (1, "sqlite://", "1:3")) is None
+    assert _do_read_site_snapshot(_snapshot_file, (2, "sqlite://", "1:2")) is None
+
+
+def test_do_read_site_snapshot_corrupt(tmp_path):
+    """_do_read_site_snapshot() should return None if the snapshot can't be
+    read."""
+    _snapshot_file = tmp_path / SITE_SNAPSHOT_FILE
+    _snapshot_file.write_bytes(b"not a snapshot")
+
+    assert _do_read_site_snapshot(str(_snapshot_file), (1, "", "")) is None
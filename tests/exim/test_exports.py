@@ -8,201 +8,263 @@
 # Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing the Exports module."""
 
+# Standard Library Imports
+import os
+
 # Third Party Imports
 import pandas as pd
 import pytest
+from openpyxl import load_workbook
 from pubsub import pub
 
 # RAMSTK Package Imports
+from ramstk.db.base import BaseDatabase
 from ramstk.exim import Export
-from ramstk.models import (
-    RAMSTKFunctionTable,
-    RAMSTKHardwareTable,
-    RAMSTKRequirementTable,
-    RAMSTKValidationTable,
-)
-
-
-@pytest.mark.usefixtures("test_program_dao")
-class TestExport:
-    """Test class for export methods."""
-
-    @pytest.mark.unit
-    def test_do_load_output_function(self, test_program_dao):
-        """do_load_output() should return a Pandas DataFrame when loading Functions for
-        export."""
-        _function = RAMSTKFunctionTable()
-        _function.do_connect(test_program_dao)
-        _function.do_select_all(attributes={"revision_id": 1})
-
-        DUT = Export()
+from ramstk.models import RAMSTKFunctionTable
 
-        pub.sendMessage("request_get_function_tree")
 
-        assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data["function"], dict)
-
-    @pytest.mark.unit
-    def test_do_load_output_requirement(self, test_program_dao):
-        """do_load_output() should return None when loading Requirements for export."""
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
-
-        DUT = Export()
+@pytest.fixture(scope="function")
+def test_export(test_program_dao):
+    """Create an Export instance connected to the test program database."""
+    DUT = Export()
+    pub.sendMessage("succeed_connect_program_database", dao=test_program_dao)
+    pub.sendMessage("selected_revision", attributes={"revision_id": 1})
 
-        pub.sendMessage("request_get_requirement_tree")
+    yield DUT
 
-        assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data["requirement"], dict)
+    pub.unsubscribe(DUT._do_connect, "succeed_connect_program_database")
+    pub.unsubscribe(DUT._do_set_revision, "selected_revision")
+    pub.unsubscribe(DUT._do_export, "request_export_data")
 
-    @pytest.mark.skip
-    def test_do_load_output_hardware(self, test_program_dao):
-        """do_load_output() should return None when loading Hardware for export."""
-        _hardware = RAMSTKHardwareTable()
-        _hardware.do_connect(test_program_dao)
-        _hardware.do_select_all(attributes={"revision_id": 1})
 
-        DUT = Export()
-
-        pub.sendMessage("request_get_hardware_tree")
+@pytest.mark.usefixtures("test_program_dao", "test_export")
+class TestExport:
+    """Test class for export methods."""
 
-        assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data["hardware"], dict)
+    def on_fail_export_data(self, error_message):
+        assert error_message == (
+            "_do_export: There was a problem exporting data.  Make sure a program "
+            "database is open."
+        )
+        print("\033[35m\nfail_export_data topic was broadcast.")
 
     @pytest.mark.unit
-    def test_do_load_output_validation(self, test_program_dao):
-        """do_load_output() should return None when loading Validations for export."""
-        _validation = RAMSTKValidationTable()
-        _validation.do_connect(test_program_dao)
-        _validation.do_select_all(attributes={"revision_id": 1})
+    def test_create_export(self, test_export):
+        """__init__() should return an instance of the Export data model that
+        doesn't listen to the work stream module trees."""
+        assert isinstance(test_export, Export)
+        assert test_export._revision_id == 1
+        assert pub.isSubscribed(
+            test_export._do_connect, "succeed_connect_program_database"
+        )
+        assert pub.isSubscribed(test_export._do_set_revision, "selected_revision")
+        assert pub.isSubscribed(test_export._do_export, "request_export_data")
+        assert not hasattr(test_export, "_dic_output_data")
 
-        DUT = Export()
+    @pytest.mark.unit
+    def test_do_load_data(self, test_program_dao, test_export):
+        """_do_load_data() should return a DataFrame with one row per record and
+        one column per attribute for each module."""
+        _function = RAMSTKFunctionTable()
+        _function.do_connect(test_program_dao)
+        _function.do_select_all(attributes={"revision_id": 1})
 
-        pub.sendMessage("request_get_validation_tree")
+        _frames = test_export._do_load_data(["function", "requirement"])
 
-        assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data["validation"], dict)
+        assert list(_frames) == ["function", "requirement"]
+        assert isinstance(_frames["function"], pd.DataFrame)
+        assert len(_frames["function"].index) == _function.tree.size() - 1
+        assert sorted(_frames["function"].columns) == sorted(
+            _function.do_select(1).get_attributes()
+        )
+        assert _frames["function"]["function_id"].is_monotonic_increasing
+        assert (_frames["requirement"]["revision_id"] == 1).all()
 
     @pytest.mark.unit
-    def test_do_export_to_csv(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to a CSV file."""
+    def test_do_load_data_unsaved_changes(self, test_program_dao, test_export):
+        """_do_load_data() should include changes to the records in the module
+        trees that haven't been saved."""
         _function = RAMSTKFunctionTable()
         _function.do_connect(test_program_dao)
         _function.do_select_all(attributes={"revision_id": 1})
+        _function.do_select(1).name = "Unsaved function name"
 
-        DUT = Export()
+        _frames = test_export._do_load_data(["function"])
 
-        pub.sendMessage("request_get_functions_tree")
+        assert (
+            _frames["function"].set_index("function_id").loc[1, "name"]
+            == "Unsaved function name"
+        )
 
-        _test_csv = test_export_dir + "test_export_function.csv"
-        assert DUT._do_export("csv", _test_csv) is None
+    @pytest.mark.unit
+    def test_do_load_data_unknown_module(self, test_export):
+        """_do_load_data() should raise a KeyError when passed an unknown
+        module."""
+        with pytest.raises(KeyError):
+            test_export._do_load_data(["shibboly"])
 
     @pytest.mark.unit
-    def test_do_export_to_xls(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to an Excel file."""
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
+    def test_do_export_no_database(self, test_export_dir):
+        """_do_export() should send the fail message when not connected to a
+        program database."""
+        pub.subscribe(self.on_fail_export_data, "fail_export_data")
 
         DUT = Export()
+        DUT._dao = BaseDatabase()
 
-        pub.sendMessage("request_get_requirements_tree")
+        _test_csv = test_export_dir + "test_export_none.csv"
+        DUT._do_export("csv", _test_csv)
 
-        _test_excel = test_export_dir + "test_export_requirement.xls"
-        assert DUT._do_export("excel", _test_excel) is None
+        assert not os.path.exists(_test_csv)
+
+        pub.unsubscribe(self.on_fail_export_data, "fail_export_data")
+        pub.unsubscribe(DUT._do_connect, "succeed_connect_program_database")
+        pub.unsubscribe(DUT._do_set_revision, "selected_revision")
+        pub.unsubscribe(DUT._do_export, "request_export_data")
 
     @pytest.mark.unit
-    def test_do_export_to_xlsx(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to an Excel file."""
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
+    def test_do_export_to_csv(self, test_export, test_export_dir):
+        """_do_export() should write a single module to the named CSV file."""
+        _test_csv = test_export_dir + "test_export_function.csv"
 
-        DUT = Export()
+        pub.sendMessage(
+            "request_export_data",
+            file_type="csv",
+            file_name=_test_csv,
+            modules=["function"],
+        )
+
+        _data = pd.read_csv(_test_csv, sep=";")
+        assert (
+            _data["function_id"].tolist()
+            == test_export._do_load_data(["function"])["function"][
+                "function_id"
+            ].tolist()
+        )
+
+    @pytest.mark.unit
+    def test_do_export_to_csv_all_modules(self, test_export, test_export_dir):
+        """_do_export() should write each module to its own CSV file."""
+        _test_csv = test_export_dir + "test_export_all.csv"
 
-        pub.sendMessage("request_get_requirements_tree")
+        pub.sendMessage("request_export_data", file_type="csv", file_name=_test_csv)
 
-        _test_excel = test_export_dir + "test_export_requirement.xlsx"
-        assert DUT._do_export("excel", _test_excel) is None
+        for _module in ["function", "requirement", "hardware", "validation"]:
+            assert os.path.exists(test_export_dir + f"test_export_all_{_module}.csv")
 
     @pytest.mark.unit
-    def test_do_export_to_xlsm(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to an Excel file."""
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
+    def test_do_export_to_text(self, test_export, test_export_dir):
+        """_do_export() should write a single module to the named text file."""
+        _test_text = test_export_dir + "test_export_function.txt"
 
-        DUT = Export()
+        test_export._do_export("text", _test_text, modules=["function"])
+
+        assert "function_id" in pd.read_csv(_test_text, sep=" ").columns
 
-        pub.sendMessage("request_get_requirements_tree")
+    @pytest.mark.unit
+    def test_do_export_unknown_type(self, test_export, test_export_dir):
+        """_do_export() should return None when passed an unknown file type."""
+        _test_text = test_export_dir + "test_export_unknown.pdf"
 
-        _test_excel = test_export_dir + "test_export_requirement.xlsm"
-        assert DUT._do_export("excel", _test_excel) is None
+        assert test_export._do_export("pdf", _test_text) is None
+        assert not os.path.exists(_test_text)
 
     @pytest.mark.unit
-    def test_do_export_to_excel_unknown_extension(
-        self, test_program_dao, test_export_dir
-    ):
-        """do_export() should return None when exporting to an Excel file and default
-        to using the xlwt engine."""
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
+    @pytest.mark.parametrize("extension", [".xlsx", ".xlsm"])
+    def test_do_export_to_xlsx(self, test_export, test_export_dir, extension):
+        """_do_export() should write each module to its own worksheet in one
+        workbook."""
+        _test_excel = test_export_dir + "test_export_multi" + extension
+
+        test_export._do_export("excel", _test_excel)
+
+        _workbook = load_workbook(_test_excel, read_only=True)
+        assert _workbook.sheetnames == [
+            "function",
+            "requirement",
+            "hardware",
+            "validation",
+        ]
+        _rows = list(_workbook["requirement"].iter_rows(values_only=True))
+        assert "requirement_id" in _rows[0]
+        assert len(_rows) - 1 == len(
+            test_export._do_load_data(["requirement"])["requirement"].index
+        )
+        _workbook.close()
 
-        DUT = Export()
+    @pytest.mark.unit
+    def test_do_export_to_xls(self, test_export, test_export_dir):
+        """_do_export() should write each module to its own worksheet in an
+        Excel 97 workbook."""
+        _test_excel = test_export_dir + "test_export_requirement.xls"
 
-        pub.sendMessage("request_get_requirements_tree")
+        test_export._do_export(
+            "excel", _test_excel, modules=["function", "requirement"]
+        )
 
-        _test_excel = test_export_dir + "test_export_requirement.xlbb"
-        assert DUT._do_export("excel", _test_excel) is None
+        assert list(pd.read_excel(_test_excel, sheet_name=None)) == [
+            "function",
+            "requirement",
+        ]
 
     @pytest.mark.unit
-    def test_do_export_to_text(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to a text file."""
-        _function = RAMSTKFunctionTable()
-        _function.do_connect(test_program_dao)
-        _function.do_select_all(attributes={"revision_id": 1})
-
-        DUT = Export()
+    def test_do_export_to_excel_unknown_extension(self, test_export, test_export_dir):
+        """_do_export() should default to an Excel 97 workbook when passed an
+        unknown extension."""
+        _test_excel = test_export_dir + "test_export_requirement.xlbb"
 
-        pub.sendMessage("request_get_functions_tree")
+        test_export._do_export("excel", _test_excel, modules=["requirement"])
 
-        _test_text = test_export_dir + "test_export_function.txt"
-        assert DUT._do_export("text", _test_text) is None
+        assert os.path.exists(test_export_dir + "test_export_requirement.xls")
 
     @pytest.mark.unit
-    def test_do_export_unknown_type(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to a text file."""
-        _function = RAMSTKFunctionTable()
-        _function.do_connect(test_program_dao)
-        _function.do_select_all(attributes={"revision_id": 1})
+    @pytest.mark.parametrize(
+        "file_type, reader", [("feather", "read_feather"), ("parquet", "read_parquet")]
+    )
+    def test_do_export_to_columnar(
+        self, test_export, test_export_dir, file_type, reader
+    ):
+        """_do_export() should write each module to its own Feather or Parquet
+        file."""
+        pytest.importorskip("pyarrow")
 
-        DUT = Export()
+        _test_file = test_export_dir + f"test_export_all.{file_type}"
 
-        pub.sendMessage("request_get_functions_tree")
+        test_export._do_export(file_type, _test_file, modules=["function", "hardware"])
 
-        _test_text = test_export_dir + "test_export_function.txt"
-        assert DUT._do_export("pdf", _test_text) is None
+        _data = getattr(pd, reader)(
+            test_export_dir + f"test_export_all_function.{file_type}"
+        )
+        assert (
+            _data["function_id"].tolist()
+            == test_export._do_load_data(["function"])["function"][
+                "function_id"
+            ].tolist()
+        )
+        assert os.path.exists(test_export_dir + f"test_export_all_hardware.{file_type}")
 
     @pytest.mark.unit
-    def test_do_export_multi_sheet(self, test_program_dao, test_export_dir):
-        """do_export() should return None when exporting to a text file."""
-        _function = RAMSTKFunctionTable()
-        _function.do_connect(test_program_dao)
-        _function.do_select_all(attributes={"revision_id": 1})
-
-        _requirement = RAMSTKRequirementTable()
-        _requirement.do_connect(test_program_dao)
-        _requirement.do_select_all(attributes={"revision_id": 1})
+    def test_do_export_to_columnar_missing_package(
+        self, monkeypatch, test_export, test_export_dir
+    ):
+        """_do_export() should send the fail message when the package needed to
+        write the file isn't installed."""
 
-        DUT = Export()
+        def _no_pyarrow(*args, **kwargs):
+            raise ImportError("Missing optional dependency 'pyarrow'.")
 
-        pub.sendMessage("request_get_functions_tree")
-        pub.sendMessage("request_get_requirements_tree")
+        def on_fail_export_data(error_message):
+            assert error_message == (
+                "_do_export: There was a problem exporting data to a feather "
+                "file: Missing optional dependency 'pyarrow'."
+            )
+            print("\033[35m\nfail_export_data topic was broadcast.")
 
-        _test_multi = test_export_dir + "test_export_multi.xlsx"
+        monkeypatch.setattr(pd.DataFrame, "to_feather", _no_pyarrow)
+        pub.subscribe(on_fail_export_data, "fail_export_data")
 
-        pub.sendMessage("request_export_data", file_type="excel", file_name=_test_multi)
+        test_export._do_export(
+            "feather", test_export_dir + "test_export.feather", modules=["function"]
+        )
 
-        assert isinstance(DUT._df_output_data, pd.core.frame.DataFrame)
+        pub.unsubscribe(on_fail_export_data, "fail_export_data")
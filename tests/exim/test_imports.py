@@ -15,6 +15,7 @@ from collections import OrderedDict
 
 # Third Party Imports
 import numpy as np
+import openpyxl
 import pandas as pd
 import pytest
 from pubsub import pub
@@ -22,6 +23,7 @@ from pubsub import pub
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
 from ramstk.exim import Import, _do_replace_nan, _get_input_value
+from ramstk.exim.imports import _do_read_chunks
 
 
 @pytest.mark.usefixtures("test_csv_file_function", "test_program_dao")
@@ -81,6 +83,10 @@ class TestImport:
         assert pub.isSubscribed(DUT._do_map_to_field, "request_map_to_field")
         assert pub.isSubscribed(DUT._do_read_db_fields, "request_db_fields")
         assert pub.isSubscribed(DUT._do_read_file, "request_read_import_file")
+        assert pub.isSubscribed(DUT._do_import, "request_import")
+        assert pub.isSubscribed(DUT._do_import_file, "request_import_file")
+        assert DUT.chunk_size == 5000
+        assert DUT._dic_import_errors == {}
 
     @pytest.mark.unit
     def test_do_read_file_csv(self, test_csv_file_function):
@@ -698,3 +704,147 @@ class TestImport:
             DUT._do_map_to_field("Validation", list(DUT._df_input_data)[_idx], _key)
 
         assert DUT._do_import("Shibboly") is None
+
+
+def _do_write_function_file(file_name, function_ids):
+    """Write a *.csv file with a Function record for each function ID."""
+    pd.DataFrame(
+        [
+            [1, _function_id, 1, "FUNC-{}".format(_function_id), "", 0, "", 0, 0]
+            for _function_id in function_ids
+        ],
+        columns=[
+            "Revision ID",
+            "Function ID",
+            "Level",
+            "Function Code",
+            "Function Name",
+            "Parent",
+            "Remarks",
+            "Safety Critical",
+            "Type",
+        ],
+    ).to_csv(file_name, sep=";", index=False)
+
+
+@pytest.mark.usefixtures("test_program_dao")
+class TestImportFile:
+    """Test class for streaming import methods."""
+
+    def on_succeed_import_chunk(self, module, chunk_id, n_rows):
+        self._chunks.append((module, chunk_id, n_rows))
+        print("\033[36m\nsucceed_import_chunk topic was broadcast.")
+
+    def on_fail_import_chunk(self, module, chunk_id, error_message):
+        self._failures.append((module, chunk_id))
+        print("\033[35m\nfail_import_chunk topic was broadcast.")
+
+    def on_fail_import_module(self, error_message):
+        assert error_message == (
+            "_do_import_file: There was a problem importing Function records in "
+            "chunk(s) 2; the other chunks were imported.  This is usually caused "
+            "by key violations; check the ID and/or parent ID fields in the "
+            "import file."
+        )
+        print("\033[35m\nfail_import_module topic was broadcast.")
+
+    @pytest.mark.unit
+    def test_do_build_records(self, test_csv_file_hardware):
+        """_do_build_records() should set the same values as _get_input_value()."""
+        DUT = Import()
+
+        DUT._do_read_file("csv", test_csv_file_hardware)
+        for _idx, _key in enumerate(DUT._dic_field_map["Hardware"]):
+            DUT._do_map_to_field("Hardware", list(DUT._df_input_data)[_idx], _key)
+
+        _records = DUT._do_build_records(
+            "Hardware",
+            DUT._df_input_data,
+            {_column: _idx for _idx, _column in enumerate(DUT._df_input_data)},
+        )
+
+        assert len(_records) == 8
+        _record_class, _fields = DUT._dic_record_fields["Hardware"][0]
+        assert isinstance(_records[0], _record_class)
+        for _attribute, _map, _field, _default in _fields:
+            assert getattr(_records[0], _attribute) == _get_input_value(
+                DUT._dic_field_map[_map],
+                DUT._df_input_data.iloc[0],
+                _field,
+                _default,
+            )
+
+    @pytest.mark.unit
+    def test_do_read_chunks_csv(self, tmp_path):
+        """_do_read_chunks() should return chunk_size rows at a time."""
+        _file_name = str(tmp_path / "functions.csv")
+        _do_write_function_file(_file_name, range(1, 6))
+
+        _chunks = list(_do_read_chunks("csv", _file_name, 2))
+
+        assert [len(_chunk.index) for _chunk in _chunks] == [2, 2, 1]
+        assert _chunks[2]["Function ID"].tolist() == [5]
+
+    @pytest.mark.unit
+    def test_do_read_chunks_xlsx(self, tmp_path):
+        """_do_read_chunks() should return chunk_size rows at a time from an
+        Excel workbook."""
+        _file_name = str(tmp_path / "functions.xlsx")
+        _workbook = openpyxl.Workbook()
+        _workbook.active.append(["Function ID", None, "Function Code"])
+        for _function_id in range(1, 6):
+            _workbook.active.append(
+                [_function_id, None, "FUNC-{}".format(_function_id)]
+            )
+        _workbook.save(_file_name)
+
+        _chunks = list(_do_read_chunks("excel", _file_name, 2))
+
+        assert [len(_chunk.index) for _chunk in _chunks] == [2, 2, 1]
+        assert list(_chunks[0].columns) == [
+            "Function ID",
+            "Unnamed: 1",
+            "Function Code",
+        ]
+        assert _chunks[1]["Function Code"].tolist() == ["FUNC-3", "FUNC-4"]
+
+    @pytest.mark.unit
+    def test_do_import_file(self, test_program_dao, tmp_path):
+        """_do_import_file() should insert and commit the records one chunk at a
+        time and skip the chunks that fail."""
+        self._chunks = []
+        self._failures = []
+        pub.subscribe(self.on_succeed_import_chunk, "succeed_import_chunk")
+        pub.subscribe(self.on_fail_import_chunk, "fail_import_chunk")
+        pub.subscribe(self.on_fail_import_module, "fail_import_module")
+
+        _file_name = str(tmp_path / "functions.csv")
+        _do_write_function_file(_file_name, [20, 21, 21, 22, 23])
+
+        DUT = Import()
+        DUT.chunk_size = 2
+        DUT._do_connect(test_program_dao)
+
+        DUT._do_read_file("csv", _file_name)
+        for _idx, _key in enumerate(DUT._dic_field_map["Function"]):
+            DUT._do_map_to_field("Function", list(DUT._df_input_data)[_idx], _key)
+
+        DUT._do_import_file("Function", "csv", _file_name)
+
+        assert self._chunks == [("Function", 1, 2), ("Function", 3, 3)]
+        assert self._failures == [("Function", 2)]
+        assert list(DUT._dic_import_errors) == [2]
+        assert sorted(
+            _record.function_code
+            for _record in test_program_dao.session.query(
+                DUT._dic_record_fields["Function"][0][0]
+            ).filter(
+                DUT._dic_record_fields["Function"][0][0].function_id.in_(
+                    [20, 21, 22, 23]
+                )
+            )
+        ) == ["FUNC-20", "FUNC-21", "FUNC-23"]
+
+        pub.unsubscribe(self.on_succeed_import_chunk, "succeed_import_chunk")
+        pub.unsubscribe(self.on_fail_import_chunk, "fail_import_chunk")
+        pub.unsubscribe(self.on_fail_import_module, "fail_import_module")
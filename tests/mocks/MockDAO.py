@@ -21,6 +21,7 @@ class MockDAO:
     def __init__(self):
         """Initialize an instance of the Mock DAO."""
         self.table: List[object] = []
+        self.mappings: List[Dict[str, Any]] = []
 
     def do_select_all(self, table, **kwargs: Dict[str, Any]) -> List[object]:
         """Mock the do_select_all() method."""
@@ -69,6 +70,53 @@ class MockDAO:
         """
         pass
 
+    def do_update_mappings(self, table, mappings, batch_size=0) -> None:
+        """Mock the do_update_mappings() method.
+
+        :param table: the database table object the records belong to.
+        :param mappings: the column values of each record to update.
+        :param batch_size: the number of records to write in each chunk.
+        """
+        self.mappings.extend(mappings)
+
+    def do_clone_revision(self, revision_id: int, new_revision_id: int) -> None:
+        """Mock the do_clone_revision() method.
+
+        :param revision_id: the ID of the revision to copy.
+        :param new_revision_id: the ID to give the new revision.
+        """
+        for _record in self.table:
+            if _record.revision_id == revision_id:
+                _clone = type(_record)()
+                for _key, _value in _record.get_attributes().items():
+                    setattr(_clone, _key, _value)
+                _clone.revision_id = new_revision_id
+                self.table.append(_clone)
+                return
+
+        raise DataAccessError("Mock DAO do_clone_revision() error.")
+
+    def do_close_session(self) -> None:
+        """Mock the do_close_session() method."""
+        pass
+
+    def do_release_id(self, table: str, field: str, record_id: int) -> None:
+        """Mock the do_release_id() method.
+
+        :param table: the name of the table the ID was allocated for.
+        :param field: the name of the field containing the ID.
+        :param record_id: the ID to release.
+        """
+        pass
+
+    def get_next_id(self, table: str, field: str):
+        """Mock the get_next_id() method.
+
+        :param table: the name of the table to allocate the ID for.
+        :param field: the name of the field containing the ID.
+        """
+        return len(self.table) + 1
+
     def get_last_id(self, table: str, field: str):
         """Mock the get_last_id() method.
 
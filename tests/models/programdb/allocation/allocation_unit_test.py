@@ -53,6 +53,9 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(
         dut.do_calculate_allocation_goals, "request_calculate_allocation_goals"
     )
+    pub.unsubscribe(
+        dut.do_calculate_all_allocations, "request_calculate_all_allocations"
+    )
 
     # Delete the device under test.
     del dut
@@ -147,6 +150,10 @@ class TestCreateModels:
             test_tablemodel.do_calculate_allocation_goals,
             "request_calculate_allocation_goals",
         )
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_allocations,
+            "request_calculate_all_allocations",
+        )
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -512,3 +519,54 @@ class TestAnalysisMethods:
         assert test_tablemodel.tree.get_node(2).data[
             "allocation"
         ].reliability_alloc == pytest.approx(0.9785973)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_allocations(self, test_attributes, test_tablemodel):
+        """should calculate the goals and apportion them for every record with
+        children."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        _record = test_tablemodel.do_select(1)
+        _record.allocation_method_id = 1
+        _record.goal_measure_id = 1
+        _record.mission_time = 100.0
+        _record.reliability_goal = 0.995
+
+        test_tablemodel.do_calculate_all_allocations({})
+
+        assert test_tablemodel.tree.get_node(1).data[
+            "allocation"
+        ].hazard_rate_goal == pytest.approx(5.012542e-05)
+        assert test_tablemodel.tree.get_node(2).data[
+            "allocation"
+        ].reliability_alloc == pytest.approx(0.995)
+        assert test_tablemodel.tree.get_node(3).data[
+            "allocation"
+        ].reliability_alloc == pytest.approx(0.9999)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_allocations_zero_system_rate(
+        self, test_attributes, test_tablemodel
+    ):
+        """should send the fail message when the ARINC method is used with a zero
+        hazard rate."""
+
+        def on_message(error_message):
+            assert error_message == (
+                "Failed to allocate reliability for hardware ID 1 using the ARINC "
+                "method because its hazard rate is zero."
+            )
+            print("\033[35m\nfail_calculate_allocation topic was broadcast.")
+
+        pub.subscribe(on_message, "fail_calculate_allocation")
+
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        _record = test_tablemodel.do_select(1)
+        _record.allocation_method_id = 3
+        _record.goal_measure_id = 2
+        _record.hazard_rate_goal = 0.000617
+
+        test_tablemodel.do_calculate_all_allocations({1: 0.0})
+
+        pub.unsubscribe(on_message, "fail_calculate_allocation")
@@ -40,6 +40,7 @@ def test_tablemodel(test_program_dao):
     pub.unsubscribe(dut.do_insert, "request_insert_design_electric")
     pub.unsubscribe(dut.do_derating_analysis, "request_derating_analysis")
     pub.unsubscribe(dut.do_stress_analysis, "request_stress_analysis")
+    pub.unsubscribe(dut.do_screen_all_stresses, "request_screen_all_stresses")
 
     # Delete the device under test.
     del dut
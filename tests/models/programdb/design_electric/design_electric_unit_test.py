@@ -42,6 +42,7 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(dut.do_insert, "request_insert_design_electric")
     pub.unsubscribe(dut.do_derating_analysis, "request_derating_analysis")
     pub.unsubscribe(dut.do_stress_analysis, "request_stress_analysis")
+    pub.unsubscribe(dut.do_screen_all_stresses, "request_screen_all_stresses")
 
     # Delete the device under test.
     del dut
@@ -158,6 +159,9 @@ class TestCreateModels:
         assert pub.isSubscribed(
             test_tablemodel.do_insert, "request_insert_design_electric"
         )
+        assert pub.isSubscribed(
+            test_tablemodel.do_screen_all_stresses, "request_screen_all_stresses"
+        )
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -491,3 +495,95 @@ class TestAnalysisMethods:
 
         assert _attributes["current_ratio"] == pytest.approx(0.0064)
         assert _attributes["voltage_ratio"] == pytest.approx(0.0661)
+
+    @pytest.mark.unit
+    def test_do_screen_all_stresses(
+        self, test_attributes, test_tablemodel, test_toml_user_configuration
+    ):
+        """should calculate the same ratios, overstress, and reason as the single
+        record methods for every part and return the violations."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+        test_tablemodel._dic_stress_limits = (
+            test_toml_user_configuration.RAMSTK_STRESS_LIMITS
+        )
+
+        _hardware = {
+            1: {"category_id": 3},
+            2: {"category_id": 5},
+            3: {"category_id": 1},
+        }
+        for _node_id, _values in {
+            1: [0.5, 0.81, 0.1, 0.06, 50.0, 0.005, 3.3],
+            2: [0.5, 0.48, 0.1, 0.0, 50.0, 20.0, 30.0],
+            3: [0.5, 0.0032, 0.0, 0.0, 0.0, 0.0, 0.0],
+        }.items():
+            _design_electric = test_tablemodel.do_select(_node_id)
+            (
+                _design_electric.current_rated,
+                _design_electric.current_operating,
+                _design_electric.power_rated,
+                _design_electric.power_operating,
+                _design_electric.voltage_rated,
+                _design_electric.voltage_ac_operating,
+                _design_electric.voltage_dc_operating,
+            ) = _values
+            _design_electric.current_ratio = 0.0
+            _design_electric.power_ratio = 0.0
+            _design_electric.voltage_ratio = 0.0
+
+        _expected = {}
+        for _node_id, _attributes in _hardware.items():
+            test_tablemodel.do_stress_analysis(_node_id, _attributes["category_id"])
+            test_tablemodel.do_derating_analysis(_node_id, _attributes["category_id"])
+            _expected[_node_id] = test_tablemodel.do_select(_node_id).get_attributes()
+            test_tablemodel.do_select(_node_id).current_ratio = 0.0
+            test_tablemodel.do_select(_node_id).power_ratio = 0.0
+            test_tablemodel.do_select(_node_id).voltage_ratio = 0.0
+
+        _violations = test_tablemodel.do_screen_all_stresses(_hardware)
+
+        for _node_id in _hardware:
+            _attributes = test_tablemodel.do_select(_node_id).get_attributes()
+            for _key in ["current_ratio", "power_ratio", "voltage_ratio"]:
+                assert _attributes[_key] == pytest.approx(_expected[_node_id][_key])
+            assert _attributes["overstress"] == _expected[_node_id]["overstress"]
+            assert _attributes["reason"] == _expected[_node_id]["reason"]
+        assert test_tablemodel.do_select(1).overstress
+        assert not test_tablemodel.do_select(3).overstress
+        assert _violations.to_dict("records") == [
+            {
+                "hardware_id": 1,
+                "stress": "power",
+                "environment": "harsh",
+                "limit": "upper",
+                "ratio": pytest.approx(0.6),
+            },
+            {
+                "hardware_id": 2,
+                "stress": "current",
+                "environment": "harsh",
+                "limit": "upper",
+                "ratio": pytest.approx(0.96),
+            },
+            {
+                "hardware_id": 2,
+                "stress": "current",
+                "environment": "mild",
+                "limit": "upper",
+                "ratio": pytest.approx(0.96),
+            },
+            {
+                "hardware_id": 2,
+                "stress": "voltage",
+                "environment": "harsh",
+                "limit": "upper",
+                "ratio": pytest.approx(1.0),
+            },
+            {
+                "hardware_id": 2,
+                "stress": "voltage",
+                "environment": "mild",
+                "limit": "upper",
+                "ratio": pytest.approx(1.0),
+            },
+        ]
@@ -199,11 +199,11 @@ def test_viewmodel(test_program_dao):
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_causes")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_controls")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_actions")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mode")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_cause")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_control")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_action")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mode")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_cause")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_control")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_action")
 
     # Delete the device under test.
     del dut
@@ -562,6 +562,30 @@ class TestInsertMethods:
 
         pub.unsubscribe(self.on_succeed_insert_test_action, "succeed_retrieve_fmea")
 
+    @pytest.mark.integration
+    def test_do_insert_without_rebuild(self, test_viewmodel):
+        """should add a new record without rebuilding the records tree."""
+        _data = test_viewmodel.tree.get_node(TEST_IDS["cause"]).data
+        _n_causes = len(test_viewmodel._dic_children["cause"][3])
+
+        pub.sendMessage(
+            "request_insert_cause",
+            attributes={
+                "revision_id": 1,
+                "hardware_id": 1,
+                "mode_id": 6,
+                "mechanism_id": 3,
+                "cause_id": 3,
+                "description": "Test Failure Cause #2 for Mechanism ID 3",
+            },
+        )
+
+        _cause = test_viewmodel._dic_children["cause"][3][-1]
+
+        assert len(test_viewmodel._dic_children["cause"][3]) == _n_causes + 1
+        assert test_viewmodel.tree.contains("6.3.{}".format(_cause.cause_id))
+        assert test_viewmodel.tree.get_node(TEST_IDS["cause"]).data is _data
+
 
 @pytest.mark.usefixtures(
     "test_viewmodel",
@@ -707,3 +731,14 @@ class TestDeleteMethods:
         assert not test_viewmodel.tree.contains(TEST_IDS["mode"])
 
         pub.unsubscribe(self.on_succeed_delete_mode, "succeed_retrieve_fmea")
+
+    @pytest.mark.integration
+    def test_do_delete_without_rebuild(self, test_viewmodel):
+        """should remove the deleted record without rebuilding the records tree."""
+        _data = test_viewmodel.tree.get_node("4").data
+
+        pub.sendMessage("request_delete_mode", node_id=5)
+
+        assert not test_viewmodel.tree.contains("5")
+        assert 5 not in test_viewmodel._dic_node_ids["mode"]
+        assert test_viewmodel.tree.get_node("4").data is _data
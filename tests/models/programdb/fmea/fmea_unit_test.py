@@ -37,11 +37,11 @@ def test_viewmodel():
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_causes")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_controls")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_actions")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mode")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_cause")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_control")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_action")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mode")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_cause")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_control")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_action")
 
     # Delete the device under test.
     del dut
@@ -72,8 +72,8 @@ class TestCreateControllers:
         assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_retrieve_causes")
         assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_retrieve_controls")
         assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_retrieve_actions")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_mode")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_mechanism")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_cause")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_control")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_action")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_mode")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_mechanism")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_cause")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_control")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_action")
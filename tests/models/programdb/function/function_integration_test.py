@@ -15,6 +15,7 @@ from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk.models import RAMSTKFunctionRecord, RAMSTKFunctionTable
+from ramstk.models.basemodel import RAMSTKLazyData
 
 
 @pytest.fixture(scope="class")
@@ -383,3 +384,70 @@ class TestGetterSetter:
         )
 
         pub.unsubscribe(self.on_succeed_set_attributes, "succeed_get_function_tree")
+
+
+@pytest.fixture(scope="class")
+def test_lazy_tablemodel(test_program_dao):
+    """Get a lazy loading data manager instance for each test class."""
+    # Create the device under test (dut) and connect to the database.
+    dut = RAMSTKFunctionTable(lazy=True)
+    dut.do_connect(test_program_dao)
+    dut.do_select_all(attributes={"revision_id": 1})
+
+    yield dut
+
+    # Unsubscribe from pypubsub topics.
+    pub.unsubscribe(dut.do_get_attributes, "request_get_function_attributes")
+    pub.unsubscribe(dut.do_set_attributes, "request_set_function_attributes")
+    pub.unsubscribe(dut.do_set_attributes, "wvw_editing_function")
+    pub.unsubscribe(dut.do_update, "request_update_function")
+    pub.unsubscribe(dut.do_select_all, "selected_revision")
+    pub.unsubscribe(dut.do_get_tree, "request_get_function_tree")
+    pub.unsubscribe(dut.do_delete, "request_delete_function")
+    pub.unsubscribe(dut.do_insert, "request_insert_function")
+
+    # Delete the device under test.
+    del dut
+
+
+@pytest.mark.usefixtures("test_lazy_tablemodel")
+class TestLazyLoading:
+    """Class for testing lazy loading of the records tree."""
+
+    @pytest.mark.integration
+    def test_do_select_all_lazy(self, test_lazy_tablemodel):
+        """should build the record tree without loading any records."""
+        assert test_lazy_tablemodel.lazy
+        assert test_lazy_tablemodel.tree.parent(2).identifier == 1
+        assert test_lazy_tablemodel.tree.parent(3).identifier == 0
+        for _node_id in [1, 2, 3]:
+            _data = test_lazy_tablemodel.tree.get_node(_node_id).data
+            assert isinstance(_data, RAMSTKLazyData)
+            assert "function" not in _data
+
+    @pytest.mark.integration
+    def test_load_on_first_access(self, test_lazy_tablemodel):
+        """should load the record and its siblings the first time the record is
+        requested."""
+        _record = test_lazy_tablemodel.tree.get_node(1).data["function"]
+
+        assert isinstance(_record, RAMSTKFunctionRecord)
+        assert _record.function_code == "FUNC-0001"
+        assert "function" in test_lazy_tablemodel.tree.get_node(3).data
+        assert "function" not in test_lazy_tablemodel.tree.get_node(2).data
+
+    @pytest.mark.integration
+    def test_do_load_subtree(self, test_lazy_tablemodel):
+        """should load every record in the subtree."""
+        test_lazy_tablemodel.do_load_subtree(1)
+
+        assert "function" in test_lazy_tablemodel.tree.get_node(2).data
+        assert test_lazy_tablemodel.do_select(2).function_code == "FUNC-0002"
+
+    @pytest.mark.integration
+    def test_do_select_lazy(self, test_lazy_tablemodel):
+        """should return the record when selecting a lazy node."""
+        test_lazy_tablemodel.do_select_all(attributes={"revision_id": 1})
+
+        assert test_lazy_tablemodel.do_select(3).function_code == "FUNC-0003"
+        assert test_lazy_tablemodel.do_select(100) is None
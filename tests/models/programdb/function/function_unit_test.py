@@ -195,6 +195,59 @@ class TestDeleteMethods:
         assert test_tablemodel.tree.get_node(_last_id) is None
 
 
+@pytest.mark.usefixtures("test_attributes", "test_tablemodel")
+class TestChangeNotifications:
+    """Class for testing attribute change notifications."""
+
+    def on_succeed_get_tree(self, tree):
+        assert isinstance(tree, Tree)
+        self._n_trees += 1
+        print("\033[36m\nsucceed_get_function_tree topic was broadcast.")
+
+    @pytest.mark.unit
+    def test_do_set_attributes(self, test_attributes, test_tablemodel):
+        """should send the tree for each set when not batching."""
+        self._n_trees = 0
+        pub.subscribe(self.on_succeed_get_tree, "succeed_get_function_tree")
+
+        test_tablemodel.do_select_all(attributes=test_attributes)
+        test_tablemodel.do_set_attributes(node_id=1, package={"name": "Big Function"})
+        test_tablemodel.do_set_attributes(node_id=2, package={"remarks": "Changed"})
+
+        assert self._n_trees == 2
+
+        pub.unsubscribe(self.on_succeed_get_tree, "succeed_get_function_tree")
+
+    @pytest.mark.unit
+    def test_do_batch_changes(self, test_attributes, test_tablemodel):
+        """should send the tree once when the outermost batch is done."""
+        self._n_trees = 0
+        pub.subscribe(self.on_succeed_get_tree, "succeed_get_function_tree")
+
+        test_tablemodel.do_select_all(attributes=test_attributes)
+        with test_tablemodel.do_batch_changes():
+            test_tablemodel.do_set_attributes(
+                node_id=1, package={"name": "Big Function"}
+            )
+            with test_tablemodel.do_batch_changes():
+                test_tablemodel.do_set_attributes(
+                    node_id=2, package={"remarks": "Changed"}
+                )
+            test_tablemodel.do_set_attributes(node_id=1, package={"remarks": "Again"})
+            test_tablemodel.do_set_attributes(
+                node_id=1, package={"not_an_attribute": 0}
+            )
+
+            assert self._n_trees == 0
+
+        assert self._n_trees == 1
+        assert test_tablemodel.do_select(1).name == "Big Function"
+        assert test_tablemodel.do_select(1).remarks == "Again"
+        assert test_tablemodel.do_select(2).remarks == "Changed"
+
+        pub.unsubscribe(self.on_succeed_get_tree, "succeed_get_function_tree")
+
+
 @pytest.mark.usefixtures("test_attributes", "test_recordmodel")
 class TestGetterSetter:
     """Class for testing methods that get or set."""
@@ -211,6 +211,7 @@ def test_design_electric(test_program_dao):
     pub.unsubscribe(dut.do_insert, "request_insert_design_electric")
     pub.unsubscribe(dut.do_derating_analysis, "request_derating_analysis")
     pub.unsubscribe(dut.do_stress_analysis, "request_stress_analysis")
+    pub.unsubscribe(dut.do_screen_all_stresses, "request_screen_all_stresses")
 
     # Delete the device under test.
     del dut
@@ -327,6 +328,9 @@ def test_reliability(test_program_dao):
     )
     pub.unsubscribe(dut.do_calculate_mtbf, "request_calculate_mtbf")
     pub.unsubscribe(dut.do_calculate_reliability, "request_calculate_reliability")
+    pub.unsubscribe(
+        dut.do_calculate_all_reliability, "request_calculate_all_reliability"
+    )
 
     # Delete the device under test.
     del dut
@@ -76,19 +76,26 @@ def test_viewmodel():
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_milhdbk217fs")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_nswcs")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_reliabilitys")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_hardware")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_electric")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_mechanic")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_milhdbk217f")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_nswc")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_reliability")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_hardware")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_design_electric")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_design_mechanic")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_milhdbk217f")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_nswc")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_reliability")
     pub.unsubscribe(dut.do_calculate_hardware, "request_calculate_hardware")
+    pub.unsubscribe(dut.do_calculate_all_hardware, "request_calculate_all_hardware")
     pub.unsubscribe(
         dut.do_calculate_power_dissipation, "request_calculate_power_dissipation"
     )
     pub.unsubscribe(
         dut.do_predict_active_hazard_rate, "request_predict_active_hazard_rate"
     )
+    pub.unsubscribe(
+        dut.do_predict_all_active_hazard_rates,
+        "request_predict_all_active_hazard_rates",
+    )
+    pub.unsubscribe(dut.do_propagate_uncertainty, "request_propagate_uncertainty")
+    pub.unsubscribe(dut.do_roll_up, "request_roll_up_hardware")
 
     # Delete the device under test.
     del dut
@@ -886,6 +893,62 @@ class TestAnalysisMethods:
 
         assert _attributes["total_power_dissipation"] == 0.00885
 
+    @pytest.mark.integration
+    def test_do_roll_up(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+    ):
+        """should roll up cost, part count, and power dissipation in one pass."""
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_design_mechanic.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+
+        for _node in test_tablemodel.tree.all_nodes()[1:]:
+            _hardware = _node.data["hardware"]
+            _hardware.cost_type_id = 2
+            _hardware.part = 1 if _node.is_leaf(test_tablemodel.tree.identifier) else 0
+            _hardware.cost = 1.5
+            _hardware.quantity = 1
+        for _node in test_design_electric.tree.all_nodes()[1:]:
+            _node.data["design_electric"].power_operating = 0.25
+        test_tablemodel.do_select(2).quantity = 2
+
+        pub.sendMessage("request_roll_up_hardware", node_id=1)
+
+        _attributes = test_tablemodel.do_select(2).get_attributes()
+        assert _attributes["total_cost"] == 6.0
+        assert _attributes["total_part_count"] == 4
+        assert _attributes["total_power_dissipation"] == 0.5
+        _attributes = test_tablemodel.do_select(1).get_attributes()
+        assert _attributes["total_cost"] == 10.5
+        assert _attributes["total_part_count"] == 7
+        assert _attributes["total_power_dissipation"] == 1.25
+
+        # Changing a part should re-roll up only the path to the top.
+        test_tablemodel.do_select(8).cost = 3.5
+        test_tablemodel.do_select(4).cost = 100.0
+        test_viewmodel.do_roll_up(8)
+
+        assert test_tablemodel.do_select(8).total_cost == 3.5
+        assert test_tablemodel.do_select(7).total_cost == 3.5
+        assert test_tablemodel.do_select(2).total_cost == 10.0
+        assert test_tablemodel.do_select(4).total_cost == 1.5
+        assert test_tablemodel.do_select(1).total_cost == 14.5
+
     @pytest.mark.integration
     def test_do_predict_hazard_rate_active_part(
         self,
@@ -1002,6 +1065,111 @@ class TestAnalysisMethods:
 
         assert _attributes["hazard_rate_active"] == pytest.approx(0.0007829)
 
+    @pytest.mark.integration
+    def test_do_predict_all_hazard_rates_active(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+    ):
+        """should predict the active hazard rate of every part in one batch."""
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_design_mechanic.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+
+        _hardware = test_tablemodel.do_select(3)
+        _hardware.category_id = 3
+        _hardware.subcategory_id = 1
+        _hardware.part = 1
+
+        _hardware = test_design_electric.do_select(3)
+        _hardware.environment_active_id = 9
+
+        _hardware = test_milhdbk217f.do_select(3)
+        _hardware.piR = 0.0038
+
+        _hardware = test_reliability.do_select(3)
+        _hardware.hazard_rate_method_id = 2
+        _hardware.quality_id = 3
+
+        _hazard_rates = test_viewmodel.do_predict_all_active_hazard_rates()
+        _attributes = test_reliability.do_select(3).get_attributes()
+
+        assert _hazard_rates[3] == pytest.approx(0.0007813826)
+        assert _attributes["hazard_rate_active"] == pytest.approx(0.0007813826)
+
+    @pytest.mark.integration
+    def test_do_propagate_uncertainty(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+    ):
+        """should return the hazard rate and reliability percentiles of the
+        top-level hardware and send the results in one message."""
+
+        def on_message(results, n_invalid):
+            assert isinstance(n_invalid, int)
+            assert "hazard_rate" in results[1]
+            assert "hazard_rate" not in results[2]
+            print("\033[36m\nsucceed_propagate_uncertainty topic was broadcast.")
+
+        pub.subscribe(on_message, "succeed_propagate_uncertainty")
+
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_design_mechanic.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+
+        _hardware = test_tablemodel.do_select(3)
+        _hardware.category_id = 3
+        _hardware.subcategory_id = 1
+        _hardware.part = 1
+
+        _hardware = test_design_electric.do_select(3)
+        _hardware.environment_active_id = 9
+
+        _hardware = test_reliability.do_select(3)
+        _hardware.hazard_rate_method_id = 2
+        _hardware.quality_id = 3
+
+        _results = test_viewmodel.do_propagate_uncertainty(
+            {"temperature_active": ("normal", 5.0)}, 500, seed=1, node_ids=[1, 3]
+        )
+
+        assert list(_results[3]["hazard_rate"]) == [5.0, 50.0, 95.0]
+        assert (
+            _results[3]["hazard_rate"][5.0]
+            < _results[3]["hazard_rate"][50.0]
+            < _results[3]["hazard_rate"][95.0]
+        )
+        assert _results[3]["reliability"][5.0] < _results[3]["reliability"][95.0]
+
+        pub.unsubscribe(on_message, "succeed_propagate_uncertainty")
+
     @pytest.mark.integration
     def test_do_calculate_hardware(
         self,
@@ -1066,3 +1234,68 @@ class TestAnalysisMethods:
         assert _attributes["mtbf_mission"] == pytest.approx(20.0349508)
         assert _attributes["reliability_logistics"] == pytest.approx(0.01104766)
         assert _attributes["reliability_mission"] == pytest.approx(0.006796975)
+
+    @pytest.mark.integration
+    def test_do_calculate_all_hardware(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+        test_toml_user_configuration,
+    ):
+        """should calculate all hardware metrics for the entire BoM at once."""
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_design_mechanic.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1, "hardware_id": 1})
+        test_design_electric._dic_stress_limits = (
+            test_toml_user_configuration.RAMSTK_STRESS_LIMITS
+        )
+
+        _hardware = test_tablemodel.do_select(3)
+        _hardware.category_id = 3
+        _hardware.cost = 12.98
+        _hardware.cost_type_id = 2
+        _hardware.part = 1
+        _hardware.quantity = 2
+        _hardware.subcategory_id = 1
+
+        _hardware = test_design_electric.do_select(3)
+        _hardware.environment_active_id = 9
+        _hardware.environment_dormant_id = 1
+        _hardware.power_operating = 0.00295
+
+        _hardware = test_milhdbk217f.do_select(3)
+        _hardware.piR = 0.0038
+
+        _hardware = test_reliability.do_select(3)
+        _hardware.hazard_rate_method_id = 2
+        _hardware.quality_id = 3
+
+        test_viewmodel.do_calculate_all_hardware()
+
+        _attributes = test_tablemodel.do_select(3).get_attributes()
+        assert _attributes["total_cost"] == 25.96
+        assert _attributes["total_part_count"] == 2
+        assert _attributes["total_power_dissipation"] == 0.0059
+
+        _attributes = test_reliability.do_select(3).get_attributes()
+        assert _attributes["hazard_rate_active"] == pytest.approx(5.2230231e-05)
+        assert _attributes["hazard_rate_dormant"] == pytest.approx(3.1338139e-06)
+        assert _attributes["hazard_rate_logistics"] == pytest.approx(0.04505536)
+        assert _attributes["hazard_rate_mission"] == pytest.approx(0.04991278)
+        assert _attributes["mtbf_logistics"] == pytest.approx(22.1949155)
+        assert _attributes["mtbf_mission"] == pytest.approx(20.0349508)
+        assert _attributes["reliability_logistics"] == pytest.approx(0.01104766)
+        assert _attributes["reliability_mission"] == pytest.approx(0.006796975)
@@ -20,12 +20,45 @@ from treelib import Tree
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
 from ramstk.models import (
+    RAMSTKDesignElectricRecord,
     RAMSTKHardwareBoMView,
     RAMSTKHardwareRecord,
     RAMSTKHardwareTable,
 )
 
 
+def _make_tree(tag, records):
+    """Build a module tree holding the records keyed by hardware ID."""
+    _tree = Tree()
+    _tree.create_node(tag=tag, identifier=0, parent=None, data=None)
+    for _record in records:
+        _tree.create_node(
+            tag=tag,
+            identifier=_record.hardware_id,
+            parent=0,
+            data={tag: _record},
+        )
+
+    return _tree
+
+
+def _make_hardware(hardware_id, parent_id):
+    """Build a hardware record."""
+    _hardware = RAMSTKHardwareRecord()
+    _hardware.hardware_id = hardware_id
+    _hardware.parent_id = parent_id
+
+    return _hardware
+
+
+def _make_design_electric(hardware_id):
+    """Build a design electric record."""
+    _design_electric = RAMSTKDesignElectricRecord()
+    _design_electric.hardware_id = hardware_id
+
+    return _design_electric
+
+
 @pytest.fixture(scope="function")
 def test_tablemodel(mock_program_dao):
     """Get a data manager instance for each test function."""
@@ -74,19 +107,26 @@ def test_viewmodel():
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_milhdbk217fs")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_nswcs")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_reliabilitys")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_hardware")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_electric")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_mechanic")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_milhdbk217f")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_nswc")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_reliability")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_hardware")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_design_electric")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_design_mechanic")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_milhdbk217f")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_nswc")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_reliability")
     pub.unsubscribe(dut.do_calculate_hardware, "request_calculate_hardware")
+    pub.unsubscribe(dut.do_calculate_all_hardware, "request_calculate_all_hardware")
     pub.unsubscribe(
         dut.do_calculate_power_dissipation, "request_calculate_power_dissipation"
     )
     pub.unsubscribe(
         dut.do_predict_active_hazard_rate, "request_predict_active_hazard_rate"
     )
+    pub.unsubscribe(
+        dut.do_predict_all_active_hazard_rates,
+        "request_predict_all_active_hazard_rates",
+    )
+    pub.unsubscribe(dut.do_propagate_uncertainty, "request_propagate_uncertainty")
+    pub.unsubscribe(dut.do_roll_up, "request_roll_up_hardware")
     # Delete the device under test.
     del dut
 
@@ -191,20 +231,27 @@ class TestCreateModels:
         assert pub.isSubscribed(
             test_viewmodel.do_set_tree, "succeed_retrieve_reliabilitys"
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_hardware")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_hardware")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_design_electric"
+            test_viewmodel.on_delete, "succeed_delete_design_electric"
         )
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_design_mechanic"
+            test_viewmodel.on_delete, "succeed_delete_design_mechanic"
         )
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_milhdbk217f")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_nswc")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_reliability")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_milhdbk217f"
+            test_viewmodel.do_predict_all_active_hazard_rates,
+            "request_predict_all_active_hazard_rates",
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_nswc")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_reliability"
+            test_viewmodel.do_calculate_all_hardware, "request_calculate_all_hardware"
         )
+        assert pub.isSubscribed(
+            test_viewmodel.do_propagate_uncertainty, "request_propagate_uncertainty"
+        )
+        assert pub.isSubscribed(test_viewmodel.do_roll_up, "request_roll_up_hardware")
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -493,3 +540,114 @@ class TestAnalysisMethods:
         _attributes = test_tablemodel.do_select(1).get_attributes()
 
         assert _attributes["total_part_count"] == 6
+
+
+@pytest.mark.usefixtures("test_viewmodel")
+class TestIncrementalMethods:
+    """Class for testing incremental maintenance of the hardware BoM."""
+
+    @pytest.fixture(autouse=True)
+    def unsubscribe_bom_listeners(self):
+        """Remove BoM listeners left behind by other tests."""
+        if pub.getDefaultTopicMgr().getTopic(
+            "succeed_retrieve_hardware_bom", okIfNone=True
+        ):
+            pub.unsubAll("succeed_retrieve_hardware_bom")
+
+        yield
+
+    def _do_load(self, viewmodel):
+        """Load two hardware items with their design electric records."""
+        viewmodel.do_set_tree(
+            _make_tree(
+                "design_electric", [_make_design_electric(_id) for _id in [1, 2]]
+            )
+        )
+        viewmodel.do_set_tree(
+            _make_tree("hardware", [_make_hardware(1, 0), _make_hardware(2, 1)])
+        )
+
+    @pytest.mark.unit
+    def test_do_set_tree_hardware(self, test_viewmodel):
+        """should build the BoM tree when the hardware tree is retrieved."""
+        self._do_load(test_viewmodel)
+
+        assert test_viewmodel.tree.parent(2).identifier == 1
+        assert test_viewmodel.tree.get_node(2).data["design_electric"].hardware_id == 2
+
+    @pytest.mark.unit
+    def test_do_set_tree_child_module(self, test_viewmodel):
+        """should re-attach a retrieved module without rebuilding the BoM tree."""
+        self._do_load(test_viewmodel)
+        _data = test_viewmodel.tree.get_node(1).data
+        _design_electric = _make_design_electric(1)
+
+        test_viewmodel.do_set_tree(_make_tree("design_electric", [_design_electric]))
+
+        assert test_viewmodel.tree.get_node(1).data is _data
+        assert _data["design_electric"] is _design_electric
+        assert "design_electric" not in test_viewmodel.tree.get_node(2).data
+
+    @pytest.mark.unit
+    def test_on_insert_hardware(self, test_viewmodel):
+        """should add a new hardware item below its parent without rebuilding."""
+        self._do_load(test_viewmodel)
+        _data = test_viewmodel.tree.get_node(1).data
+        _tree = test_viewmodel._dic_trees["hardware"]
+        _tree.create_node(
+            tag="hardware",
+            identifier=3,
+            parent=0,
+            data={"hardware": _make_hardware(3, 1)},
+        )
+        test_viewmodel._dic_trees["design_electric"].create_node(
+            tag="design_electric",
+            identifier=3,
+            parent=0,
+            data={"design_electric": _make_design_electric(3)},
+        )
+
+        test_viewmodel.on_insert(_tree, 3)
+
+        assert test_viewmodel.tree.get_node(1).data is _data
+        assert test_viewmodel.tree.is_branch(1) == [2, 3]
+        assert test_viewmodel.tree.get_node(3).data["design_electric"].hardware_id == 3
+
+    @pytest.mark.unit
+    def test_on_insert_child_module(self, test_viewmodel):
+        """should attach a new record to its hardware node."""
+        self._do_load(test_viewmodel)
+        _tree = _make_tree("design_electric", [_make_design_electric(1)])
+        _design_electric = _tree.get_node(1).data["design_electric"]
+
+        test_viewmodel.on_insert(_tree, 1)
+
+        assert test_viewmodel.tree.get_node(1).data["design_electric"] is (
+            _design_electric
+        )
+
+    @pytest.mark.unit
+    def test_on_delete_hardware(self, test_viewmodel):
+        """should remove a deleted hardware item without rebuilding."""
+        self._do_load(test_viewmodel)
+        _data = test_viewmodel.tree.get_node(1).data
+        _tree = test_viewmodel._dic_trees["hardware"]
+        _tree.remove_node(2)
+
+        test_viewmodel.on_delete(_tree)
+
+        assert not test_viewmodel.tree.contains(2)
+        assert test_viewmodel.tree.get_node(1).data is _data
+
+    @pytest.mark.unit
+    def test_on_delete_child_module(self, test_viewmodel):
+        """should detach a deleted record from its hardware node."""
+        self._do_load(test_viewmodel)
+        _tree = test_viewmodel._dic_trees["design_electric"]
+        _tree.remove_node(2)
+
+        test_viewmodel.on_delete(_tree)
+
+        assert test_viewmodel.tree.contains(2)
+        assert "design_electric" not in test_viewmodel.tree.get_node(2).data
+        assert "design_electric" in test_viewmodel.tree.get_node(1).data
@@ -39,6 +39,7 @@ def test_tablemodel(test_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_hazard")
     pub.unsubscribe(dut.do_insert, "request_insert_hazard")
     pub.unsubscribe(dut.do_calculate_fha, "request_calculate_fha")
+    pub.unsubscribe(dut.do_calculate_all_fha, "request_calculate_all_fha")
 
     # Delete the device under test.
     del dut
@@ -364,6 +365,13 @@ class TestAnalysisMethods:
         assert node_id == 1
         print("\033[36m\nsucceed_calculate_fha topic was broadcast.")
 
+    def on_fail_calculate_fha(self, error_message):
+        assert error_message == (
+            "Failed to calculate the user-defined hazard analysis for hazard ID 1.  "
+            "User-defined equation uf1/0 divides by zero."
+        )
+        print("\033[35m\nfail_calculate_fha topic was broadcast.")
+
     @pytest.mark.integration
     def test_do_calculate_fha(self, test_tablemodel):
         """should calculate the HRI and user-defined hazard analyses."""
@@ -380,3 +388,15 @@ class TestAnalysisMethods:
         assert _attributes["result_2"] == pytest.approx(0.6)
 
         pub.unsubscribe(self.on_succeed_calculate_fha, "succeed_calculate_fha")
+
+    @pytest.mark.integration
+    def test_do_calculate_fha_divide_by_zero(self, test_tablemodel):
+        """should send the fail message when a user-defined equation divides by
+        zero."""
+        pub.subscribe(self.on_fail_calculate_fha, "fail_calculate_fha")
+
+        test_tablemodel.do_select(1).function_1 = "uf1/0"
+
+        pub.sendMessage("request_calculate_fha", node_id=1)
+
+        pub.unsubscribe(self.on_fail_calculate_fha, "fail_calculate_fha")
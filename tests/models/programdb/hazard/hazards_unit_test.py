@@ -46,6 +46,7 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_hazard")
     pub.unsubscribe(dut.do_insert, "request_insert_hazard")
     pub.unsubscribe(dut.do_calculate_fha, "request_calculate_fha")
+    pub.unsubscribe(dut.do_calculate_all_fha, "request_calculate_all_fha")
 
     # Delete the device under test.
     del dut
@@ -138,6 +139,9 @@ class TestCreateModels:
         assert pub.isSubscribed(
             test_tablemodel.do_calculate_fha, "request_calculate_fha"
         )
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_fha, "request_calculate_all_fha"
+        )
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -341,3 +345,35 @@ class TestAnalysisMethods:
         assert _attributes["system_hri_f"] == 12
         assert _attributes["result_1"] == pytest.approx(1.2)
         assert _attributes["result_2"] == pytest.approx(0.6)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_fha(self, test_attributes, test_tablemodel):
+        """should calculate the HRI and user-defined analyses for all hazards."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        test_tablemodel.do_calculate_all_fha()
+        _attributes = test_tablemodel.do_select(1).get_attributes()
+
+        assert _attributes["assembly_hri"] == 30
+        assert _attributes["system_hri"] == 20
+        assert _attributes["assembly_hri_f"] == 16
+        assert _attributes["system_hri_f"] == 12
+        assert _attributes["result_1"] == pytest.approx(1.2)
+        assert _attributes["result_2"] == pytest.approx(0.6)
+        assert _attributes["result_3"] == 0.0
+
+    @pytest.mark.unit
+    def test_do_calculate_all_fha_divide_by_zero(
+        self, test_attributes, test_tablemodel
+    ):
+        """should calculate the HRI and leave the user-defined results alone when an
+        equation divides by zero."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+        test_tablemodel.do_select(1).function_1 = "uf1/0"
+        test_tablemodel.do_select(1).result_1 = 1.0
+
+        test_tablemodel.do_calculate_all_fha()
+        _attributes = test_tablemodel.do_select(1).get_attributes()
+
+        assert _attributes["assembly_hri"] == 30
+        assert _attributes["result_1"] == 1.0
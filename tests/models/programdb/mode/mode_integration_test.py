@@ -43,6 +43,9 @@ def test_tablemodel(test_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_mode")
     pub.unsubscribe(dut.do_insert, "request_insert_mode")
     pub.unsubscribe(dut.do_calculate_criticality, "request_calculate_criticality")
+    pub.unsubscribe(
+        dut.do_calculate_all_criticality, "request_calculate_all_criticality"
+    )
 
     # Delete the device under test.
     del dut
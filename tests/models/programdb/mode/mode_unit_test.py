@@ -39,6 +39,9 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_mode")
     pub.unsubscribe(dut.do_insert, "request_insert_mode")
     pub.unsubscribe(dut.do_calculate_criticality, "request_calculate_criticality")
+    pub.unsubscribe(
+        dut.do_calculate_all_criticality, "request_calculate_all_criticality"
+    )
 
     # Delete the device under test.
     del dut
@@ -108,6 +111,10 @@ class TestCreateModels:
         assert pub.isSubscribed(
             test_tablemodel.do_calculate_criticality, "request_calculate_criticality"
         )
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_criticality,
+            "request_calculate_all_criticality",
+        )
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -275,3 +282,25 @@ class TestAnalysisMethods:
         assert test_tablemodel.tree.get_node(1).data[
             "mode"
         ].mode_criticality == pytest.approx(1.2259632e-05)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_criticality(self, test_attributes, test_tablemodel):
+        """should calculate the mode hazard rate and mode criticality of each mode
+        using the hazard rate of its hardware item."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        test_tablemodel.tree.get_node(1).data["mode"].mode_ratio = 0.428
+        test_tablemodel.tree.get_node(1).data["mode"].mode_op_time = 4.2
+        test_tablemodel.tree.get_node(1).data["mode"].effect_probability = 1.0
+        test_tablemodel.tree.get_node(1).data["mode"].severity_class = "III"
+        test_tablemodel.tree.get_node(2).data["mode"].hardware_id = 8
+
+        test_tablemodel.do_calculate_all_criticality({1: 0.00000682})
+
+        assert test_tablemodel.tree.get_node(1).data[
+            "mode"
+        ].mode_hazard_rate == pytest.approx(2.91896e-06)
+        assert test_tablemodel.tree.get_node(1).data[
+            "mode"
+        ].mode_criticality == pytest.approx(1.2259632e-05)
+        assert test_tablemodel.tree.get_node(2).data["mode"].mode_hazard_rate == 0.0
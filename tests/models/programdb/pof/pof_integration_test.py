@@ -163,10 +163,10 @@ def test_viewmodel(test_program_dao):
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_oploads")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_opstresss")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_test_methods")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opload")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opstress")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_test_method")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_opload")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_opstress")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_test_method")
 
     # Delete the device under test.
     del dut
@@ -35,10 +35,10 @@ def test_viewmodel():
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_oploads")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_opstresss")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_test_methods")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opload")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opstress")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_test_method")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_opload")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_opstress")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_test_method")
 
     # Delete the device under test.
     del dut
@@ -71,9 +71,7 @@ class TestCreateControllers:
         assert pub.isSubscribed(
             test_viewmodel.do_set_tree, "succeed_retrieve_test_methods"
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_mechanism")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_opload")
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_opstress")
-        assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_test_method"
-        )
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_mechanism")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_opload")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_opstress")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_test_method")
@@ -54,6 +54,13 @@ def test_tablemodel(test_program_dao):
     )
     pub.unsubscribe(dut.do_calculate_mtbf, "request_calculate_mtbf")
     pub.unsubscribe(dut.do_calculate_reliability, "request_calculate_reliability")
+    pub.unsubscribe(
+        dut.do_calculate_all_reliability, "request_calculate_all_reliability"
+    )
+    pub.unsubscribe(
+        dut.do_calculate_all_hazard_rate_dormant,
+        "request_calculate_all_hazard_rate_dormant",
+    )
 
     # Delete the device under test.
     del dut
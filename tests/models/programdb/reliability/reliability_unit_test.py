@@ -57,6 +57,13 @@ def test_tablemodel(mock_program_dao):
     )
     pub.unsubscribe(dut.do_calculate_mtbf, "request_calculate_mtbf")
     pub.unsubscribe(dut.do_calculate_reliability, "request_calculate_reliability")
+    pub.unsubscribe(
+        dut.do_calculate_all_reliability, "request_calculate_all_reliability"
+    )
+    pub.unsubscribe(
+        dut.do_calculate_all_hazard_rate_dormant,
+        "request_calculate_all_hazard_rate_dormant",
+    )
 
     # Delete the device under test.
     del dut
@@ -153,6 +160,14 @@ class TestCreateModels:
         assert pub.isSubscribed(test_tablemodel.do_update, "request_update_reliability")
         assert pub.isSubscribed(test_tablemodel.do_delete, "request_delete_reliability")
         assert pub.isSubscribed(test_tablemodel.do_insert, "request_insert_reliability")
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_reliability,
+            "request_calculate_all_reliability",
+        )
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_hazard_rate_dormant,
+            "request_calculate_all_hazard_rate_dormant",
+        )
 
 
 @pytest.mark.usefixtures("test_attributes", "test_tablemodel")
@@ -411,14 +426,14 @@ class TestAnalysisMethods:
 
         # Two-parameter LOGN.
         test_tablemodel.do_calculate_hazard_rate_active(1, 100.0, 1, 1.0, time=4.0)
-        assert _reliability.hazard_rate_active == pytest.approx(0.6610467)
+        assert _reliability.hazard_rate_active == pytest.approx(0.009224548)
 
         # Three-parameter LOGN.
         _reliability.failure_distribution_id = 4
         _reliability.location_parameter = 1.85
 
         test_tablemodel.do_calculate_hazard_rate_active(1, 100.0, 1, 1.0, time=4.0)
-        assert _reliability.hazard_rate_active == pytest.approx(1.5117773)
+        assert _reliability.hazard_rate_active == pytest.approx(0.003348938)
 
     @pytest.mark.unit
     def test_do_calculate_hazard_rate_active_normal(
@@ -460,13 +475,13 @@ class TestAnalysisMethods:
 
         # Two-parameter WEI.
         test_tablemodel.do_calculate_hazard_rate_active(1, 100.0, 1, 1.0, time=105.0)
-        assert _reliability.hazard_rate_active == pytest.approx(0.0235972)
+        assert _reliability.hazard_rate_active == pytest.approx(0.0004259177)
 
         # Three-parameter WEI.
         _reliability.failure_distribution_id = 7
         _reliability.location_parameter = 18.5
         test_tablemodel.do_calculate_hazard_rate_active(1, 100.0, 1, 1.0, time=105.0)
-        assert _reliability.hazard_rate_active == pytest.approx(0.02874279)
+        assert _reliability.hazard_rate_active == pytest.approx(0.0003184681)
 
     @pytest.mark.unit
     def test_do_calculate_hazard_rate_no_type(self, test_attributes, test_tablemodel):
@@ -575,3 +590,171 @@ class TestAnalysisMethods:
         test_tablemodel.do_calculate_reliability(1, 1.0)
         assert _reliability.reliability_logistics == pytest.approx(0.9966277)
         assert _reliability.reliability_mission == pytest.approx(0.9981341)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_reliability(self, test_attributes, test_tablemodel):
+        """should calculate the same metrics as the single record methods."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        _hardware = {
+            1: {
+                "category_id": 3,
+                "subcategory_id": 1,
+                "duty_cycle": 65.0,
+                "quantity": 2,
+                "mission_time": 105.0,
+                "environment_active_id": 9,
+                "environment_dormant_id": 1,
+            },
+            2: {
+                "category_id": 2,
+                "subcategory_id": 1,
+                "duty_cycle": 100.0,
+                "quantity": 1,
+                "mission_time": 24.0,
+                "environment_active_id": 3,
+                "environment_dormant_id": 2,
+                "hazard_rate_predicted": 0.0,
+            },
+        }
+
+        _reliability = test_tablemodel.do_select(1)
+        _reliability.hazard_rate_type_id = 4
+        _reliability.failure_distribution_id = 7
+        _reliability.scale_parameter = 525.0
+        _reliability.shape_parameter = 2.5
+        _reliability.location_parameter = 18.5
+        _reliability.hazard_rate_software = 0.00005
+        _reliability = test_tablemodel.do_select(2)
+        _reliability.hazard_rate_type_id = 3
+        _reliability.mtbf_specified = 12632.0
+        _reliability.add_adj_factor = 0.0001
+        _reliability.mult_adj_factor = 1.2
+
+        for _node_id, _attributes in _hardware.items():
+            test_tablemodel.do_calculate_hazard_rate_active(
+                _node_id,
+                _attributes["duty_cycle"],
+                _attributes["quantity"],
+                1.0,
+                time=_attributes["mission_time"],
+            )
+            test_tablemodel.do_calculate_hazard_rate_dormant(
+                _node_id,
+                _attributes["category_id"],
+                _attributes["subcategory_id"],
+                _attributes["environment_active_id"],
+                _attributes["environment_dormant_id"],
+            )
+            test_tablemodel.do_calculate_hazard_rate_logistics(_node_id)
+            test_tablemodel.do_calculate_hazard_rate_mission(
+                _node_id, _attributes["duty_cycle"]
+            )
+            test_tablemodel.do_calculate_mtbf(_node_id, 1.0)
+            test_tablemodel.do_calculate_reliability(
+                _node_id, _attributes["mission_time"]
+            )
+        _expected = {
+            _node_id: test_tablemodel.do_select(_node_id).get_attributes()
+            for _node_id in _hardware
+        }
+
+        test_tablemodel.do_calculate_all_reliability(_hardware, 1.0)
+
+        for _node_id in _hardware:
+            _attributes = test_tablemodel.do_select(_node_id).get_attributes()
+            for _key in [
+                "hazard_rate_active",
+                "hazard_rate_dormant",
+                "hazard_rate_logistics",
+                "hazard_rate_mission",
+                "mtbf_logistics",
+                "mtbf_mission",
+                "reliability_logistics",
+                "reliability_mission",
+            ]:
+                assert _attributes[_key] == pytest.approx(_expected[_node_id][_key])
+
+    @pytest.mark.unit
+    def test_do_calculate_all_hazard_rate_dormant(
+        self, test_attributes, test_tablemodel
+    ):
+        """should calculate the same dormant hazard rates as the single record
+        method for every record in the revision."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        _hardware = {
+            1: {
+                "category_id": 2,
+                "subcategory_id": 7,
+                "environment_active_id": 3,
+                "environment_dormant_id": 2,
+            },
+            2: {
+                "category_id": 4,
+                "subcategory_id": 1,
+                "environment_active_id": 11,
+                "environment_dormant_id": 4,
+            },
+        }
+        test_tablemodel.do_select(1).hazard_rate_active = 0.008642374
+        test_tablemodel.do_select(2).hazard_rate_active = 0.0002
+
+        _expected = {}
+        for _node_id, _attributes in _hardware.items():
+            test_tablemodel.do_calculate_hazard_rate_dormant(
+                _node_id,
+                _attributes["category_id"],
+                _attributes["subcategory_id"],
+                _attributes["environment_active_id"],
+                _attributes["environment_dormant_id"],
+            )
+            _expected[_node_id] = test_tablemodel.do_select(
+                _node_id
+            ).hazard_rate_dormant
+            test_tablemodel.do_select(_node_id).hazard_rate_dormant = 0.0
+
+        pub.sendMessage(
+            "request_calculate_all_hazard_rate_dormant", attributes=_hardware
+        )
+
+        assert test_tablemodel.do_select(1).hazard_rate_dormant == pytest.approx(
+            0.0004321187
+        )
+        for _node_id in _hardware:
+            assert test_tablemodel.do_select(
+                _node_id
+            ).hazard_rate_dormant == pytest.approx(_expected[_node_id])
+
+    @pytest.mark.unit
+    def test_do_calculate_all_reliability_zero_hazard_rate(
+        self, test_attributes, test_tablemodel
+    ):
+        """should return 0.0 for the MTBF and 1.0 for the reliability when the hazard
+        rate = 0.0."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        _reliability = test_tablemodel.do_select(1)
+        _reliability.hazard_rate_type_id = 5
+
+        test_tablemodel.do_calculate_all_reliability(
+            {
+                1: {
+                    "category_id": 0,
+                    "subcategory_id": 0,
+                    "duty_cycle": 100.0,
+                    "quantity": 1,
+                    "mission_time": 100.0,
+                    "environment_active_id": 0,
+                    "environment_dormant_id": 0,
+                },
+            },
+            1.0,
+        )
+
+        assert _reliability.hazard_rate_active == 0.0
+        assert _reliability.hazard_rate_logistics == 0.0
+        assert _reliability.mtbf_logistics == 0.0
+        assert _reliability.mtbf_mission == 0.0
+        assert _reliability.reliability_logistics == 1.0
+        assert _reliability.reliability_mission == 1.0
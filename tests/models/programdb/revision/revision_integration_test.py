@@ -39,6 +39,7 @@ def test_tablemodel(test_program_dao):
     pub.unsubscribe(dut.do_select_all, "request_retrieve_revisions")
     pub.unsubscribe(dut.do_delete, "request_delete_revision")
     pub.unsubscribe(dut.do_insert, "request_insert_revision")
+    pub.unsubscribe(dut.do_clone, "request_clone_revision")
 
     # Delete the device under test.
     del dut
@@ -85,7 +86,7 @@ class TestInsertMethods:
 
     def on_fail_insert_no_database(self, error_message):
         assert error_message == (
-            "dao.do_insert: No database connected when attempting to add a record."
+            "dao.get_next_id: No database connected when attempting to allocate an ID."
         )
         print("\033[35m\nfail_insert_revision topic was broadcast.")
 
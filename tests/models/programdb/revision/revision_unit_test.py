@@ -42,6 +42,7 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(dut.do_select_all, "request_retrieve_revisions")
     pub.unsubscribe(dut.do_delete, "request_delete_revision")
     pub.unsubscribe(dut.do_insert, "request_insert_revision")
+    pub.unsubscribe(dut.do_clone, "request_clone_revision")
 
     # Delete the device under test.
     del dut
@@ -178,6 +179,45 @@ class TestInsertMethods:
         )
 
 
+@pytest.mark.usefixtures("test_tablemodel")
+class TestCloneMethods:
+    """Class for testing the clone() method."""
+
+    def on_succeed_clone(self, node_id, tree):
+        assert node_id == 3
+        assert isinstance(tree, Tree)
+        assert tree.get_node(3).data["revision"].revision_id == 3
+        assert tree.get_node(3).data["revision"].name == "Revision A"
+        print("\033[36m\nsucceed_clone_revision topic was broadcast.")
+
+    def on_fail_clone_non_existent_id(self, error_message):
+        assert error_message == "Mock DAO do_clone_revision() error."
+        print("\033[35m\nfail_clone_revision topic was broadcast.")
+
+    @pytest.mark.unit
+    def test_do_clone(self, test_tablemodel):
+        """should copy the revision and reload the revision tree."""
+        pub.subscribe(self.on_succeed_clone, "succeed_clone_revision")
+
+        pub.sendMessage("request_clone_revision", node_id=2)
+
+        assert test_tablemodel.last_id == 3
+        assert test_tablemodel.tree.get_node(2).data["revision"].revision_id == 2
+
+        pub.unsubscribe(self.on_succeed_clone, "succeed_clone_revision")
+
+    @pytest.mark.unit
+    def test_do_clone_non_existent_id(self, test_tablemodel):
+        """should send the fail message when the revision doesn't exist."""
+        pub.subscribe(self.on_fail_clone_non_existent_id, "fail_clone_revision")
+
+        pub.sendMessage("request_clone_revision", node_id=10)
+
+        assert test_tablemodel.tree.get_node(3) is None
+
+        pub.unsubscribe(self.on_fail_clone_non_existent_id, "fail_clone_revision")
+
+
 @pytest.mark.usefixtures("test_tablemodel")
 class TestDeleteMethods:
     """Class for testing the delete() method."""
@@ -253,3 +293,48 @@ class TestGetterSetter:
         test_attributes.pop("revision_id")
         with pytest.raises(AttributeError):
             test_recordmodel.set_attributes({"shibboly-bibbly-boo": 0.9998})
+
+
+@pytest.mark.usefixtures("test_tablemodel")
+class TestBackgroundSaveMethods:
+    """Class for testing the methods used to save on a worker thread."""
+
+    @pytest.mark.unit
+    def test_do_get_changes(self, test_tablemodel):
+        """should return a copy of the column values of each changed record."""
+        test_tablemodel.do_set_saved(test_tablemodel.do_get_changes())
+        test_tablemodel.do_select(2).name = "Changed Revision"
+
+        _changes = test_tablemodel.do_get_changes()
+
+        assert len(_changes) == 1
+        assert _changes[0]["revision_id"] == 2
+        assert _changes[0]["name"] == "Changed Revision"
+
+    @pytest.mark.unit
+    def test_do_set_saved(self, test_tablemodel):
+        """should mark the written values as saved and leave values changed after
+        they were copied as changed."""
+        test_tablemodel.do_set_saved(test_tablemodel.do_get_changes())
+        test_tablemodel.do_select(1).name = "Changed Revision"
+        test_tablemodel.do_select(2).name = "Changed Revision"
+
+        _changes = test_tablemodel.do_get_changes()
+        test_tablemodel.do_select(2).name = "Changed Again"
+        test_tablemodel.do_set_saved(_changes)
+
+        _changes = test_tablemodel.do_get_changes()
+        assert len(_changes) == 1
+        assert _changes[0]["revision_id"] == 2
+        assert _changes[0]["name"] == "Changed Again"
+
+    @pytest.mark.unit
+    def test_do_write_changes(self, test_tablemodel):
+        """should pass the changed values to the DAO."""
+        test_tablemodel.do_set_saved(test_tablemodel.do_get_changes())
+        test_tablemodel.do_select(1).name = "Changed Revision"
+
+        test_tablemodel.do_write_changes(test_tablemodel.do_get_changes())
+
+        assert test_tablemodel.dao.mappings[0]["revision_id"] == 1
+        assert test_tablemodel.dao.mappings[0]["name"] == "Changed Revision"
@@ -39,6 +39,9 @@ def test_tablemodel(test_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_similar_item")
     pub.unsubscribe(dut.do_insert, "request_insert_similar_item")
     pub.unsubscribe(dut.do_calculate_similar_item, "request_calculate_similar_item")
+    pub.unsubscribe(
+        dut.do_calculate_all_similar_items, "request_calculate_all_similar_items"
+    )
     pub.unsubscribe(
         dut.do_roll_up_change_descriptions, "request_roll_up_change_descriptions"
     )
@@ -510,6 +513,16 @@ class TestAnalysisMethods:
             "method."
         )
 
+    def on_fail_calculate_divide_by_zero(self, error_message):
+        assert error_message == (
+            "Failed to calculate similar item reliability for hardware ID 1.  "
+            "User-defined equation hr/0 divides by zero."
+        )
+        print(
+            "\033[35m\nfail_calculate_similar_item topic was broadcast on divide "
+            "by zero."
+        )
+
     @pytest.mark.integration
     def test_do_calculate_similar_item_topic_633(self, test_tablemodel):
         """should calculate the Topic 6.3.3 similar item."""
@@ -600,3 +613,20 @@ class TestAnalysisMethods:
         pub.unsubscribe(
             self.on_fail_calculate_unknown_method, "fail_calculate_similar_item"
         )
+
+    @pytest.mark.integration
+    def test_do_calculate_divide_by_zero(self, test_tablemodel):
+        """should send the fail message when a user-defined equation divides by
+        zero."""
+        pub.subscribe(
+            self.on_fail_calculate_divide_by_zero, "fail_calculate_similar_item"
+        )
+
+        test_tablemodel.tree.get_node(1).data["similar_item"].similar_item_method_id = 2
+        test_tablemodel.tree.get_node(1).data["similar_item"].function_1 = "hr/0"
+
+        pub.sendMessage("request_calculate_similar_item", node_id=1)
+
+        pub.unsubscribe(
+            self.on_fail_calculate_divide_by_zero, "fail_calculate_similar_item"
+        )
@@ -43,6 +43,9 @@ def test_tablemodel(mock_program_dao):
     pub.unsubscribe(dut.do_delete, "request_delete_similar_item")
     pub.unsubscribe(dut.do_insert, "request_insert_similar_item")
     pub.unsubscribe(dut.do_calculate_similar_item, "request_calculate_similar_item")
+    pub.unsubscribe(
+        dut.do_calculate_all_similar_items, "request_calculate_all_similar_items"
+    )
     pub.unsubscribe(
         dut.do_roll_up_change_descriptions, "request_roll_up_change_descriptions"
     )
@@ -161,6 +164,10 @@ class TestCreateModels:
         assert pub.isSubscribed(
             test_tablemodel.do_insert, "request_insert_similar_item"
         )
+        assert pub.isSubscribed(
+            test_tablemodel.do_calculate_all_similar_items,
+            "request_calculate_all_similar_items",
+        )
         assert pub.isSubscribed(
             test_tablemodel.do_roll_up_change_descriptions,
             "request_roll_up_change_descriptions",
@@ -426,3 +433,52 @@ class TestAnalysisMethods:
         assert _record.change_factor_1 == 0.85
         assert _record.change_factor_2 == 1.2
         assert _record.result_1 == pytest.approx(0.00062934)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_similar_items(self, test_attributes, test_tablemodel):
+        """should calculate the similar item hazard rate for all records."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        for _node_id in [1, 2]:
+            _record = test_tablemodel.do_select(_node_id)
+            _record.similar_item_method_id = 2
+            _record.change_factor_1 = 0.85
+            _record.change_factor_2 = 1.2
+            _record.function_1 = "pi1*pi2*hr"
+            _record.function_2 = "res1*2"
+            _record.function_3 = "0"
+            _record.function_4 = "0"
+            _record.function_5 = "0"
+
+        test_tablemodel.do_calculate_all_similar_items({1: 0.000617, 2: 0.001})
+
+        _record = test_tablemodel.do_select(1)
+        assert _record.result_1 == pytest.approx(0.00062934)
+        assert _record.result_2 == pytest.approx(0.00125868)
+        _record = test_tablemodel.do_select(2)
+        assert _record.result_1 == pytest.approx(0.00102)
+        assert _record.result_2 == pytest.approx(0.00204)
+
+    @pytest.mark.unit
+    def test_do_calculate_all_similar_items_divide_by_zero(
+        self, test_attributes, test_tablemodel
+    ):
+        """should leave the user-defined results alone when an equation divides by
+        zero."""
+        test_tablemodel.do_select_all(attributes=test_attributes)
+
+        for _node_id in [1, 2]:
+            _record = test_tablemodel.do_select(_node_id)
+            _record.similar_item_method_id = 2
+            _record.result_1 = 1.0
+            _record.function_1 = "hr/uf1"
+            _record.function_2 = "0"
+            _record.function_3 = "0"
+            _record.function_4 = "0"
+            _record.function_5 = "0"
+            _record.user_float_1 = 0.0
+
+        test_tablemodel.do_calculate_all_similar_items({1: 0.000617, 2: 0.001})
+
+        assert test_tablemodel.do_select(1).result_1 == 1.0
+        assert test_tablemodel.do_select(2).result_1 == 1.0
@@ -7,12 +7,16 @@
 # All rights reserved.
 """Class for testing RAMSTK module algorithms and models."""
 
+# Standard Library Imports
+import threading
+
 # Third Party Imports
 import pytest
 from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
+from ramstk.exceptions import DataAccessError
 from ramstk.models import RAMSTKProgramDB
 
 
@@ -29,8 +33,13 @@ def test_datamanager(test_program_dao):
     pub.unsubscribe(dut.do_open_program, "request_open_program")
     pub.unsubscribe(dut.do_close_program, "request_close_program")
     pub.unsubscribe(dut.do_save_program, "request_update_program")
+    pub.unsubscribe(
+        dut.do_save_program_in_background, "request_save_project_in_background"
+    )
+    pub.unsubscribe(dut.do_cancel_tasks, "request_cancel_tasks")
 
     # Delete the device under test.
+    dut.tasks.do_shutdown()
     del dut
 
 
@@ -137,6 +146,13 @@ class TestProgramManager:
         assert pub.isSubscribed(
             test_datamanager.do_save_program, "request_update_program"
         )
+        assert pub.isSubscribed(
+            test_datamanager.do_save_program_in_background,
+            "request_save_project_in_background",
+        )
+        assert pub.isSubscribed(
+            test_datamanager.do_cancel_tasks, "request_cancel_tasks"
+        )
 
     @pytest.mark.integration
     def test_do_open_program(self, test_datamanager, test_program_dao):
@@ -343,3 +359,182 @@ class TestProgramManager:
         )
 
         test_datamanager.do_close_program()
+
+
+class MockSaveDAO:
+    """Mock the DAO methods used by a background save."""
+
+    def __init__(self):
+        """Initialize an instance of the mock DAO."""
+        self.closed = []
+
+    def do_close_session(self):
+        """Record the thread the session was closed on."""
+        self.closed.append(threading.current_thread())
+
+
+class MockSaveTable:
+    """Mock the table methods used by a background save."""
+
+    def __init__(self, changes, error=None):
+        """Initialize an instance of the mock table."""
+        self.changes = changes
+        self.dao = MockSaveDAO()
+        self.error = error
+        self.saved = []
+        self.written = []
+
+    def do_get_changes(self):
+        """Return the changed records."""
+        return self.changes
+
+    def do_set_saved(self, changes):
+        """Record the changes that were marked saved."""
+        self.saved.extend(changes)
+
+    def do_write_changes(self, changes):
+        """Record the thread the changes were written on."""
+        if self.error is not None:
+            raise self.error
+        self.written.append(threading.current_thread())
+
+
+@pytest.fixture(scope="function")
+def test_background_datamanager():
+    """Get a data manager instance for each background save test."""
+    # Create the device under test (dut).
+    dut = RAMSTKProgramDB()
+
+    yield dut
+
+    # Unsubscribe from pypubsub topics.
+    pub.unsubscribe(dut.do_create_program, "request_create_program")
+    pub.unsubscribe(dut.do_open_program, "request_open_program")
+    pub.unsubscribe(dut.do_open_program, "succeed_create_program_database")
+    pub.unsubscribe(dut.do_close_program, "request_close_program")
+    pub.unsubscribe(dut.do_save_program, "request_update_program")
+    pub.unsubscribe(
+        dut.do_save_program_in_background, "request_save_project_in_background"
+    )
+    pub.unsubscribe(dut.do_cancel_tasks, "request_cancel_tasks")
+
+    # Delete the device under test.
+    dut.tasks.do_shutdown()
+    del dut
+
+
+@pytest.mark.usefixtures("test_background_datamanager")
+class TestBackgroundSave:
+    """Test class for saving the program database on worker threads."""
+
+    def on_succeed_save_project(self):
+        self.n_succeed += 1
+        print("\033[36m\nsucceed_save_project topic was broadcast")
+
+    def on_fail_save_project(self, error_message):
+        assert error_message == "Saving hardware failed: Mock DAO write error."
+        print("\033[35m\nfail_save_project topic was broadcast")
+
+    def on_request_set_progress(self, progress):
+        self.progress.append(progress)
+
+    @pytest.mark.unit
+    def test_do_save_program_in_background(self, test_background_datamanager):
+        """do_save_program_in_background() should write the changed records of
+        each table on a worker thread and broadcast the success message when every
+        table is written."""
+        self.n_succeed = 0
+        self.progress = []
+        pub.subscribe(self.on_succeed_save_project, "succeed_save_project")
+        pub.subscribe(self.on_request_set_progress, "request_set_progress")
+
+        _hardware = MockSaveTable([{"hardware_id": 1}, {"hardware_id": 2}])
+        _revision = MockSaveTable([{"revision_id": 1}])
+        _unchanged = MockSaveTable([])
+        test_background_datamanager.dic_tables = {
+            "hardware": _hardware,
+            "options": object,
+            "revision": _revision,
+            "function": _unchanged,
+        }
+
+        test_background_datamanager.do_save_program_in_background()
+        test_background_datamanager.tasks.do_shutdown()
+
+        assert _hardware.saved == [{"hardware_id": 1}, {"hardware_id": 2}]
+        assert _revision.saved == [{"revision_id": 1}]
+        assert _unchanged.written == []
+        assert _hardware.written[0] is not threading.current_thread()
+        assert _hardware.dao.closed == _hardware.written
+        assert sorted(self.progress) == [0.5, 1.0]
+        assert self.n_succeed == 1
+
+        pub.unsubscribe(self.on_succeed_save_project, "succeed_save_project")
+        pub.unsubscribe(self.on_request_set_progress, "request_set_progress")
+
+    @pytest.mark.unit
+    def test_do_save_program_in_background_no_changes(
+        self, test_background_datamanager
+    ):
+        """do_save_program_in_background() should broadcast the success message
+        immediately when there are no changes to save."""
+        self.n_succeed = 0
+        pub.subscribe(self.on_succeed_save_project, "succeed_save_project")
+
+        test_background_datamanager.dic_tables = {"revision": MockSaveTable([])}
+        test_background_datamanager.do_save_program_in_background()
+
+        assert self.n_succeed == 1
+        assert test_background_datamanager.tasks.active == []
+
+        pub.unsubscribe(self.on_succeed_save_project, "succeed_save_project")
+
+    @pytest.mark.unit
+    def test_do_save_program_in_background_failed(self, test_background_datamanager):
+        """do_save_program_in_background() should broadcast the fail message and
+        leave the records changed when a table can't be written."""
+        self.n_succeed = 0
+        pub.subscribe(self.on_succeed_save_project, "succeed_save_project")
+        pub.subscribe(self.on_fail_save_project, "fail_save_project")
+
+        _hardware = MockSaveTable(
+            [{"hardware_id": 1}], DataAccessError("Mock DAO write error.")
+        )
+        test_background_datamanager.dic_tables = {"hardware": _hardware}
+
+        test_background_datamanager.do_save_program_in_background()
+        test_background_datamanager.tasks.do_shutdown()
+
+        assert _hardware.saved == []
+        assert len(_hardware.dao.closed) == 1
+        assert self.n_succeed == 1
+
+        pub.unsubscribe(self.on_succeed_save_project, "succeed_save_project")
+        pub.unsubscribe(self.on_fail_save_project, "fail_save_project")
+
+    @pytest.mark.unit
+    def test_do_cancel_tasks_wait(self, test_background_datamanager):
+        """do_cancel_tasks() should cancel the pending saves and wait for the
+        running save to finish when passed wait=True."""
+        _started = threading.Event()
+        _release = threading.Event()
+
+        def _write(task):
+            _started.set()
+            _release.wait(5.0)
+
+        _running = test_background_datamanager.tasks.do_submit(
+            "Saving hardware", _write, key="hardware"
+        )
+        _pending = test_background_datamanager.tasks.do_submit(
+            "Saving hardware", _write, key="hardware"
+        )
+        assert _started.wait(5.0)
+
+        threading.Timer(0.05, _release.set).start()
+        pub.sendMessage("request_cancel_tasks", wait=True)
+
+        assert _running.status == "cancelled"
+        assert _pending.status == "cancelled"
+        assert _release.is_set()
+        assert test_background_datamanager.tasks.active == []
@@ -35,9 +35,9 @@ def test_viewmodel():
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_environments")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_missions")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_mission_phases")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_environment")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mission")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mission_phase")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_environment")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mission")
+    pub.unsubscribe(dut.on_delete, "succeed_delete_mission_phase")
 
     # Delete the device under test.
     del dut
@@ -82,10 +82,8 @@ class TestCreateControllers:
             test_viewmodel.do_set_tree,
             "succeed_retrieve_mission_phases",
         )
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_environment")
+        assert pub.isSubscribed(test_viewmodel.on_delete, "succeed_delete_mission")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_environment"
-        )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_mission")
-        assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_mission_phase"
+            test_viewmodel.on_delete, "succeed_delete_mission_phase"
         )
@@ -0,0 +1,275 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.models.test_treeindex.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the array-backed tree index and treelib adapter."""
+
+# Third Party Imports
+import pytest
+from treelib import Tree
+from treelib.exceptions import (
+    DuplicatedNodeIdError,
+    MultipleRootError,
+    NodeIDAbsentError,
+)
+
+# RAMSTK Package Imports
+from ramstk.models import RAMSTKTree, RAMSTKTreeIndex
+
+
+def _build(tree):
+    """Build the same small hierarchy in a treelib or RAMSTK tree."""
+    tree.create_node(tag="hardware", identifier=0)
+    tree.create_node(tag="c", identifier=1, parent=0, data={"id": 1})
+    tree.create_node(tag="a", identifier=2, parent=1, data={"id": 2})
+    tree.create_node(tag="b", identifier=3, parent=1, data={"id": 3})
+    tree.create_node(tag="d", identifier=4, parent=0, data={"id": 4})
+    tree.create_node(tag="e", identifier=5, parent=3, data={"id": 5})
+
+    return tree
+
+
+@pytest.fixture
+def test_tree():
+    """Get a RAMSTKTree() and an identical treelib Tree()."""
+    yield _build(RAMSTKTree()), _build(Tree())
+
+
+@pytest.mark.unit
+def test_index_add():
+    """add() should link new nodes as the last child of their parent."""
+    DUT = RAMSTKTreeIndex()
+    DUT.add(0)
+    DUT.add(1, 0)
+    DUT.add(2, 0)
+    DUT.add(3, 1)
+
+    assert len(DUT) == 4
+    assert DUT.root == 0
+    assert 3 in DUT
+    assert list(DUT.children(0)) == [1, 2]
+    assert DUT.parent(3) == 1
+    assert DUT.parent(0) is None
+    assert DUT.level(3) == 2
+    assert DUT.depth() == 2
+
+
+@pytest.mark.unit
+def test_index_add_errors():
+    """add() should raise an error for a duplicate ID, second root, or missing
+    parent."""
+    DUT = RAMSTKTreeIndex()
+    DUT.add(0)
+
+    with pytest.raises(ValueError):
+        DUT.add(0)
+    with pytest.raises(ValueError):
+        DUT.add(1)
+    with pytest.raises(KeyError):
+        DUT.add(1, 42)
+
+
+@pytest.mark.unit
+def test_index_traversal():
+    """preorder() and postorder() should walk a subtree in the correct order."""
+    DUT = RAMSTKTreeIndex()
+    for _node_id, _parent_id in [(0, None), (1, 0), (2, 1), (3, 1), (4, 0), (5, 3)]:
+        DUT.add(_node_id, _parent_id)
+
+    assert list(DUT.preorder()) == [0, 1, 2, 3, 5, 4]
+    assert list(DUT.postorder()) == [2, 5, 3, 1, 4, 0]
+    assert list(DUT.preorder(1)) == [1, 2, 3, 5]
+    assert list(DUT.postorder(1)) == [2, 5, 3, 1]
+    assert list(DUT.postorder(4)) == [4]
+    assert list(RAMSTKTreeIndex().preorder()) == []
+
+
+@pytest.mark.unit
+def test_index_remove():
+    """remove() should unlink a subtree and reuse the freed rows."""
+    DUT = RAMSTKTreeIndex()
+    for _node_id, _parent_id in [(0, None), (1, 0), (2, 1), (3, 1), (4, 0), (5, 3)]:
+        DUT.add(_node_id, _parent_id)
+
+    assert DUT.remove(3) == [5, 3]
+    assert list(DUT.children(1)) == [2]
+    assert 5 not in DUT
+
+    _row = DUT.add(6, 1)
+
+    assert _row in [3, 5]
+    assert list(DUT.children(1)) == [2, 6]
+    assert list(DUT.preorder()) == [0, 1, 2, 6, 4]
+
+    assert DUT.remove(0) == [2, 6, 1, 4, 0]
+    assert DUT.root is None
+    assert len(DUT) == 0
+
+
+@pytest.mark.unit
+def test_index_rows():
+    """find_row(), get_id(), and rows() should map between node IDs and rows."""
+    DUT = RAMSTKTreeIndex()
+    for _node_id, _parent_id in [(0, None), (1, 0), (2, 1)]:
+        DUT.add(_node_id, _parent_id)
+
+    assert DUT.find_row(2) == DUT.get_row(2)
+    assert DUT.find_row(42) == -1
+    assert [DUT.get_id(_row) for _row in DUT.rows()] == [0, 1, 2]
+
+    DUT.remove(2)
+
+    assert DUT.get_id(2) is None
+    assert list(DUT.rows()) == [0, 1]
+
+
+@pytest.mark.unit
+def test_tree_is_treelib_tree(test_tree):
+    """RAMSTKTree() should be usable wherever a treelib Tree() is expected."""
+    DUT, _tree = test_tree
+
+    assert isinstance(DUT, Tree)
+    assert DUT.root == _tree.root
+    assert len(DUT) == len(_tree)
+    assert DUT.depth() == _tree.depth()
+    assert 5 in DUT
+    assert DUT.contains(5)
+    assert not DUT.contains(42)
+    assert DUT.get_node(42) is None
+
+
+@pytest.mark.unit
+def test_tree_matches_treelib(test_tree):
+    """RAMSTKTree() should return the same results as treelib."""
+    DUT, _tree = test_tree
+
+    assert [_node.identifier for _node in DUT.all_nodes()] == [
+        _node.identifier for _node in _tree.all_nodes()
+    ]
+    assert list(DUT.nodes) == list(_tree.nodes)
+    assert list(DUT.expand_tree()) == list(_tree.expand_tree())
+    assert list(DUT.expand_tree(sorting=False)) == list(
+        _tree.expand_tree(sorting=False)
+    )
+    assert list(DUT.expand_tree(mode=Tree.WIDTH)) == list(
+        _tree.expand_tree(mode=Tree.WIDTH)
+    )
+    for _node_id in _tree.nodes:
+        _node = DUT.get_node(_node_id)
+
+        assert _node.tag == _tree.get_node(_node_id).tag
+        assert _node.data == _tree.get_node(_node_id).data
+        assert _node.successors(DUT.identifier) == _tree.get_node(_node_id).successors(
+            _tree.identifier
+        )
+        assert _node.predecessor(DUT.identifier) == _tree.get_node(
+            _node_id
+        ).predecessor(_tree.identifier)
+        assert DUT.level(_node_id) == _tree.level(_node_id)
+        assert [_child.identifier for _child in DUT.children(_node_id)] == [
+            _child.identifier for _child in _tree.children(_node_id)
+        ]
+        assert [_sibling.identifier for _sibling in DUT.siblings(_node_id)] == [
+            _sibling.identifier for _sibling in _tree.siblings(_node_id)
+        ]
+
+
+@pytest.mark.unit
+def test_tree_node_data(test_tree):
+    """Node data should be shared with the tree so updates are kept."""
+    DUT, _tree = test_tree
+
+    DUT.get_node(3).data["hardware"] = "Some hardware"
+    DUT[4].data = {"id": 44}
+
+    assert DUT.get_node(3).data["hardware"] == "Some hardware"
+    assert DUT.get_node(4).data == {"id": 44}
+    assert DUT.parent(3).identifier == 1
+    assert DUT.parent(0) is None
+
+    _row = DUT.index.get_row(2)
+    DUT.set_tag(_row, "z")
+    DUT.set_data(_row, {"id": 22})
+
+    assert DUT.get_tag(_row) == "z"
+    assert DUT.get_data(_row) == {"id": 22}
+    assert DUT[2].tag == "z"
+
+
+@pytest.mark.unit
+def test_tree_nodes(test_tree):
+    """nodes should be a view of the tree's nodes that follows its changes."""
+    DUT, _tree = test_tree
+
+    _nodes = DUT.nodes
+
+    assert _nodes is DUT.nodes
+    assert len(_nodes) == 6
+    assert 3 in _nodes
+    assert _nodes[3] == DUT.get_node(3)
+    assert _nodes.get(42) is None
+    with pytest.raises(KeyError):
+        _nodes[42]
+
+    DUT.remove_node(3)
+    DUT.create_node(tag="f", identifier=6, parent=4, data={"id": 6})
+
+    assert list(_nodes) == [0, 1, 2, 4, 6]
+    assert _nodes[6].data == {"id": 6}
+
+
+@pytest.mark.unit
+def test_tree_traversal(test_tree):
+    """preorder() and postorder() should return node IDs in order."""
+    DUT, _tree = test_tree
+
+    assert list(DUT.preorder()) == [0, 1, 2, 3, 5, 4]
+    assert list(DUT.postorder(1)) == [2, 5, 3, 1]
+
+
+@pytest.mark.unit
+def test_tree_remove_node(test_tree):
+    """remove_node() should remove a node and its descendants."""
+    DUT, _tree = test_tree
+
+    assert DUT.remove_node(1) == _tree.remove_node(1)
+    assert list(DUT.expand_tree()) == list(_tree.expand_tree())
+
+    DUT.create_node(tag="f", identifier=6, parent=4, data=None)
+
+    assert DUT.get_node(6).tag == "f"
+    assert DUT.get_node(6).predecessor(DUT.identifier) == 4
+
+
+@pytest.mark.unit
+def test_tree_errors(test_tree):
+    """RAMSTKTree() should raise the same errors as treelib."""
+    DUT, _tree = test_tree
+
+    with pytest.raises(DuplicatedNodeIdError):
+        DUT.create_node(tag="a", identifier=2, parent=1)
+    with pytest.raises(MultipleRootError):
+        DUT.create_node(tag="z", identifier=42)
+    with pytest.raises(NodeIDAbsentError):
+        DUT.create_node(tag="z", identifier=42, parent=41)
+    with pytest.raises(NodeIDAbsentError):
+        DUT.remove_node(42)
+    with pytest.raises(NodeIDAbsentError):
+        DUT.children(42)
+    with pytest.raises(NodeIDAbsentError):
+        DUT[42]
+
+
+@pytest.mark.unit
+def test_tree_from_tree(test_tree):
+    """from_tree() should copy a treelib Tree() into a RAMSTKTree()."""
+    DUT, _tree = test_tree
+
+    _copy = RAMSTKTree.from_tree(_tree)
+
+    assert list(_copy.expand_tree()) == list(_tree.expand_tree())
+    assert _copy.get_node(5).data is _tree.get_node(5).data
@@ -0,0 +1,211 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_cli.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the headless command line program."""
+
+# Standard Library Imports
+import argparse
+import copy
+import subprocess
+import sys
+
+# Third Party Imports
+import pytest
+from pubsub import pub
+
+# RAMSTK Package Imports
+from ramstk import cli
+from ramstk.configuration import RAMSTKSiteConfiguration
+from ramstk.db.base import BaseDatabase
+from ramstk.models import RAMSTKReliabilityRecord
+
+
+def _do_run_database(database, revision_id, steps, save=True, configurations=None):
+    """Return a result without connecting to a database."""
+    return {
+        "database": database,
+        "status": int(database == "bad_db"),
+        "elapsed": 0.5,
+        "steps": {_step: 0.1 for _step in steps},
+        "errors": ["Failed to open."] if database == "bad_db" else [],
+        "revision_id": revision_id,
+        "save": save,
+    }
+
+
+def _get_connection(dao):
+    """Return the connection information of a test database DAO."""
+    return {
+        "dialect": "postgres",
+        "user": "postgres",
+        "password": "postgres",
+        "host": "localhost",
+        "port": "5432",
+        "database": dao.database.rsplit("/", 1)[-1],
+    }
+
+
+def _get_hazard_rates(connection):
+    """Return the saved active hazard rate of each hardware item."""
+    _dao = BaseDatabase()
+    _dao.do_connect(connection)
+    _hazard_rates = {
+        _record.hardware_id: _record.hazard_rate_active
+        for _record in _dao.do_select_all(
+            RAMSTKReliabilityRecord,
+            key=["revision_id"],
+            value=[1],
+            order=RAMSTKReliabilityRecord.hardware_id,
+        )
+    }
+    _dao.do_disconnect()
+
+    return _hazard_rates
+
+
+@pytest.fixture(scope="function")
+def test_configurations(test_common_dao, test_toml_user_configuration):
+    """Get site and user configurations for the test databases."""
+    _site_configuration = RAMSTKSiteConfiguration()
+    _site_configuration.RAMSTK_COM_INFO = _get_connection(test_common_dao)
+
+    _user_configuration = copy.deepcopy(test_toml_user_configuration)
+    _user_configuration.RAMSTK_PROG_INFO = _get_connection(test_common_dao)
+
+    # The command line program has the message bus to itself.  Drop any
+    # listeners other tests left behind so they don't answer its messages.
+    pub.unsubAll()
+
+    yield _site_configuration, _user_configuration
+
+
+@pytest.mark.unit
+def test_import_without_gtk():
+    """the cli module should not import the GTK views."""
+    _output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, ramstk.cli; print('ramstk.views.gtk3' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert _output.stdout.strip() == "False"
+
+
+@pytest.mark.unit
+def test_do_parse_steps():
+    """do_parse_steps() should return the steps in pipeline order."""
+    assert cli.do_parse_steps("criticality, prediction") == [
+        "prediction",
+        "criticality",
+    ]
+    assert cli.do_parse_steps("rollup,rollup,") == ["rollup"]
+
+
+@pytest.mark.unit
+def test_do_parse_steps_unknown():
+    """do_parse_steps() should raise an ArgumentTypeError for an unknown step."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.do_parse_steps("prediction,fta")
+
+
+@pytest.mark.unit
+def test_do_make_parser():
+    """do_make_parser() should return the default options."""
+    _args = cli.do_make_parser().parse_args(["db1", "db2"])
+
+    assert _args.databases == ["db1", "db2"]
+    assert _args.revision == 1
+    assert _args.steps == cli.DEFAULT_STEPS
+    assert _args.jobs == 1
+    assert not _args.dry_run
+
+
+@pytest.mark.unit
+def test_do_run_databases(monkeypatch):
+    """do_run_databases() should return the results of each database in order."""
+    monkeypatch.setattr(cli, "do_run_database", _do_run_database)
+
+    _results = cli.do_run_databases(
+        ["db1", "db2"], 2, ["prediction"], max_workers=1, save=False
+    )
+
+    assert [_result["database"] for _result in _results] == ["db1", "db2"]
+    assert _results[0]["revision_id"] == 2
+    assert _results[0]["steps"] == {"prediction": 0.1}
+    assert not _results[1]["save"]
+
+
+@pytest.mark.unit
+def test_main(monkeypatch, capsys):
+    """main() should report each database and return 1 if any failed."""
+    monkeypatch.setattr(cli, "do_run_database", _do_run_database)
+
+    assert cli.main(["-s", "rollup", "good_db"]) == 0
+    assert cli.main(["--dry-run", "good_db", "bad_db"]) == 1
+
+    _output = capsys.readouterr().out.splitlines()
+    assert _output[0] == "good_db: OK in 0.50s (rollup 0.10s)"
+    assert _output[2].startswith("bad_db: FAILED in 0.50s")
+    assert _output[3] == "    Failed to open."
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("test_program_dao", "test_configurations")
+class TestRunDatabase:
+    """Test class for running the pipeline on a RAMSTK Program database."""
+
+    def test_do_run_database(self, test_program_dao, test_configurations):
+        """do_run_database() should save the predicted hazard rates."""
+        _connection = _get_connection(test_program_dao)
+        _before = _get_hazard_rates(_connection)
+
+        _result = cli.do_run_database(
+            _connection["database"],
+            1,
+            ["prediction"],
+            configurations=test_configurations,
+        )
+
+        assert _result["status"] == 0, _result["errors"]
+        assert _result["errors"] == []
+        assert list(_result["steps"]) == ["prediction"]
+        _after = _get_hazard_rates(_connection)
+        assert _after.keys() == _before.keys()
+        assert _after != _before
+
+    def test_do_run_databases_workers(self, test_program_dao, test_configurations):
+        """do_run_databases() should save the same hazard rates from worker
+        processes as do_run_database() does in the calling process."""
+        _connection = _get_connection(test_program_dao)
+        _expected = _get_hazard_rates(_connection)
+        test_program_dao.session.query(RAMSTKReliabilityRecord).update(
+            {"hazard_rate_active": 0.0}
+        )
+        test_program_dao.session.commit()
+
+        _results = cli.do_run_databases(
+            [_connection["database"], "no_such_db"],
+            1,
+            ["prediction"],
+            max_workers=2,
+            configurations=test_configurations,
+        )
+
+        assert [_result["database"] for _result in _results] == [
+            _connection["database"],
+            "no_such_db",
+        ]
+        assert _results[0]["status"] == 0
+        assert _results[1]["status"] == 1
+        assert _results[1]["errors"]
+        assert _get_hazard_rates(_connection) == _expected
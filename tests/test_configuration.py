@@ -343,6 +343,7 @@ class TestCreateConfiguration:
 
         assert DUT.RAMSTK_COLORS == {}
         assert DUT.RAMSTK_FORMAT_FILE == {}
+        assert DUT.RAMSTK_LOAD_POLICY == {}
         assert DUT.RAMSTK_PAGE_NUMBER == {
             0: "revision",
             1: "function",
@@ -779,6 +780,7 @@ class TestGetterSetter:
             "usage_profile": "usage_profile.toml",
             "validation": "validation.toml",
         }
+        assert DUT.RAMSTK_LOAD_POLICY == {"function": "eager", "mode": "lazy"}
         assert DUT.RAMSTK_STRESS_LIMITS == {
             1: [0.8, 0.9, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 125.0, 125.0],
             2: [1.0, 1.0, 0.7, 0.9, 1.0, 1.0, 0.0, 0.0, 125.0, 125.0],
@@ -856,6 +858,7 @@ class TestGetterSetter:
         DUT.RAMSTK_MTIME = 24.0
         DUT.RAMSTK_DEC_PLACES = 4
         DUT.RAMSTK_BACKEND = "mysql"
+        DUT.RAMSTK_LOAD_POLICY["hardware"] = "lazy"
         DUT.RAMSTK_PROG_INFO = {
             "dialect": "mysql",
             "host": "treebeard",
@@ -874,6 +877,8 @@ class TestGetterSetter:
         assert DUT.RAMSTK_MTIME == 24.0
         assert DUT.RAMSTK_DEC_PLACES == 4
         assert DUT.RAMSTK_BACKEND == "mysql"
+        assert DUT.RAMSTK_LOAD_POLICY["hardware"] == "lazy"
+        assert DUT.RAMSTK_LOAD_POLICY["mode"] == "eager"
         assert DUT.RAMSTK_PROG_INFO == {
             "dialect": "mysql",
             "host": "treebeard",
@@ -50,6 +50,8 @@ class TestLogManager:
         assert pub.isSubscribed(DUT._do_log_fail_message, "fail_insert_validation")
         assert pub.isSubscribed(DUT._do_log_fail_message, "fail_insert_stakeholder")
         assert pub.isSubscribed(DUT._do_log_fail_message, "fail_insert_revision")
+        assert pub.isSubscribed(DUT._do_log_fail_message, "fail_clone_revision")
+        assert pub.isSubscribed(DUT._do_log_fail_message, "fail_export_data")
         assert pub.isSubscribed(DUT._do_log_fail_message, "fail_insert_environment")
         assert pub.isSubscribed(
             DUT._do_log_fail_message, "fail_insert_failure_definition"
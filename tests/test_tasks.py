@@ -0,0 +1,241 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_tasks.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the background task queue."""
+
+# Standard Library Imports
+import threading
+import time
+
+# Third Party Imports
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.tasks import RAMSTKTask, RAMSTKTaskQueue, do_call_now
+
+
+@pytest.fixture
+def test_queue():
+    """Create a task queue and shut it down when the test is finished."""
+    _queue = RAMSTKTaskQueue(max_workers=4)
+
+    yield _queue
+
+    _queue.do_shutdown()
+
+
+@pytest.mark.unit
+def test_do_call_now():
+    """do_call_now() should call the callback and return False."""
+    _args = []
+
+    assert not do_call_now(_args.extend, [1, 2])
+    assert _args == [1, 2]
+
+
+@pytest.mark.unit
+def test_task_create():
+    """__init__() should create a pending RAMSTKTask."""
+    DUT = RAMSTKTask("Save hardware", lambda task: None, key="hardware")
+
+    assert DUT.name == "Save hardware"
+    assert DUT.key == "hardware"
+    assert DUT.status == "pending"
+    assert DUT.progress == 0.0
+    assert DUT.error is None
+    assert DUT.result is None
+    assert not DUT.cancelled
+
+
+@pytest.mark.unit
+def test_task_run():
+    """do_run() should store the result of the work function and call on_done."""
+    _done = []
+    DUT = RAMSTKTask("Add", lambda task: 1 + 2, on_done=_done.append)
+
+    DUT.do_run()
+
+    assert DUT.status == "done"
+    assert DUT.result == 3
+    assert _done == [DUT]
+
+
+@pytest.mark.unit
+def test_task_run_failed():
+    """do_run() should store the exception raised by the work function."""
+    _done = []
+    DUT = RAMSTKTask("Divide", lambda task: 1 / 0, on_done=_done.append)
+
+    DUT.do_run()
+
+    assert DUT.status == "failed"
+    assert isinstance(DUT.error, ZeroDivisionError)
+    assert _done == [DUT]
+
+
+@pytest.mark.unit
+def test_task_run_cancelled():
+    """do_run() should not call the work function of a cancelled task."""
+    _calls = []
+    DUT = RAMSTKTask("Cancel", _calls.append)
+
+    DUT.cancel()
+    DUT.do_run()
+
+    assert DUT.status == "cancelled"
+    assert _calls == []
+
+
+@pytest.mark.unit
+def test_task_report_progress():
+    """do_report_progress() should dispatch the on_progress callback."""
+    _dispatched = []
+    _progress = []
+
+    def _dispatch(callback, *args):
+        _dispatched.append(callback)
+        return callback(*args)
+
+    def _work(task):
+        task.do_report_progress(0.5, "Halfway")
+        task.do_report_progress(1.0, "Finished")
+
+    DUT = RAMSTKTask(
+        "Progress",
+        _work,
+        dispatch=_dispatch,
+        on_progress=lambda task: _progress.append((task.progress, task.message)),
+    )
+    DUT.do_run()
+
+    assert _progress == [(0.5, "Halfway"), (1.0, "Finished")]
+    assert len(_dispatched) == 2
+
+
+@pytest.mark.unit
+def test_queue_submit(test_queue):
+    """do_submit() should run the task on a worker thread."""
+    _finished = threading.Event()
+    _threads = []
+
+    _task = test_queue.do_submit(
+        "Thread",
+        lambda task: _threads.append(threading.current_thread()),
+        on_done=lambda task: _finished.set(),
+    )
+
+    assert _finished.wait(5.0)
+    assert _task.status == "done"
+    assert _threads[0] is not threading.current_thread()
+    assert _threads[0].name.startswith("ramstk-task")
+
+
+@pytest.mark.unit
+def test_queue_same_key_serialized(test_queue):
+    """do_submit() should run tasks with the same key one at a time in the
+    order they were submitted."""
+    _order = []
+    _running = []
+
+    def _work(task):
+        _running.append(task.name)
+        assert len(_running) == 1
+        time.sleep(0.01)
+        _order.append(task.name)
+        _running.remove(task.name)
+
+    _tasks = [
+        test_queue.do_submit(str(_idx), _work, key="hardware") for _idx in range(5)
+    ]
+    test_queue.do_shutdown()
+
+    assert _order == ["0", "1", "2", "3", "4"]
+    assert [_task.status for _task in _tasks] == ["done"] * 5
+    assert test_queue.active == []
+
+
+@pytest.mark.unit
+def test_queue_different_keys_concurrent(test_queue):
+    """do_submit() should run tasks with different keys at the same time."""
+    _barrier = threading.Barrier(2, timeout=5.0)
+
+    _tasks = [
+        test_queue.do_submit("A", lambda task: _barrier.wait(), key="hardware"),
+        test_queue.do_submit("B", lambda task: _barrier.wait(), key="function"),
+    ]
+    test_queue.do_shutdown()
+
+    assert [_task.status for _task in _tasks] == ["done", "done"]
+
+
+@pytest.mark.unit
+def test_queue_cancel_all(test_queue):
+    """do_cancel_all() should cancel the running task and the pending tasks."""
+    _started = threading.Event()
+
+    def _work(task):
+        _started.set()
+        while not task.cancelled:
+            time.sleep(0.001)
+
+    _running = test_queue.do_submit("Running", _work, key="hardware")
+    _pending = test_queue.do_submit("Pending", _work, key="hardware")
+
+    assert _started.wait(5.0)
+    assert test_queue.active == [_running, _pending]
+
+    test_queue.do_cancel_all()
+    test_queue.do_shutdown()
+
+    assert _running.status == "cancelled"
+    assert _pending.status == "cancelled"
+    assert test_queue.active == []
+
+
+@pytest.mark.unit
+def test_queue_wait(test_queue):
+    """do_wait() should return True once the running and pending tasks finish."""
+    _release = threading.Event()
+    _order = []
+
+    _running = test_queue.do_submit(
+        "Running", lambda task: _release.wait(5.0), key="hardware"
+    )
+    _pending = test_queue.do_submit(
+        "Pending", lambda task: _order.append(task.name), key="hardware"
+    )
+
+    assert not test_queue.do_wait(timeout=0.01)
+
+    _release.set()
+
+    assert test_queue.do_wait(timeout=5.0)
+    assert _running.status == "done"
+    assert _pending.status == "done"
+    assert _order == ["Pending"]
+    assert test_queue.active == []
+    assert test_queue.do_wait(timeout=0.0)
+
+
+@pytest.mark.unit
+def test_queue_dispatch(test_queue):
+    """do_submit() should pass the on_done callback to the queue's dispatch
+    function."""
+    _dispatched = []
+    _done = []
+
+    def _dispatch(callback, *args):
+        _dispatched.append(threading.current_thread())
+        return callback(*args)
+
+    test_queue.dispatch = _dispatch
+    test_queue.do_submit("Dispatch", lambda task: None, on_done=_done.append)
+    test_queue.do_shutdown()
+
+    assert len(_dispatched) == 1
+    assert _done[0].status == "done"